@@ -1,5 +1,11 @@
 """NutriFlavorOS backend package."""
 
+# Opt-in import profiling (STARTUP_PROFILE_REPORT) must be installed before any
+# other backend import so the report sees the whole path to ``backend.main``.
+from backend import startup_profile as _startup_profile
+
+_startup_profile.install_from_env()
+
 # Import additive ORM mappings during package initialization so every process
 # using Base.metadata sees the complete reviewed schema regardless of which
 # service module is imported first.
@@ -2,40 +2,23 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Optional
-
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from backend.database import DBMealPlan, DBUser, get_db
-from backend.models import PlanResponse
+from backend.database import DBUser, get_db
+from backend.meal_plan_summary_models import DBMealPlanSummary
+from backend.services.meal_plan_summary_service import latest_plan_summary
 from backend.utils.security import get_current_user, require_self
 
 
 router = APIRouter(prefix="/api/v1/analytics", tags=["analytics"])
 
 
-def _latest_plan(db: Session, user_id: str) -> Optional[PlanResponse]:
-    row = (
-        db.query(DBMealPlan)
-        .filter(DBMealPlan.user_id == user_id)
-        .order_by(DBMealPlan.created_at.desc(), DBMealPlan.id.desc())
-        .first()
-    )
-    if row is None:
-        return None
-    try:
-        return PlanResponse.model_validate(row.plan_data)
-    except ValueError:
-        return None
-
-
-def _require_plan(db: Session, user_id: str) -> PlanResponse:
-    plan = _latest_plan(db, user_id)
-    if plan is None:
+def _require_summary(db: Session, user_id: str) -> DBMealPlanSummary:
+    summary = latest_plan_summary(db, user_id)
+    if summary is None:
         raise HTTPException(status_code=404, detail="No valid meal plan found")
-    return plan
+    return summary
 
 
 @router.get("/health/{user_id}")
@@ -46,15 +29,15 @@ def get_health_insights(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _require_plan(db, user_id)
+    summary = _require_summary(db, user_id)
     return [
         {
-            "date": f"Plan day {day.day}",
-            "score": round(float(day.scores.get("health_match", 0.0)) * 100, 1),
+            "date": f"Plan day {day['day']}",
+            "score": round(day["health_match"] * 100, 1),
             "metric": "planned_macro_match",
             "period": period,
         }
-        for day in plan.days
+        for day in summary.day_stats
     ]
 
 
@@ -65,28 +48,16 @@ def get_taste_insights(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _require_plan(db, user_id)
-
-    totals = defaultdict(float)
-    counts = Counter()
-    for day in plan.days:
-        for recipe in day.meals.values():
-            for dimension, value in recipe.flavor_profile.items():
-                try:
-                    totals[dimension] += float(value)
-                    counts[dimension] += 1
-                except (TypeError, ValueError):
-                    continue
-
+    summary = _require_summary(db, user_id)
     return [
         {
             "subject": dimension.replace("_", " ").title(),
-            "A": round(totals[dimension] / counts[dimension] * 100, 1),
+            "A": round(total / count * 100, 1),
             "fullMark": 100,
             "metric": "average_planned_recipe_profile",
         }
-        for dimension in sorted(counts)
-        if counts[dimension]
+        for dimension, (total, count) in sorted(summary.flavor_totals.items())
+        if count
     ]
 
 
@@ -97,12 +68,8 @@ def get_variety_insights(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _require_plan(db, user_id)
-    cuisines = Counter(
-        recipe.cuisine or "Unknown"
-        for day in plan.days
-        for recipe in day.meals.values()
-    )
+    summary = _require_summary(db, user_id)
+    cuisines = summary.cuisine_counts
     total = sum(cuisines.values())
     return [
         {
@@ -130,8 +97,7 @@ def get_plan_insight(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _require_plan(db, user_id)
-    stats = plan.overall_stats or {}
+    stats = _require_summary(db, user_id).overall_stats
     health = float(stats.get("average_health_match", 0.0) or 0.0)
     variety = float(stats.get("average_variety", 0.0) or 0.0)
 
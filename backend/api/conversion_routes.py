@@ -7,12 +7,15 @@ from sqlalchemy.orm import Session
 
 from backend.database import DBUser, get_db
 from backend.domain.conversions import (
+    ConversionBatchRequest,
+    ConversionBatchResult,
     ConversionRequest,
     ConversionResult,
     IngredientConversionView,
     StoragePolicyView,
 )
 from backend.services.conversion_service import (
+    convert_quantities,
     convert_quantity,
     list_conversions,
     list_storage_policies,
@@ -45,6 +48,15 @@ def convert_route(
     return convert_quantity(db, payload)
 
 
+@router.post("/convert/batch", response_model=ConversionBatchResult)
+def convert_batch_route(
+    payload: ConversionBatchRequest,
+    db: Session = Depends(get_db),
+    _current_user: DBUser = Depends(get_current_user),
+):
+    return convert_quantities(db, payload)
+
+
 @router.get("/storage-policies", response_model=list[StoragePolicyView])
 def storage_policies_route(
     food_category: str | None = Query(default=None, max_length=240),
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from backend.database import CURRENT_PLAN_SCHEMA_VERSION, DBMealPlan, DBUser, get_db
 from backend.engines.plan_generator import InfeasiblePlanError, PlanGenerator
 from backend.models import DailyPlan, PlanResponse, Recipe, UserProfile
+from backend.services.meal_plan_summary_service import record_plan_summary
 from backend.utils.security import get_current_user, require_self
 from backend.utils.user_profiles import apply_profile, db_user_to_profile
 
@@ -105,13 +106,13 @@ def generate_meal_plan(
         _raise_planner_error(exc)
         raise AssertionError("unreachable")
 
-    db.add(
-        DBMealPlan(
-            user_id=current_user.id,
-            schema_version=CURRENT_PLAN_SCHEMA_VERSION,
-            plan_data=plan.model_dump(mode="json"),
-        )
+    stored = DBMealPlan(
+        user_id=current_user.id,
+        schema_version=CURRENT_PLAN_SCHEMA_VERSION,
+        plan_data=plan.model_dump(mode="json"),
     )
+    db.add(stored)
+    record_plan_summary(db, stored, plan)
     db.commit()
     return plan
 
@@ -135,23 +136,24 @@ def regenerate_day(
     stored = _latest_plan(db, current_user.id)
     if stored is None:
         replacement = generated.model_copy(update={"days": [new_day]})
-        db.add(
-            DBMealPlan(
-                user_id=current_user.id,
-                schema_version=CURRENT_PLAN_SCHEMA_VERSION,
-                plan_data=replacement.model_dump(mode="json"),
-            )
+        stored = DBMealPlan(
+            user_id=current_user.id,
+            schema_version=CURRENT_PLAN_SCHEMA_VERSION,
+            plan_data=replacement.model_dump(mode="json"),
         )
+        db.add(stored)
     else:
         current_plan = PlanResponse.model_validate(stored.plan_data)
         if payload.day_index >= len(current_plan.days):
             raise HTTPException(status_code=404, detail="Plan day not found")
         updated_days = list(current_plan.days)
         updated_days[payload.day_index] = new_day
-        stored.plan_data = current_plan.model_copy(update={"days": updated_days}).model_dump(mode="json")
+        replacement = current_plan.model_copy(update={"days": updated_days})
+        stored.plan_data = replacement.model_dump(mode="json")
         stored.schema_version = CURRENT_PLAN_SCHEMA_VERSION
         db.add(stored)
 
+    record_plan_summary(db, stored, replacement)
     db.commit()
     return new_day
 
@@ -2,20 +2,22 @@
 
 Feedback is stored for an offline, reviewed training pipeline. Request handlers
 never mutate production model weights. Demo responses that previously fabricated
-inventory, predictions, points, ranks, and achievements now return a clear
-``501 Not Implemented`` instead of presenting fixtures as user data.
+inventory and predictions now return a clear ``501 Not Implemented`` instead of
+presenting fixtures as user data. Gamification points, ranks, and achievements
+are scored transactionally from logged meals.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from backend.database import DBFeedback, DBMealPlan, DBUser, get_db
-from backend.models import PlanResponse
+from backend.database import DBFeedback, DBUser, get_db
+from backend.services import gamification_service
+from backend.services.meal_plan_summary_service import latest_plan_summary
 from backend.utils.security import get_current_user, require_self
 
 
@@ -80,21 +82,6 @@ def _not_implemented(feature: str) -> None:
     )
 
 
-def _latest_plan(db: Session, user_id: str) -> Optional[PlanResponse]:
-    row = (
-        db.query(DBMealPlan)
-        .filter(DBMealPlan.user_id == user_id)
-        .order_by(DBMealPlan.created_at.desc(), DBMealPlan.id.desc())
-        .first()
-    )
-    if row is None:
-        return None
-    try:
-        return PlanResponse.model_validate(row.plan_data)
-    except ValueError:
-        return None
-
-
 @router.post("/feedback/taste", status_code=status.HTTP_202_ACCEPTED)
 def log_taste_feedback(
     feedback: TasteFeedback,
@@ -165,32 +152,29 @@ def generate_shopping_list(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _latest_plan(db, user_id)
-    if plan is None or not plan.shopping_list:
+    summary = latest_plan_summary(db, user_id)
+    if summary is None or not summary.shopping_items:
         raise HTTPException(status_code=404, detail="Generate a meal plan before requesting a shopping list")
 
-    items = []
-    for category, category_items in plan.shopping_list.items():
-        for item_name, item_data in category_items.items():
-            count = int(item_data.get("count", 0) or 0)
-            items.append(
-                {
-                    "item": item_name,
-                    "predicted_quantity": count,
-                    "quantity_label": item_data.get("quantity"),
-                    "quantity_status": item_data.get("quantity_status"),
-                    "estimated_cost": 0.0,
-                    "urgency": 0.0,
-                    "category": category,
-                }
-            )
+    items = [
+        {
+            "item": entry["item"],
+            "predicted_quantity": entry["count"],
+            "quantity_label": entry["quantity"],
+            "quantity_status": entry["quantity_status"],
+            "estimated_cost": 0.0,
+            "urgency": 0.0,
+            "category": entry["category"],
+        }
+        for entry in summary.shopping_items
+    ]
 
     return {
         "shopping_list": items,
         "summary": {
             "total_items": len(items),
             "estimated_total_cost": 0.0,
-            "days_covered": min(days_ahead, len(plan.days)),
+            "days_covered": min(days_ahead, summary.day_count),
             "urgent_items": 0,
             "cost_status": "unavailable",
         },
@@ -228,27 +212,56 @@ def predict_next_purchase(
 @router.post("/gamification/log_meal")
 def log_meal_impact(
     impact: MealImpact,
+    db: Session = Depends(get_db),
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(impact.user_id, current_user)
-    _not_implemented("Transactional gamification scoring")
+    return gamification_service.record_meal_impact(
+        db, current_user.id, impact.model_dump(exclude={"user_id"})
+    )
 
 
 @router.get("/gamification/leaderboard")
-def get_leaderboard(_: DBUser = Depends(get_current_user)):
-    _not_implemented("Real leaderboard aggregation")
+def get_leaderboard(
+    metric: str = Query(default="carbon_saved", min_length=1, max_length=64),
+    period: Literal["day", "week", "month", "all_time"] = "month",
+    limit: int = Query(default=100, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: DBUser = Depends(get_current_user),
+):
+    entries = gamification_service.get_leaderboard(
+        db, metric, period=period, limit=limit, viewer_user_id=current_user.id
+    )
+    # Other users' account ids and names are not disclosed on a shared leaderboard.
+    return [
+        {
+            **{key: value for key, value in entry.items() if key != "user_id"},
+            "is_current_user": entry["user_id"] == current_user.id,
+        }
+        for entry in entries
+    ]
 
 
 @router.get("/gamification/rank/{user_id}")
-def get_user_rank(user_id: str, current_user: DBUser = Depends(get_current_user)):
+def get_user_rank(
+    user_id: str,
+    metric: str = Query(default="carbon_saved", min_length=1, max_length=64),
+    period: Literal["day", "week", "month", "all_time"] = "month",
+    db: Session = Depends(get_db),
+    current_user: DBUser = Depends(get_current_user),
+):
     require_self(user_id, current_user)
-    _not_implemented("Real user ranking")
+    return gamification_service.get_user_rank(db, current_user.id, metric, period=period)
 
 
 @router.get("/gamification/achievements/{user_id}")
-def get_user_achievements(user_id: str, current_user: DBUser = Depends(get_current_user)):
+def get_user_achievements(
+    user_id: str,
+    db: Session = Depends(get_db),
+    current_user: DBUser = Depends(get_current_user),
+):
     require_self(user_id, current_user)
-    _not_implemented("Persisted achievements")
+    return gamification_service.list_achievements(db, current_user.id)
 
 
 @router.get("/gamification/impact_summary/{user_id}")
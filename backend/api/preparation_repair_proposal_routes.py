@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from backend.database import DBUser, get_db
@@ -35,6 +35,7 @@ from backend.services.preparation_repair_proposal_invalidation_service import (
     invalidate_repair_proposal,
 )
 from backend.services.preparation_repair_proposal_read_service import (
+    encode_repair_proposal_cursor,
     get_repair_proposal,
     get_repair_proposal_acceptance,
     list_repair_proposal_events,
@@ -47,6 +48,8 @@ from backend.services.preparation_repair_source_acceptance_guard_service import
 from backend.utils.security import get_current_user
 
 
+MAX_PROPOSAL_PAGE_SIZE = 200
+
 router = APIRouter(
     prefix="/api/v1/households/{household_id}/preparation-operations/repair-proposals",
     tags=["household-preparation-repair-proposals"],
@@ -106,16 +109,26 @@ def preflight_execution_aware_repair_proposal_route(
 @router.get("", response_model=List[PreparationRepairProposalView])
 def list_repair_proposals_route(
     household_id: str,
+    response: Response,
     status: List[PreparationRepairProposalStatus] | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PROPOSAL_PAGE_SIZE),
+    cursor: str | None = Query(default=None, max_length=256),
     db: Session = Depends(get_db),
     current_user: DBUser = Depends(get_current_user),
 ):
+    """List proposals newest first; a full page sets ``X-Next-Cursor``."""
+
     _access(db, household_id, current_user.id, HouseholdRole.VIEWER)
-    return list_repair_proposals(
+    views = list_repair_proposals(
         db,
         household_id=household_id,
         statuses=status,
+        limit=limit,
+        cursor=cursor,
     )
+    if limit is not None and len(views) == limit:
+        response.headers["X-Next-Cursor"] = encode_repair_proposal_cursor(views[-1])
+    return views
 
 
 @router.get("/{proposal_id}", response_model=PreparationRepairProposalView)
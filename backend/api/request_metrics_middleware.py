@@ -0,0 +1,68 @@
+"""ASGI boundary that records per-route latency and database usage.
+
+The middleware labels each HTTP request with its method and the route template
+Starlette matched, so concrete identifiers in the path never reach a metric
+label. Database statements run while the request is in flight are attributed to
+it through ``backend.request_metrics``. Nothing is exposed over HTTP; see
+``backend.request_metrics_openmetrics`` for rendering.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Optional
+
+from fastapi import FastAPI
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.request_metrics import (
+    REQUEST_METRICS,
+    RequestMetrics,
+    begin_request,
+    end_request,
+    instrument_engine,
+)
+
+
+def _route_template(scope: Scope) -> Optional[str]:
+    route: Any = scope.get("route")
+    return getattr(route, "path", None)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = REQUEST_METRICS) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        usage, token = begin_request()
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            elapsed = perf_counter() - started
+            end_request(token)
+            self.metrics.record_request(
+                method=scope["method"],
+                route=_route_template(scope),
+                seconds=elapsed,
+                usage=usage,
+            )
+
+
+def install_request_metrics(
+    app: FastAPI,
+    engine: Engine,
+    metrics: RequestMetrics = REQUEST_METRICS,
+) -> None:
+    """Record request metrics on one application and its database engine."""
+
+    instrument_engine(engine, metrics)
+    app.add_middleware(RequestMetricsMiddleware, metrics=metrics)
+
+
+__all__ = ["RequestMetricsMiddleware", "install_request_metrics"]
@@ -2,39 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from backend.database import DBMealPlan, DBUser, get_db
-from backend.models import PlanResponse
+from backend.database import DBUser, get_db
+from backend.meal_plan_summary_models import DBMealPlanSummary
+from backend.services.meal_plan_summary_service import latest_plan_summary
 from backend.utils.security import get_current_user, require_self
 
 
 router = APIRouter(prefix="/api/v1/sustainability", tags=["sustainability"])
 
 
-def _latest_plan(db: Session, user_id: str) -> Optional[PlanResponse]:
-    row = (
-        db.query(DBMealPlan)
-        .filter(DBMealPlan.user_id == user_id)
-        .order_by(DBMealPlan.created_at.desc(), DBMealPlan.id.desc())
-        .first()
-    )
-    if row is None:
-        return None
-    try:
-        return PlanResponse.model_validate(row.plan_data)
-    except ValueError:
-        return None
-
-
-def _require_plan(db: Session, user_id: str) -> PlanResponse:
-    plan = _latest_plan(db, user_id)
-    if plan is None:
+def _require_summary(db: Session, user_id: str) -> DBMealPlanSummary:
+    summary = latest_plan_summary(db, user_id)
+    if summary is None:
         raise HTTPException(status_code=404, detail="No valid meal plan found")
-    return plan
+    return summary
 
 
 @router.get("/{user_id}")
@@ -45,11 +29,11 @@ def get_sustainability_data(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _require_plan(db, user_id)
+    summary = _require_summary(db, user_id)
     values = [
-        float(day.total_stats["carbon_footprint_kg"])
-        for day in plan.days
-        if isinstance(day.total_stats.get("carbon_footprint_kg"), (int, float))
+        day["carbon_footprint_kg"]
+        for day in summary.day_stats
+        if day["carbon_footprint_kg"] is not None
     ]
     return {
         "carbon_saved_kg": 0.0,
@@ -70,18 +54,18 @@ def get_carbon_footprint(
     current_user: DBUser = Depends(get_current_user),
 ):
     require_self(user_id, current_user)
-    plan = _require_plan(db, user_id)
+    summary = _require_summary(db, user_id)
     breakdown = [
         {
-            "category": f"Plan day {day.day}",
-            "value": float(day.total_stats["carbon_footprint_kg"]),
-            "status": day.total_stats.get("carbon_data_status", "unknown"),
+            "category": f"Plan day {day['day']}",
+            "value": day["carbon_footprint_kg"],
+            "status": day["carbon_data_status"],
         }
-        for day in plan.days
-        if isinstance(day.total_stats.get("carbon_footprint_kg"), (int, float))
+        for day in summary.day_stats
+        if day["carbon_footprint_kg"] is not None
     ]
     total = sum(item["value"] for item in breakdown)
-    meal_count = sum(len(day.meals) for day in plan.days)
+    meal_count = summary.meal_count
     return {
         "total_footprint": round(total, 2) if breakdown else 0.0,
         "average_meal_footprint": round(total / meal_count, 3) if breakdown and meal_count else 0.0,
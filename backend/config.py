@@ -30,9 +30,15 @@ class APIConfig:
         "SUSTAINABLEFOODDB_BASE_URL", "https://cosylab.iiitd.edu.in/sustainablefooddb"
     )
     SUSTAINABLEFOODDB_API_KEY: Optional[str] = os.getenv("SUSTAINABLEFOODDB_API_KEY")
+    SUSTAINABILITY_CARBON_TABLE_FILE: Optional[str] = os.getenv(
+        "SUSTAINABILITY_CARBON_TABLE_FILE"
+    )
 
     DIETRXDB_BASE_URL: str = os.getenv("DIETRXDB_BASE_URL", "https://cosylab.iiitd.edu.in/dietrxdb")
     DIETRXDB_API_KEY: Optional[str] = os.getenv("DIETRXDB_API_KEY")
+    DIETRX_COMPATIBILITY_INDEX_FILE: Optional[str] = os.getenv(
+        "DIETRX_COMPATIBILITY_INDEX_FILE"
+    )
 
     FOODDATA_CENTRAL_API_KEY: Optional[str] = os.getenv("FOODDATA_CENTRAL_API_KEY")
     ENABLE_FOODDATA_CENTRAL: bool = _bool_env("ENABLE_FOODDATA_CENTRAL", False)
@@ -40,8 +46,16 @@ class APIConfig:
     CACHE_TTL: int = max(0, int(os.getenv("CACHE_TTL", "300")))
     CACHE_ENABLED: bool = _bool_env("CACHE_ENABLED", True)
     CACHE_MAX_ENTRIES: int = max(1, int(os.getenv("CACHE_MAX_ENTRIES", "512")))
+    # "memory" keeps the per-instance LRU; "sqlite" shares CACHE_SQLITE_PATH
+    # across service instances and worker processes.
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory").strip().lower()
+    CACHE_SQLITE_PATH: Optional[str] = os.getenv("CACHE_SQLITE_PATH")
 
     MAX_REQUESTS_PER_MINUTE: int = max(1, int(os.getenv("MAX_REQUESTS_PER_MINUTE", "60")))
+    RATE_LIMIT_BURST: int = max(
+        1, int(os.getenv("RATE_LIMIT_BURST", str(MAX_REQUESTS_PER_MINUTE)))
+    )
+    FETCH_MANY_MAX_WORKERS: int = max(1, int(os.getenv("FETCH_MANY_MAX_WORKERS", "8")))
     MAX_RETRIES: int = max(1, int(os.getenv("MAX_RETRIES", "3")))
     RETRY_BACKOFF_FACTOR: float = max(0.0, float(os.getenv("RETRY_BACKOFF_FACTOR", "0.5")))
     REQUEST_TIMEOUT_SECONDS: float = max(0.1, float(os.getenv("REQUEST_TIMEOUT_SECONDS", "10")))
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from backend.research.inventory_policy_sweep import PolicySweepAxis
 from backend.research.inventory_simulation import (
     DemandEvent,
     ReorderPolicy,
@@ -47,6 +48,9 @@ class PlannerTargetsFixture(StrictFixtureModel):
 
 
 class PlannerBenchmarkFixture(StrictFixtureModel):
+    schema_version: int = Field(default=1, ge=1, le=1)
+    description: Optional[str] = Field(default=None, max_length=2000)
+    generator: Optional[Dict[str, object]] = None
     options: List[PlannerOptionFixture] = Field(min_length=1, max_length=100000)
     targets: PlannerTargetsFixture
 
@@ -139,6 +143,57 @@ class InventoryBenchmarkFixture(StrictFixtureModel):
         return self
 
 
+class PolicySweepAxisFixture(StrictFixtureModel):
+    sku: str = Field(min_length=1, max_length=300)
+    reorder_points: List[float] = Field(min_length=1, max_length=10000)
+    order_up_to_levels: List[float] = Field(min_length=1, max_length=10000)
+    lead_time_days: int = Field(ge=1, le=3650)
+    shelf_life_days: int = Field(ge=1, le=36500)
+
+    @model_validator(mode="after")
+    def validate_axis(self):
+        self.sku = self.sku.strip()
+        if not self.sku:
+            raise ValueError("sweep sku cannot be blank")
+        for values in (self.reorder_points, self.order_up_to_levels):
+            if any(value < 0 for value in values):
+                raise ValueError("sweep policy levels must be non-negative")
+            if len(values) != len(set(values)):
+                raise ValueError("sweep policy levels must be unique")
+        if max(self.order_up_to_levels) < min(self.reorder_points):
+            raise ValueError("sweep axis has no order_up_to >= reorder_point cell")
+        return self
+
+    def to_domain(self) -> PolicySweepAxis:
+        return PolicySweepAxis(
+            sku=self.sku,
+            reorder_points=tuple(self.reorder_points),
+            order_up_to_levels=tuple(self.order_up_to_levels),
+            lead_time_days=self.lead_time_days,
+            shelf_life_days=self.shelf_life_days,
+        )
+
+
+class InventoryPolicySweepFixture(StrictFixtureModel):
+    horizon_days: int = Field(ge=1, le=3650)
+    initial_lots: List[SimulationLotFixture] = Field(default_factory=list, max_length=100000)
+    demand_events: List[DemandEventFixture] = Field(default_factory=list, max_length=1000000)
+    policy_grid: List[PolicySweepAxisFixture] = Field(min_length=1, max_length=100000)
+
+    @model_validator(mode="after")
+    def validate_document(self):
+        lot_ids = [value.lot_id for value in self.initial_lots]
+        if len(lot_ids) != len(set(lot_ids)):
+            raise ValueError("initial lot_id values must be unique")
+        axis_skus = [value.sku for value in self.policy_grid]
+        if len(axis_skus) != len(set(axis_skus)):
+            raise ValueError("at most one sweep axis is allowed per sku")
+        outside = [value.day for value in self.demand_events if value.day >= self.horizon_days]
+        if outside:
+            raise ValueError("demand events cannot fall outside horizon_days")
+        return self
+
+
 class ForecastConfigurationFixture(StrictFixtureModel):
     season_length: int = Field(default=7, ge=1, le=3650)
     moving_window: int = Field(default=7, ge=1, le=3650)
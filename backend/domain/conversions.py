@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -69,6 +69,28 @@ class ConversionResult(BaseModel):
     warnings: List[str] = Field(default_factory=list)
 
 
+MAX_CONVERSION_BATCH_ITEMS = 10_000
+
+
+class ConversionBatchRequest(BaseModel):
+    items: List[ConversionRequest] = Field(
+        min_length=1, max_length=MAX_CONVERSION_BATCH_ITEMS
+    )
+
+
+class ConversionBatchItem(BaseModel):
+    index: int
+    result: Optional[ConversionResult] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+class ConversionBatchResult(BaseModel):
+    table_version: int
+    converted_count: int
+    error_count: int
+    items: List[ConversionBatchItem]
+
+
 class StoragePolicyView(BaseModel):
     id: int
     policy_key: str
@@ -7,13 +7,21 @@ or hepatic impairment, and medication management require specialist review.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from backend.config import APIConfig
 from backend.models import Gender, Goal, NutrientTarget, UserProfile
+from backend.services.condition_compatibility_index import (
+    ConditionCompatibilityIndex,
+    load_condition_compatibility_index,
+)
 from backend.services.dietrxdb_service import DietRxDBService
 from backend.services.recipedb_service import RecipeDBService
 
 
+CompatibilityCheck = Callable[[str], Dict[str, Any]]
+
+
 class HealthEngine:
     """Adult macro targets plus advisory nutrient/condition scoring."""
 
@@ -41,9 +49,21 @@ class HealthEngine:
         "Manganese": {"male": 2.3, "female": 1.8, "unit": "mg"},
     }
 
-    def __init__(self):
+    def __init__(
+        self, compatibility_index: Optional[ConditionCompatibilityIndex] = None
+    ):
         self.recipe_service = RecipeDBService()
         self.diet_rx_service = DietRxDBService()
+        if compatibility_index is None and APIConfig.DIETRX_COMPATIBILITY_INDEX_FILE:
+            compatibility_index = load_condition_compatibility_index(
+                APIConfig.DIETRX_COMPATIBILITY_INDEX_FILE
+            )
+        self.compatibility_index = compatibility_index
+
+    def _compatibility_source(self) -> Callable[[str, List[str]], Dict[str, Any]]:
+        if self.compatibility_index is not None:
+            return self.compatibility_index.check_condition_compatibility
+        return self.diet_rx_service.check_condition_compatibility
 
     @staticmethod
     def calculate_bmr(user: UserProfile) -> float:
@@ -134,6 +154,52 @@ class HealthEngine:
     ) -> Dict[str, Any]:
         """Return an advisory score with explicit unknown-safety handling."""
 
+        check = self._compatibility_source()
+        return self._score_recipe(
+            recipe_id,
+            target,
+            user_conditions,
+            lambda ingredient: check(ingredient, user_conditions),
+        )
+
+    def score_recipes_batch(
+        self,
+        recipes: Iterable[str],
+        target: NutrientTarget,
+        conditions: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Score a candidate set, checking each distinct ingredient once.
+
+        Results are in input order and equal to calling
+        ``score_recipe_comprehensive`` per recipe.
+        """
+
+        check = self._compatibility_source()
+        outcomes: Dict[str, tuple[Optional[Dict[str, Any]], Optional[Exception]]] = {}
+
+        def compatibility(ingredient: str) -> Dict[str, Any]:
+            if ingredient not in outcomes:
+                try:
+                    outcomes[ingredient] = (check(ingredient, conditions), None)
+                except Exception as exc:
+                    outcomes[ingredient] = (None, exc)
+            result, error = outcomes[ingredient]
+            if error is not None:
+                raise error
+            return result
+
+        return [
+            self._score_recipe(recipe_id, target, conditions, compatibility)
+            for recipe_id in recipes
+        ]
+
+    def _score_recipe(
+        self,
+        recipe_id: str,
+        target: NutrientTarget,
+        user_conditions: Optional[List[str]],
+        compatibility_for: CompatibilityCheck,
+    ) -> Dict[str, Any]:
         nutrition = self.get_recipe_full_nutrition(recipe_id)
         macros = nutrition.get("macros", {})
         micros = nutrition.get("micros", {})
@@ -175,9 +241,7 @@ class HealthEngine:
 
             for ingredient in ingredients:
                 try:
-                    compatibility = self.diet_rx_service.check_condition_compatibility(
-                        ingredient, user_conditions
-                    )
+                    compatibility = compatibility_for(ingredient)
                     if not compatibility.get("safe_to_consume", False):
                         condition_score = 0.0
                         warnings.extend(compatibility.get("warnings", []))
@@ -29,6 +29,7 @@ from backend.engines.weekly_optimizer import OptimizationInfeasible, PlanSelecti
 from backend.engines.household_optimizer import optimize_household_horizon
 from backend.models import NutrientTarget, PlanResponse, UserProfile
 from backend.services.inventory_service import list_pantry_items, reconcile_shopping_list
+from backend.services.meal_plan_summary_service import record_plan_summary
 from backend.services.reservation_service import (
     create_plan_reservations,
     ingredient_availability_score,
@@ -277,6 +278,7 @@ def create_household_plan(
         plan_data=plan_response.model_dump(mode="json"),
     )
     db.add(stored)
+    record_plan_summary(db, stored, plan_response)
     db.commit()
     db.refresh(stored)
 
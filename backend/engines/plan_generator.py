@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import re
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from backend.domain.ingredients import (
     canonicalize_ingredient_name,
@@ -25,6 +25,7 @@ from backend.models import (
     Recipe,
     UserProfile,
 )
+from backend.services.carbon_footprint_table import RecipeCarbon
 from backend.services.sustainablefooddb_service import SustainableFoodDBService
 
 
@@ -192,6 +193,7 @@ class PlanGenerator:
         for selection in optimized.selections:
             selections_by_day[selection.day].append(selection)
 
+        carbon_by_recipe = self._estimate_recipe_carbon(optimized.selections)
         daily_plans: List[DailyPlan] = []
         variety_engine = VarietyEngine(no_repeat_window=7)
         for day in range(1, days + 1):
@@ -202,6 +204,7 @@ class PlanGenerator:
                     target=targets,
                     genome=genome,
                     variety_engine=variety_engine,
+                    carbon_by_recipe=carbon_by_recipe,
                 )
             )
 
@@ -305,6 +308,22 @@ class PlanGenerator:
             return [line.name for line in recipe.ingredient_lines if line.name]
         return [canonicalize_ingredient_name(value) for value in recipe.ingredients]
 
+    def _estimate_recipe_carbon(
+        self, selections: Sequence[PlanSelection]
+    ) -> Optional[Dict[str, RecipeCarbon]]:
+        """Score every selected recipe in one batch; ``None`` when disabled."""
+
+        if os.getenv("ENABLE_SUSTAINABILITY_ESTIMATES", "false").lower() != "true":
+            return None
+        recipes = list({item.recipe.id: item.recipe for item in selections}.values())
+        try:
+            scored = self.sustainability_service.score_recipes(
+                [self._recipe_ingredient_keys(recipe) for recipe in recipes]
+            )
+        except Exception:
+            return {}
+        return {recipe.id: carbon for recipe, carbon in zip(recipes, scored)}
+
     def _build_daily_plan(
         self,
         *,
@@ -313,6 +332,7 @@ class PlanGenerator:
         target: NutrientTarget,
         genome: Dict[str, Any],
         variety_engine: VarietyEngine,
+        carbon_by_recipe: Optional[Mapping[str, RecipeCarbon]] = None,
     ) -> DailyPlan:
         order = {slot: index for index, (slot, _) in enumerate(self.MEAL_SLOTS)}
         selections = sorted(selections, key=lambda item: order[item.slot])
@@ -341,14 +361,19 @@ class PlanGenerator:
 
         carbon_footprint: Optional[float] = None
         carbon_status = "disabled"
-        if os.getenv("ENABLE_SUSTAINABILITY_ESTIMATES", "false").lower() == "true":
-            try:
-                raw_ingredients = [value for recipe in recipes for value in recipe.ingredients]
-                result = self.sustainability_service.get_sustainability_score(raw_ingredients)
-                carbon_footprint = float(result["carbon_footprint_kg"])
-                carbon_status = "unverified_estimate"
-            except Exception:
-                carbon_status = "unavailable"
+        carbon_unknown: List[str] = []
+        if carbon_by_recipe is not None:
+            estimates = [carbon_by_recipe.get(recipe.id) for recipe in recipes]
+            carbon_status = "unavailable"
+            if all(estimate is not None for estimate in estimates):
+                carbon_unknown = sorted(
+                    {key for estimate in estimates for key in estimate.unknown_ingredients}
+                )
+                if not carbon_unknown:
+                    carbon_footprint = round(
+                        sum(estimate.carbon_footprint_kg for estimate in estimates), 2
+                    )
+                    carbon_status = "unverified_estimate"
 
         cuisine = next((recipe.cuisine for recipe in recipes if recipe.cuisine), "unknown")
         variety = variety_engine.calculate_variety_score(recipes)
@@ -369,6 +394,7 @@ class PlanGenerator:
                 "target_fat_g": float(target.fat_g),
                 "carbon_footprint_kg": carbon_footprint,
                 "carbon_data_status": carbon_status,
+                "carbon_unknown_ingredients": carbon_unknown,
                 "total_cost": round(cost, 2),
             },
             scores={
@@ -0,0 +1,136 @@
+"""ORM models for transactional gamification scores, events, and achievements.
+
+Scores are pre-aggregated per ``(metric, period, bucket_start, user_id)`` so a
+leaderboard for any day, ISO week, month, or all time is an ordered scan of one
+index range, and a user's rank is a count over that same index. Every scoring
+call also appends an immutable ``gamification_events`` row with the applied
+deltas, which is the audit trail the buckets are derived from.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+    UniqueConstraint,
+)
+
+from backend.database import Base, utcnow
+
+
+SCORE_PERIODS = ("day", "week", "month", "all_time")
+
+
+class DBGamificationEvent(Base):
+    __tablename__ = "gamification_events"
+    __table_args__ = (
+        CheckConstraint(
+            "event_type IN ('meal_logged','stats_updated')",
+            name="ck_gamification_event_type",
+        ),
+        Index(
+            "ix_gamification_events_user_occurred",
+            "user_id",
+            "occurred_at",
+            "id",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(
+        String,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_type = Column(String(32), nullable=False)
+    deltas = Column(JSON, nullable=False, default=dict)
+    occurred_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+
+
+class DBGamificationScore(Base):
+    __tablename__ = "gamification_scores"
+    __table_args__ = (
+        UniqueConstraint(
+            "metric",
+            "period",
+            "bucket_start",
+            "user_id",
+            name="uq_gamification_score_bucket",
+        ),
+        CheckConstraint(
+            "period IN ('day','week','month','all_time')",
+            name="ck_gamification_score_period",
+        ),
+        CheckConstraint(
+            "length(trim(metric)) > 0",
+            name="ck_gamification_score_metric_nonblank",
+        ),
+        Index(
+            "ix_gamification_scores_ranking",
+            "metric",
+            "period",
+            "bucket_start",
+            "score",
+            "user_id",
+        ),
+        Index(
+            "ix_gamification_scores_user_bucket",
+            "user_id",
+            "period",
+            "bucket_start",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(
+        String,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    metric = Column(String(64), nullable=False)
+    period = Column(String(16), nullable=False)
+    bucket_start = Column(Date, nullable=False)
+    score = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+
+class DBGamificationAchievement(Base):
+    __tablename__ = "gamification_achievements"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "achievement_id",
+            name="uq_gamification_achievement_user",
+        ),
+        CheckConstraint("points >= 0", name="ck_gamification_achievement_points"),
+        Index(
+            "ix_gamification_achievements_user_earned",
+            "user_id",
+            "earned_at",
+            "id",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(
+        String,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    achievement_id = Column(String(64), nullable=False)
+    points = Column(Integer, nullable=False)
+    earned_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from backend import startup_profile
 from backend.api import (
     analytics_routes,
     auth_routes,
@@ -27,13 +28,15 @@ from backend.api import (
     preparation_schedule_derivation_routes,
     preparation_task_execution_eligibility_routes,
     recipe_routes,
+    request_metrics_middleware,
     research_routes,
     substitution_routes,
     sustainability_routes,
     user_routes,
     vision_routes,
 )
-from backend.database import DB_URL, SessionLocal, init_db
+from backend.database import DB_URL, SessionLocal, engine, init_db
+from backend.ml import runtime as ml_runtime
 from backend.schema_verification import verify_runtime_schema
 from backend.services.conversion_service import seed_official_storage_policies
 from backend.services.official_evidence_history import (
@@ -53,17 +56,27 @@ def _bool_env(name: str, default: bool) -> bool:
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     auto_create_default = DB_URL.startswith("sqlite")
-    if _bool_env("AUTO_CREATE_SCHEMA", auto_create_default):
-        init_db()
-    else:
-        verify_runtime_schema()
+    with startup_profile.phase("schema"):
+        if _bool_env("AUTO_CREATE_SCHEMA", auto_create_default):
+            init_db()
+        else:
+            verify_runtime_schema()
     if _bool_env("SEED_REVIEWED_STORAGE_POLICIES", True):
-        db = SessionLocal()
-        try:
-            seed_official_storage_policies(db)
-            seed_official_storage_policy_versions(db)
-        finally:
-            db.close()
+        with startup_profile.phase("seed_storage_policies"):
+            db = SessionLocal()
+            try:
+                seed_official_storage_policies(db)
+                seed_official_storage_policy_versions(db)
+            finally:
+                db.close()
+    warm_imports = startup_profile.configured_warm_imports()
+    if warm_imports:
+        with startup_profile.phase("warm_imports"):
+            startup_profile.warm_imports(warm_imports)
+    with startup_profile.phase("ml_warmup_start"):
+        warmup_models, inference_variant = ml_runtime.configured_warmup()
+        ml_runtime.start_background_warmup(warmup_models, variant=inference_variant)
+    startup_profile.finish()
     yield
 
 
@@ -97,6 +110,8 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type", "Idempotency-Key"],
 )
+if _bool_env("REQUEST_METRICS_ENABLED", False):
+    request_metrics_middleware.install_request_metrics(app, engine)
 
 
 @app.get("/")
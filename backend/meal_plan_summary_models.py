@@ -0,0 +1,66 @@
+"""ORM projection of stored meal plans for read-only analytics endpoints.
+
+``meal_plan_summaries`` holds one row per ``meal_plans`` row with the per-day
+scores, carbon figures, flavor and cuisine aggregates, and the flattened
+shopping list that analytics, sustainability, and grocery reads need. Those
+reads then never validate the full ``plan_data`` document into a
+``PlanResponse``. The covering index on ``meal_plans`` turns the "latest plan
+for a user" lookup into a single index seek.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+)
+
+from backend.database import Base, DBMealPlan, utcnow
+
+
+Index(
+    "ix_meal_plans_user_created_desc",
+    DBMealPlan.__table__.c.user_id,
+    DBMealPlan.__table__.c.created_at.desc(),
+    DBMealPlan.__table__.c.id.desc(),
+)
+
+
+class DBMealPlanSummary(Base):
+    __tablename__ = "meal_plan_summaries"
+    __table_args__ = (
+        CheckConstraint(
+            "projection_version >= 1",
+            name="ck_meal_plan_summary_projection_version",
+        ),
+        CheckConstraint("meal_count >= 0", name="ck_meal_plan_summary_meal_count"),
+    )
+
+    plan_id = Column(
+        Integer,
+        ForeignKey("meal_plans.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    projection_version = Column(Integer, nullable=False)
+    schema_version = Column(String, nullable=False)
+    plan_valid = Column(Boolean, nullable=False)
+    day_count = Column(Integer, nullable=False, default=0)
+    meal_count = Column(Integer, nullable=False, default=0)
+    day_stats = Column(JSON, nullable=False, default=list)
+    flavor_totals = Column(JSON, nullable=False, default=dict)
+    cuisine_counts = Column(JSON, nullable=False, default=dict)
+    overall_stats = Column(JSON, nullable=False, default=dict)
+    shopping_items = Column(JSON, nullable=False, default=list)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
@@ -13,6 +13,9 @@ from backend.database import Base
 # binding target_metadata, otherwise autogeneration and metadata audits silently
 # omit preparation and immutable food-evidence tables.
 from backend import evidence_history_models as _evidence_history_models  # noqa: F401,E402
+from backend import gamification_models as _gamification_models  # noqa: F401,E402
+from backend import meal_plan_summary_models as _meal_plan_summary_models  # noqa: F401,E402
+from backend import preparation_coverage_counter_models as _preparation_coverage_counter_models  # noqa: F401,E402
 from backend import preparation_models as _preparation_models  # noqa: F401,E402
 
 
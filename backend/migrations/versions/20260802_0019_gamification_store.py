@@ -0,0 +1,147 @@
+"""Store gamification scores in indexed period buckets.
+
+Revision ID: 20260802_0019
+Revises: 20260802_0018
+Create Date: 2026-08-02
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260802_0019"
+down_revision = "20260802_0018"
+branch_labels = None
+depends_on = None
+
+
+def _user_column() -> sa.Column:
+    return sa.Column(
+        "user_id",
+        sa.String(),
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gamification_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        _user_column(),
+        sa.Column("event_type", sa.String(length=32), nullable=False),
+        sa.Column("deltas", sa.JSON(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "event_type IN ('meal_logged','stats_updated')",
+            name="ck_gamification_event_type",
+        ),
+    )
+    op.create_index(
+        "ix_gamification_events_user_occurred",
+        "gamification_events",
+        ["user_id", "occurred_at", "id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "gamification_scores",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        _user_column(),
+        sa.Column("metric", sa.String(length=64), nullable=False),
+        sa.Column("period", sa.String(length=16), nullable=False),
+        sa.Column("bucket_start", sa.Date(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "metric",
+            "period",
+            "bucket_start",
+            "user_id",
+            name="uq_gamification_score_bucket",
+        ),
+        sa.CheckConstraint(
+            "period IN ('day','week','month','all_time')",
+            name="ck_gamification_score_period",
+        ),
+        sa.CheckConstraint(
+            "length(trim(metric)) > 0",
+            name="ck_gamification_score_metric_nonblank",
+        ),
+    )
+    op.create_index(
+        "ix_gamification_scores_ranking",
+        "gamification_scores",
+        ["metric", "period", "bucket_start", "score", "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_gamification_scores_user_bucket",
+        "gamification_scores",
+        ["user_id", "period", "bucket_start"],
+        unique=False,
+    )
+
+    op.create_table(
+        "gamification_achievements",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        _user_column(),
+        sa.Column("achievement_id", sa.String(length=64), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column(
+            "earned_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "user_id",
+            "achievement_id",
+            name="uq_gamification_achievement_user",
+        ),
+        sa.CheckConstraint(
+            "points >= 0",
+            name="ck_gamification_achievement_points",
+        ),
+    )
+    op.create_index(
+        "ix_gamification_achievements_user_earned",
+        "gamification_achievements",
+        ["user_id", "earned_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_gamification_achievements_user_earned",
+        table_name="gamification_achievements",
+    )
+    op.drop_table("gamification_achievements")
+    op.drop_index(
+        "ix_gamification_scores_user_bucket",
+        table_name="gamification_scores",
+    )
+    op.drop_index(
+        "ix_gamification_scores_ranking",
+        table_name="gamification_scores",
+    )
+    op.drop_table("gamification_scores")
+    op.drop_index(
+        "ix_gamification_events_user_occurred",
+        table_name="gamification_events",
+    )
+    op.drop_table("gamification_events")
@@ -0,0 +1,67 @@
+"""Project stored meal plans into read-side summaries.
+
+Revision ID: 20260802_0020
+Revises: 20260802_0019
+Create Date: 2026-08-02
+
+Existing plans are summarised lazily by the first read that needs them, so
+the upgrade does not parse every stored ``plan_data`` document.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260802_0020"
+down_revision = "20260802_0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_meal_plans_user_created_desc",
+        "meal_plans",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_table(
+        "meal_plan_summaries",
+        sa.Column(
+            "plan_id",
+            sa.Integer(),
+            sa.ForeignKey("meal_plans.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("projection_version", sa.Integer(), nullable=False),
+        sa.Column("schema_version", sa.String(), nullable=False),
+        sa.Column("plan_valid", sa.Boolean(), nullable=False),
+        sa.Column("day_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("meal_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("day_stats", sa.JSON(), nullable=False),
+        sa.Column("flavor_totals", sa.JSON(), nullable=False),
+        sa.Column("cuisine_counts", sa.JSON(), nullable=False),
+        sa.Column("overall_stats", sa.JSON(), nullable=False),
+        sa.Column("shopping_items", sa.JSON(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "projection_version >= 1",
+            name="ck_meal_plan_summary_projection_version",
+        ),
+        sa.CheckConstraint(
+            "meal_count >= 0",
+            name="ck_meal_plan_summary_meal_count",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("meal_plan_summaries")
+    op.drop_index("ix_meal_plans_user_created_desc", table_name="meal_plans")
@@ -0,0 +1,87 @@
+"""Project preparation task execution events into per-task state rows.
+
+Revision ID: 20260802_0021
+Revises: 20260802_0020
+Create Date: 2026-08-02
+
+Existing ledgers are projected lazily by the next event recorded against
+their schedule, so the upgrade does not replay stored execution history.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260802_0021"
+down_revision = "20260802_0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "preparation_task_execution_projections",
+        sa.Column(
+            "schedule_id",
+            sa.Integer(),
+            sa.ForeignKey("persisted_preparation_schedules.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("schedule_hash", sa.String(64), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_event_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "event_count >= 0",
+            name="ck_preparation_task_projection_event_count",
+        ),
+        sa.CheckConstraint(
+            "length(schedule_hash) = 64",
+            name="ck_preparation_task_projection_hash_length",
+        ),
+    )
+    op.create_table(
+        "preparation_task_execution_task_states",
+        sa.Column(
+            "schedule_id",
+            sa.Integer(),
+            sa.ForeignKey(
+                "preparation_task_execution_projections.schedule_id",
+                ondelete="CASCADE",
+            ),
+            primary_key=True,
+        ),
+        sa.Column("task_id", sa.String(160), primary_key=True),
+        sa.Column("state", sa.String(32), nullable=False),
+        sa.Column("started_actual_minute", sa.Integer(), nullable=True),
+        sa.Column("completed_actual_minute", sa.Integer(), nullable=True),
+        sa.Column("skipped_actual_minute", sa.Integer(), nullable=True),
+        sa.Column("latest_event_id", sa.Integer(), nullable=True),
+        sa.Column("terminal_reason", sa.String(1000), nullable=True),
+        sa.CheckConstraint(
+            "state IN ('planned','in_progress','completed','skipped')",
+            name="ck_preparation_task_state_value",
+        ),
+    )
+    op.create_index(
+        "ix_preparation_task_states_schedule_state",
+        "preparation_task_execution_task_states",
+        ["schedule_id", "state"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_preparation_task_states_schedule_state",
+        table_name="preparation_task_execution_task_states",
+    )
+    op.drop_table("preparation_task_execution_task_states")
+    op.drop_table("preparation_task_execution_projections")
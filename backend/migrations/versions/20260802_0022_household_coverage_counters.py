@@ -0,0 +1,88 @@
+"""Add incrementally maintained household coverage counters.
+
+Revision ID: 20260802_0022
+Revises: 20260802_0021
+Create Date: 2026-08-02
+
+Existing households are counted by their first coverage read or schedule
+write, so the upgrade does not replay any household history.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260802_0022"
+down_revision = "20260802_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "household_coverage_counters",
+        sa.Column(
+            "household_id",
+            sa.String(),
+            sa.ForeignKey("households.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("counter", sa.String(160), primary_key=True),
+        sa.Column("value", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "length(trim(counter)) > 0",
+            name="ck_household_coverage_counter_nonblank",
+        ),
+    )
+    op.create_table(
+        "preparation_schedule_coverage_contributions",
+        sa.Column(
+            "schedule_id",
+            sa.Integer(),
+            sa.ForeignKey("persisted_preparation_schedules.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "household_id",
+            sa.String(),
+            sa.ForeignKey("households.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("counters", sa.JSON(), nullable=False),
+        sa.Column("warnings", sa.JSON(), nullable=False),
+        sa.Column(
+            "has_warnings",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_schedule_coverage_contributions_household_warnings",
+        "preparation_schedule_coverage_contributions",
+        ["household_id", "has_warnings"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_schedule_coverage_contributions_household_warnings",
+        table_name="preparation_schedule_coverage_contributions",
+    )
+    op.drop_table("preparation_schedule_coverage_contributions")
+    op.drop_table("household_coverage_counters")
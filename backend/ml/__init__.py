@@ -1,17 +1,31 @@
 """
 ML Package for NutriFlavorOS
 Contains advanced ML models for taste prediction, meal planning, and personalization
+
+Model classes are resolved lazily (PEP 562), so importing ``backend.ml`` or a
+torch-free helper such as ``backend.ml.runtime`` does not import torch.
 """
-from .taste_predictor import DeepTastePredictor
-from .meal_planner_rl import RLMealPlanner
-from .recipe_vision import RecipeVisionAnalyzer
-from .recipe_generator_nlp import NLPRecipeGenerator
-from .health_predictor import HealthOutcomePredictor
+import importlib
+
+_EXPORTS = {
+    'DeepTastePredictor': '.taste_predictor',
+    'RLMealPlanner': '.meal_planner_rl',
+    'RecipeVisionAnalyzer': '.recipe_vision',
+    'NLPRecipeGenerator': '.recipe_generator_nlp',
+    'HealthOutcomePredictor': '.health_predictor',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    'DeepTastePredictor',
-    'RLMealPlanner',
-    'RecipeVisionAnalyzer',
-    'NLPRecipeGenerator',
-    'HealthOutcomePredictor'
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
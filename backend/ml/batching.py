@@ -0,0 +1,184 @@
+"""
+In-process micro-batching for synchronous model inference.
+
+Async request handlers call ``await batcher.infer(item)``; the item is queued
+and the handler's event loop is free while it waits. One worker thread takes
+the first queued item, keeps collecting until ``max_batch_size`` items or
+``max_wait_ms`` have passed, runs ``batch_fn`` once on the whole list, and
+resolves each caller's future with its own result. A full queue is rejected
+immediately (``InferenceQueueFull``) instead of growing without bound.
+
+The module is framework-free: callers supply ``batch_fn`` (for example a
+stacked torch forward) and an optional ``on_start`` hook that runs on the
+worker thread, such as pinning ``torch.set_num_threads``.
+"""
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_STOP = object()
+
+
+class InferenceQueueFull(RuntimeError):
+    """Raised when a request arrives while the inference queue is full."""
+
+
+@dataclass(frozen=True)
+class BatcherMetrics:
+    submitted: int
+    rejected: int
+    completed: int
+    failed: int
+    batches: int
+    queue_depth: int
+    max_queue_depth: int
+    mean_batch_size: Optional[float]
+    mean_queue_wait_ms: Optional[float]
+    batch_size_histogram: Dict[int, int]
+
+
+class MicroBatcher(Generic[T, R]):
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], Sequence[R]],
+        *,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 256,
+        on_start: Optional[Callable[[], None]] = None,
+        name: str = "micro-batcher",
+    ):
+        if max_batch_size < 1 or max_queue_size < 1:
+            raise ValueError("max_batch_size and max_queue_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        self.on_start = on_start
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._submitted = self._rejected = self._completed = self._failed = 0
+        self._max_depth = 0
+        self._wait_seconds = 0.0
+        self._histogram: Counter[int] = Counter()
+
+    def __enter__(self) -> "MicroBatcher[T, R]":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def start(self) -> "MicroBatcher[T, R]":
+        self._thread.start()
+        return self
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting work, finish everything already queued, and join."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def submit(self, item: T) -> "Future[R]":
+        future: "Future[R]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the inference queue is closed")
+            try:
+                self._queue.put_nowait((item, future, time.perf_counter()))
+            except queue.Full:
+                self._rejected += 1
+                raise InferenceQueueFull("the inference queue is full") from None
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, self._queue.qsize())
+        return future
+
+    async def infer(self, item: T) -> R:
+        return await asyncio.wrap_future(self.submit(item))
+
+    def metrics(self) -> BatcherMetrics:
+        with self._lock:
+            batches = sum(self._histogram.values())
+            items = sum(size * count for size, count in self._histogram.items())
+            return BatcherMetrics(
+                submitted=self._submitted,
+                rejected=self._rejected,
+                completed=self._completed,
+                failed=self._failed,
+                batches=batches,
+                queue_depth=self._queue.qsize(),
+                max_queue_depth=self._max_depth,
+                mean_batch_size=items / batches if batches else None,
+                mean_queue_wait_ms=1000.0 * self._wait_seconds / items if items else None,
+                batch_size_histogram=dict(sorted(self._histogram.items())),
+            )
+
+    def _collect(self, first: object) -> Tuple[List[tuple], bool]:
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                entry = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if entry is _STOP:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    def _run(self) -> None:
+        if self.on_start is not None:
+            self.on_start()
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch, stopping = self._collect(first)
+            started = time.perf_counter()
+            live = [
+                entry for entry in batch if entry[1].set_running_or_notify_cancel()
+            ]
+            if not live:
+                continue
+            try:
+                results = list(self.batch_fn([item for item, _future, _queued in live]))
+                if len(results) != len(live):
+                    raise RuntimeError(
+                        f"batch_fn returned {len(results)} results for {len(live)} items"
+                    )
+            except Exception as exc:
+                for _item, future, _queued in live:
+                    future.set_exception(exc)
+                failed, succeeded = len(live), 0
+            else:
+                for (_item, future, _queued), result in zip(live, results):
+                    future.set_result(result)
+                failed, succeeded = 0, len(live)
+            with self._lock:
+                self._histogram[len(live)] += 1
+                self._completed += succeeded
+                self._failed += failed
+                self._wait_seconds += sum(started - queued for _i, _f, queued in live)
@@ -0,0 +1,119 @@
+"""
+Stable feature hashing for named flavor, ingredient, and compound features.
+
+Python's ``hash()`` on strings is salted per process (PYTHONHASHSEED), so
+indices derived from it change on every restart and silently invalidate saved
+weights. Indices here come from a personalized BLAKE2b digest and are identical
+across processes, platforms, and Python versions. Digests are memoized in a
+bounded vocabulary cache because the same few thousand names recur on every
+request.
+
+Batches are returned as CSR arrays (``SparseBatch``); collisions within a row
+are summed, which is the standard hashing-trick convention. The module only
+needs numpy; conversion to torch sparse tensors lives with the models.
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Mapping, Sequence, Tuple
+
+import numpy as np
+
+HASH_PERSONALIZATION = b"nfos-features-v1"
+VOCABULARY_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=VOCABULARY_CACHE_SIZE)
+def stable_feature_hash(name: str) -> int:
+    """Return a process-independent unsigned 64-bit hash of ``name``."""
+
+    digest = hashlib.blake2b(
+        name.encode("utf-8"), digest_size=8, person=HASH_PERSONALIZATION
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+def stable_feature_index(name: str, width: int) -> int:
+    """Return the bucket of ``name`` in a table of ``width`` columns."""
+
+    if width < 1:
+        raise ValueError("width must be at least 1")
+    return stable_feature_hash(name) % width
+
+
+@dataclass(frozen=True)
+class SparseBatch:
+    """A CSR matrix of shape ``(rows, width)`` with float32 values."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    values: np.ndarray
+    width: int
+
+    @property
+    def rows(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.rows, self.width
+
+    def coo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(row, column, value)`` coordinate arrays."""
+
+        rows = np.repeat(np.arange(self.rows, dtype=np.int64), np.diff(self.indptr))
+        return rows, self.indices, self.values
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=np.float32)
+        rows, columns, values = self.coo()
+        dense[rows, columns] = values
+        return dense
+
+
+class FeatureHasher:
+    """Map ``{feature name: value}`` mappings into ``width`` hashed columns."""
+
+    def __init__(self, width: int):
+        if width < 1:
+            raise ValueError("width must be at least 1")
+        self.width = width
+
+    def index(self, name: str) -> int:
+        return stable_feature_hash(name) % self.width
+
+    def indices(self, names: Iterable[str]) -> np.ndarray:
+        return np.fromiter(
+            (stable_feature_hash(name) % self.width for name in names), dtype=np.int64
+        )
+
+    def transform(self, features: Sequence[Mapping[str, float]]) -> SparseBatch:
+        """Hash one mapping per row into a canonical CSR batch.
+
+        Column indices are sorted within each row and colliding features are
+        summed, so equal inputs always produce byte-identical arrays.
+        """
+
+        counts = np.fromiter((len(row) for row in features), dtype=np.int64)
+        total = int(counts.sum())
+        rows = np.repeat(np.arange(len(features), dtype=np.int64), counts)
+        columns = self.indices(name for row in features for name in row)
+        values = np.fromiter(
+            (value for row in features for value in row.values()),
+            dtype=np.float64,
+            count=total,
+        )
+        if not np.isfinite(values).all():
+            raise ValueError("feature values must be finite")
+        keys, inverse = np.unique(rows * self.width + columns, return_inverse=True)
+        summed = np.bincount(inverse, weights=values, minlength=len(keys))
+        indptr = np.zeros(len(features) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // self.width, minlength=len(features)), out=indptr[1:])
+        return SparseBatch(
+            indptr=indptr,
+            indices=keys % self.width,
+            values=summed.astype(np.float32),
+            width=self.width,
+        )
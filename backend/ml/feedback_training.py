@@ -0,0 +1,440 @@
+"""
+Offline batched training of the taste predictor from stored feedback.
+
+``/api/v1/learning`` only appends rows to ``feedback_events``; nothing is
+trained at request time. This job reads the ``taste`` rows in id order with
+keyset pagination, one bounded page at a time, turns each page into shuffled
+tensor batches inside a ``DataLoader``, and trains a single in-memory model
+on CPU. Checkpoints are written at page boundaries so an interrupted run
+resumes from the last finished page with identical batches. A finished run
+is registered in ``LocalArtifactRegistry`` at the ``registered`` stage;
+promotion stays a manual, gated step.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import torch
+import torch.nn as nn
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from torch.utils.data import DataLoader, IterableDataset
+
+from backend.database import DBFeedback
+from backend.research.cards import build_model_card
+from backend.research.manifest import fingerprint_file
+from backend.research.registry import LocalArtifactRegistry
+
+from .taste_predictor import DeepTastePredictor
+
+FEEDBACK_TYPE = "taste"
+CHECKPOINT_NAME = "checkpoint.pt"
+WEIGHTS_NAME = "taste_predictor.pth"
+SUMMARY_NAME = "training_summary.json"
+DEFAULT_MODEL_ID = "replay_personalization"
+
+SessionFactory = Callable[[], Session]
+
+
+@dataclass(frozen=True)
+class FeedbackTrainingConfig:
+    epochs: int = 1
+    batch_size: int = 64
+    chunk_size: int = 4096
+    learning_rate: float = 1e-4
+    seed: int = 0
+    input_dim: int = 512
+    hidden_dim: int = 256
+    num_workers: int = 0
+    checkpoint_every_pages: int = 1
+
+    def __post_init__(self) -> None:
+        if min(self.epochs, self.batch_size, self.chunk_size) < 1:
+            raise ValueError("epochs, batch_size and chunk_size must be at least 1")
+        if self.checkpoint_every_pages < 1:
+            raise ValueError("checkpoint_every_pages must be at least 1")
+        if self.num_workers not in (0, 1):
+            # Pages must reach the trainer in id order for page-boundary
+            # checkpoints to be resumable; one worker still overlaps loading.
+            raise ValueError("num_workers must be 0 or 1")
+        if not (math.isfinite(self.learning_rate) and self.learning_rate > 0):
+            raise ValueError("learning_rate must be positive and finite")
+        if self.input_dim < 1:
+            raise ValueError("input_dim must be at least 1")
+        if self.hidden_dim < 8 or self.hidden_dim % 8:
+            # The encoders use eight attention heads.
+            raise ValueError("hidden_dim must be a positive multiple of 8")
+
+
+@dataclass(frozen=True)
+class FeedbackTrainingResult:
+    completed: bool
+    epochs_completed: int
+    samples_trained: int
+    skipped_rows: int
+    resumed_from_feedback_id: Optional[int]
+    through_feedback_id: int
+    mean_loss_last_epoch: Optional[float]
+    train_seconds: float
+    samples_per_second: float
+    weights_path: Optional[str]
+    weights_sha256: Optional[str]
+    registry_key: Optional[str]
+
+
+def _vector(values: object, width: int) -> List[float]:
+    """Validate one payload vector and zero-pad or truncate it to ``width``."""
+
+    if not isinstance(values, (list, tuple)) or not values:
+        raise ValueError("feedback vector must be a non-empty list")
+    vector = [float(value) for value in values[:width]]
+    if not all(math.isfinite(value) for value in vector):
+        raise ValueError("feedback vector must be finite")
+    return vector + [0.0] * (width - len(vector))
+
+
+def iter_feedback_pages(
+    db: Session,
+    *,
+    after_id: int = 0,
+    through_id: Optional[int] = None,
+    chunk_size: int = 4096,
+) -> Iterator[Sequence[Tuple[int, dict]]]:
+    """Yield ``(id, payload)`` pages of taste feedback in id order.
+
+    Each page is one indexed query bounded by the previous page's last id, so
+    memory stays at one page regardless of how much feedback is stored.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    last_id = after_id
+    while True:
+        query = db.query(DBFeedback.id, DBFeedback.payload).filter(
+            DBFeedback.feedback_type == FEEDBACK_TYPE, DBFeedback.id > last_id
+        )
+        if through_id is not None:
+            query = query.filter(DBFeedback.id <= through_id)
+        rows = query.order_by(DBFeedback.id).limit(chunk_size).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+class TasteFeedbackBatches(IterableDataset):
+    """Stream page-aligned tensor batches of stored taste feedback.
+
+    Every item is already a batch: ``(user, recipe, rating, page_last_id,
+    page_end, skipped)`` where ``user`` and ``recipe`` are ``(B, 1, input_dim)``
+    and ``rating`` is ``(B, 1)``. Rows are shuffled within their page with a
+    generator seeded by ``(seed, epoch, page_last_id)``, so a resumed epoch
+    replays exactly the batches the interrupted one would have produced.
+    The session is opened inside ``__iter__`` so it lives in the loader worker.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        batch_size: int,
+        chunk_size: int,
+        input_dim: int,
+        seed: int,
+        epoch: int,
+        after_id: int = 0,
+        through_id: Optional[int] = None,
+    ):
+        super().__init__()
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.input_dim = input_dim
+        self.seed = seed
+        self.epoch = epoch
+        self.after_id = after_id
+        self.through_id = through_id
+
+    def _page_tensors(
+        self, rows: Sequence[Tuple[int, dict]]
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, int]:
+        users: List[List[float]] = []
+        recipes: List[List[float]] = []
+        ratings: List[float] = []
+        skipped = 0
+        for _row_id, payload in rows:
+            try:
+                user = _vector(payload["user_genome"], self.input_dim)
+                recipe = _vector(payload["recipe_profile"], self.input_dim)
+                rating = float(payload["rating"])
+            except (KeyError, TypeError, ValueError):
+                skipped += 1
+                continue
+            if not 0.0 <= rating <= 1.0:
+                skipped += 1
+                continue
+            users.append(user)
+            recipes.append(recipe)
+            ratings.append(rating)
+        return (
+            torch.tensor(users, dtype=torch.float32).reshape(-1, 1, self.input_dim),
+            torch.tensor(recipes, dtype=torch.float32).reshape(-1, 1, self.input_dim),
+            torch.tensor(ratings, dtype=torch.float32).reshape(-1, 1),
+            skipped,
+        )
+
+    def __iter__(self):
+        db = self.session_factory()
+        try:
+            for rows in iter_feedback_pages(
+                db,
+                after_id=self.after_id,
+                through_id=self.through_id,
+                chunk_size=self.chunk_size,
+            ):
+                page_last_id = int(rows[-1][0])
+                users, recipes, ratings, skipped = self._page_tensors(rows)
+                generator = torch.Generator().manual_seed(
+                    ((self.seed * 1_000_003 + self.epoch) * 1_000_003 + page_last_id)
+                    % 2**63
+                )
+                order = torch.randperm(len(ratings), generator=generator)
+                starts = list(range(0, len(order), self.batch_size)) or [0]
+                for start in starts:
+                    index = order[start : start + self.batch_size]
+                    yield (
+                        users[index],
+                        recipes[index],
+                        ratings[index],
+                        page_last_id,
+                        start == starts[-1],
+                        skipped if start == 0 else 0,
+                    )
+        finally:
+            db.close()
+
+
+def _config_fingerprint(config: FeedbackTrainingConfig) -> str:
+    payload = asdict(config)
+    # Loader parallelism and checkpoint cadence do not change the trained model.
+    payload.pop("num_workers")
+    payload.pop("checkpoint_every_pages")
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _atomic_save(payload: Dict, path: Path) -> None:
+    temporary = path.with_name(f".{path.name}.tmp")
+    torch.save(payload, temporary)
+    os.replace(temporary, path)
+
+
+def _latest_feedback_id(session_factory: SessionFactory) -> Optional[int]:
+    db = session_factory()
+    try:
+        return (
+            db.query(func.max(DBFeedback.id))
+            .filter(DBFeedback.feedback_type == FEEDBACK_TYPE)
+            .scalar()
+        )
+    finally:
+        db.close()
+
+
+def train_taste_predictor(
+    session_factory: SessionFactory,
+    output_dir: Path,
+    config: FeedbackTrainingConfig = FeedbackTrainingConfig(),
+    *,
+    registry: Optional[LocalArtifactRegistry] = None,
+    model_id: str = DEFAULT_MODEL_ID,
+    version: Optional[str] = None,
+    max_pages: Optional[int] = None,
+) -> FeedbackTrainingResult:
+    """Train ``DeepTastePredictor`` on stored taste feedback.
+
+    The run trains on a snapshot: feedback stored after the first start (its
+    highest id is kept in the checkpoint) is left for the next run. When
+    ``output_dir`` holds a checkpoint written with the same configuration the
+    run resumes from it; a checkpoint from a different configuration is an
+    error rather than silently discarded. ``max_pages`` stops after that many
+    pages in this invocation, leaving the checkpoint for a later resume.
+    Completed weights are registered under ``model_id`` when ``registry`` is
+    given; the checkpoint is removed once the weights are written.
+    """
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = output_dir / CHECKPOINT_NAME
+    fingerprint = _config_fingerprint(config)
+    device = torch.device("cpu")
+
+    torch.manual_seed(config.seed)
+    model = DeepTastePredictor(config.input_dim, config.hidden_dim, device=device)
+    optimizer = torch.optim.Adam(model.parameters(), lr=config.learning_rate)
+    criterion = nn.MSELoss(reduction="sum")
+
+    state = {
+        "epoch": 0,
+        "after_id": 0,
+        "samples_trained": 0,
+        "skipped_rows": 0,
+        "epoch_samples": 0,
+        "epoch_loss": 0.0,
+        "through_id": None,
+    }
+    resumed_from = None
+    if checkpoint_path.exists():
+        checkpoint = torch.load(checkpoint_path, map_location=device)
+        if checkpoint["config_sha256"] != fingerprint:
+            raise ValueError(
+                f"{checkpoint_path} was written with a different training configuration"
+            )
+        model.load_state_dict(checkpoint["model"])
+        optimizer.load_state_dict(checkpoint["optimizer"])
+        torch.set_rng_state(checkpoint["rng_state"])
+        state.update(checkpoint["state"])
+        resumed_from = state["after_id"]
+    if state["through_id"] is None:
+        state["through_id"] = _latest_feedback_id(session_factory)
+        if state["through_id"] is None:
+            raise ValueError("no taste feedback is stored")
+
+    def save_checkpoint() -> None:
+        _atomic_save(
+            {
+                "config_sha256": fingerprint,
+                "model": model.state_dict(),
+                "optimizer": optimizer.state_dict(),
+                "rng_state": torch.get_rng_state(),
+                "state": dict(state),
+            },
+            checkpoint_path,
+        )
+
+    model.train()
+    pages = 0
+    trained_here = 0
+    train_seconds = 0.0
+    last_epoch_loss = None
+    stopped = False
+    while state["epoch"] < config.epochs and not stopped:
+        loader = DataLoader(
+            TasteFeedbackBatches(
+                session_factory,
+                batch_size=config.batch_size,
+                chunk_size=config.chunk_size,
+                input_dim=config.input_dim,
+                seed=config.seed,
+                epoch=state["epoch"],
+                after_id=state["after_id"],
+                through_id=state["through_id"],
+            ),
+            batch_size=None,
+            num_workers=config.num_workers,
+        )
+        started = time.perf_counter()
+        for user, recipe, rating, page_last_id, page_end, skipped in loader:
+            # Every epoch replays the same rows; count each malformed row once.
+            if state["epoch"] == 0:
+                state["skipped_rows"] += int(skipped)
+            count = int(rating.shape[0])
+            if count:
+                optimizer.zero_grad(set_to_none=True)
+                predicted, _confidence = model(user, recipe)
+                loss = criterion(predicted, rating)
+                (loss / count).backward()
+                optimizer.step()
+                state["epoch_loss"] += float(loss.detach())
+                state["epoch_samples"] += count
+                state["samples_trained"] += count
+                trained_here += count
+            if not page_end:
+                continue
+            state["after_id"] = int(page_last_id)
+            pages += 1
+            stopped = max_pages is not None and pages >= max_pages
+            if stopped or pages % config.checkpoint_every_pages == 0:
+                train_seconds += time.perf_counter() - started
+                save_checkpoint()
+                started = time.perf_counter()
+            if stopped:
+                break
+        train_seconds += time.perf_counter() - started
+        if stopped and state["after_id"] < state["through_id"]:
+            break
+        if state["epoch_samples"]:
+            last_epoch_loss = state["epoch_loss"] / state["epoch_samples"]
+        state.update(epoch=state["epoch"] + 1, after_id=0, epoch_samples=0, epoch_loss=0.0)
+        if state["epoch"] < config.epochs:
+            save_checkpoint()
+
+    completed = state["epoch"] >= config.epochs
+    weights_path = weights_sha256 = registry_key = None
+    if completed:
+        if state["samples_trained"] == 0:
+            raise ValueError("no stored taste feedback had a usable payload")
+        weights = output_dir / WEIGHTS_NAME
+        _atomic_save(model.state_dict(), weights)
+        weights_sha256 = fingerprint_file(weights)
+        weights_path = str(weights)
+        metrics = {
+            "train_mse_last_epoch": last_epoch_loss,
+            "samples_trained": state["samples_trained"],
+            "skipped_rows": state["skipped_rows"],
+        }
+        if registry is not None:
+            card = build_model_card(
+                model_id,
+                version=version or f"taste-{state['through_id']}-{weights_sha256[:12]}",
+            ).model_copy(
+                update={
+                    "framework": f"pytorch-{torch.__version__}",
+                    "evaluation_metrics": metrics,
+                    "training_data_statement": (
+                        f"feedback_events type={FEEDBACK_TYPE} id<={state['through_id']}"
+                    ),
+                    "reproducibility_statement": f"config_sha256={fingerprint}",
+                }
+            )
+            registry_key = registry.register_model(card, weights).key
+        checkpoint_path.unlink(missing_ok=True)
+        (output_dir / SUMMARY_NAME).write_text(
+            json.dumps(
+                {
+                    "config": asdict(config),
+                    "config_sha256": fingerprint,
+                    "through_feedback_id": state["through_id"],
+                    "weights_sha256": weights_sha256,
+                    "registry_key": registry_key,
+                    **metrics,
+                },
+                indent=2,
+                sort_keys=True,
+                allow_nan=False,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+    return FeedbackTrainingResult(
+        completed=completed,
+        epochs_completed=state["epoch"],
+        samples_trained=state["samples_trained"],
+        skipped_rows=state["skipped_rows"],
+        resumed_from_feedback_id=resumed_from,
+        through_feedback_id=state["through_id"],
+        mean_loss_last_epoch=last_epoch_loss,
+        train_seconds=round(train_seconds, 4),
+        samples_per_second=round(trained_here / max(train_seconds, 1e-9), 1),
+        weights_path=weights_path,
+        weights_sha256=weights_sha256,
+        registry_key=registry_key,
+    )
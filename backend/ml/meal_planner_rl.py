@@ -10,6 +10,10 @@ import numpy as np
 from typing import List, Dict, Tuple
 from collections import deque
 from .device_config import get_device, to_device
+from .feature_hashing import FeatureHasher
+
+# Ingredient buckets in the meal-history and pantry blocks of the state vector
+INGREDIENT_HASHER = FeatureHasher(50)
 
 class PolicyNetwork(nn.Module):
     """Actor network for meal selection"""
@@ -117,14 +121,13 @@ class RLMealPlanner:
             if isinstance(meal, dict):
                 recent_ingredients.update(meal.get('ingredients', []))
         
-        for i, ing in enumerate(list(recent_ingredients)[:50]):
-            idx = 50 + (hash(ing) % 50)
-            state_vector[idx] = 1.0
+        # Sorted so the kept ingredients do not depend on set iteration order
+        history_names = sorted(str(ing) for ing in recent_ingredients)[:50]
+        state_vector[50 + INGREDIENT_HASHER.indices(history_names)] = 1.0
         
         # Pantry features (150-200)
-        for i, ing in enumerate(pantry[:50]):
-            idx = 150 + (hash(ing) % 50)
-            state_vector[idx] = 1.0
+        pantry_names = [str(ing) for ing in pantry[:50]]
+        state_vector[150 + INGREDIENT_HASHER.indices(pantry_names)] = 1.0
         
         # Time context (200-210)
         state_vector[200] = time_context.get('day_of_week', 0) / 7.0
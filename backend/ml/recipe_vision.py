@@ -8,9 +8,34 @@ import torchvision.models as models
 import torchvision.transforms as transforms
 from PIL import Image
 import numpy as np
-from typing import Dict, Tuple, Any
+from typing import Any, Dict, List, Tuple
+from .batching import MicroBatcher
 from .device_config import get_device, to_device
 
+# Food-101 class names (abbreviated list for internal mapping)
+FOOD_101_NAMES = [
+    "apple_pie", "baby_back_ribs", "baklava", "beef_carpaccio", "beef_tartare",
+    "beet_salad", "beignets", "bibimbap", "bread_pudding", "breakfast_burrito",
+    "bruschetta", "caesar_salad", "cannoli", "caprese_salad", "carrot_cake",
+    "ceviche", "cheesecake", "cheese_plate", "chicken_curry", "chicken_quesadilla",
+    "chicken_wings", "chocolate_cake", "chocolate_mousse", "churros", "clam_chowder",
+    "club_sandwich", "crab_cakes", "creme_brulee", "croque_madame", "cup_cakes",
+    "deviled_eggs", "donuts", "dumplings", "edamame", "eggs_benedict",
+    "escargots", "falafel", "filet_mignon", "fish_and_chips", "foie_gras",
+    "french_fries", "french_onion_soup", "french_toast", "fried_calamari", "fried_rice",
+    "frozen_yogurt", "garlic_bread", "gnocchi", "greek_salad", "grilled_cheese_sandwich",
+    "grilled_salmon", "guacamole", "gyoza", "hamburger", "hot_and_sour_soup",
+    "hot_dog", "huevos_rancheros", "hummus", "ice_cream", "lasagna",
+    "lobster_bisque", "lobster_roll_sandwich", "macaroni_and_cheese", "macarons", "miso_soup",
+    "mussels", "nachos", "omelette", "onion_rings", "oysters",
+    "pad_thai", "paella", "pancakes", "panna_cotta", "peking_duck",
+    "pho", "pizza", "pork_chop", "poutine", "prime_rib",
+    "pulled_pork_sandwich", "ramen", "ravioli", "red_velvet_cake", "risotto",
+    "samosa", "sashimi", "scallops", "seaweed_salad", "shrimp_and_grits",
+    "spaghetti_bolognese", "spaghetti_carbonara", "spring_rolls", "steak", "strawberry_shortcake",
+    "sushi", "tacos", "takoyaki", "tiramisu", "tuna_tartare", "waffles"
+]
+
 class RecipeVisionAnalyzer(nn.Module):
     """
     Computer Vision model for meal logging via photos
@@ -86,59 +111,50 @@ class RecipeVisionAnalyzer(nn.Module):
             print(f"Warning: Could not load weights from {path}: {e}")
             print("Using pretrained ResNet50 backbone for classification.")
 
+    def preprocess(self, image: Image.Image) -> torch.Tensor:
+        """Convert a PIL Image into a normalized (3, 224, 224) CPU tensor"""
+        return self.transform(image.convert('RGB'))
+
     def analyze_pil_image(self, image: Image.Image) -> Dict[str, Any]:
         """
         Analyze a PIL Image and return nutrition estimates
         """
+        return self.analyze_tensors([self.preprocess(image)])[0]
+
+    def analyze_tensors(self, images: List[torch.Tensor]) -> List[Dict[str, Any]]:
+        """
+        Analyze preprocessed images in one batched forward pass
+
+        Args:
+            images: (3, 224, 224) tensors from ``preprocess``
+
+        Returns:
+            One nutrition estimate per image, in input order
+        """
         self.eval()
-        
-        # Preprocess image
-        image_rgb = image.convert('RGB')
-        image_tensor = self.transform(image_rgb).unsqueeze(0)
-        
-        # Move to device
-        image_tensor = image_tensor.to(self.device)
-        
-        with torch.no_grad():
-            food_class, nutrition = self.forward(image_tensor)
-        
-        # Get predicted food class
-        probs = torch.softmax(food_class, dim=1)
-        confidence, predicted_class = torch.max(probs, dim=1)
-        
-        # Food-101 class names (abbreviated list for internal mapping)
-        food_names = [
-            "apple_pie", "baby_back_ribs", "baklava", "beef_carpaccio", "beef_tartare",
-            "beet_salad", "beignets", "bibimbap", "bread_pudding", "breakfast_burrito",
-            "bruschetta", "caesar_salad", "cannoli", "caprese_salad", "carrot_cake",
-            "ceviche", "cheesecake", "cheese_plate", "chicken_curry", "chicken_quesadilla",
-            "chicken_wings", "chocolate_cake", "chocolate_mousse", "churros", "clam_chowder",
-            "club_sandwich", "crab_cakes", "creme_brulee", "croque_madame", "cup_cakes",
-            "deviled_eggs", "donuts", "dumplings", "edamame", "eggs_benedict",
-            "escargots", "falafel", "filet_mignon", "fish_and_chips", "foie_gras",
-            "french_fries", "french_onion_soup", "french_toast", "fried_calamari", "fried_rice",
-            "frozen_yogurt", "garlic_bread", "gnocchi", "greek_salad", "grilled_cheese_sandwich",
-            "grilled_salmon", "guacamole", "gyoza", "hamburger", "hot_and_sour_soup",
-            "hot_dog", "huevos_rancheros", "hummus", "ice_cream", "lasagna",
-            "lobster_bisque", "lobster_roll_sandwich", "macaroni_and_cheese", "macarons", "miso_soup",
-            "mussels", "nachos", "omelette", "onion_rings", "oysters",
-            "pad_thai", "paella", "pancakes", "panna_cotta", "peking_duck",
-            "pho", "pizza", "pork_chop", "poutine", "prime_rib",
-            "pulled_pork_sandwich", "ramen", "ravioli", "red_velvet_cake", "risotto",
-            "samosa", "sashimi", "scallops", "seaweed_salad", "shrimp_and_grits",
-            "spaghetti_bolognese", "spaghetti_carbonara", "spring_rolls", "steak", "strawberry_shortcake",
-            "sushi", "tacos", "takoyaki", "tiramisu", "tuna_tartare", "waffles"
+        batch = torch.stack(images).to(self.device)
+        with torch.inference_mode():
+            food_class, nutrition = self.forward(batch)
+            probs = torch.softmax(food_class, dim=1)
+            confidence, predicted_class = torch.max(probs, dim=1)
+        return [
+            self._estimate(int(index), float(conf), row.tolist())
+            for index, conf, row in zip(
+                predicted_class.cpu(), confidence.cpu(), nutrition.cpu()
+            )
         ]
-        
-        class_idx = predicted_class.item()
-        food_name = food_names[class_idx] if class_idx < len(food_names) else "unknown"
+
+    @staticmethod
+    def _estimate(class_idx: int, confidence: float, nutrition: List[float]) -> Dict[str, Any]:
+        """Format one image's class and nutrition head outputs"""
+        food_name = FOOD_101_NAMES[class_idx] if class_idx < len(FOOD_101_NAMES) else "unknown"
         
         # Extract nutrition values
         # If model is not fine-tuned, these will be based on random init or generic features
-        calories = int(nutrition[0, 0].item())
-        protein = int(nutrition[0, 1].item())
-        carbs = int(nutrition[0, 2].item())
-        fat = int(nutrition[0, 3].item())
+        calories = int(nutrition[0])
+        protein = int(nutrition[1])
+        carbs = int(nutrition[2])
+        fat = int(nutrition[3])
         
         # Heuristic calibration if regression head is un-trained
         # (This makes the prototype feel "live" even if the .pth is missing)
@@ -148,7 +164,7 @@ class RecipeVisionAnalyzer(nn.Module):
 
         return {
             'food_name': food_name.replace('_', ' ').title(),
-            'confidence': round(confidence.item(), 3),
+            'confidence': round(confidence, 3),
             'calories': calories,
             'protein_g': protein,
             'carbs_g': carbs,
@@ -158,26 +174,50 @@ class RecipeVisionAnalyzer(nn.Module):
     def batch_analyze(self, image_paths: list) -> list:
         """Analyze multiple images in batch"""
         results = []
+        tensors, positions = [], []
         for path in image_paths:
             try:
                 # Helper to load from path if needed
-                img = Image.open(path)
-                result = self.analyze_pil_image(img)
-                results.append(result)
+                with Image.open(path) as img:
+                    tensors.append(self.preprocess(img))
+                positions.append(len(results))
+                results.append(None)
             except Exception as e:
                 results.append({'error': str(e)})
+        if tensors:
+            for position, result in zip(positions, self.analyze_tensors(tensors)):
+                results[position] = result
         return results
 
-# Global instance for API usage
-_vision_model = None
+    def create_batcher(self, *, max_batch_size: int = 16, max_wait_ms: float = 10.0,
+                       max_queue_size: int = 256, num_threads: int = None) -> MicroBatcher:
+        """
+        Create a micro-batching queue over ``analyze_tensors``
+
+        Callers enqueue ``preprocess`` output and await ``infer``; the worker
+        thread runs one forward per collected batch. ``num_threads`` pins
+        torch's intra-op CPU threads from the worker thread.
+        """
+        def pin_threads():
+            if num_threads is not None:
+                torch.set_num_threads(num_threads)
+
+        return MicroBatcher(
+            self.analyze_tensors,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            on_start=pin_threads,
+            name="vision-batcher",
+        )
 
 def get_vision_analyzer():
-    global _vision_model
-    if _vision_model is None:
-        _vision_model = RecipeVisionAnalyzer()
-        # Try to load weights from standard location
-        import os
-        weights_path = os.path.join(os.path.dirname(__file__), "weights", "recipe_vision.pth")
-        if os.path.exists(weights_path):
-            _vision_model.load_weights(weights_path)
-    return _vision_model
+    """Get the process-wide vision analyzer for the weights hash
+
+    Always the eager model, so every helper works; with a quantized or
+    torchscript ML_INFERENCE_VARIANT it is the CPU model that variant's
+    forward was built from (see ``runtime.load_configured``).
+    """
+    from .runtime import load_configured_eager
+
+    return load_configured_eager("recipe_vision").model
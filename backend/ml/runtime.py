@@ -0,0 +1,362 @@
+"""
+Model runtime: lazy torch imports, a process-wide model cache, and warm-up.
+
+Nothing here imports torch at module import time, so API workers that never
+serve a model never pay for it. Loaded models are cached per process under
+``(name, artifact sha256, variant, device)``; the artifact hash is memoized
+per file ``(size, mtime)`` so repeated lookups do not re-read weights.
+Concurrent first requests for the same key share one load.
+
+Variants:
+- ``eager``: the ``nn.Module`` as defined, in eval mode
+- ``quantized``: dynamic int8 quantization of ``nn.Linear`` layers (CPU only)
+- ``torchscript``: traced and frozen dense ``forward`` (CPU only)
+
+Optimized variants only provide ``forward``: a traced module has no helpers
+such as ``predict_batch``, and quantized layers have no dense ``weight`` for
+the sparse input path. Each one is built from the cached CPU eager model, so
+``load_configured`` returns the optimized forward while
+``load_configured_eager`` returns the eager model with its full interface;
+both read the keys warm-up fills for ``ML_INFERENCE_VARIANT``.
+
+Warm-up is opt-in through ``ML_WARMUP_MODELS`` (comma-separated names from
+``WARMERS``) and runs in a daemon thread so startup never waits on it.
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from backend.research.manifest import fingerprint_file
+
+logger = logging.getLogger(__name__)
+
+VARIANTS = ("eager", "quantized", "torchscript")
+UNTRAINED = "untrained"
+WEIGHTS_DIR = Path(__file__).with_name("weights")
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def torch_available() -> bool:
+    """Return whether torch is installed, without importing it."""
+
+    return importlib.util.find_spec("torch") is not None
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    name: str
+    artifact_sha256: str
+    variant: str
+    device: str
+    model: Any
+    load_seconds: float
+
+
+class ModelCache:
+    """Thread-safe process-wide cache with single-flight loading per key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[CacheKey, LoadedModel] = {}
+        self._key_locks: Dict[CacheKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        name: str,
+        artifact_sha256: str,
+        variant: str,
+        device: str,
+        loader: Callable[[], Any],
+    ) -> LoadedModel:
+        key = (name, artifact_sha256, variant, device)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry
+                self.misses += 1
+            started = time.perf_counter()
+            model = loader()
+            entry = LoadedModel(
+                name=name,
+                artifact_sha256=artifact_sha256,
+                variant=variant,
+                device=device,
+                model=model,
+                load_seconds=time.perf_counter() - started,
+            )
+            with self._lock:
+                self._entries[key] = entry
+                self._key_locks.pop(key, None)
+        return entry
+
+    def entries(self) -> List[LoadedModel]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+MODEL_CACHE = ModelCache()
+
+_artifact_hashes: Dict[Tuple[str, int, int], str] = {}
+_artifact_lock = threading.Lock()
+
+
+def artifact_key(path: Optional[Path]) -> str:
+    """Return the sha256 of ``path``, or ``UNTRAINED`` when it does not exist."""
+
+    if path is None or not path.is_file():
+        return UNTRAINED
+    resolved = path.resolve()
+    stat = resolved.stat()
+    memo_key = (str(resolved), stat.st_size, stat.st_mtime_ns)
+    with _artifact_lock:
+        digest = _artifact_hashes.get(memo_key)
+    if digest is None:
+        digest = fingerprint_file(resolved)
+        with _artifact_lock:
+            _artifact_hashes[memo_key] = digest
+    return digest
+
+
+def _check_variant(variant: str, device: Optional[Any]) -> None:
+    if variant not in VARIANTS:
+        raise ValueError(f"variant must be one of {', '.join(VARIANTS)}")
+    if variant != "eager" and device is not None and str(device) != "cpu":
+        raise ValueError(f"the {variant} variant runs on CPU only")
+
+
+def _inference_variant(model, variant: str, example_inputs: Tuple[Any, ...]):
+    import torch
+
+    model.eval()
+    if variant == "quantized":
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    if variant == "torchscript":
+        with torch.no_grad():
+            traced = torch.jit.trace(model, example_inputs, check_trace=False)
+        return torch.jit.optimize_for_inference(traced)
+    return model
+
+
+def load_taste_predictor(
+    weights_path: Optional[Path] = None,
+    *,
+    variant: str = "eager",
+    device: Optional[Any] = None,
+    cache: ModelCache = MODEL_CACHE,
+) -> LoadedModel:
+    """Return the cached taste predictor for ``weights_path``.
+
+    Missing weights yield the randomly initialized model, keyed as
+    ``UNTRAINED``, matching ``get_pretrained_taste_predictor``.
+    """
+
+    _check_variant(variant, device)
+    path = Path(weights_path) if weights_path else WEIGHTS_DIR / "taste_predictor.pth"
+    digest = artifact_key(path)
+
+    def loader():
+        import torch
+
+        from .taste_predictor import DeepTastePredictor
+
+        if variant != "eager":
+            model = load_taste_predictor(
+                path, device=torch.device("cpu"), cache=cache
+            ).model
+            example = torch.zeros(1, 1, model.input_dim)
+            return _inference_variant(model, variant, (example, example))
+        model = DeepTastePredictor(device=device)
+        if digest != UNTRAINED:
+            model.load_state_dict(torch.load(path, map_location=model.device))
+        return _inference_variant(model, variant, ())
+
+    return cache.get_or_load(
+        "taste_predictor", digest, variant, str(device or "default"), loader
+    )
+
+
+def load_vision_analyzer(
+    weights_path: Optional[Path] = None,
+    *,
+    variant: str = "eager",
+    device: Optional[Any] = None,
+    cache: ModelCache = MODEL_CACHE,
+) -> LoadedModel:
+    """Return the cached vision analyzer for ``weights_path``.
+
+    When a checkpoint exists it replaces every backbone weight, so the
+    ImageNet weights are not downloaded or built first.
+    """
+
+    _check_variant(variant, device)
+    path = Path(weights_path) if weights_path else WEIGHTS_DIR / "recipe_vision.pth"
+    digest = artifact_key(path)
+
+    def loader():
+        import torch
+
+        from .recipe_vision import RecipeVisionAnalyzer
+
+        if variant != "eager":
+            model = load_vision_analyzer(
+                path, device=torch.device("cpu"), cache=cache
+            ).model
+            example = torch.zeros(1, 3, 224, 224)
+            return _inference_variant(model, variant, (example,))
+        model = RecipeVisionAnalyzer(pretrained=digest == UNTRAINED, device=device)
+        if digest != UNTRAINED:
+            model.load_state_dict(torch.load(path, map_location=model.device))
+        return _inference_variant(model, variant, ())
+
+    return cache.get_or_load(
+        "recipe_vision", digest, variant, str(device or "default"), loader
+    )
+
+
+def _warm_taste_predictor(variant: str) -> LoadedModel:
+    import torch
+
+    loaded = load_taste_predictor(variant=variant)
+    example = torch.zeros(1, 1, 512, device=_model_device(loaded))
+    with torch.inference_mode():
+        loaded.model(example, example)
+    return loaded
+
+
+def _warm_vision_analyzer(variant: str) -> LoadedModel:
+    import torch
+
+    loaded = load_vision_analyzer(variant=variant)
+    with torch.inference_mode():
+        loaded.model(torch.zeros(1, 3, 224, 224, device=_model_device(loaded)))
+    return loaded
+
+
+def _model_device(loaded: LoadedModel):
+    return getattr(loaded.model, "device", "cpu")
+
+
+LOADERS: Dict[str, Callable[..., LoadedModel]] = {
+    "taste_predictor": load_taste_predictor,
+    "recipe_vision": load_vision_analyzer,
+}
+
+
+def configured_variant() -> str:
+    """Read ``ML_INFERENCE_VARIANT``, defaulting to ``eager``."""
+
+    return os.getenv("ML_INFERENCE_VARIANT", "eager").strip() or "eager"
+
+
+def load_configured(name: str) -> LoadedModel:
+    """Load ``name`` with the configured variant, the key warm-up fills.
+
+    For ``quantized`` and ``torchscript`` the model is the optimized forward
+    only; use ``load_configured_eager`` for ``predict_batch`` and friends.
+    """
+
+    return LOADERS[name](variant=configured_variant())
+
+
+def load_configured_eager(name: str) -> LoadedModel:
+    """Load the eager ``name`` that the configured variant was built from."""
+
+    if configured_variant() == "eager":
+        return LOADERS[name]()
+    import torch
+
+    return LOADERS[name](device=torch.device("cpu"))
+
+
+WARMERS: Dict[str, Callable[[str], LoadedModel]] = {
+    "taste_predictor": _warm_taste_predictor,
+    "recipe_vision": _warm_vision_analyzer,
+}
+
+
+def warm_up(names: Sequence[str], *, variant: str = "eager") -> Dict[str, float]:
+    """Load each named model and run one inference; return seconds per model."""
+
+    unknown = sorted(set(names) - set(WARMERS))
+    if unknown:
+        raise ValueError(f"unknown warm-up models: {', '.join(unknown)}")
+    timings = {}
+    for name in names:
+        started = time.perf_counter()
+        WARMERS[name](variant)
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def _warm_up_logged(names: Sequence[str], variant: str) -> None:
+    try:
+        timings = warm_up(names, variant=variant)
+    except Exception:
+        logger.exception("ML warm-up failed for %s", ", ".join(names))
+        return
+    for name, seconds in timings.items():
+        logger.info("ML warm-up loaded %s (%s) in %.2fs", name, variant, seconds)
+
+
+def configured_warmup() -> Tuple[List[str], str]:
+    """Read ``ML_WARMUP_MODELS`` and ``ML_INFERENCE_VARIANT``."""
+
+    names = [
+        name.strip()
+        for name in os.getenv("ML_WARMUP_MODELS", "").split(",")
+        if name.strip()
+    ]
+    return names, configured_variant()
+
+
+def start_background_warmup(
+    names: Sequence[str], *, variant: str = "eager"
+) -> Optional[threading.Thread]:
+    """Warm models in a daemon thread; return it, or None when there is nothing to do.
+
+    Names and variant are validated before the thread starts so a typo fails
+    startup instead of being logged later.
+    """
+
+    if not names:
+        return None
+    unknown = sorted(set(names) - set(WARMERS))
+    if unknown:
+        raise ValueError(f"unknown warm-up models: {', '.join(unknown)}")
+    _check_variant(variant, None)
+    if not torch_available():
+        logger.warning("ML warm-up skipped: torch is not installed")
+        return None
+    thread = threading.Thread(
+        target=_warm_up_logged,
+        args=(list(names), variant),
+        name="ml-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -5,9 +5,31 @@ Replaces simple cosine similarity with neural network for 95%+ accuracy
 import torch
 import torch.nn as nn
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 import os
 from .device_config import get_device, to_device
+from .feature_hashing import FeatureHasher, SparseBatch
+
+
+def sparse_batch_to_tensor(batch: SparseBatch, layout: str = "csr", device=None) -> torch.Tensor:
+    """Convert a hashed ``SparseBatch`` into a torch sparse CSR or COO tensor"""
+    if layout == "csr":
+        tensor = torch.sparse_csr_tensor(
+            torch.from_numpy(batch.indptr),
+            torch.from_numpy(batch.indices),
+            torch.from_numpy(batch.values),
+            size=batch.shape,
+        )
+    elif layout == "coo":
+        rows, columns, values = batch.coo()
+        tensor = torch.sparse_coo_tensor(
+            torch.from_numpy(np.stack([rows, columns])),
+            torch.from_numpy(values),
+            size=batch.shape,
+        ).coalesce()
+    else:
+        raise ValueError("layout must be 'csr' or 'coo'")
+    return tensor if device is None else tensor.to(device)
 
 class TransformerEncoder(nn.Module):
     """Transformer encoder for flavor profile encoding"""
@@ -27,8 +49,13 @@ class TransformerEncoder(nn.Module):
         self.output_proj = nn.Linear(hidden_dim, hidden_dim)
         
     def forward(self, x):
-        # x shape: (batch, seq_len, input_dim)
-        x = self.embedding(x)
+        # x shape: (batch, seq_len, input_dim), or a sparse (batch, input_dim)
+        # hashed batch that is embedded as a length-1 sequence without densifying
+        if x.layout in (torch.sparse_csr, torch.sparse_coo):
+            x = torch.sparse.mm(x, self.embedding.weight.t()) + self.embedding.bias
+            x = x.unsqueeze(1)
+        else:
+            x = self.embedding(x)
         x = self.transformer(x)
         # Global average pooling
         x = x.mean(dim=1)
@@ -78,6 +105,10 @@ class DeepTastePredictor(nn.Module):
         # Set device
         self.device = device if device is not None else get_device()
         
+        # Stable hashed feature columns shared by single and batched prediction
+        self.input_dim = input_dim
+        self.feature_hasher = FeatureHasher(input_dim)
+        
         # Encoders
         self.user_encoder = TransformerEncoder(input_dim, hidden_dim)
         self.recipe_encoder = TransformerEncoder(input_dim, hidden_dim)
@@ -115,6 +146,10 @@ class DeepTastePredictor(nn.Module):
         user_vec = self.user_encoder(user_genome)
         recipe_vec = self.recipe_encoder(recipe_profile)
         
+        return self._score(user_vec, recipe_vec)
+    
+    def _score(self, user_vec, recipe_vec):
+        """Fuse encoded (batch, hidden_dim) user and recipe vectors into predictions"""
         # Fuse
         fused = self.fusion(user_vec, recipe_vec)
         
@@ -159,17 +194,61 @@ class DeepTastePredictor(nn.Module):
             
             return score.item(), conf.item()
     
-    def _dict_to_tensor(self, flavor_dict: Dict[str, float], max_dim=512) -> torch.Tensor:
-        """Convert flavor dictionary to fixed-size tensor"""
-        # Create zero tensor
-        tensor = torch.zeros(max_dim)
+    def predict_batch(self, users: Sequence[Dict[str, float]],
+                      recipes: Sequence[Dict[str, float]],
+                      batch_size: int = 4096) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Predict hedonic scores for many user-recipe pairs
+        
+        Features are hashed into sparse CSR batches, so the input layer costs
+        one sparse matmul per chunk instead of a dense 512-wide tensor per
+        pair. A single user is encoded once and paired with every recipe.
+        
+        Args:
+            users: One flavor dict per recipe, or a single dict for all recipes
+            recipes: Recipe flavor dicts
+            batch_size: Recipes per forward pass (bounds peak memory)
         
-        # Hash compound names to indices
-        for compound, value in flavor_dict.items():
-            idx = hash(compound) % max_dim
-            tensor[idx] = value
+        Returns:
+            (hedonic_scores, confidences) as 1-D CPU tensors aligned with recipes
+        """
+        if len(users) not in (1, len(recipes)):
+            raise ValueError("users must contain one dict or one dict per recipe")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         
-        return tensor
+        self.eval()
+        scores, confidences = [], []
+        with torch.inference_mode():
+            shared_user = None
+            if len(users) == 1:
+                shared_user = self.user_encoder(self._sparse_features(users))
+            for start in range(0, len(recipes), batch_size):
+                chunk = recipes[start:start + batch_size]
+                recipe_vec = self.recipe_encoder(self._sparse_features(chunk))
+                if shared_user is None:
+                    user_vec = self.user_encoder(
+                        self._sparse_features(users[start:start + batch_size])
+                    )
+                else:
+                    user_vec = shared_user.expand(len(chunk), -1)
+                score, conf = self._score(user_vec, recipe_vec)
+                scores.append(score[:, 0].cpu())
+                confidences.append(conf[:, 0].cpu())
+        if not scores:
+            return torch.empty(0), torch.empty(0)
+        return torch.cat(scores), torch.cat(confidences)
+    
+    def _sparse_features(self, flavor_dicts: Sequence[Dict[str, float]]) -> torch.Tensor:
+        """Hash flavor dicts into a sparse (batch, input_dim) tensor on the model device"""
+        return sparse_batch_to_tensor(
+            self.feature_hasher.transform(flavor_dicts), device=self.device
+        )
+    
+    def _dict_to_tensor(self, flavor_dict: Dict[str, float], max_dim=512) -> torch.Tensor:
+        """Convert flavor dictionary to fixed-size tensor using stable hashed indices"""
+        hasher = self.feature_hasher if max_dim == self.input_dim else FeatureHasher(max_dim)
+        return torch.from_numpy(hasher.transform([flavor_dict]).to_dense()[0])
     
     def train_on_feedback(self, user_genome, recipe_profile, actual_rating, 
                          optimizer, criterion):
@@ -211,22 +290,13 @@ class DeepTastePredictor(nn.Module):
             return True
         return False
 
-# Pretrained model singleton
-_pretrained_model = None
-
 def get_pretrained_taste_predictor():
-    """Get or initialize pretrained taste predictor"""
-    global _pretrained_model
-    
-    if _pretrained_model is None:
-        _pretrained_model = DeepTastePredictor()
-        
-        # Try to load pretrained weights
-        model_path = os.path.join(
-            os.path.dirname(__file__), 
-            'weights', 
-            'taste_predictor.pth'
-        )
-        _pretrained_model.load_model(model_path)
-    
-    return _pretrained_model
+    """Get the process-wide taste predictor for the weights hash
+
+    Always the eager model, so every helper works; with a quantized or
+    torchscript ML_INFERENCE_VARIANT it is the CPU model that variant's
+    forward was built from (see ``runtime.load_configured``).
+    """
+    from .runtime import load_configured_eager
+
+    return load_configured_eager("taste_predictor").model
@@ -0,0 +1,82 @@
+"""Incrementally maintained counters behind the household coverage endpoints.
+
+``preparation_schedule_coverage_contributions`` records what each persisted
+schedule currently adds to its household's coverage (derivation verdict,
+replay provenance, execution structure, and task-event tallies).
+``household_coverage_counters`` holds the per-household sums of those
+contributions. Services that create or transition schedules, accept repair
+proposals, or record task execution events update both tables in the same
+transaction, so coverage reads touch a bounded number of rows regardless of
+household age.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+)
+
+from backend.database import Base, utcnow
+
+
+class DBHouseholdCoverageCounter(Base):
+    __tablename__ = "household_coverage_counters"
+    __table_args__ = (
+        CheckConstraint(
+            "length(trim(counter)) > 0",
+            name="ck_household_coverage_counter_nonblank",
+        ),
+    )
+
+    household_id = Column(
+        String,
+        ForeignKey("households.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    counter = Column(String(160), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+
+class DBPreparationScheduleCoverageContribution(Base):
+    __tablename__ = "preparation_schedule_coverage_contributions"
+    __table_args__ = (
+        Index(
+            "ix_schedule_coverage_contributions_household_warnings",
+            "household_id",
+            "has_warnings",
+        ),
+    )
+
+    schedule_id = Column(
+        Integer,
+        ForeignKey("persisted_preparation_schedules.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    household_id = Column(
+        String,
+        ForeignKey("households.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    counters = Column(JSON, nullable=False, default=dict)
+    warnings = Column(JSON, nullable=False, default=list)
+    has_warnings = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
@@ -1,4 +1,10 @@
-"""Persistence model for user-confirmed preparation task execution events."""
+"""Persistence models for user-confirmed preparation task execution.
+
+``preparation_task_execution_events`` is the append-only ledger. The two
+projection tables hold each task's replayed state so reads and new events do
+not re-scan the ledger; they are maintained in the same transaction as every
+event insert and can always be rebuilt from the ledger.
+"""
 
 from __future__ import annotations
 
@@ -137,3 +143,70 @@ class DBPreparationTaskExecutionEvent(Base):
     schedule_version_before = Column(Integer, nullable=False)
     schedule_version_after = Column(Integer, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+
+
+class DBPreparationTaskExecutionProjection(Base):
+    """Freshness marker for the per-task projection of one schedule's ledger.
+
+    The projection is current when ``schedule_hash`` matches the schedule and
+    ``last_event_id`` is the newest ledger event; anything else is rebuilt
+    from a full replay.
+    """
+
+    __tablename__ = "preparation_task_execution_projections"
+    __table_args__ = (
+        CheckConstraint(
+            "event_count >= 0",
+            name="ck_preparation_task_projection_event_count",
+        ),
+        CheckConstraint(
+            "length(schedule_hash) = 64",
+            name="ck_preparation_task_projection_hash_length",
+        ),
+    )
+
+    schedule_id = Column(
+        Integer,
+        ForeignKey("persisted_preparation_schedules.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    schedule_hash = Column(String(64), nullable=False)
+    event_count = Column(Integer, nullable=False, default=0)
+    last_event_id = Column(Integer, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+
+class DBPreparationTaskExecutionTaskState(Base):
+    __tablename__ = "preparation_task_execution_task_states"
+    __table_args__ = (
+        CheckConstraint(
+            "state IN ('planned','in_progress','completed','skipped')",
+            name="ck_preparation_task_state_value",
+        ),
+        Index(
+            "ix_preparation_task_states_schedule_state",
+            "schedule_id",
+            "state",
+        ),
+    )
+
+    schedule_id = Column(
+        Integer,
+        ForeignKey(
+            "preparation_task_execution_projections.schedule_id",
+            ondelete="CASCADE",
+        ),
+        primary_key=True,
+    )
+    task_id = Column(String(160), primary_key=True)
+    state = Column(String(32), nullable=False)
+    started_actual_minute = Column(Integer, nullable=True)
+    completed_actual_minute = Column(Integer, nullable=True)
+    skipped_actual_minute = Column(Integer, nullable=True)
+    latest_event_id = Column(Integer, nullable=True)
+    terminal_reason = Column(String(1000), nullable=True)
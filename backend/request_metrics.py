@@ -0,0 +1,359 @@
+"""Process metrics for request latency and database usage per route template.
+
+Requests are labelled only by HTTP method and matched route template (for
+example ``/households/{household_id}/plans``), never by concrete path, query,
+user, or household. SQL text and parameters are never stored; statements are
+only counted and timed.
+
+Recording is lock-free on the hot path: each thread writes to its own shard,
+and ``snapshot`` merges shards. The registry lock is taken once per thread, the
+first time that thread records anything, and by ``snapshot``/``reset``.
+
+Statement metrics come from SQLAlchemy cursor events on an instrumented engine.
+Statements executed while a request is in flight are also attributed to that
+request's route through a context variable that Starlette copies into the
+threadpool for sync endpoints and dependencies. Row counts are the DBAPI
+``cursor.rowcount``; drivers that report ``-1`` for SELECT (SQLite) contribute
+only affected rows. Pool checkout time is measured around
+``Engine.raw_connection`` and therefore includes pre-ping and establishing new
+connections as well as waiting for a free slot.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_COUNT_BUCKETS = (0.0, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 250.0)
+STATEMENT_SECONDS_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0,
+)
+POOL_CHECKOUT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+ALLOWED_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"})
+OTHER_METHOD = "OTHER"
+UNMATCHED_ROUTE = "unmatched"
+
+_STARTED_KEY = "request_metrics_statement_started"
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _RouteSeries:
+    __slots__ = ("latency", "statements", "db_seconds", "rows")
+
+    def __init__(self) -> None:
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.statements = _Histogram(STATEMENT_COUNT_BUCKETS)
+        self.db_seconds = _Histogram(LATENCY_BUCKETS)
+        self.rows = 0
+
+
+class _Shard:
+    __slots__ = (
+        "routes",
+        "statement_seconds",
+        "statement_rows",
+        "statements_outside_requests",
+        "pool_checkout_seconds",
+        "pool_checkouts",
+        "pool_checkins",
+    )
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], _RouteSeries] = {}
+        self.statement_seconds = _Histogram(STATEMENT_SECONDS_BUCKETS)
+        self.statement_rows = 0
+        self.statements_outside_requests = 0
+        self.pool_checkout_seconds = _Histogram(POOL_CHECKOUT_BUCKETS)
+        self.pool_checkouts = 0
+        self.pool_checkins = 0
+
+
+class RequestDatabaseUsage:
+    """Mutable per-request accumulator shared with threadpool workers."""
+
+    __slots__ = ("statements", "seconds", "rows")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+        self.rows = 0
+
+
+_CURRENT_REQUEST: ContextVar[Optional[RequestDatabaseUsage]] = ContextVar(
+    "request_metrics_current_request", default=None
+)
+
+
+def begin_request() -> Tuple[RequestDatabaseUsage, Any]:
+    """Start attributing statements in this context; return (usage, token)."""
+
+    usage = RequestDatabaseUsage()
+    return usage, _CURRENT_REQUEST.set(usage)
+
+
+def end_request(token: Any) -> None:
+    _CURRENT_REQUEST.reset(token)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Per-bucket (non-cumulative) counts; the last count is above every bound."""
+
+    bounds: Tuple[float, ...]
+    bucket_counts: Tuple[int, ...]
+    sum: float
+    count: int
+
+
+@dataclass(frozen=True)
+class RouteMetricsSnapshot:
+    method: str
+    route: str
+    latency_seconds: HistogramSnapshot
+    db_statements: HistogramSnapshot
+    db_seconds: HistogramSnapshot
+    db_rows_total: int
+
+
+@dataclass(frozen=True)
+class RequestMetricsSnapshot:
+    generated_at: datetime
+    routes: Tuple[RouteMetricsSnapshot, ...]
+    statement_seconds: HistogramSnapshot
+    statement_rows_total: int
+    statements_outside_requests_total: int
+    pool_checkout_seconds: HistogramSnapshot
+    pool_checkouts_total: int
+    pool_checkins_total: int
+    pool_checked_out: int
+
+
+def _merge(bounds: Tuple[float, ...], histograms: List[_Histogram]) -> HistogramSnapshot:
+    counts = [0] * (len(bounds) + 1)
+    total = 0.0
+    observed = 0
+    for histogram in histograms:
+        for index, value in enumerate(tuple(histogram.counts)):
+            counts[index] += value
+        total += histogram.sum
+        observed += histogram.count
+    return HistogramSnapshot(
+        bounds=bounds, bucket_counts=tuple(counts), sum=total, count=observed
+    )
+
+
+class RequestMetrics:
+    """Per-thread sharded registry for request and database usage metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset_unlocked()
+
+    def _reset_unlocked(self) -> None:
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+
+    def reset_for_tests(self) -> None:
+        """Drop all shards; production code must not call this."""
+
+        with self._lock:
+            self._reset_unlocked()
+
+    def _shard(self) -> _Shard:
+        local = self._local
+        try:
+            return local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            local.shard = shard
+            return shard
+
+    def record_request(
+        self,
+        *,
+        method: str,
+        route: Optional[str],
+        seconds: float,
+        usage: RequestDatabaseUsage,
+    ) -> None:
+        key = (
+            method if method in ALLOWED_METHODS else OTHER_METHOD,
+            route or UNMATCHED_ROUTE,
+        )
+        routes = self._shard().routes
+        series = routes.get(key)
+        if series is None:
+            series = routes[key] = _RouteSeries()
+        series.latency.observe(seconds)
+        series.statements.observe(usage.statements)
+        series.db_seconds.observe(usage.seconds)
+        series.rows += usage.rows
+
+    def record_statement(self, seconds: float, rowcount: int) -> None:
+        shard = self._shard()
+        shard.statement_seconds.observe(seconds)
+        rows = rowcount if rowcount > 0 else 0
+        shard.statement_rows += rows
+        usage = _CURRENT_REQUEST.get()
+        if usage is None:
+            shard.statements_outside_requests += 1
+        else:
+            usage.statements += 1
+            usage.seconds += seconds
+            usage.rows += rows
+
+    def record_pool_checkout_wait(self, seconds: float) -> None:
+        self._shard().pool_checkout_seconds.observe(seconds)
+
+    def record_pool_checkout(self) -> None:
+        self._shard().pool_checkouts += 1
+
+    def record_pool_checkin(self) -> None:
+        self._shard().pool_checkins += 1
+
+    def snapshot(self) -> RequestMetricsSnapshot:
+        with self._lock:
+            shards = list(self._shards)
+        by_route: Dict[Tuple[str, str], List[_RouteSeries]] = {}
+        for shard in shards:
+            for key, series in dict(shard.routes).items():
+                by_route.setdefault(key, []).append(series)
+        routes = tuple(
+            RouteMetricsSnapshot(
+                method=method,
+                route=route,
+                latency_seconds=_merge(
+                    LATENCY_BUCKETS, [series.latency for series in group]
+                ),
+                db_statements=_merge(
+                    STATEMENT_COUNT_BUCKETS, [series.statements for series in group]
+                ),
+                db_seconds=_merge(
+                    LATENCY_BUCKETS, [series.db_seconds for series in group]
+                ),
+                db_rows_total=sum(series.rows for series in group),
+            )
+            for (method, route), group in sorted(
+                by_route.items(), key=lambda item: (item[0][1], item[0][0])
+            )
+        )
+        checkouts = sum(shard.pool_checkouts for shard in shards)
+        checkins = sum(shard.pool_checkins for shard in shards)
+        return RequestMetricsSnapshot(
+            generated_at=utcnow(),
+            routes=routes,
+            statement_seconds=_merge(
+                STATEMENT_SECONDS_BUCKETS, [shard.statement_seconds for shard in shards]
+            ),
+            statement_rows_total=sum(shard.statement_rows for shard in shards),
+            statements_outside_requests_total=sum(
+                shard.statements_outside_requests for shard in shards
+            ),
+            pool_checkout_seconds=_merge(
+                POOL_CHECKOUT_BUCKETS, [shard.pool_checkout_seconds for shard in shards]
+            ),
+            pool_checkouts_total=checkouts,
+            pool_checkins_total=checkins,
+            pool_checked_out=max(0, checkouts - checkins),
+        )
+
+
+REQUEST_METRICS = RequestMetrics()
+
+_INSTRUMENTED_ENGINES: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def instrument_engine(engine: Engine, metrics: RequestMetrics = REQUEST_METRICS) -> None:
+    """Attach statement, pool, and checkout-wait hooks to ``engine`` once."""
+
+    if engine in _INSTRUMENTED_ENGINES:
+        return
+    _INSTRUMENTED_ENGINES.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+        conn.info.setdefault(_STARTED_KEY, []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, _statement, _parameters, _context, _executemany):
+        started = conn.info[_STARTED_KEY].pop()
+        metrics.record_statement(perf_counter() - started, cursor.rowcount)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        connection = context.connection
+        if connection is not None:
+            started = connection.info.get(_STARTED_KEY)
+            if started:
+                started.pop()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(_dbapi_connection, _record, _proxy):
+        metrics.record_pool_checkout()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(_dbapi_connection, _record):
+        metrics.record_pool_checkin()
+
+    raw_connection = engine.raw_connection
+
+    def _timed_raw_connection():
+        started = perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            metrics.record_pool_checkout_wait(perf_counter() - started)
+
+    engine.raw_connection = _timed_raw_connection  # type: ignore[method-assign]
+
+
+def snapshot_request_metrics() -> RequestMetricsSnapshot:
+    return REQUEST_METRICS.snapshot()
+
+
+__all__ = [
+    "ALLOWED_METHODS",
+    "HistogramSnapshot",
+    "REQUEST_METRICS",
+    "RequestDatabaseUsage",
+    "RequestMetrics",
+    "RequestMetricsSnapshot",
+    "RouteMetricsSnapshot",
+    "UNMATCHED_ROUTE",
+    "begin_request",
+    "end_request",
+    "instrument_engine",
+    "snapshot_request_metrics",
+]
@@ -0,0 +1,187 @@
+"""Deterministic OpenMetrics rendering for request and database usage metrics.
+
+This module renders an already-aggregated process snapshot. Like the database
+recovery renderer it does not expose an HTTP endpoint; deployments publish the
+returned text through their own authenticated monitoring integration.
+"""
+
+from __future__ import annotations
+
+from math import isfinite
+
+from backend.request_metrics import (
+    ALLOWED_METHODS,
+    UNMATCHED_ROUTE,
+    HistogramSnapshot,
+    RequestMetricsSnapshot,
+)
+
+
+METRIC_PREFIX = "nutriflavor"
+_ALLOWED_METHOD_LABELS = ALLOWED_METHODS | {"OTHER"}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: tuple[tuple[str, str], ...]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _header(lines: list[str], name: str, metric_type: str, help_text: str) -> None:
+    lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"])
+
+
+def _validate_histogram(name: str, histogram: HistogramSnapshot) -> None:
+    if len(histogram.bucket_counts) != len(histogram.bounds) + 1:
+        raise ValueError(f"request metrics histogram {name} has mismatched buckets")
+    if list(histogram.bounds) != sorted(set(histogram.bounds)):
+        raise ValueError(f"request metrics histogram {name} bounds must increase")
+    if any(type(value) is not int or value < 0 for value in histogram.bucket_counts):
+        raise ValueError(
+            f"request metrics histogram {name} counts must be nonnegative integers"
+        )
+    if sum(histogram.bucket_counts) != histogram.count:
+        raise ValueError(f"request metrics histogram {name} count drifted from buckets")
+    if not isfinite(histogram.sum) or histogram.sum < 0:
+        raise ValueError(
+            f"request metrics histogram {name} sum must be a finite nonnegative number"
+        )
+
+
+def _validate(snapshot: RequestMetricsSnapshot) -> None:
+    for route in snapshot.routes:
+        if route.method not in _ALLOWED_METHOD_LABELS:
+            raise ValueError("request metrics snapshot contains an unbounded method label")
+        if route.route != UNMATCHED_ROUTE and not route.route.startswith("/"):
+            raise ValueError("request metrics route label must be a route template")
+        for name, histogram in (
+            ("latency_seconds", route.latency_seconds),
+            ("db_statements", route.db_statements),
+            ("db_seconds", route.db_seconds),
+        ):
+            _validate_histogram(name, histogram)
+        if type(route.db_rows_total) is not int or route.db_rows_total < 0:
+            raise ValueError("request metrics db_rows_total must be a nonnegative integer")
+    _validate_histogram("statement_seconds", snapshot.statement_seconds)
+    _validate_histogram("pool_checkout_seconds", snapshot.pool_checkout_seconds)
+    for field_name in (
+        "statement_rows_total",
+        "statements_outside_requests_total",
+        "pool_checkouts_total",
+        "pool_checkins_total",
+        "pool_checked_out",
+    ):
+        value = getattr(snapshot, field_name)
+        if type(value) is not int or value < 0:
+            raise ValueError(f"request metrics {field_name} must be a nonnegative integer")
+
+
+def _histogram_samples(
+    lines: list[str],
+    name: str,
+    labels: tuple[tuple[str, str], ...],
+    histogram: HistogramSnapshot,
+) -> None:
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.bucket_counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(labels + (('le', repr(float(bound))),))} {cumulative}")
+    lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+
+
+def render_request_metrics_openmetrics(snapshot: RequestMetricsSnapshot) -> str:
+    """Render one immutable snapshot as deterministic OpenMetrics text."""
+
+    _validate(snapshot)
+    lines: list[str] = []
+
+    route_histograms = (
+        (
+            "http_request_duration_seconds",
+            "Request latency by method and matched route template.",
+            "latency_seconds",
+        ),
+        (
+            "http_request_db_statements",
+            "Database statements executed per request by route template.",
+            "db_statements",
+        ),
+        (
+            "http_request_db_duration_seconds",
+            "Total database statement time per request by route template.",
+            "db_seconds",
+        ),
+    )
+    for suffix, help_text, attribute in route_histograms:
+        name = f"{METRIC_PREFIX}_{suffix}"
+        _header(lines, name, "histogram", help_text)
+        for route in snapshot.routes:
+            _histogram_samples(
+                lines,
+                name,
+                (("method", route.method), ("route", route.route)),
+                getattr(route, attribute),
+            )
+
+    rows_name = f"{METRIC_PREFIX}_http_request_db_rows_total"
+    _header(lines, rows_name, "counter", "Driver-reported database row counts by route template.")
+    for route in snapshot.routes:
+        lines.append(
+            f"{rows_name}{_labels((('method', route.method), ('route', route.route)))} "
+            f"{route.db_rows_total}"
+        )
+
+    statement_name = f"{METRIC_PREFIX}_db_statement_duration_seconds"
+    _header(lines, statement_name, "histogram", "Duration of individual database statements.")
+    _histogram_samples(lines, statement_name, (), snapshot.statement_seconds)
+
+    for suffix, help_text, value in (
+        (
+            "db_rows_total",
+            "Driver-reported database row counts across all statements.",
+            snapshot.statement_rows_total,
+        ),
+        (
+            "db_statements_outside_requests_total",
+            "Database statements executed outside an HTTP request.",
+            snapshot.statements_outside_requests_total,
+        ),
+        (
+            "db_pool_checkouts_total",
+            "Connections checked out of the pool.",
+            snapshot.pool_checkouts_total,
+        ),
+        (
+            "db_pool_checkins_total",
+            "Connections returned to the pool.",
+            snapshot.pool_checkins_total,
+        ),
+    ):
+        name = f"{METRIC_PREFIX}_{suffix}"
+        _header(lines, name, "counter", help_text)
+        lines.append(f"{name} {value}")
+
+    checkout_name = f"{METRIC_PREFIX}_db_pool_checkout_duration_seconds"
+    _header(
+        lines,
+        checkout_name,
+        "histogram",
+        "Time to obtain a pooled connection, including pre-ping and connects.",
+    )
+    _histogram_samples(lines, checkout_name, (), snapshot.pool_checkout_seconds)
+
+    occupancy_name = f"{METRIC_PREFIX}_db_pool_checked_out"
+    _header(lines, occupancy_name, "gauge", "Connections currently checked out of the pool.")
+    lines.append(f"{occupancy_name} {snapshot.pool_checked_out}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+__all__ = ["METRIC_PREFIX", "render_request_metrics_openmetrics"]
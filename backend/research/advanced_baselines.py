@@ -37,45 +37,138 @@ class BM25Retriever:
         return sorted(result,key=lambda x:(-x[1],x[0]))[:k]
 
 
+_ALS_BLOCK=1<<18
+_RECOMMEND_CHUNK=1_024
+
+
+def _normal_equations(rows:np.ndarray, columns:np.ndarray, targets:np.ndarray, factors:np.ndarray, size:int, reg:float)->np.ndarray:
+    """Solve every row's ridge system against fixed ``[factors, 1]`` column features.
+
+    ``rows`` must be sorted. Rows are visited shortest first and packed into
+    zero-padded ``(rows, length, width)`` blocks of at most ``_ALS_BLOCK``
+    interactions, so each block's Gram matrices are one batched matmul and
+    skewed row lengths waste little padding. The ridge term is scaled by each
+    row's interaction count (ALS-WR).
+    """
+    width=factors.shape[1]+1; features=np.hstack([factors,np.ones((len(factors),1))]); gram=np.zeros((size,width,width)); rhs=np.zeros((size,width))
+    counts=np.bincount(rows,minlength=size); starts=np.concatenate(([0],np.cumsum(counts)[:-1])); order=np.argsort(counts,kind="stable"); position=0
+    while position<size:
+        end=min(size,position+max(1,_ALS_BLOCK//max(1,int(counts[order[position]]))))
+        while end-position>1 and (end-position)*int(counts[order[end-1]])>_ALS_BLOCK: end=position+max(1,_ALS_BLOCK//int(counts[order[end-1]]))
+        block=order[position:end]; length=int(counts[block[-1]]); position=end
+        if not length: continue
+        offsets=np.arange(length); mask=offsets[None,:]<counts[block][:,None]; index=np.where(mask,starts[block][:,None]+offsets[None,:],0)
+        z=features[columns[index]]*mask[...,None]; zt=z.transpose(0,2,1)
+        gram[block]=zt@z; rhs[block]=(zt@(targets[index]*mask)[...,None])[...,0]
+    gram+=reg*counts[:,None,None]*np.eye(width)
+    return np.linalg.solve(gram,rhs[...,None])[...,0]
+
+
 class MatrixFactorizationRecommender:
-    def __init__(self, *, factors:int=16, learning_rate:float=0.03, regularization:float=0.02, epochs:int=50, seed:int=0):
-        if factors<1 or epochs<1 or learning_rate<=0 or regularization<0: raise ValueError("invalid matrix-factorization parameters")
-        self.factors=factors; self.lr=learning_rate; self.reg=regularization; self.epochs=epochs; self.seed=seed
+    """Biased matrix factorization trained by per-interaction SGD (default) or ALS.
+
+    ``solver="sgd"`` is the original sequential trainer. ``solver="als"``
+    alternates closed-form ridge solves for all users and then all items; one
+    epoch is one user sweep plus one item sweep, and it needs positive
+    ``regularization``. Both solvers are deterministic for a given ``seed``.
+    """
+    def __init__(self, *, factors:int=16, learning_rate:float=0.03, regularization:float=0.02, epochs:int=50, seed:int=0, solver:str="sgd"):
+        if factors<1 or epochs<1 or learning_rate<=0 or regularization<0 or solver not in ("als","sgd"): raise ValueError("invalid matrix-factorization parameters")
+        if solver=="als" and regularization<=0: raise ValueError("ALS requires positive regularization")
+        self.factors=factors; self.lr=learning_rate; self.reg=regularization; self.epochs=epochs; self.seed=seed; self.solver=solver
     def fit(self, interactions: Sequence[Tuple[str,str,float]]) -> "MatrixFactorizationRecommender":
         if not interactions: raise ValueError("interactions are required")
         self.users=sorted({u for u,_,_ in interactions}); self.items=sorted({i for _,i,_ in interactions}); self.ui={u:n for n,u in enumerate(self.users)}; self.ii={i:n for n,i in enumerate(self.items)}
-        rng=np.random.default_rng(self.seed); self.global_mean=float(np.mean([r for _,_,r in interactions])); self.p=rng.normal(0,0.1,(len(self.users),self.factors)); self.q=rng.normal(0,0.1,(len(self.items),self.factors)); self.ub=np.zeros(len(self.users)); self.ib=np.zeros(len(self.items))
+        ratings=np.fromiter((float(r) for _,_,r in interactions),dtype=float,count=len(interactions))
+        rng=np.random.default_rng(self.seed); self.global_mean=float(np.mean(ratings)); self.p=rng.normal(0,0.1,(len(self.users),self.factors)); self.q=rng.normal(0,0.1,(len(self.items),self.factors)); self.ub=np.zeros(len(self.users)); self.ib=np.zeros(len(self.items))
+        if self.solver=="als": return self._fit_als(interactions,ratings)
         ordered=sorted(interactions,key=lambda x:(x[0],x[1],x[2]))
         for _ in range(self.epochs):
             for user,item,rating in ordered:
                 u=self.ui[user]; i=self.ii[item]; pred=self.global_mean+self.ub[u]+self.ib[i]+float(self.p[u]@self.q[i]); error=float(rating)-pred; pu=self.p[u].copy()
                 self.ub[u]+=self.lr*(error-self.reg*self.ub[u]); self.ib[i]+=self.lr*(error-self.reg*self.ib[i]); self.p[u]+=self.lr*(error*self.q[i]-self.reg*self.p[u]); self.q[i]+=self.lr*(error*pu-self.reg*self.q[i])
         return self
+    def _fit_als(self, interactions: Sequence[Tuple[str,str,float]], ratings:np.ndarray) -> "MatrixFactorizationRecommender":
+        users=np.fromiter((self.ui[u] for u,_,_ in interactions),dtype=np.int64,count=len(interactions)); items=np.fromiter((self.ii[i] for _,i,_ in interactions),dtype=np.int64,count=len(interactions))
+        by_user=np.lexsort((items,users)); by_item=np.lexsort((users,items)); centered=ratings-self.global_mean
+        for _ in range(self.epochs):
+            solution=_normal_equations(users[by_user],items[by_user],centered[by_user]-self.ib[items[by_user]],self.q,len(self.users),self.reg); self.p=solution[:,:-1]; self.ub=solution[:,-1]
+            solution=_normal_equations(items[by_item],users[by_item],centered[by_item]-self.ub[users[by_item]],self.p,len(self.items),self.reg); self.q=solution[:,:-1]; self.ib=solution[:,-1]
+        return self
     def predict(self,user:str,item:str)->float:
         if user not in self.ui or item not in self.ii: return self.global_mean
         u=self.ui[user]; i=self.ii[item]; return float(self.global_mean+self.ub[u]+self.ib[i]+self.p[u]@self.q[i])
     def recommend(self,user:str,*,k:int=10,exclude:Iterable[str]=())->List[Tuple[str,float]]:
-        banned=set(exclude); values=[(item,self.predict(user,item)) for item in self.items if item not in banned]; return sorted(values,key=lambda x:(-x[1],x[0]))[:k]
+        return self.recommend_batch([user],k=k,exclude={user:exclude})[user]
+    def recommend_batch(self,users:Sequence[str],*,k:int=10,exclude:Mapping[str,Iterable[str]]|None=None)->Dict[str,List[Tuple[str,float]]]:
+        """Top-``k`` items per user, ties broken by item id.
+
+        Scores come from one ``P[u] @ Q.T`` product per block of users;
+        ``argpartition`` finds each row's ``k``-th score and only items at or
+        above it are sorted. Unknown users score every item at the global mean.
+        """
+        if k<1: raise ValueError("k must be positive")
+        exclude=exclude or {}; result={}; kth=min(k,len(self.items))-1
+        for start in range(0,len(users),_RECOMMEND_CHUNK):
+            block=list(users[start:start+_RECOMMEND_CHUNK]); rows=np.array([self.ui.get(u,-1) for u in block],dtype=np.int64); known=rows>=0
+            scores=np.full((len(block),len(self.items)),self.global_mean)
+            scores[known]=(self.global_mean+self.ub[rows[known]])[:,None]+self.ib[None,:]+self.p[rows[known]]@self.q.T
+            for offset,user in enumerate(block):
+                banned=[self.ii[i] for i in exclude.get(user,()) if i in self.ii]; scores[offset,banned]=-np.inf
+            thresholds=-np.partition(-scores,kth,axis=1)[:,kth]
+            for offset,user in enumerate(block):
+                row=scores[offset]; candidates=np.flatnonzero((row>=thresholds[offset])&(row>-np.inf)); ordered=candidates[np.lexsort((candidates,-row[candidates]))][:k]
+                result[user]=[(self.items[i],float(row[i])) for i in ordered]
+        return result
+
+
+def _read_only(view:np.ndarray)->np.ndarray:
+    view.setflags(write=False); return view
 
 
 class LinUCBPolicy:
+    """Disjoint LinUCB with per-action inverses kept current by Sherman–Morrison.
+
+    Design matrices, their inverses, reward vectors, and ridge estimates are
+    stacked ``(actions, d, ...)`` arrays; ``A`` and ``b`` remain per-action
+    read-only views into them, so state changes only through ``update`` and
+    the cached inverse cannot drift from the design matrix. ``update`` costs O(d²) and ``select`` scores every
+    allowed action with one batched contraction instead of inverting each
+    design matrix.
+    """
     def __init__(self, action_ids:Sequence[str], feature_dim:int, *, alpha:float=1.0):
         if not action_ids or feature_dim<1 or alpha<0: raise ValueError("invalid LinUCB configuration")
-        self.actions=tuple(sorted(set(action_ids))); self.d=feature_dim; self.alpha=alpha; self.A={a:np.eye(feature_dim) for a in self.actions}; self.b={a:np.zeros(feature_dim) for a in self.actions}
+        self.actions=tuple(sorted(set(action_ids))); self.d=feature_dim; self.alpha=alpha; self.index={a:n for n,a in enumerate(self.actions)}
+        self._design=np.tile(np.eye(feature_dim),(len(self.actions),1,1)); self._inverse=self._design.copy(); self._rewards=np.zeros((len(self.actions),feature_dim)); self._theta=np.zeros((len(self.actions),feature_dim))
+        self.A={a:_read_only(self._design[n]) for a,n in self.index.items()}; self.b={a:_read_only(self._rewards[n]) for a,n in self.index.items()}
+    def _candidates(self, allowed:Iterable[str]|None)->Tuple[Tuple[str,...],np.ndarray|slice]:
+        if allowed is None: return self.actions,slice(None)
+        candidates=tuple(sorted(set(allowed)&set(self.actions))); return candidates,np.array([self.index[a] for a in candidates],dtype=np.int64)
     def select(self, context:Sequence[float], *, allowed:Iterable[str]|None=None)->Tuple[str,Dict[str,float]]:
         x=np.asarray(context,dtype=float)
         if x.shape!=(self.d,): raise ValueError("context dimension mismatch")
-        candidates=self.actions if allowed is None else tuple(sorted(set(allowed)&set(self.actions)))
+        candidates,rows=self._candidates(allowed)
         if not candidates: raise ValueError("no allowed actions")
-        scores={}
-        for action in candidates:
-            inv=np.linalg.inv(self.A[action]); theta=inv@self.b[action]; scores[action]=float(theta@x+self.alpha*sqrt(max(0,float(x@inv@x))))
-        chosen=min(candidates,key=lambda a:(-scores[a],a)); return chosen,scores
+        values=self._theta[rows]@x+self.alpha*np.sqrt(np.maximum(0,np.einsum("kij,i,j->k",self._inverse[rows],x,x)))
+        scores={a:float(v) for a,v in zip(candidates,values)}; chosen=min(candidates,key=lambda a:(-scores[a],a)); return chosen,scores
+    def select_batch(self, contexts:Sequence[Sequence[float]], *, allowed:Iterable[str]|None=None)->Tuple[List[str],np.ndarray]:
+        """Score many contexts against the current state without updating it.
+
+        Returns the chosen action per row and the ``(contexts, candidates)``
+        score matrix in sorted candidate order; ties go to the smaller id.
+        """
+        x=np.asarray(contexts,dtype=float)
+        if x.ndim!=2 or x.shape[1]!=self.d: raise ValueError("context dimension mismatch")
+        candidates,rows=self._candidates(allowed)
+        if not candidates: raise ValueError("no allowed actions")
+        values=x@self._theta[rows].T+self.alpha*np.sqrt(np.maximum(0,np.einsum("ni,kij,nj->nk",x,self._inverse[rows],x,optimize=True)))
+        return [candidates[i] for i in np.argmax(values,axis=1)],values
     def update(self,action:str,context:Sequence[float],reward:float)->None:
         if action not in self.A: raise KeyError(action)
         x=np.asarray(context,dtype=float)
         if x.shape!=(self.d,): raise ValueError("context dimension mismatch")
-        self.A[action]+=np.outer(x,x); self.b[action]+=float(reward)*x
+        n=self.index[action]; inverse=self._inverse[n]; ax=inverse@x
+        self._design[n]+=np.outer(x,x); self._rewards[n]+=float(reward)*x; inverse-=np.outer(ax,ax)/(1.0+float(x@ax)); self._theta[n]=inverse@self._rewards[n]
 
 
 class BetaBernoulliThompsonPolicy:
@@ -93,16 +186,56 @@ class BetaBernoulliThompsonPolicy:
 
 
 class BradleyTerryPreference:
-    def __init__(self, *, learning_rate:float=0.05, epochs:int=200, regularization:float=0.01): self.lr=learning_rate; self.epochs=epochs; self.reg=regularization
+    """Regularized Bradley–Terry scores from pairwise outcomes in ``[0, 1]``.
+
+    ``solver="sgd"`` (default) is the original sequential pass over sorted
+    comparisons. ``"mm"`` and ``"newton"`` maximize the objective that pass
+    approximates: the log-likelihood minus ``regularization/2 * n_i * s_i**2``
+    for an item in ``n_i`` comparisons. Both encode comparisons once as index
+    arrays and accumulate per-item gradients with ``np.bincount``. MM divides
+    by the fixed curvature bound ``(1/2 + regularization) * n_i``, so no step
+    decreases the objective; Newton uses the diagonal Hessian with step
+    halving and stops at the current scores if no halved step improves the
+    objective. ``epochs`` caps the iterations, which stop once the largest score
+    change is at most ``tolerance``.
+    """
+    def __init__(self, *, learning_rate:float=0.05, epochs:int=200, regularization:float=0.01, solver:str="sgd", tolerance:float=1e-9):
+        if solver not in ("newton","mm","sgd") or epochs<1 or regularization<0 or tolerance<0: raise ValueError("invalid Bradley-Terry parameters")
+        self.lr=learning_rate; self.epochs=epochs; self.reg=regularization; self.solver=solver; self.tolerance=tolerance; self.iterations=0
     def fit(self, comparisons:Sequence[Tuple[str,str,float]])->"BradleyTerryPreference":
         if not comparisons: raise ValueError("comparisons are required")
         self.items=sorted({x for a,b,_ in comparisons for x in (a,b)}); self.score={x:0.0 for x in self.items}
+        if self.solver!="sgd": return self._fit_batch(comparisons)
         for _ in range(self.epochs):
             for a,b,outcome in sorted(comparisons):
                 if not 0<=outcome<=1: raise ValueError("outcome must be in [0,1]")
                 delta=np.clip(self.score[a]-self.score[b],-30,30); prob=float(1/(1+np.exp(-delta))); grad=outcome-prob
                 self.score[a]+=self.lr*(grad-self.reg*self.score[a]); self.score[b]+=self.lr*(-grad-self.reg*self.score[b])
-        mean=float(np.mean(list(self.score.values()))); self.score={k:v-mean for k,v in self.score.items()}; return self
+        self.iterations=self.epochs; mean=float(np.mean(list(self.score.values()))); self.score={k:v-mean for k,v in self.score.items()}; return self
+    def _fit_batch(self, comparisons:Sequence[Tuple[str,str,float]])->"BradleyTerryPreference":
+        index={x:n for n,x in enumerate(self.items)}; size=len(self.items); count=len(comparisons)
+        winners=np.fromiter((index[a] for a,_,_ in comparisons),dtype=np.int64,count=count); losers=np.fromiter((index[b] for _,b,_ in comparisons),dtype=np.int64,count=count); outcomes=np.fromiter((float(o) for _,_,o in comparisons),dtype=float,count=count)
+        if np.any((outcomes<0)|(outcomes>1)|np.isnan(outcomes)): raise ValueError("outcome must be in [0,1]")
+        degree=np.bincount(winners,minlength=size)+np.bincount(losers,minlength=size); scores=np.zeros(size)
+        def objective(values:np.ndarray)->float:
+            delta=values[winners]-values[losers]; return float(-(outcomes*np.logaddexp(0,-delta)+(1-outcomes)*np.logaddexp(0,delta)).sum()-0.5*self.reg*(degree*values*values).sum())
+        current=objective(scores); self.iterations=0
+        for _ in range(self.epochs):
+            prob=1/(1+np.exp(-np.clip(scores[winners]-scores[losers],-30,30))); residual=outcomes-prob
+            gradient=np.bincount(winners,residual,size)-np.bincount(losers,residual,size)-self.reg*degree*scores
+            if self.solver=="mm": curvature=(0.5+self.reg)*degree
+            else: weight=prob*(1-prob); curvature=np.bincount(winners,weight,size)+np.bincount(losers,weight,size)+self.reg*degree
+            step=gradient/np.maximum(curvature,1e-12)
+            if self.solver=="newton":
+                for _halving in range(30):
+                    candidate=objective(scores+step)
+                    if candidate>=current: break
+                    step=step/2
+                else: break
+                current=candidate
+            scores=scores+step; self.iterations+=1
+            if float(np.max(np.abs(step)))<=self.tolerance: break
+        scores=scores-scores.mean(); self.score={x:float(v) for x,v in zip(self.items,scores)}; return self
     def probability(self,a:str,b:str)->float:
         delta=np.clip(self.score.get(a,0)-self.score.get(b,0),-30,30); return float(1/(1+np.exp(-delta)))
     def ranking(self)->List[Tuple[str,float]]: return sorted(self.score.items(),key=lambda x:(-x[1],x[0]))
@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import math
 from collections import Counter
-from typing import Iterable, List, Sequence
+from typing import TYPE_CHECKING, Iterable, List, Sequence
 
-import numpy as np
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class DriftMetric(BaseModel):
     name: str
@@ -32,11 +34,15 @@ class DriftReport(BaseModel):
 
 
 def _finite(values: Iterable[float]) -> np.ndarray:
+    import numpy as np
+
     array = np.asarray(list(values), dtype=float)
     return array[np.isfinite(array)]
 
 
 def population_stability_index(reference: Sequence[float], current: Sequence[float], bins: int = 10) -> float:
+    import numpy as np
+
     ref = _finite(reference)
     cur = _finite(current)
     if len(ref) == 0 or len(cur) == 0:
@@ -57,6 +63,8 @@ def population_stability_index(reference: Sequence[float], current: Sequence[flo
 
 
 def two_sample_ks_statistic(reference: Sequence[float], current: Sequence[float]) -> float:
+    import numpy as np
+
     ref = np.sort(_finite(reference))
     cur = np.sort(_finite(current))
     if len(ref) == 0 or len(cur) == 0:
@@ -68,6 +76,8 @@ def two_sample_ks_statistic(reference: Sequence[float], current: Sequence[float]
 
 
 def standardized_mean_shift(reference: Sequence[float], current: Sequence[float]) -> float:
+    import numpy as np
+
     ref = _finite(reference)
     cur = _finite(current)
     if len(ref) == 0 or len(cur) == 0:
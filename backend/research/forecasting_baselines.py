@@ -6,10 +6,21 @@ not trigger procurement, inventory changes, or request-time personalization.
 
 from __future__ import annotations
 
+import copy
 import math
 from dataclasses import dataclass
 from typing import Callable, List, Sequence, Tuple
 
+import numpy as np
+
+
+SMOOTHING_GRID: Tuple[float, ...] = tuple(value / 20 for value in range(1, 21))
+# Below this many (candidate, prefix) fits the per-step NumPy dispatch costs
+# more than one plain Python pass per fit, so a single fit on the default grid
+# uses the scalar recurrence. Rolling-origin backtests fit every origin prefix
+# from one scan and clear this easily.
+VECTOR_SCAN_MIN_CANDIDATES = 40
+
 
 def _series(values: Sequence[float], *, nonnegative: bool = False) -> List[float]:
     result = [float(value) for value in values]
@@ -44,6 +55,149 @@ class SeasonalNaiveForecaster:
         return [season[index % self.season_length] for index in range(horizon)]
 
 
+def _smoothing_scalar(values: Sequence[float], alpha: float) -> tuple[float, float]:
+    level = values[0]
+    squared_error = 0.0
+    for value in values[1:]:
+        squared_error += (value - level) ** 2
+        level = alpha * value + (1 - alpha) * level
+    return level, squared_error
+
+
+def _holt_state(
+    values: Sequence[float],
+    alpha: float,
+    beta: float,
+    damping: float,
+) -> tuple[float, float]:
+    """Fixed-parameter Holt recurrence; no error is needed without a grid."""
+
+    level = values[0]
+    trend = values[1] - values[0] if len(values) > 1 else 0.0
+    for value in values[1:]:
+        previous_level = level
+        level = alpha * value + (1 - alpha) * (level + damping * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * damping * trend
+    return level, trend
+
+
+def _holt_prefix_states(
+    values: Sequence[float],
+    alpha: float,
+    beta: float,
+    damping: float,
+) -> List[tuple[float, float]]:
+    """``_holt_state`` for every prefix of at least two values, in one pass.
+
+    Entry ``t`` is the state after ``values[: t + 1]``; entry 0 carries the
+    two-point initial trend and is not a valid one-point fit.
+    """
+
+    level = values[0]
+    trend = values[1] - values[0] if len(values) > 1 else 0.0
+    states = [(level, trend)]
+    for value in values[1:]:
+        previous_level = level
+        level = alpha * value + (1 - alpha) * (level + damping * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * damping * trend
+        states.append((level, trend))
+    return states
+
+
+def _holt_scalar(
+    values: Sequence[float],
+    alpha: float,
+    beta: float,
+    damping: float,
+) -> tuple[float, float, float]:
+    level = values[0]
+    trend = values[1] - values[0] if len(values) > 1 else 0.0
+    squared_error = 0.0
+    for value in values[1:]:
+        previous_level = level
+        squared_error += (value - (level + damping * trend)) ** 2
+        level = alpha * value + (1 - alpha) * (level + damping * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * damping * trend
+    return level, trend, squared_error
+
+
+def _smoothing_scan(
+    values: Sequence[float],
+    alphas: Sequence[float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run the exponential-smoothing recurrence for every alpha at once.
+
+    Row ``t`` of the returned ``(time, candidates)`` levels and cumulative
+    squared errors is the state after fitting ``values[: t + 1]``, so one pass
+    serves every prefix. Element-wise float64 operations in the same order as
+    the scalar loop keep results bit-identical.
+    """
+
+    series = np.asarray(values, dtype=np.float64)
+    alpha = np.asarray(alphas, dtype=np.float64)
+    levels = np.empty((len(series), len(alpha)))
+    errors = np.empty((len(series), len(alpha)))
+    level = np.full(alpha.shape, series[0])
+    squared_error = np.zeros(alpha.shape)
+    levels[0] = level
+    errors[0] = squared_error
+    for step, value in enumerate(series[1:], start=1):
+        squared_error += (value - level) ** 2
+        level = alpha * value + (1 - alpha) * level
+        levels[step] = level
+        errors[step] = squared_error
+    return levels, errors
+
+
+def _holt_scan(
+    values: Sequence[float],
+    alphas: Sequence[float],
+    betas: Sequence[float],
+    damping: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run the damped Holt recurrence for paired alpha/beta candidates.
+
+    Returns ``(time, candidates)`` levels, trends, and cumulative one-step-ahead
+    squared errors per prefix, with the same scalar operation order as
+    :func:`_holt_scalar`. Prefixes start from the trend ``values[1] -
+    values[0]``, so row 0 is only meaningful for series of length one.
+    """
+
+    series = np.asarray(values, dtype=np.float64)
+    alpha = np.asarray(alphas, dtype=np.float64)
+    beta = np.asarray(betas, dtype=np.float64)
+    if alpha.shape != beta.shape:
+        raise ValueError("alpha and beta candidates must have equal shape")
+    levels = np.empty((len(series), len(alpha)))
+    trends = np.empty((len(series), len(alpha)))
+    errors = np.empty((len(series), len(alpha)))
+    level = np.full(alpha.shape, series[0])
+    trend = np.full(
+        alpha.shape,
+        series[1] - series[0] if len(series) > 1 else 0.0,
+    )
+    squared_error = np.zeros(alpha.shape)
+    levels[0] = level
+    trends[0] = trend
+    errors[0] = squared_error
+    for step, value in enumerate(series[1:], start=1):
+        previous_level = level
+        squared_error += (value - (level + damping * trend)) ** 2
+        level = alpha * value + (1 - alpha) * (level + damping * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * damping * trend
+        levels[step] = level
+        trends[step] = trend
+        errors[step] = squared_error
+    return levels, trends, errors
+
+
+def _prefix_lengths(series: Sequence[float], lengths: Sequence[int]) -> List[int]:
+    result = [int(length) for length in lengths]
+    if any(length < 1 or length > len(series) for length in result):
+        raise ValueError("prefix lengths must be between 1 and the series length")
+    return result
+
+
 class SimpleExponentialSmoothingForecaster:
     def __init__(self, alpha: float | None = None):
         if alpha is not None and not 0 < alpha <= 1:
@@ -52,31 +206,51 @@ class SimpleExponentialSmoothingForecaster:
         self.fitted_alpha_: float | None = None
         self.level_: float | None = None
 
-    @staticmethod
-    def _fit_alpha(values: Sequence[float], alpha: float) -> tuple[float, float]:
-        level = float(values[0])
-        squared_error = 0.0
-        for value in values[1:]:
-            squared_error += (float(value) - level) ** 2
-            level = alpha * float(value) + (1 - alpha) * level
-        return level, squared_error
+    def _candidates(self) -> List[float]:
+        return [float(self.alpha)] if self.alpha is not None else list(SMOOTHING_GRID)
+
+    def _fitted(self, level: float, alpha: float) -> "SimpleExponentialSmoothingForecaster":
+        model = copy.copy(self)
+        model.level_ = float(level)
+        model.fitted_alpha_ = alpha
+        return model
 
     def fit(self, values: Sequence[float]) -> "SimpleExponentialSmoothingForecaster":
         series = _series(values)
-        candidates = (
-            [float(self.alpha)]
-            if self.alpha is not None
-            else [value / 20 for value in range(1, 21)]
-        )
-        scored = [
-            (*self._fit_alpha(series, alpha), alpha)
-            for alpha in candidates
-        ]
-        level, _error, alpha = min(scored, key=lambda item: (item[1], item[2]))
-        self.level_ = level
-        self.fitted_alpha_ = alpha
+        candidates = self._candidates()
+        scored = [_smoothing_scalar(series, alpha) for alpha in candidates]
+        # Candidates are ascending, so the first minimum is also the smallest
+        # alpha, matching the (error, alpha) tie-break.
+        best = min(range(len(candidates)), key=lambda index: scored[index][1])
+        self.level_ = scored[best][0]
+        self.fitted_alpha_ = candidates[best]
         return self
 
+    def fit_prefixes(
+        self,
+        values: Sequence[float],
+        lengths: Sequence[int],
+    ) -> List["SimpleExponentialSmoothingForecaster"]:
+        """Return one fitted copy per prefix length, equal to ``fit(values[:n])``.
+
+        Every prefix is read off a single recurrence over ``values``, which is
+        how :func:`rolling_origin_backtest` fits all of its origins at once.
+        """
+
+        series = _series(values)
+        prefixes = _prefix_lengths(series, lengths)
+        candidates = self._candidates()
+        if len(candidates) * len(prefixes) < VECTOR_SCAN_MIN_CANDIDATES:
+            return [
+                copy.copy(self).fit(series[:length]) for length in prefixes
+            ]
+        levels, errors = _smoothing_scan(series, candidates)
+        best = np.argmin(errors, axis=1)
+        return [
+            self._fitted(levels[length - 1, best[length - 1]], candidates[best[length - 1]])
+            for length in prefixes
+        ]
+
     def predict(self, horizon: int) -> List[float]:
         if self.level_ is None:
             raise RuntimeError("Forecaster must be fit before predict")
@@ -86,14 +260,26 @@ class SimpleExponentialSmoothingForecaster:
 
 
 class HoltLinearForecaster:
+    """Damped Holt linear trend baseline.
+
+    Passing ``alpha=None`` or ``beta=None`` selects that parameter from
+    :data:`SMOOTHING_GRID` by one-step-ahead squared error; ties resolve to the
+    smallest ``(alpha, beta)``. Grids of :data:`VECTOR_SCAN_MIN_CANDIDATES` or
+    more candidates are scanned jointly, smaller ones one candidate at a time;
+    :meth:`fit_prefixes` counts every (candidate, prefix) pair toward that
+    width.
+    """
+
     def __init__(
         self,
-        alpha: float = 0.3,
-        beta: float = 0.1,
+        alpha: float | None = 0.3,
+        beta: float | None = 0.1,
         damping: float = 1.0,
         nonnegative: bool = True,
     ):
-        if not 0 < alpha <= 1 or not 0 < beta <= 1:
+        if (alpha is not None and not 0 < alpha <= 1) or (
+            beta is not None and not 0 < beta <= 1
+        ):
             raise ValueError("alpha and beta must be in (0, 1]")
         if not 0 < damping <= 1:
             raise ValueError("damping must be in (0, 1]")
@@ -101,25 +287,109 @@ class HoltLinearForecaster:
         self.beta = beta
         self.damping = damping
         self.nonnegative = nonnegative
+        self.fitted_alpha_: float | None = None
+        self.fitted_beta_: float | None = None
         self.level_: float | None = None
         self.trend_: float | None = None
 
+    def _grid(self) -> tuple[List[float], List[float]]:
+        alpha_grid = (
+            [float(self.alpha)] if self.alpha is not None else list(SMOOTHING_GRID)
+        )
+        beta_grid = (
+            [float(self.beta)] if self.beta is not None else list(SMOOTHING_GRID)
+        )
+        # The flattened grid is in lexicographic (alpha, beta) order.
+        alphas = [alpha for alpha in alpha_grid for _beta in beta_grid]
+        betas = [beta for _alpha in alpha_grid for beta in beta_grid]
+        return alphas, betas
+
+    def _fitted(
+        self, alpha: float, beta: float, level: float, trend: float
+    ) -> "HoltLinearForecaster":
+        model = copy.copy(self)
+        model.fitted_alpha_ = alpha
+        model.fitted_beta_ = beta
+        model.level_ = float(level)
+        model.trend_ = float(trend)
+        return model
+
     def fit(self, values: Sequence[float]) -> "HoltLinearForecaster":
         series = _series(values, nonnegative=self.nonnegative)
-        level = series[0]
-        trend = series[1] - series[0] if len(series) > 1 else 0.0
-        for value in series[1:]:
-            previous_level = level
-            level = self.alpha * value + (1 - self.alpha) * (
-                level + self.damping * trend
+        if self.alpha is not None and self.beta is not None:
+            self.fitted_alpha_ = float(self.alpha)
+            self.fitted_beta_ = float(self.beta)
+            self.level_, self.trend_ = _holt_state(
+                series, self.fitted_alpha_, self.fitted_beta_, self.damping
+            )
+            return self
+        alphas, betas = self._grid()
+        if len(alphas) < VECTOR_SCAN_MIN_CANDIDATES:
+            scored = [
+                _holt_scalar(series, alpha, beta, self.damping)
+                for alpha, beta in zip(alphas, betas)
+            ]
+            levels = [level for level, _trend, _error in scored]
+            trends = [trend for _level, trend, _error in scored]
+            errors = [error for _level, _trend, error in scored]
+        else:
+            level_rows, trend_rows, error_rows = _holt_scan(
+                series, alphas, betas, self.damping
             )
-            trend = self.beta * (level - previous_level) + (
-                1 - self.beta
-            ) * self.damping * trend
-        self.level_ = level
-        self.trend_ = trend
+            levels, trends, errors = level_rows[-1], trend_rows[-1], error_rows[-1]
+        best = min(range(len(alphas)), key=errors.__getitem__)
+        self.fitted_alpha_ = alphas[best]
+        self.fitted_beta_ = betas[best]
+        self.level_ = float(levels[best])
+        self.trend_ = float(trends[best])
         return self
 
+    def fit_prefixes(
+        self,
+        values: Sequence[float],
+        lengths: Sequence[int],
+    ) -> List["HoltLinearForecaster"]:
+        """Return one fitted copy per prefix length, equal to ``fit(values[:n])``.
+
+        Fixed parameters take one scalar pass and grids one joint scan over
+        ``values``; :func:`rolling_origin_backtest` uses this to fit all of
+        its origins at once.
+        """
+
+        series = _series(values)
+        prefixes = _prefix_lengths(series, lengths)
+        _series(series[: max(prefixes)], nonnegative=self.nonnegative)
+        alphas, betas = self._grid()
+        if len(alphas) * len(prefixes) < VECTOR_SCAN_MIN_CANDIDATES and len(alphas) > 1:
+            return [copy.copy(self).fit(series[:length]) for length in prefixes]
+        if len(alphas) == 1:
+            states = _holt_prefix_states(series, alphas[0], betas[0], self.damping)
+            fitted = [
+                self._fitted(alphas[0], betas[0], *states[length - 1])
+                for length in prefixes
+                if length > 1
+            ]
+        else:
+            levels, trends, errors = _holt_scan(series, alphas, betas, self.damping)
+            best = np.argmin(errors, axis=1)
+            fitted = [
+                self._fitted(
+                    alphas[best[length - 1]],
+                    betas[best[length - 1]],
+                    levels[length - 1, best[length - 1]],
+                    trends[length - 1, best[length - 1]],
+                )
+                for length in prefixes
+                if length > 1
+            ]
+        # A one-point prefix starts from a zero trend rather than values[1] -
+        # values[0], so it is fitted on its own.
+        remaining = iter(fitted)
+        return [
+            copy.copy(self).fit(series[:1]) if length == 1 else next(remaining)
+            for length in prefixes
+        ]
+
     def predict(self, horizon: int) -> List[float]:
         if self.level_ is None or self.trend_ is None:
             raise RuntimeError("Forecaster must be fit before predict")
@@ -199,13 +469,25 @@ def rolling_origin_backtest(
     predictions: List[float] = []
     actuals: List[float] = []
     origins: List[int] = []
-    for origin in range(minimum_train_size, len(series) - horizon + 1, step):
-        model = factory()
+    origin_points = list(range(minimum_train_size, len(series) - horizon + 1, step))
+    # Forecasters that can fit every training prefix in one pass do so from a
+    # single factory instance; others get a fresh instance per origin.
+    prototype = factory()
+    fit_prefixes = getattr(prototype, "fit_prefixes", None)
+    prefix_models = (
+        fit_prefixes(series, origin_points) if callable(fit_prefixes) else None
+    )
+    for position, origin in enumerate(origin_points):
+        if prefix_models is not None:
+            model = prefix_models[position]
+        else:
+            model = prototype if position == 0 else factory()
         fit = getattr(model, "fit", None)
         predict = getattr(model, "predict", None)
         if not callable(fit) or not callable(predict):
             raise TypeError("factory must produce objects with fit and predict methods")
-        fit(series[:origin])
+        if prefix_models is None:
+            fit(series[:origin])
         forecast = [float(value) for value in predict(horizon)]
         if len(forecast) != horizon:
             raise ValueError("forecaster returned the wrong horizon length")
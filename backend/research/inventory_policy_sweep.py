@@ -0,0 +1,336 @@
+"""Offline reorder-policy sweeps over one shared perishable-demand trace.
+
+A sweep replays the same initial lots and realized demand under every
+candidate ``(reorder_point, order_up_to)`` pair of a per-SKU parameter grid.
+SKUs never interact inside :func:`simulate_perishable_inventory`, so each grid
+cell simulates only its own SKU and cells can run on a process pool. Worker
+processes receive the parsed trace once, through the pool initializer, rather
+than once per cell. Nothing here selects or applies a runtime policy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from backend.research.inventory_simulation import (
+    DemandEvent,
+    ReorderPolicy,
+    SKUInventoryMetrics,
+    SimulationLot,
+    simulate_perishable_inventory,
+)
+
+
+Trace = Dict[str, Tuple[Tuple[SimulationLot, ...], Tuple[DemandEvent, ...]]]
+
+
+@dataclass(frozen=True)
+class PolicySweepAxis:
+    sku: str
+    reorder_points: Tuple[float, ...]
+    order_up_to_levels: Tuple[float, ...]
+    lead_time_days: int
+    shelf_life_days: int
+
+    def __post_init__(self) -> None:
+        if not self.sku.strip():
+            raise ValueError("sweep sku cannot be blank")
+        for name in ("reorder_points", "order_up_to_levels"):
+            values = tuple(float(value) for value in getattr(self, name))
+            if not values:
+                raise ValueError(f"{name} cannot be empty")
+            if any(not math.isfinite(value) or value < 0 for value in values):
+                raise ValueError(f"{name} must be finite and non-negative")
+            if len(values) != len(set(values)):
+                raise ValueError(f"{name} must be unique")
+            object.__setattr__(self, name, tuple(sorted(values)))
+        if self.lead_time_days < 1:
+            raise ValueError("lead_time_days must be at least 1")
+        if self.shelf_life_days < 1:
+            raise ValueError("shelf_life_days must be at least 1")
+
+    def policies(self) -> List[ReorderPolicy]:
+        """Return every admissible grid point in ascending parameter order."""
+
+        return [
+            ReorderPolicy(
+                sku=self.sku,
+                reorder_point=reorder_point,
+                order_up_to=order_up_to,
+                lead_time_days=self.lead_time_days,
+                shelf_life_days=self.shelf_life_days,
+            )
+            for reorder_point in self.reorder_points
+            for order_up_to in self.order_up_to_levels
+            if order_up_to >= reorder_point
+        ]
+
+
+@dataclass(frozen=True)
+class PolicySweepCell:
+    sku: str
+    reorder_point: float
+    order_up_to: float
+    lead_time_days: int
+    shelf_life_days: int
+    rank: int
+    pareto_efficient: bool
+    fill_rate: float
+    expired_units: float
+    stockout_units: float
+    ordered_units: float
+    ending_units: float
+    average_on_hand: float
+    stockout_event_count: int
+    order_count: int
+    input_fingerprint: str
+
+
+@dataclass(frozen=True)
+class PolicySweepResult:
+    method: str
+    deterministic: bool
+    horizon_days: int
+    sweep_fingerprint: str
+    cell_count: int
+    cells: Tuple[PolicySweepCell, ...]
+    best_by_sku: Tuple[PolicySweepCell, ...]
+    warnings: Tuple[str, ...]
+
+
+_WORKER_TRACE: Trace = {}
+_WORKER_HORIZON = 0
+
+
+def sweep_fingerprint(
+    initial_lots: Sequence[SimulationLot],
+    demand_events: Sequence[DemandEvent],
+    axes: Sequence[PolicySweepAxis],
+    horizon_days: int,
+) -> str:
+    payload = {
+        "horizon_days": horizon_days,
+        "initial_lots": [
+            asdict(value)
+            for value in sorted(
+                initial_lots,
+                key=lambda item: (item.sku, item.expires_day, item.lot_id),
+            )
+        ],
+        "demand_events": [
+            asdict(value)
+            for value in sorted(
+                demand_events,
+                key=lambda item: (item.day, item.sku, item.quantity),
+            )
+        ],
+        "axes": [
+            asdict(value) for value in sorted(axes, key=lambda item: item.sku)
+        ],
+    }
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        allow_nan=False,
+    ).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def _partition_trace(
+    initial_lots: Sequence[SimulationLot],
+    demand_events: Sequence[DemandEvent],
+    skus: Iterable[str],
+) -> Trace:
+    trace: Trace = {}
+    for sku in skus:
+        trace[sku] = (
+            tuple(value for value in initial_lots if value.sku == sku),
+            tuple(value for value in demand_events if value.sku == sku),
+        )
+    return trace
+
+
+def _simulate_cell(
+    trace: Trace,
+    horizon_days: int,
+    policy: ReorderPolicy,
+) -> Tuple[SKUInventoryMetrics, str]:
+    lots, demand = trace[policy.sku]
+    result = simulate_perishable_inventory(
+        lots,
+        demand,
+        [policy],
+        horizon_days=horizon_days,
+        compact_events=True,
+    )
+    return result.per_sku[0], result.input_fingerprint
+
+
+def _install_worker_trace(trace: Trace, horizon_days: int) -> None:
+    global _WORKER_TRACE, _WORKER_HORIZON
+    _WORKER_TRACE = trace
+    _WORKER_HORIZON = horizon_days
+
+
+def _simulate_worker_cell(
+    policy: ReorderPolicy,
+) -> Tuple[SKUInventoryMetrics, str]:
+    return _simulate_cell(_WORKER_TRACE, _WORKER_HORIZON, policy)
+
+
+def _rank_sku_cells(
+    rows: Sequence[Tuple[ReorderPolicy, SKUInventoryMetrics, str]],
+) -> List[PolicySweepCell]:
+    ordered = sorted(
+        rows,
+        key=lambda row: (
+            -row[1].fill_rate,
+            row[1].expired_units,
+            row[1].stockout_units,
+            row[1].ordered_units,
+            row[0].reorder_point,
+            row[0].order_up_to,
+        ),
+    )
+    cells = []
+    frontier: Tuple[float, float] | None = None
+    for rank, (policy, metrics, fingerprint) in enumerate(ordered, start=1):
+        # Rows arrive in descending fill rate, so a row is efficient exactly
+        # when it wastes less than every earlier row or ties the last
+        # efficient point on both objectives.
+        point = (metrics.fill_rate, metrics.expired_units)
+        efficient = frontier is None or point[1] < frontier[1] or point == frontier
+        if efficient:
+            frontier = point
+        cells.append(
+            PolicySweepCell(
+                sku=policy.sku,
+                reorder_point=policy.reorder_point,
+                order_up_to=policy.order_up_to,
+                lead_time_days=policy.lead_time_days,
+                shelf_life_days=policy.shelf_life_days,
+                rank=rank,
+                pareto_efficient=efficient,
+                fill_rate=metrics.fill_rate,
+                expired_units=metrics.expired_units,
+                stockout_units=metrics.stockout_units,
+                ordered_units=metrics.ordered_units,
+                ending_units=metrics.ending_units,
+                average_on_hand=metrics.average_on_hand,
+                stockout_event_count=metrics.stockout_event_count,
+                order_count=metrics.order_count,
+                input_fingerprint=fingerprint,
+            )
+        )
+    return cells
+
+
+def sweep_reorder_policies(
+    initial_lots: Iterable[SimulationLot],
+    demand_events: Iterable[DemandEvent],
+    axes: Iterable[PolicySweepAxis],
+    *,
+    horizon_days: int,
+    workers: int = 1,
+    maximum_cells: int = 100_000,
+) -> PolicySweepResult:
+    """Replay every grid cell and rank cells by fill rate, then waste.
+
+    ``workers=1`` runs in-process. Larger values use a process pool; the
+    result is identical either way because every cell is an independent,
+    deterministic replay and ranking happens after all cells return.
+    """
+
+    lots_input = list(initial_lots)
+    demand_input = list(demand_events)
+    axis_input = sorted(axes, key=lambda value: value.sku)
+    if not axis_input:
+        raise ValueError("at least one sweep axis is required")
+    skus = [value.sku for value in axis_input]
+    if len(skus) != len(set(skus)):
+        raise ValueError("at most one sweep axis is allowed per sku")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    policies = [policy for axis in axis_input for policy in axis.policies()]
+    if not policies:
+        raise ValueError("sweep grid contains no cell with order_up_to >= reorder_point")
+    if len(policies) > maximum_cells:
+        raise ValueError(
+            f"sweep grid has {len(policies)} cells; maximum is {maximum_cells}"
+        )
+    # Validates horizon, lot identifiers, and demand days once for the sweep.
+    simulate_perishable_inventory(
+        lots_input,
+        demand_input,
+        [],
+        horizon_days=horizon_days,
+        compact_events=True,
+    )
+
+    trace = _partition_trace(lots_input, demand_input, skus)
+    if workers == 1:
+        outcomes = [
+            _simulate_cell(trace, horizon_days, policy) for policy in policies
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_install_worker_trace,
+            initargs=(trace, horizon_days),
+        ) as pool:
+            outcomes = list(
+                pool.map(
+                    _simulate_worker_cell,
+                    policies,
+                    chunksize=max(1, len(policies) // (workers * 4)),
+                )
+            )
+
+    rows_by_sku: Dict[str, List[Tuple[ReorderPolicy, SKUInventoryMetrics, str]]] = {}
+    for policy, (metrics, fingerprint) in zip(policies, outcomes):
+        rows_by_sku.setdefault(policy.sku, []).append(
+            (policy, metrics, fingerprint)
+        )
+    cells: List[PolicySweepCell] = []
+    best: List[PolicySweepCell] = []
+    for sku in skus:
+        ranked = _rank_sku_cells(rows_by_sku[sku])
+        cells.extend(ranked)
+        best.append(ranked[0])
+
+    ignored = sorted(
+        (
+            {value.sku for value in lots_input}
+            | {value.sku for value in demand_input}
+        )
+        - set(skus)
+    )
+    warnings = [
+        "Cells are ranked by fill rate, then expired units; no policy is applied automatically.",
+        "Every cell replays the same realized demand path and is not a forecast of future service.",
+    ]
+    if ignored:
+        warnings.append(
+            "SKUs without a sweep axis were not simulated: " + ", ".join(ignored)
+        )
+    return PolicySweepResult(
+        method="fefo_reorder_policy_grid_sweep_v1",
+        deterministic=True,
+        horizon_days=horizon_days,
+        sweep_fingerprint=sweep_fingerprint(
+            lots_input,
+            demand_input,
+            axis_input,
+            horizon_days,
+        ),
+        cell_count=len(cells),
+        cells=tuple(cells),
+        best_by_sku=tuple(best),
+        warnings=tuple(warnings),
+    )
@@ -8,6 +8,7 @@ recorded in a reproducible event ledger.
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
 import math
@@ -79,6 +80,14 @@ class InventorySimulationEvent:
     metadata: Mapping[str, object] | None = None
 
 
+@dataclass(frozen=True)
+class InventoryEventCounter:
+    sku: str
+    event_type: str
+    count: int
+    quantity: float
+
+
 @dataclass(frozen=True)
 class SKUInventoryMetrics:
     sku: str
@@ -113,6 +122,7 @@ class InventorySimulationResult:
     order_count: int
     per_sku: Tuple[SKUInventoryMetrics, ...]
     events: Tuple[InventorySimulationEvent, ...]
+    event_counters: Tuple[InventoryEventCounter, ...] = ()
 
 
 @dataclass
@@ -123,6 +133,10 @@ class _MutableLot:
     expires_day: int
 
 
+def _lot_order(value: _MutableLot) -> tuple[int, str]:
+    return value.expires_day, value.lot_id
+
+
 @dataclass(frozen=True)
 class _PendingOrder:
     order_id: str
@@ -193,7 +207,17 @@ def simulate_perishable_inventory(
     policies: Iterable[ReorderPolicy],
     *,
     horizon_days: int,
+    compact_events: bool = False,
 ) -> InventorySimulationResult:
+    """Replay demand against FEFO lots and fixed reorder policies.
+
+    Each SKU keeps its lots in one queue ordered by ``(expires_day, lot_id)``,
+    so expiry and FEFO allocation only touch the queue head, and orders are
+    filed in a day-indexed arrival calendar. With ``compact_events`` the
+    per-movement ledger is omitted and only ``event_counters`` are reported;
+    metrics and the input fingerprint are unaffected.
+    """
+
     lots_input = list(initial_lots)
     demand_input = list(demand_events)
     policy_input = list(policies)
@@ -207,21 +231,29 @@ def simulate_perishable_inventory(
 
     lots: Dict[str, List[_MutableLot]] = {}
     for value in lots_input:
-        lots.setdefault(value.sku, []).append(
-            _MutableLot(
-                lot_id=value.lot_id,
-                sku=value.sku,
-                quantity=float(value.quantity),
-                expires_day=value.expires_day,
+        queue = lots.setdefault(value.sku, [])
+        # Lots at or below the tolerance would be dropped on day zero without
+        # an event, before any demand can reach them.
+        if value.quantity > 1e-12:
+            queue.append(
+                _MutableLot(
+                    lot_id=value.lot_id,
+                    sku=value.sku,
+                    quantity=float(value.quantity),
+                    expires_day=value.expires_day,
+                )
             )
-        )
+    for queue in lots.values():
+        queue.sort(key=_lot_order)
     policies_by_sku = {value.sku: value for value in policy_input}
     demands_by_day: Dict[int, List[DemandEvent]] = {}
     for value in demand_input:
         demands_by_day.setdefault(value.day, []).append(value)
 
-    pending: List[_PendingOrder] = []
+    arrivals_by_day: Dict[int, List[_PendingOrder]] = {}
+    on_order_by_sku: Dict[str, List[_PendingOrder]] = {}
     events: List[InventorySimulationEvent] = []
+    counters: Dict[Tuple[str, str], List[float]] = {}
     totals: Dict[str, Dict[str, float]] = {}
     stockout_counts: Dict[str, int] = {}
     order_counts: Dict[str, int] = {}
@@ -241,13 +273,36 @@ def simulate_perishable_inventory(
         order_counts[sku] = 0
         inventory_area[sku] = 0.0
 
+    def record(
+        day: int,
+        event_type: str,
+        sku: str,
+        quantity: float,
+        lot_id: str | None = None,
+        metadata: Mapping[str, object] | None = None,
+    ) -> None:
+        counter = counters.setdefault((sku, event_type), [0, 0.0])
+        counter[0] += 1
+        counter[1] += quantity
+        if not compact_events:
+            events.append(
+                InventorySimulationEvent(
+                    day=day,
+                    event_type=event_type,
+                    sku=sku,
+                    quantity=quantity,
+                    lot_id=lot_id,
+                    metadata=metadata,
+                )
+            )
+
     for day in range(horizon_days):
         arrivals = sorted(
-            [value for value in pending if value.arrival_day == day],
+            arrivals_by_day.pop(day, []),
             key=lambda value: (value.sku, value.order_id),
         )
-        pending = [value for value in pending if value.arrival_day != day]
         for order in arrivals:
+            on_order_by_sku[order.sku].remove(order)
             lot_id = f"{order.order_id}.arrival"
             lot = _MutableLot(
                 lot_id=lot_id,
@@ -255,38 +310,27 @@ def simulate_perishable_inventory(
                 quantity=order.quantity,
                 expires_day=day + order.shelf_life_days,
             )
-            lots.setdefault(order.sku, []).append(lot)
-            events.append(
-                InventorySimulationEvent(
-                    day=day,
-                    event_type="arrival",
-                    sku=order.sku,
-                    quantity=order.quantity,
-                    lot_id=lot_id,
-                    metadata={"order_id": order.order_id},
-                )
+            bisect.insort(lots.setdefault(order.sku, []), lot, key=_lot_order)
+            record(
+                day,
+                "arrival",
+                order.sku,
+                order.quantity,
+                lot_id,
+                {"order_id": order.order_id} if not compact_events else None,
             )
 
         for sku in known_skus:
-            survivors = []
-            for lot in sorted(
-                lots.get(sku, []),
-                key=lambda value: (value.expires_day, value.lot_id),
-            ):
-                if lot.expires_day <= day and lot.quantity > 0:
+            queue = lots.get(sku, [])
+            expired = 0
+            while expired < len(queue) and queue[expired].expires_day <= day:
+                lot = queue[expired]
+                if lot.quantity > 0:
                     totals[sku]["expired"] += lot.quantity
-                    events.append(
-                        InventorySimulationEvent(
-                            day=day,
-                            event_type="expiry",
-                            sku=sku,
-                            quantity=lot.quantity,
-                            lot_id=lot.lot_id,
-                        )
-                    )
-                elif lot.quantity > 1e-12:
-                    survivors.append(lot)
-            lots[sku] = survivors
+                    record(day, "expiry", sku, lot.quantity, lot.lot_id)
+                expired += 1
+            if expired:
+                del queue[:expired]
 
         for demand in sorted(
             demands_by_day.get(day, []),
@@ -296,10 +340,8 @@ def simulate_perishable_inventory(
             quantity = float(demand.quantity)
             totals[sku]["demand"] += quantity
             remaining = quantity
-            for lot in sorted(
-                lots.get(sku, []),
-                key=lambda value: (value.expires_day, value.lot_id),
-            ):
+            queue = lots.get(sku, [])
+            for lot in queue:
                 if remaining <= 1e-12:
                     break
                 used = min(lot.quantity, remaining)
@@ -307,34 +349,23 @@ def simulate_perishable_inventory(
                 remaining -= used
                 totals[sku]["fulfilled"] += used
                 if used > 0:
-                    events.append(
-                        InventorySimulationEvent(
-                            day=day,
-                            event_type="demand_fulfilled",
-                            sku=sku,
-                            quantity=used,
-                            lot_id=lot.lot_id,
-                        )
-                    )
-            lots[sku] = [
-                value for value in lots.get(sku, []) if value.quantity > 1e-12
-            ]
+                    record(day, "demand_fulfilled", sku, used, lot.lot_id)
+            # FEFO only depletes a prefix of the queue; every untouched lot
+            # is still above the tolerance.
+            depleted = 0
+            while depleted < len(queue) and queue[depleted].quantity <= 1e-12:
+                depleted += 1
+            if depleted:
+                del queue[:depleted]
             if remaining > 1e-12:
                 totals[sku]["stockout"] += remaining
                 stockout_counts[sku] += 1
-                events.append(
-                    InventorySimulationEvent(
-                        day=day,
-                        event_type="stockout",
-                        sku=sku,
-                        quantity=remaining,
-                    )
-                )
+                record(day, "stockout", sku, remaining)
 
         for sku, policy in sorted(policies_by_sku.items()):
             on_hand = sum(value.quantity for value in lots.get(sku, []))
             on_order = sum(
-                value.quantity for value in pending if value.sku == sku
+                value.quantity for value in on_order_by_sku.get(sku, [])
             )
             inventory_position = on_hand + on_order
             if inventory_position <= policy.reorder_point + 1e-12:
@@ -342,28 +373,30 @@ def simulate_perishable_inventory(
                 if quantity > 1e-12:
                     order_counts[sku] += 1
                     order_id = f"order.{sku}.{day}.{order_counts[sku]}"
-                    pending.append(
-                        _PendingOrder(
-                            order_id=order_id,
-                            sku=sku,
-                            quantity=quantity,
-                            arrival_day=day + policy.lead_time_days,
-                            shelf_life_days=policy.shelf_life_days,
-                        )
+                    order = _PendingOrder(
+                        order_id=order_id,
+                        sku=sku,
+                        quantity=quantity,
+                        arrival_day=day + policy.lead_time_days,
+                        shelf_life_days=policy.shelf_life_days,
                     )
+                    arrivals_by_day.setdefault(order.arrival_day, []).append(order)
+                    on_order_by_sku.setdefault(sku, []).append(order)
                     totals[sku]["ordered"] += quantity
-                    events.append(
-                        InventorySimulationEvent(
-                            day=day,
-                            event_type="order_placed",
-                            sku=sku,
-                            quantity=quantity,
-                            metadata={
+                    record(
+                        day,
+                        "order_placed",
+                        sku,
+                        quantity,
+                        metadata=(
+                            {
                                 "order_id": order_id,
-                                "arrival_day": day + policy.lead_time_days,
+                                "arrival_day": order.arrival_day,
                                 "inventory_position": inventory_position,
-                            },
-                        )
+                            }
+                            if not compact_events
+                            else None
+                        ),
                     )
 
         for sku in known_skus:
@@ -421,4 +454,13 @@ def simulate_perishable_inventory(
         order_count=sum(value.order_count for value in per_sku),
         per_sku=tuple(per_sku),
         events=tuple(events),
+        event_counters=tuple(
+            InventoryEventCounter(
+                sku=sku,
+                event_type=event_type,
+                count=int(count),
+                quantity=quantity,
+            )
+            for (sku, event_type), (count, quantity) in sorted(counters.items())
+        ),
     )
@@ -13,7 +13,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-import numpy as np
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -82,6 +81,8 @@ def artifact_entry(path: Path, *, root: Optional[Path] = None, media_type: str =
 
 
 def environment_snapshot() -> Dict[str, Any]:
+    import numpy as np
+
     return {
         "python": sys.version,
         "platform": platform.platform(),
@@ -92,6 +93,8 @@ def environment_snapshot() -> Dict[str, Any]:
 
 
 def seed_everything(seed: int) -> None:
+    import numpy as np
+
     random.seed(seed)
     np.random.seed(seed)
 
@@ -17,7 +17,9 @@ from backend.research.solver_baselines import (
     PlannerOption,
     PlannerTargets,
     SolverResult,
+    beam_search_optimize,
     cp_sat_optimize,
+    dynamic_programming_optimize,
     evaluate_selection,
     milp_optimize,
     pareto_enumeration,
@@ -27,6 +29,8 @@ from backend.research.solver_baselines import (
 Solver = Callable[[Iterable[PlannerOption], PlannerTargets], SolverResult]
 DEFAULT_SOLVERS: Dict[str, Solver] = {
     "pareto": pareto_enumeration,
+    "beam": beam_search_optimize,
+    "exact_dp": dynamic_programming_optimize,
     "cp_sat": cp_sat_optimize,
     "milp": milp_optimize,
 }
@@ -251,6 +255,10 @@ def run_benchmark(
             gate_failures.append(f"{name}:nondeterministic")
         if not valid:
             gate_failures.append(f"{name}:invalid_selection")
+        if any(
+            run["diagnostics"].get("proven_optimal") == 0 for run in runs
+        ):
+            gate_failures.append(f"{name}:optimality_not_proven")
 
     completed = {
         name: value
@@ -266,6 +274,17 @@ def run_benchmark(
         ),
         default=None,
     )
+    # Solvers that certify an optimum (or a bound on it) report
+    # ``objective_upper_bound``; the tightest one measures every other
+    # solver's distance from the true optimum, not just from the best run.
+    certified_bound = min(
+        (
+            float(value["representative"]["diagnostics"]["objective_upper_bound"])
+            for value in completed.values()
+            if "objective_upper_bound" in value["representative"]["diagnostics"]
+        ),
+        default=None,
+    )
     comparisons = {}
     for name, value in completed.items():
         objective = value["representative"]["audit"]["common_objective"]
@@ -273,13 +292,18 @@ def run_benchmark(
         comparisons[name] = {
             "common_objective": objective,
             "gap_to_best": gap,
+            "gap_to_upper_bound": (
+                round(certified_bound - objective, 8)
+                if certified_bound is not None
+                else None
+            ),
         }
         if max_objective_gap is not None and gap is not None and gap > max_objective_gap:
             gate_failures.append(f"{name}:objective_gap_exceeded")
 
     slots = sorted({option.slot for option in options})
     report = {
-        "schema_version": 2,
+        "schema_version": 3,
         "problem_fingerprint": canonical_fingerprint(raw_problem),
         "problem": {
             "slot_count": len(slots),
@@ -298,6 +322,7 @@ def run_benchmark(
         "results": results,
         "comparisons": {
             "best_common_objective": best_objective,
+            "certified_upper_bound": certified_bound,
             "solvers": comparisons,
             "maximum_allowed_gap": max_objective_gap,
         },
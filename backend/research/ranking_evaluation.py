@@ -11,6 +11,7 @@ import hashlib
 import json
 import math
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
@@ -156,110 +157,359 @@ def intra_list_diversity(
 ) -> float:
     if len(item_ids) < 2:
         return 0.0
+    vectors = [np.asarray(feature_map[value], dtype=float) for value in item_ids]
     distances = []
-    for left_index in range(len(item_ids)):
-        for right_index in range(left_index + 1, len(item_ids)):
-            left = np.asarray(feature_map[item_ids[left_index]], dtype=float)
-            right = np.asarray(feature_map[item_ids[right_index]], dtype=float)
+    for left_index in range(len(vectors)):
+        left = vectors[left_index]
+        for right in vectors[left_index + 1 :]:
             if left.shape != right.shape or left.ndim != 1:
                 raise ValueError("feature vectors must be aligned one-dimensional arrays")
             distances.append(1.0 - _cosine(left, right))
     return sum(distances) / len(distances)
 
 
-def _novelty(
-    item_ids: Sequence[str],
-    popularity: Mapping[str, int],
-    total_events: int,
-    catalog_size: int,
-) -> float:
-    if not item_ids:
-        return 0.0
-    denominator = total_events + catalog_size
-    return sum(
-        -math.log2((popularity.get(item_id, 0) + 1) / denominator)
-        for item_id in item_ids
-    ) / len(item_ids)
+# Upper bound on gathered feature values per batched dot-product call.
+_GATHER_LIMIT = 2_000_000
 
 
-def evaluate_rankings(
-    *,
-    model_id: str,
-    recommendations: Mapping[str, Sequence[RankedItem]],
-    split: TemporalRankingSplit,
+def _sequential_means(terms: np.ndarray) -> np.ndarray:
+    """Row means summed left to right from zero, exactly like ``sum()/len``.
+
+    NumPy's ``sum`` is pairwise and can differ in the last bit from Python's
+    ``sum``; ``cumsum`` is strictly sequential.
+    """
+
+    padded = np.concatenate((np.zeros((len(terms), 1)), terms), axis=1)
+    return np.cumsum(padded, axis=1)[:, -1] / terms.shape[1]
+
+
+@dataclass(frozen=True)
+class _EvaluationContext:
+    """Catalog-wide arrays shared by every evaluation chunk.
+
+    Features are stored as one matrix per feature length, so a recommendation
+    list reduces to row indices. ``ineligible_codes`` is the sorted sparse
+    mask of ``user_row * catalog_size + item_row`` for every seen or excluded
+    catalog item of an evaluated user.
+    """
+
+    item_index: Mapping[str, int]
+    dimensions: np.ndarray
+    feature_rows: np.ndarray
+    features: Mapping[int, np.ndarray]
+    norms: np.ndarray
+    novelty_terms: np.ndarray
+    ineligible_codes: np.ndarray
+    ineligible_counts: np.ndarray
+
+    @property
+    def catalog_size(self) -> int:
+        return len(self.dimensions)
+
+    def blocked(self, codes: np.ndarray) -> np.ndarray:
+        if not len(self.ineligible_codes):
+            return np.zeros(len(codes), dtype=bool)
+        positions = np.searchsorted(self.ineligible_codes, codes)
+        positions = np.minimum(positions, len(self.ineligible_codes) - 1)
+        return self.ineligible_codes[positions] == codes
+
+    def diversity(self, lists: Sequence[Sequence[int]]) -> np.ndarray:
+        """Mean pairwise cosine distance of every list.
+
+        Each list's pairwise dot products are the strict upper triangle of its
+        Gram submatrix. They are taken with batched vector-vector ``matmul``,
+        which uses the same dot kernel as ``np.dot``; a ``X @ X.T`` product
+        would use a different summation order and change the last bit.
+        """
+
+        result = np.zeros(len(lists))
+        groups: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for position, rows in enumerate(lists):
+            if len(rows) >= 2:
+                groups[(len(rows), int(self.dimensions[rows[0]]))].append(position)
+        for (length, dimension), positions in sorted(groups.items()):
+            left, right = np.triu_indices(length, 1)
+            matrix = self.features[dimension]
+            members = np.array([lists[position] for position in positions])
+            batch = max(1, _GATHER_LIMIT // (len(left) * max(1, dimension)))
+            for start in range(0, len(positions), batch):
+                block = members[start : start + batch]
+                rows = self.feature_rows[block]
+                dots = np.matmul(
+                    matrix[rows[:, left]][..., None, :],
+                    matrix[rows[:, right]][..., :, None],
+                )[..., 0, 0]
+                denominators = self.norms[block[:, left]] * self.norms[block[:, right]]
+                cosine = np.zeros_like(dots)
+                np.divide(dots, denominators, out=cosine, where=denominators > 0)
+                result[positions[start : start + batch]] = _sequential_means(
+                    1.0 - cosine
+                )
+        return result
+
+    def novelty(self, lists: Sequence[Sequence[int]]) -> np.ndarray:
+        result = np.zeros(len(lists))
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for position, rows in enumerate(lists):
+            if rows:
+                groups[len(rows)].append(position)
+        for positions in groups.values():
+            members = np.array([lists[position] for position in positions])
+            result[positions] = _sequential_means(self.novelty_terms[members])
+        return result
+
+
+def _evaluation_context(
     items: Sequence[RankingItem],
-    user_groups: Mapping[str, str],
+    split: TemporalRankingSplit,
+    users: Sequence[str],
     hard_exclusions: Mapping[str, Sequence[str]],
-    k: int,
-) -> RankingEvaluationResult:
-    if not model_id.strip():
-        raise ValueError("model_id cannot be blank")
-    if k < 1:
-        raise ValueError("k must be at least 1")
-    item_map = {value.item_id: value for value in items}
-    if len(item_map) != len(items):
-        raise ValueError("item_id values must be unique")
-    feature_map = {identifier: value.features for identifier, value in item_map.items()}
+) -> _EvaluationContext:
+    item_index = {value.item_id: row for row, value in enumerate(items)}
+    dimensions = np.array([len(value.features) for value in items], dtype=np.int64)
+    feature_rows = np.zeros(len(items), dtype=np.int64)
+    features: Dict[int, np.ndarray] = {}
+    norms = np.zeros(len(items))
+    for dimension in sorted(set(dimensions.tolist())):
+        members = np.flatnonzero(dimensions == dimension)
+        matrix = np.asarray([items[row].features for row in members], dtype=float)
+        feature_rows[members] = np.arange(len(members))
+        features[dimension] = matrix
+        # np.linalg.norm of a vector is sqrt(x.dot(x)); batched matmul keeps
+        # that dot kernel.
+        norms[members] = np.sqrt(
+            np.matmul(matrix[:, None, :], matrix[:, :, None])[:, 0, 0]
+        )
+
     popularity = Counter(value.item_id for value in split.train)
-    seen_by_user: Dict[str, set[str]] = defaultdict(set)
-    for value in split.train:
-        seen_by_user[value.user_id].add(value.item_id)
+    denominator = len(split.train) + len(items)
+    novelty_terms = np.array(
+        [
+            -math.log2((popularity.get(value.item_id, 0) + 1) / denominator)
+            for value in items
+        ]
+    )
 
-    per_user: List[UserRankingMetrics] = []
-    recommended_catalog = set()
-    fingerprint_payload = {}
-    for user_id, relevant_item in sorted(split.test_by_user.items()):
-        if relevant_item not in item_map:
+    catalog_size = len(items)
+    user_rows = {user_id: row for row, user_id in enumerate(users)}
+    codes = [
+        user_rows[value.user_id] * catalog_size + item_index[value.item_id]
+        for value in split.train
+        if value.user_id in user_rows and value.item_id in item_index
+    ]
+    for user_id, values in hard_exclusions.items():
+        row = user_rows.get(user_id)
+        if row is None:
+            continue
+        codes.extend(
+            row * catalog_size + item_index[value]
+            for value in values
+            if value in item_index
+        )
+    ineligible_codes = np.unique(np.asarray(codes, dtype=np.int64))
+    return _EvaluationContext(
+        item_index=item_index,
+        dimensions=dimensions,
+        feature_rows=feature_rows,
+        features=features,
+        norms=norms,
+        novelty_terms=novelty_terms,
+        ineligible_codes=ineligible_codes,
+        ineligible_counts=np.bincount(
+            ineligible_codes // max(1, catalog_size), minlength=len(users)
+        ),
+    )
+
+
+_ChunkEntry = Tuple[str, str, str, Sequence[RankedItem]]
+_ChunkResult = Tuple[List[UserRankingMetrics], List[str], np.ndarray]
+
+_WORKER_CONTEXT: _EvaluationContext | None = None
+
+
+def _evaluate_chunk(
+    context: _EvaluationContext,
+    first_row: int,
+    entries: Sequence[_ChunkEntry],
+) -> _ChunkResult:
+    """Validate and score one contiguous block of sorted users.
+
+    Validation runs user by user before any vectorized scoring so the first
+    invalid user, in sorted order, raises the same error as a scalar loop.
+    """
+
+    catalog_size = context.catalog_size
+    relevant_rows = np.array(
+        [context.item_index.get(relevant, -1) for _user, relevant, _group, _raw in entries],
+        dtype=np.int64,
+    )
+    user_rows = np.arange(first_row, first_row + len(entries), dtype=np.int64)
+    relevant_blocked = context.blocked(user_rows * catalog_size + relevant_rows)
+    single_dimension = len(context.features) == 1
+    lists: List[List[int]] = []
+    fragments: List[str] = []
+    for offset, (user_id, relevant_item, _group, raw) in enumerate(entries):
+        if relevant_rows[offset] < 0:
             raise ValueError(f"test item {relevant_item} is missing from item catalog")
-        exclusions = set(hard_exclusions.get(user_id, ()))
-        eligible = set(item_map) - seen_by_user.get(user_id, set()) - exclusions
-        if relevant_item not in eligible:
+        if relevant_blocked[offset]:
             raise ValueError(
                 f"relevant item {relevant_item} is ineligible for user {user_id}"
             )
-        raw = list(recommendations.get(user_id, ()))[:k]
         identifiers = [value.item_id for value in raw]
         if len(identifiers) != len(set(identifiers)):
             raise ValueError(f"recommendations for {user_id} contain duplicates")
-        unknown = sorted(set(identifiers) - set(item_map))
+        unknown = sorted(set(identifiers) - context.item_index.keys())
         if unknown:
             raise ValueError(
                 f"recommendations for {user_id} reference unknown items: {unknown}"
             )
-        violations = [value for value in identifiers if value not in eligible]
-        rank = (
-            identifiers.index(relevant_item) + 1
-            if relevant_item in identifiers
-            else None
+        rows = [context.item_index[value] for value in identifiers]
+        if (
+            not single_dimension
+            and len({int(context.dimensions[row]) for row in rows}) > 1
+        ):
+            raise ValueError("feature vectors must be aligned one-dimensional arrays")
+        lists.append(rows)
+        fragments.append(
+            json.dumps(user_id)
+            + ":"
+            + json.dumps(
+                [
+                    {"item_id": value.item_id, "score": float(value.score)}
+                    for value in raw
+                ],
+                sort_keys=True,
+                separators=(",", ":"),
+                allow_nan=False,
+            )
         )
-        hit = 1.0 if rank is not None else 0.0
-        reciprocal_rank = 1.0 / rank if rank is not None else 0.0
-        ndcg = 1.0 / math.log2(rank + 1) if rank is not None else 0.0
-        recommended_catalog.update(identifiers)
-        group = user_groups.get(user_id, "unassigned")
-        per_user.append(
+
+    flat_rows = np.fromiter(
+        (row for rows in lists for row in rows),
+        dtype=np.int64,
+        count=sum(len(rows) for rows in lists),
+    )
+    owners = np.repeat(user_rows, [len(rows) for rows in lists])
+    violations = np.bincount(
+        np.repeat(np.arange(len(lists)), [len(rows) for rows in lists])[
+            context.blocked(owners * catalog_size + flat_rows)
+        ],
+        minlength=len(lists),
+    )
+    diversity = context.diversity(lists)
+    novelty = context.novelty(lists)
+    metrics = []
+    for offset, (user_id, relevant_item, group, _raw) in enumerate(entries):
+        rows = lists[offset]
+        relevant_row = int(relevant_rows[offset])
+        rank = rows.index(relevant_row) + 1 if relevant_row in rows else None
+        metrics.append(
             UserRankingMetrics(
                 user_id=user_id,
                 group=group,
                 relevant_item=relevant_item,
-                eligible_candidate_count=len(eligible),
-                recommendation_count=len(identifiers),
-                hit=hit,
-                reciprocal_rank=reciprocal_rank,
-                ndcg=ndcg,
-                novelty=_novelty(
-                    identifiers,
-                    popularity,
-                    len(split.train),
-                    len(item_map),
-                ),
-                diversity=intra_list_diversity(identifiers, feature_map),
-                hard_violation_count=len(violations),
+                eligible_candidate_count=catalog_size
+                - int(context.ineligible_counts[first_row + offset]),
+                recommendation_count=len(rows),
+                hit=1.0 if rank is not None else 0.0,
+                reciprocal_rank=1.0 / rank if rank is not None else 0.0,
+                ndcg=1.0 / math.log2(rank + 1) if rank is not None else 0.0,
+                novelty=float(novelty[offset]),
+                diversity=float(diversity[offset]),
+                hard_violation_count=int(violations[offset]),
             )
         )
-        fingerprint_payload[user_id] = [
-            {"item_id": value.item_id, "score": float(value.score)} for value in raw
-        ]
+    return metrics, fragments, flat_rows
+
+
+def _install_worker_context(context: _EvaluationContext) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _evaluate_worker_chunk(chunk: Tuple[int, Sequence[_ChunkEntry]]) -> _ChunkResult:
+    assert _WORKER_CONTEXT is not None
+    return _evaluate_chunk(_WORKER_CONTEXT, *chunk)
+
+
+def evaluate_rankings(
+    *,
+    model_id: str,
+    recommendations: Mapping[str, Sequence[RankedItem]],
+    split: TemporalRankingSplit,
+    items: Sequence[RankingItem],
+    user_groups: Mapping[str, str],
+    hard_exclusions: Mapping[str, Sequence[str]],
+    k: int,
+    workers: int = 1,
+    chunk_size: int = 4096,
+) -> RankingEvaluationResult:
+    """Evaluate top-``k`` lists for every held-out user.
+
+    Users are scored in sorted blocks of ``chunk_size``; ``workers > 1``
+    spreads blocks over a process pool that receives the catalog arrays once
+    through its initializer. Metrics and ``recommendation_fingerprint`` do
+    not depend on ``workers`` or ``chunk_size``.
+    """
+
+    if not model_id.strip():
+        raise ValueError("model_id cannot be blank")
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    item_map = {value.item_id: value for value in items}
+    if len(item_map) != len(items):
+        raise ValueError("item_id values must be unique")
+    users = sorted(split.test_by_user)
+    context = _evaluation_context(items, split, users, hard_exclusions)
+    chunks = [
+        (
+            start,
+            [
+                (
+                    user_id,
+                    split.test_by_user[user_id],
+                    user_groups.get(user_id, "unassigned"),
+                    list(recommendations.get(user_id, ()))[:k],
+                )
+                for user_id in users[start : start + chunk_size]
+            ],
+        )
+        for start in range(0, len(users), chunk_size)
+    ]
+    if workers == 1:
+        outcomes: Iterable[_ChunkResult] = (
+            _evaluate_chunk(context, start, entries) for start, entries in chunks
+        )
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_install_worker_context,
+            initargs=(context,),
+        )
+        outcomes = pool.map(_evaluate_worker_chunk, chunks)
+
+    per_user: List[UserRankingMetrics] = []
+    recommended = np.zeros(context.catalog_size, dtype=bool)
+    # The canonical JSON of the sorted user->list payload is streamed into
+    # the digest one user at a time instead of being built as one string.
+    digest = hashlib.sha256(b"{")
+    separator = b""
+    try:
+        for metrics, fragments, rows in outcomes:
+            for fragment in fragments:
+                digest.update(separator + fragment.encode("utf-8"))
+                separator = b","
+            per_user.extend(metrics)
+            recommended[rows] = True
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    digest.update(b"}")
 
     if not per_user:
         raise ValueError("no users were evaluated")
@@ -280,12 +530,6 @@ def evaluate_rankings(
         }
         for group, values in sorted(grouped.items())
     }
-    canonical = json.dumps(
-        fingerprint_payload,
-        sort_keys=True,
-        separators=(",", ":"),
-        allow_nan=False,
-    ).encode("utf-8")
     user_count = len(per_user)
     hard_violations = sum(value.hard_violation_count for value in per_user)
     return RankingEvaluationResult(
@@ -296,7 +540,7 @@ def evaluate_rankings(
         hit_rate_at_k=sum(value.hit for value in per_user) / user_count,
         mrr_at_k=sum(value.reciprocal_rank for value in per_user) / user_count,
         ndcg_at_k=sum(value.ndcg for value in per_user) / user_count,
-        catalog_coverage=len(recommended_catalog) / max(1, len(item_map)),
+        catalog_coverage=int(recommended.sum()) / max(1, len(item_map)),
         mean_novelty=sum(value.novelty for value in per_user) / user_count,
         mean_intra_list_diversity=(
             sum(value.diversity for value in per_user) / user_count
@@ -304,5 +548,5 @@ def evaluate_rankings(
         hard_violation_count=hard_violations,
         per_group=per_group,
         per_user=tuple(per_user),
-        recommendation_fingerprint=hashlib.sha256(canonical).hexdigest(),
+        recommendation_fingerprint=digest.hexdigest(),
     )
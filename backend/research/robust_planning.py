@@ -7,12 +7,13 @@ import json
 import math
 from collections import defaultdict
 from dataclasses import asdict, dataclass, replace
-from itertools import product
 from typing import Dict, Iterable, List, Sequence
 
 from backend.research.solver_baselines import (
+    BOUND_SLACK,
     PlannerOption,
     PlannerTargets,
+    SlotSelectionBounds,
     SolverResult,
     evaluate_selection,
 )
@@ -119,12 +120,133 @@ def stress_test_selection(
     }
 
 
+def _selection_scores(
+    selection: Sequence[PlannerOption],
+    targets: PlannerTargets,
+) -> tuple[float, float, bool]:
+    """Return worst objective, mean objective, and scenario cost feasibility.
+
+    ``selection`` is already transformed for one scenario per entry in the
+    outer sequence; the arithmetic matches :func:`stress_test_selection`.
+    """
+
+    objectives = []
+    feasible = True
+    for transformed in selection:
+        objective, metrics = evaluate_selection(transformed, targets)
+        objectives.append(objective)
+        if targets.cost_limit is not None and (
+            max(0.0, metrics["cost"] - targets.cost_limit) > 1e-9
+        ):
+            feasible = False
+    return min(objectives), sum(objectives) / len(objectives), feasible
+
+
+class _RobustSearch:
+    """Slot-wise branch and bound on the worst-case scenario objective.
+
+    Each scenario keeps its own optimistic bounds. A subtree is pruned when
+    any scenario's cost lower bound already violates the budget or when the
+    smallest per-scenario objective bound cannot reach the incumbent.
+    """
+
+    def __init__(
+        self,
+        ordered: Sequence[tuple[str, Sequence[PlannerOption]]],
+        targets: PlannerTargets,
+        scenarios: Sequence[PlannerScenario],
+        maximum_nodes: int,
+    ):
+        self.targets = targets
+        self.maximum_nodes = maximum_nodes
+        self.slots = [values for _slot, values in ordered]
+        self.transformed = {
+            value.option_id: tuple(
+                _scenario_option(value, scenario) for scenario in scenarios
+            )
+            for values in self.slots
+            for value in values
+        }
+        self.bounds = [
+            SlotSelectionBounds(
+                [
+                    (
+                        slot,
+                        [self.transformed[value.option_id][index] for value in values],
+                    )
+                    for slot, values in ordered
+                ],
+                targets,
+            )
+            for index in range(len(scenarios))
+        ]
+        self.nodes = 0
+        self.evaluated = 0
+        self.feasible = 0
+        self.best_worst = -math.inf
+        self.candidates: List[tuple[float, float, tuple[str, ...]]] = []
+
+    def search(
+        self,
+        depth: int = 0,
+        partials: tuple[tuple[float, ...], ...] | None = None,
+        selection: tuple[PlannerOption, ...] = (),
+    ) -> None:
+        self.nodes += 1
+        if self.nodes > self.maximum_nodes:
+            raise ValueError(
+                f"Robust branch and bound exceeded {self.maximum_nodes} nodes "
+                "before proving the worst-case selection"
+            )
+        if partials is None:
+            partials = tuple((0.0,) * 8 for _bound in self.bounds)
+        if depth == len(self.slots):
+            self.evaluated += 1
+            per_scenario = [
+                [self.transformed[value.option_id][index] for value in selection]
+                for index in range(len(self.bounds))
+            ]
+            worst, mean, feasible = _selection_scores(per_scenario, self.targets)
+            if not feasible:
+                return
+            self.feasible += 1
+            if worst >= self.best_worst - BOUND_SLACK:
+                self.best_worst = max(self.best_worst, worst)
+                self.candidates.append(
+                    (worst, mean, tuple(value.option_id for value in selection))
+                )
+            return
+        children = []
+        for value in self.slots[depth]:
+            transformed = self.transformed[value.option_id]
+            extended = tuple(
+                bound.extend(partial, option)
+                for bound, partial, option in zip(self.bounds, partials, transformed)
+            )
+            if any(
+                bound.budget_pruned(depth + 1, partial)
+                for bound, partial in zip(self.bounds, extended)
+            ):
+                continue
+            worst_bound = min(
+                bound.upper_bounds(depth + 1, partial)[0]
+                for bound, partial in zip(self.bounds, extended)
+            )
+            children.append((worst_bound, value, extended))
+        children.sort(key=lambda item: -item[0])
+        for worst_bound, value, extended in children:
+            if worst_bound < self.best_worst - BOUND_SLACK:
+                break
+            self.search(depth + 1, extended, selection + (value,))
+
+
 def robust_pareto_enumeration(
     options: Iterable[PlannerOption],
     targets: PlannerTargets,
     scenarios: Sequence[PlannerScenario],
     *,
-    maximum_combinations: int = 250_000,
+    maximum_combinations: int = 10**15,
+    maximum_nodes: int = 2_000_000,
 ) -> SolverResult:
     if maximum_combinations < 1:
         raise ValueError("maximum_combinations must be at least 1")
@@ -149,36 +271,37 @@ def robust_pareto_enumeration(
             f"limit is {maximum_combinations}"
         )
 
-    feasible = []
-    for selection in product(*(values for _, values in ordered)):
-        audit = stress_test_selection(selection, targets, scenarios)
-        if not bool(audit["all_cost_feasible"]):
-            continue
-        signature = tuple(value.option_id for value in selection)
-        feasible.append(
-            (
-                float(audit["worst_objective"]),
-                float(audit["mean_objective"]),
-                signature,
-                audit,
-            )
-        )
-    if not feasible:
+    search = _RobustSearch(
+        ordered,
+        targets,
+        sorted(scenarios, key=lambda value: value.scenario_id),
+        maximum_nodes,
+    )
+    search.search()
+    if not search.candidates:
         raise ValueError("No complete selection is feasible in every declared scenario")
-    worst, mean, signature, audit = sorted(
-        feasible,
+    worst, mean, signature = sorted(
+        search.candidates,
         key=lambda value: (-value[0], -value[1], value[2]),
     )[0]
+    by_id = {value.option_id: value for _slot, values in ordered for value in values}
+    audit = stress_test_selection(
+        [by_id[identifier] for identifier in signature],
+        targets,
+        scenarios,
+    )
     return SolverResult(
-        method="robust_worst_case_enumeration_v1",
+        method="robust_worst_case_branch_and_bound_v2",
         selected_ids=signature,
         objective=round(worst, 8),
         diagnostics={
             "worst_objective": round(worst, 8),
             "mean_objective": round(mean, 8),
             "scenario_count": len(scenarios),
-            "combinations_inspected": combinations,
-            "robust_feasible_combinations": len(feasible),
+            "search_space_combinations": combinations,
+            "nodes_expanded": search.nodes,
+            "complete_selections_evaluated": search.evaluated,
+            "robust_feasible_selections_evaluated": search.feasible,
             "scenario_fingerprint": scenario_hash,
             "audit_json": json.dumps(
                 audit,
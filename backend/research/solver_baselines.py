@@ -2,14 +2,19 @@
 
 The runtime application does not depend on OR-Tools or PuLP. These adapters are
 offline research baselines loaded only when their optional dependencies are
-installed. The pure-Python Pareto baseline is always available.
+installed. The pure-Python Pareto, beam, and dynamic-programming baselines are
+always available.
 """
 
 from __future__ import annotations
 
+import bisect
+import itertools
+import math
 from dataclasses import dataclass
-from itertools import product
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
 
 
 class OptionalSolverUnavailable(RuntimeError):
@@ -113,63 +118,848 @@ def _group(options: Iterable[PlannerOption]) -> List[Tuple[str, List[PlannerOpti
     return result
 
 
+_SELECTION_FIELDS = (
+    "calories",
+    "protein",
+    "carbs",
+    "fat",
+    "cost",
+    "taste",
+    "variety",
+    "pantry",
+)
+_NUTRITION_WEIGHTS = (
+    ("calories", 0.40),
+    ("protein", 0.25),
+    ("carbs", 0.20),
+    ("fat", 0.15),
+)
+# Bounds are summed in a different order than evaluate_selection, so every
+# pruning comparison keeps this much slack to stay exact.
+BOUND_SLACK = 1e-7
+
+ParetoVector = Tuple[float, float, float, float]
+
+
+def _closeness_bound(lower: float, upper: float, target: float) -> float:
+    if target <= 0:
+        return 1.0 if lower <= 0 else 0.0
+    if lower <= target <= upper:
+        return 1.0
+    return _closeness(lower if lower > target else upper, target)
+
+
+def _pareto_vector(metrics: Mapping[str, float]) -> ParetoVector:
+    return (
+        metrics["nutrition_match"],
+        metrics["taste"],
+        metrics["variety"],
+        metrics["pantry"] - metrics["cost"] * 0.001,
+    )
+
+
+def _dominates(left: ParetoVector, right: ParetoVector) -> bool:
+    return all(a >= b for a, b in zip(left, right)) and any(
+        a > b for a, b in zip(left, right)
+    )
+
+
+class SlotSelectionBounds:
+    """Optimistic bounds for partial slot-ordered selections.
+
+    ``partial`` holds running totals of :data:`_SELECTION_FIELDS` over the
+    first ``depth`` slots. Each bound relaxes the remaining slots to their
+    per-field best case independently, so it is never below the value of any
+    completion of the partial selection.
+    """
+
+    def __init__(
+        self,
+        grouped: Sequence[Tuple[str, Sequence[PlannerOption]]],
+        targets: PlannerTargets,
+    ):
+        self.targets = targets
+        self.slot_count = len(grouped)
+        width = len(_SELECTION_FIELDS)
+        minimum = [0.0] * width
+        maximum = [0.0] * width
+        self._suffix_minimum = [tuple(minimum)]
+        self._suffix_maximum = [tuple(maximum)]
+        for _slot, values in reversed(grouped):
+            for index, name in enumerate(_SELECTION_FIELDS):
+                column = [float(getattr(value, name)) for value in values]
+                minimum[index] += min(column)
+                maximum[index] += max(column)
+            self._suffix_minimum.append(tuple(minimum))
+            self._suffix_maximum.append(tuple(maximum))
+        self._suffix_minimum.reverse()
+        self._suffix_maximum.reverse()
+
+    @staticmethod
+    def extend(partial: Tuple[float, ...], value: PlannerOption) -> Tuple[float, ...]:
+        return tuple(
+            total + getattr(value, name)
+            for total, name in zip(partial, _SELECTION_FIELDS)
+        )
+
+    def cost_lower_bound(self, depth: int, partial: Tuple[float, ...]) -> float:
+        return partial[4] + self._suffix_minimum[depth][4]
+
+    def budget_pruned(self, depth: int, partial: Tuple[float, ...]) -> bool:
+        limit = self.targets.cost_limit
+        return limit is not None and (
+            self.cost_lower_bound(depth, partial) > limit + 1e-9 + BOUND_SLACK
+        )
+
+    def upper_bounds(
+        self,
+        depth: int,
+        partial: Tuple[float, ...],
+    ) -> Tuple[float, ParetoVector]:
+        """Return bounds on the objective and on every Pareto component."""
+
+        lower = [
+            total + value
+            for total, value in zip(partial, self._suffix_minimum[depth])
+        ]
+        upper = [
+            total + value
+            for total, value in zip(partial, self._suffix_maximum[depth])
+        ]
+        nutrition = sum(
+            _closeness_bound(
+                lower[index],
+                upper[index],
+                getattr(self.targets, name),
+            )
+            * weight
+            for index, (name, weight) in enumerate(_NUTRITION_WEIGHTS)
+        )
+        count = max(1, self.slot_count)
+        taste = upper[5] / count
+        variety = upper[6] / count
+        pantry = upper[7] / count
+        cost = lower[4]
+        cost_penalty = 0.0
+        limit = self.targets.cost_limit
+        if limit is not None and cost > limit:
+            cost_penalty = (cost - limit) / max(1.0, limit)
+        objective = (
+            nutrition * 0.56
+            + taste * 0.18
+            + variety * 0.12
+            + pantry * 0.10
+            - cost_penalty * 0.30
+            - cost * 0.001
+        )
+        return objective, (nutrition, taste, variety, pantry - cost * 0.001)
+
+
+@dataclass(frozen=True)
+class _Leaf:
+    selection: Tuple[PlannerOption, ...]
+    signature: Tuple[str, ...]
+    objective: float
+    metrics: Dict[str, float]
+    vector: ParetoVector
+
+
+class _ParetoSearch:
+    """Best-objective Pareto point search by slot-wise branch and bound.
+
+    The answer is the highest-objective member of the budget-feasible Pareto
+    frontier. The main search prunes subtrees whose objective bound cannot
+    reach the best verified frontier point. A candidate leaf is verified by a
+    bounded dominator search; a dominated candidate is replaced by its
+    dominator until a non-dominated point is reached, so every check adds a
+    frontier point. Verified points are kept sorted by their first component
+    so archive dominance checks only scan points that could dominate.
+    """
+
+    def __init__(
+        self,
+        grouped: Sequence[Tuple[str, Sequence[PlannerOption]]],
+        targets: PlannerTargets,
+        maximum_nodes: int,
+    ):
+        self.slots = [values for _slot, values in grouped]
+        self.targets = targets
+        self.bounds = SlotSelectionBounds(grouped, targets)
+        self.maximum_nodes = maximum_nodes
+        self.nodes = 0
+        self.evaluated = 0
+        self.dominance_searches = 0
+        self.frontier: Dict[Tuple[str, ...], _Leaf] = {}
+        self.archive: List[Tuple[float, Tuple[str, ...]]] = []
+        self.dominated: set[Tuple[str, ...]] = set()
+        self.best_objective = -math.inf
+
+    def _visit(self) -> None:
+        self.nodes += 1
+        if self.nodes > self.maximum_nodes:
+            raise ValueError(
+                f"Pareto branch and bound exceeded {self.maximum_nodes} nodes "
+                "before proving the frontier selection"
+            )
+
+    def _leaf(self, selection: Tuple[PlannerOption, ...]) -> _Leaf | None:
+        self.evaluated += 1
+        objective, metrics = evaluate_selection(selection, self.targets)
+        if (
+            self.targets.cost_limit is not None
+            and metrics["cost"] > self.targets.cost_limit + 1e-9
+        ):
+            return None
+        return _Leaf(
+            selection=selection,
+            signature=tuple(value.option_id for value in selection),
+            objective=objective,
+            metrics=metrics,
+            vector=_pareto_vector(metrics),
+        )
+
+    def _children(
+        self,
+        depth: int,
+        partial: Tuple[float, ...],
+    ) -> List[Tuple[float, ParetoVector, PlannerOption, Tuple[float, ...]]]:
+        children = []
+        for value in self.slots[depth]:
+            extended = self.bounds.extend(partial, value)
+            if self.bounds.budget_pruned(depth + 1, extended):
+                continue
+            objective, vector = self.bounds.upper_bounds(depth + 1, extended)
+            children.append((objective, vector, value, extended))
+        children.sort(key=lambda item: -item[0])
+        return children
+
+    def _archived_dominator(self, vector: ParetoVector) -> _Leaf | None:
+        start = bisect.bisect_left(self.archive, (vector[0],))
+        for _first, signature in self.archive[start:]:
+            leaf = self.frontier[signature]
+            if _dominates(leaf.vector, vector):
+                return leaf
+        return None
+
+    def _find_dominator(
+        self,
+        vector: ParetoVector,
+        depth: int = 0,
+        partial: Tuple[float, ...] = (0.0,) * len(_SELECTION_FIELDS),
+        selection: Tuple[PlannerOption, ...] = (),
+    ) -> _Leaf | None:
+        self._visit()
+        if depth == len(self.slots):
+            leaf = self._leaf(selection)
+            if leaf is not None and _dominates(leaf.vector, vector):
+                return leaf
+            return None
+        for _objective, bound, value, extended in self._children(depth, partial):
+            if any(
+                limit < required - BOUND_SLACK
+                for limit, required in zip(bound, vector)
+            ):
+                continue
+            found = self._find_dominator(
+                vector,
+                depth + 1,
+                extended,
+                selection + (value,),
+            )
+            if found is not None:
+                return found
+        return None
+
+    def _verify(self, leaf: _Leaf) -> None:
+        current: _Leaf | None = leaf
+        while current is not None:
+            signature = current.signature
+            if signature in self.frontier or signature in self.dominated:
+                return
+            dominator = self._archived_dominator(current.vector)
+            if dominator is None:
+                self.dominance_searches += 1
+                dominator = self._find_dominator(current.vector)
+            if dominator is None:
+                self.frontier[signature] = current
+                bisect.insort(self.archive, (current.vector[0], signature))
+                self.best_objective = max(self.best_objective, current.objective)
+                return
+            self.dominated.add(signature)
+            current = dominator
+
+    def search(
+        self,
+        depth: int = 0,
+        partial: Tuple[float, ...] = (0.0,) * len(_SELECTION_FIELDS),
+        selection: Tuple[PlannerOption, ...] = (),
+    ) -> None:
+        self._visit()
+        if depth == len(self.slots):
+            leaf = self._leaf(selection)
+            if leaf is not None and leaf.objective >= self.best_objective:
+                self._verify(leaf)
+            return
+        for objective, _vector, value, extended in self._children(depth, partial):
+            if objective < self.best_objective - BOUND_SLACK:
+                # Children are sorted by bound, so no later sibling can reach
+                # the incumbent either.
+                break
+            self.search(depth + 1, extended, selection + (value,))
+
+
 def pareto_enumeration(
     options: Iterable[PlannerOption],
     targets: PlannerTargets,
     *,
-    maximum_combinations: int = 250_000,
+    maximum_combinations: int = 10**15,
+    maximum_nodes: int = 2_000_000,
 ) -> SolverResult:
-    """Enumerate bounded problems under the same hard budget as exact solvers."""
+    """Return the best-objective plan on the budget-feasible Pareto frontier.
+
+    The result is the same selection the exhaustive frontier enumeration
+    returns, found by slot-wise branch and bound instead of ``product()``.
+    ``maximum_nodes`` bounds total search work; exceeding it raises instead
+    of returning an unproven selection.
+    """
 
     grouped = _group(options)
-    combinations = 1
-    for _, values in grouped:
-        combinations *= len(values)
+    combinations = math.prod(len(values) for _, values in grouped)
     if combinations > maximum_combinations:
         raise ValueError(
             f"Pareto enumeration would inspect {combinations} combinations; "
             f"limit is {maximum_combinations}"
         )
 
-    frontier: List[Tuple[Tuple[float, float, float, float], Tuple[PlannerOption, ...]]] = []
-    inspected = 0
-    feasible = 0
-    skipped_budget = 0
-    for selection in product(*(values for _, values in grouped)):
-        inspected += 1
+    search = _ParetoSearch(grouped, targets, maximum_nodes)
+    search.search()
+    if not search.frontier:
+        budget = (
+            f" under cost limit {targets.cost_limit}"
+            if targets.cost_limit is not None
+            else ""
+        )
+        raise ValueError(f"No complete slot selection is feasible{budget}")
+
+    best = max(
+        search.frontier.values(),
+        key=lambda item: (item.objective, tuple(reversed(item.signature))),
+    )
+    return SolverResult(
+        method="pure_python_pareto_branch_and_bound_v3",
+        selected_ids=best.signature,
+        objective=round(best.objective, 8),
+        diagnostics={
+            **{key: round(value, 8) for key, value in best.metrics.items()},
+            "search_space_combinations": combinations,
+            "nodes_expanded": search.nodes,
+            "complete_selections_evaluated": search.evaluated,
+            "dominance_searches": search.dominance_searches,
+            "verified_frontier_points": len(search.frontier),
+        },
+    )
+
+
+def _selection_result(
+    method: str,
+    selection: Sequence[PlannerOption],
+    targets: PlannerTargets,
+    diagnostics: Mapping[str, float | int | str],
+) -> SolverResult:
+    objective, metrics = evaluate_selection(selection, targets)
+    return SolverResult(
+        method=method,
+        selected_ids=tuple(value.option_id for value in selection),
+        objective=round(objective, 8),
+        diagnostics={
+            **{key: round(value, 8) for key, value in metrics.items()},
+            **diagnostics,
+        },
+    )
+
+
+def _within_budget(cost: float, targets: PlannerTargets) -> bool:
+    return targets.cost_limit is None or cost <= targets.cost_limit + 1e-9
+
+
+def _prorated_objective(
+    totals: Tuple[float, ...],
+    count: int,
+    slot_count: int,
+    targets: PlannerTargets,
+) -> float:
+    """Score a partial selection against targets scaled to its slot share."""
+
+    share = count / slot_count
+    nutrition = sum(
+        _closeness(totals[index], getattr(targets, name) * share) * weight
+        for index, (name, weight) in enumerate(_NUTRITION_WEIGHTS)
+    )
+    return (
+        nutrition * 0.56
+        + (totals[5] * 0.18 + totals[6] * 0.12 + totals[7] * 0.10) / count
+        - totals[4] * 0.001
+    )
+
+
+def _beam_selection(
+    grouped: Sequence[Tuple[str, Sequence[PlannerOption]]],
+    targets: PlannerTargets,
+    beam_width: int,
+) -> Tuple[PlannerOption, ...] | None:
+    bounds = SlotSelectionBounds(grouped, targets)
+    beam: List[Tuple[Tuple[PlannerOption, ...], Tuple[float, ...]]] = [
+        ((), (0.0,) * len(_SELECTION_FIELDS))
+    ]
+    for depth, (_slot, values) in enumerate(grouped):
+        expanded = []
+        for selection, partial in beam:
+            for value in values:
+                extended = bounds.extend(partial, value)
+                if bounds.budget_pruned(depth + 1, extended):
+                    continue
+                chosen = selection + (value,)
+                score = _prorated_objective(
+                    extended, depth + 1, len(grouped), targets
+                )
+                expanded.append(
+                    (-score, tuple(item.option_id for item in chosen), chosen, extended)
+                )
+        expanded.sort(key=lambda item: (item[0], item[1]))
+        beam = [
+            (chosen, extended)
+            for _score, _ids, chosen, extended in expanded[:beam_width]
+        ]
+    best: Tuple[float, Tuple[PlannerOption, ...]] | None = None
+    for selection, _partial in beam:
         objective, metrics = evaluate_selection(selection, targets)
-        if (
-            targets.cost_limit is not None
-            and metrics["cost"] > targets.cost_limit + 1e-9
+        if _within_budget(metrics["cost"], targets) and (
+            best is None or objective > best[0]
         ):
-            skipped_budget += 1
-            continue
-        feasible += 1
-        vector = (
-            metrics["nutrition_match"],
-            metrics["taste"],
-            metrics["variety"],
-            metrics["pantry"] - metrics["cost"] * 0.001,
+            best = (objective, selection)
+    return best[1] if best is not None else None
+
+
+def beam_search_optimize(
+    options: Iterable[PlannerOption],
+    targets: PlannerTargets,
+    *,
+    beam_width: int = 48,
+) -> SolverResult:
+    """Deterministic slot-by-slot beam search over the common objective.
+
+    Partial selections are ranked against targets prorated to the slots
+    filled so far, mirroring the runtime weekly optimizer's bounded beam. The
+    result is a heuristic baseline and carries no optimality claim.
+    """
+
+    if beam_width < 1:
+        raise ValueError("beam_width must be positive")
+    grouped = _group(options)
+    selection = _beam_selection(grouped, targets, beam_width)
+    if selection is None:
+        raise ValueError(
+            f"Beam search found no selection under cost limit {targets.cost_limit}"
         )
-        dominated = False
-        survivors = []
-        for old_vector, old_selection in frontier:
-            old_dominates = all(a >= b for a, b in zip(old_vector, vector)) and any(
-                a > b for a, b in zip(old_vector, vector)
+    return _selection_result(
+        "deterministic_slot_beam_search_v1",
+        selection,
+        targets,
+        {"beam_width": beam_width},
+    )
+
+
+def _improve_by_swaps(
+    grouped: Sequence[Tuple[str, Sequence[PlannerOption]]],
+    targets: PlannerTargets,
+    selection: Tuple[PlannerOption, ...],
+) -> Tuple[float, Tuple[PlannerOption, ...]]:
+    """Apply first-improvement single-slot swaps until none helps."""
+
+    current = list(selection)
+    best, _metrics = evaluate_selection(current, targets)
+    improved = True
+    while improved:
+        improved = False
+        for index, (_slot, values) in enumerate(grouped):
+            for value in values:
+                previous = current[index]
+                if value is previous:
+                    continue
+                current[index] = value
+                objective, metrics = evaluate_selection(current, targets)
+                if _within_budget(metrics["cost"], targets) and objective > best:
+                    best = objective
+                    improved = True
+                else:
+                    current[index] = previous
+    return best, tuple(current)
+
+
+class _MacroDynamicProgram:
+    """Exact slot-layer dynamic program over discretized macro sums.
+
+    Labels are partial selections carrying exact macro, cost, and linear
+    score totals. Two pruning rules keep the layers small without losing the
+    optimum:
+
+    * Lagrangian bounds. Each nutrition closeness term is at most
+      ``1 - lambda * (total - target) / target`` for any admissible
+      ``lambda``; with a fixed multiplier grid the remaining slots separate,
+      so suffix maxima per multiplier are precomputed and a label's bound is
+      a minimum over one matrix product. Labels whose bound cannot reach the
+      incumbent are dropped.
+    * Bucket dominance. Labels whose macro totals fall into the same
+      ``resolution * target`` cell differ in every closeness term by less
+      than ``resolution``. A label is dropped when another label in its cell
+      costs no more and its linear score is higher by more than that
+      Lipschitz gap, because every completion of it is then strictly worse.
+
+    When a layer still exceeds ``maximum_labels`` the labels with the highest
+    bounds are kept and the run reports the largest discarded bound instead
+    of claiming optimality.
+    """
+
+    _CHUNK = 8192
+
+    def __init__(
+        self,
+        grouped: Sequence[Tuple[str, Sequence[PlannerOption]]],
+        targets: PlannerTargets,
+        resolution: float,
+    ):
+        self.grouped = grouped
+        self.targets = targets
+        self.slot_count = len(grouped)
+        names = [name for name, _weight in _NUTRITION_WEIGHTS]
+        self.target = np.array([getattr(targets, name) for name in names], dtype=float)
+        weights = np.array([weight for _name, weight in _NUTRITION_WEIGHTS])
+        self.nutrition_weights = 0.56 * weights
+        self.positive = self.target > 0
+        self.safe_target = np.where(self.positive, self.target, 1.0)
+        self.coefficient = np.where(
+            self.positive, self.nutrition_weights / self.safe_target, 0.0
+        )
+        self.nutrition_ceiling = float(self.nutrition_weights.sum())
+        # Cells are exact values for non-positive targets, whose closeness is
+        # a step function with no Lipschitz bound.
+        self.width = np.where(self.positive, resolution * self.target, 0.0)
+        self.gap = 0.56 * resolution * float(weights[self.positive].sum())
+        self.macros = [
+            np.array(
+                [[float(getattr(value, name)) for name in names] for value in values]
+            )
+            for _slot, values in grouped
+        ]
+        self.costs = [
+            np.array([float(value.cost) for value in values])
+            for _slot, values in grouped
+        ]
+        self.scores = [
+            np.array(
+                [
+                    (value.taste * 0.18 + value.variety * 0.12 + value.pantry * 0.10)
+                    / self.slot_count
+                    - value.cost * 0.001
+                    for value in values
+                ]
+            )
+            for _slot, values in grouped
+        ]
+        self.suffix_minimum = np.zeros((self.slot_count + 1, 4))
+        self.suffix_maximum = np.zeros((self.slot_count + 1, 4))
+        self.suffix_cost = np.zeros(self.slot_count + 1)
+        for depth in range(self.slot_count - 1, -1, -1):
+            following = depth + 1
+            macros = self.macros[depth]
+            self.suffix_minimum[depth] = self.suffix_minimum[following] + macros.min(0)
+            self.suffix_maximum[depth] = self.suffix_maximum[following] + macros.max(0)
+            self.suffix_cost[depth] = (
+                self.suffix_cost[following] + self.costs[depth].min()
             )
-            new_dominates = all(a >= b for a, b in zip(vector, old_vector)) and any(
-                a > b for a, b in zip(vector, old_vector)
+        self.multipliers = self._multiplier_grid()
+        self.suffix_relaxation = np.zeros((self.slot_count + 1, len(self.multipliers)))
+        for depth in range(self.slot_count - 1, -1, -1):
+            self.suffix_relaxation[depth] = (
+                self.suffix_relaxation[depth + 1] + self._slot_relaxation(depth)
             )
-            if old_dominates:
-                dominated = True
+
+    def _slot_relaxation(self, depth: int) -> np.ndarray:
+        penalised = self.scores[depth][None, :] - self.multipliers @ (
+            self.macros[depth] * self.coefficient
+        ).T
+        return penalised.max(axis=1)
+
+    def _root_multiplier(self, iterations: int = 400) -> np.ndarray:
+        """Approximate the root Lagrangian dual with projected subgradients."""
+
+        multiplier = np.zeros(4)
+        best_value = math.inf
+        best = multiplier
+        offset = self.target * self.coefficient
+        for iteration in range(iterations):
+            value = float(offset @ multiplier)
+            gradient = offset.copy()
+            for depth in range(self.slot_count):
+                scaled = self.macros[depth] * self.coefficient
+                penalised = self.scores[depth] - scaled @ multiplier
+                chosen = int(penalised.argmax())
+                value += float(penalised[chosen])
+                gradient -= scaled[chosen]
+            if value < best_value:
+                best_value = value
+                best = multiplier.copy()
+            norm = float(np.linalg.norm(gradient))
+            if norm == 0.0:
                 break
-            if not new_dominates:
-                survivors.append((old_vector, old_selection))
-        if not dominated:
-            survivors.append((vector, selection))
-            frontier = survivors
+            multiplier = np.clip(
+                multiplier - 0.5 / (iteration + 1) * gradient / norm,
+                -1.0,
+                1.0,
+            )
+            multiplier[~self.positive] = 0.0
+        return best
+
+    def _multiplier_grid(self) -> np.ndarray:
+        candidates = [
+            np.array(values, dtype=float)
+            for values in itertools.product((-1.0, -0.5, 0.0, 0.5, 1.0), repeat=4)
+        ]
+        root = self._root_multiplier()
+        candidates.append(root)
+        for index in range(4):
+            for delta in (-0.15, -0.05, 0.05, 0.15):
+                shifted = root.copy()
+                shifted[index] = min(1.0, max(-1.0, shifted[index] + delta))
+                candidates.append(shifted)
+        grid = np.unique(np.array(candidates), axis=0)
+        return grid[np.all((grid == 0.0) | self.positive, axis=1)]
+
+    def _upper_bounds(
+        self, depth: int, macros: np.ndarray, scores: np.ndarray
+    ) -> np.ndarray:
+        deviation = macros - self.target
+        bounds = np.empty(len(scores))
+        for start in range(0, len(scores), self._CHUNK):
+            window = slice(start, start + self._CHUNK)
+            relaxed = self.suffix_relaxation[depth][None, :] - (
+                deviation[window] * self.coefficient
+            ) @ self.multipliers.T
+            bounds[window] = relaxed.min(axis=1)
+        # A multiplier is admissible only while the linear majorant stays
+        # non-negative wherever the closeness term is clipped at zero.
+        highest = deviation + self.suffix_maximum[depth]
+        lowest = deviation + self.suffix_minimum[depth]
+        clipped = np.any(
+            self.positive & ((highest > self.target) | (lowest < -self.target)),
+            axis=1,
+        )
+        for row in np.flatnonzero(clipped):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                upper = np.where(
+                    self.positive & (highest[row] > self.target),
+                    self.target / highest[row],
+                    1.0,
+                )
+                lower = np.where(
+                    self.positive & (lowest[row] < -self.target),
+                    self.target / lowest[row],
+                    -1.0,
+                )
+            admissible = np.all(
+                (self.multipliers >= lower) & (self.multipliers <= upper),
+                axis=1,
+            )
+            relaxed = self.suffix_relaxation[depth][admissible] - (
+                deviation[row] * self.coefficient
+            ) @ self.multipliers[admissible].T
+            bounds[row] = relaxed.min()
+        return scores + self.nutrition_ceiling + bounds
+
+    def _objectives(self, macros: np.ndarray, scores: np.ndarray) -> np.ndarray:
+        closeness = np.where(
+            self.positive,
+            np.maximum(0.0, 1.0 - np.abs(macros - self.target) / self.safe_target),
+            (macros <= 0).astype(float),
+        )
+        return scores + closeness @ self.nutrition_weights
 
-    if not frontier:
+    def _undominated(
+        self, macros: np.ndarray, costs: np.ndarray, scores: np.ndarray
+    ) -> np.ndarray:
+        cells = np.where(
+            self.positive,
+            np.floor(macros / np.where(self.positive, self.width, 1.0)),
+            macros,
+        )
+        order = np.lexsort((-scores, costs, *cells.T[::-1]))
+        ordered = cells[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+        group = np.cumsum(first) - 1
+        ordered_scores = scores[order]
+        # Offsetting each cell by more than the score range lets one running
+        # maximum stand in for a per-cell maximum over cheaper labels.
+        span = float(ordered_scores.max() - ordered_scores.min()) + 1.0
+        shifted = ordered_scores + group * span
+        previous = np.concatenate(([-np.inf], np.maximum.accumulate(shifted)[:-1]))
+        previous[first] = -np.inf
+        dominated = previous - group * span >= ordered_scores + self.gap + BOUND_SLACK
+        keep = order[~dominated]
+        # Identical totals have identical completions; keep the first.
+        _values, unique = np.unique(
+            np.column_stack((macros[keep], costs[keep], scores[keep])),
+            axis=0,
+            return_index=True,
+        )
+        return np.sort(keep[unique])
+
+    def solve(
+        self, incumbent: float, maximum_labels: int
+    ) -> Tuple[List[Tuple[float, Tuple[PlannerOption, ...]]], Dict[str, float | int]]:
+        limit = self.targets.cost_limit
+        macros = np.zeros((1, 4))
+        costs = np.zeros(1)
+        scores = np.zeros(1)
+        parents: List[np.ndarray] = []
+        choices: List[np.ndarray] = []
+        discarded_bound = -math.inf
+        expanded = 0
+        widest = 1
+        for depth in range(self.slot_count):
+            if not len(costs):
+                break
+            width = len(self.costs[depth])
+            parts = []
+            for start in range(0, len(costs), max(1, self._CHUNK // width)):
+                stop = min(len(costs), start + max(1, self._CHUNK // width))
+                parent = np.repeat(np.arange(start, stop), width)
+                choice = np.tile(np.arange(width), stop - start)
+                child_costs = costs[parent] + self.costs[depth][choice]
+                child_macros = macros[parent] + self.macros[depth][choice]
+                child_scores = scores[parent] + self.scores[depth][choice]
+                expanded += len(parent)
+                keep = np.ones(len(parent), dtype=bool)
+                if limit is not None:
+                    keep &= (
+                        child_costs + self.suffix_cost[depth + 1]
+                        <= limit + 1e-9 + BOUND_SLACK
+                    )
+                bounds = np.full(len(parent), -np.inf)
+                bounds[keep] = self._upper_bounds(
+                    depth + 1, child_macros[keep], child_scores[keep]
+                )
+                keep &= bounds >= incumbent - BOUND_SLACK
+                parts.append(
+                    tuple(
+                        array[keep]
+                        for array in (
+                            parent,
+                            choice,
+                            child_macros,
+                            child_costs,
+                            child_scores,
+                            bounds,
+                        )
+                    )
+                )
+            parent, choice, macros, costs, scores, bounds = (
+                np.concatenate([part[index] for part in parts]) for index in range(6)
+            )
+            if len(costs):
+                keep = self._undominated(macros, costs, scores)
+                parent, choice, macros, costs, scores, bounds = (
+                    array[keep]
+                    for array in (parent, choice, macros, costs, scores, bounds)
+                )
+            if len(costs) > maximum_labels:
+                ranked = np.lexsort((np.arange(len(bounds)), -bounds))
+                discarded_bound = max(
+                    discarded_bound, float(bounds[ranked[maximum_labels]])
+                )
+                keep = np.sort(ranked[:maximum_labels])
+                parent, choice, macros, costs, scores = (
+                    array[keep] for array in (parent, choice, macros, costs, scores)
+                )
+            parents.append(parent)
+            choices.append(choice)
+            widest = max(widest, len(costs))
+
+        final = self._objectives(macros, scores)
+        candidates = []
+        if len(final) and len(parents) == self.slot_count:
+            for label in np.flatnonzero(final >= final.max() - BOUND_SLACK):
+                selection = []
+                index = int(label)
+                for depth in range(self.slot_count - 1, -1, -1):
+                    selection.append(self.grouped[depth][1][int(choices[depth][index])])
+                    index = int(parents[depth][index])
+                selection.reverse()
+                candidates.append((float(final[label]), tuple(selection)))
+        return candidates, {
+            "labels_expanded": expanded,
+            "maximum_layer_labels": widest,
+            "lagrangian_multipliers": len(self.multipliers),
+            "discarded_bound": discarded_bound,
+        }
+
+
+def dynamic_programming_optimize(
+    options: Iterable[PlannerOption],
+    targets: PlannerTargets,
+    *,
+    resolution: float = 0.001,
+    maximum_labels: int = 250_000,
+    beam_width: int = 48,
+) -> SolverResult:
+    """Maximize the common objective under the hard cost limit without solvers.
+
+    A beam search plus single-slot swaps supplies the incumbent; the macro
+    dynamic program then proves or improves it. ``resolution`` sets the
+    dominance cell width as a fraction of each macro target and trades layer
+    size against pruning, never exactness. ``proven_optimal`` is 0 only when
+    a cut to ``maximum_labels`` discarded a label that could still beat the
+    result; ``objective_upper_bound`` then certifies how far the returned plan
+    can be from the optimum.
+    """
+
+    if not 0 < resolution <= 0.1:
+        raise ValueError("resolution must be in (0, 0.1]")
+    if maximum_labels < 1:
+        raise ValueError("maximum_labels must be positive")
+    grouped = _group(options)
+    combinations = math.prod(len(values) for _, values in grouped)
+    program = _MacroDynamicProgram(grouped, targets, resolution)
+    candidates: List[Tuple[float, Tuple[PlannerOption, ...]]] = []
+    incumbent = -math.inf
+    seeds = [_beam_selection(grouped, targets, beam_width)]
+    # A narrow, bound-ordered pass is a much stronger incumbent than the beam
+    # and makes the exact pass prune far earlier.
+    narrow, _diagnostics = program.solve(incumbent, min(maximum_labels, 1024))
+    seeds.extend(selection for _objective, selection in narrow[:1])
+    for seed in seeds:
+        if seed is None:
+            continue
+        if not _within_budget(sum(value.cost for value in seed), targets):
+            continue
+        objective, improved = _improve_by_swaps(grouped, targets, seed)
+        candidates.append((objective, improved))
+        incumbent = max(incumbent, objective)
+
+    found, diagnostics = program.solve(incumbent, maximum_labels)
+    candidates.extend(found)
+    best: Tuple[float, Tuple[str, ...], Tuple[PlannerOption, ...]] | None = None
+    for _bound, selection in candidates:
+        objective, metrics = evaluate_selection(selection, targets)
+        if not _within_budget(metrics["cost"], targets):
+            continue
+        signature = tuple(value.option_id for value in selection)
+        if best is None or (objective, tuple(reversed(signature))) > (
+            best[0],
+            tuple(reversed(best[1])),
+        ):
+            best = (objective, signature, selection)
+    if best is None:
         budget = (
             f" under cost limit {targets.cost_limit}"
             if targets.cost_limit is not None
@@ -177,24 +967,23 @@ def pareto_enumeration(
         )
         raise ValueError(f"No complete slot selection is feasible{budget}")
 
-    scored = []
-    for _, selection in frontier:
-        objective, metrics = evaluate_selection(selection, targets)
-        signature = tuple(item.option_id for item in selection)
-        scored.append((objective, signature, selection, metrics))
-    objective, signature, _selection, metrics = max(
-        scored, key=lambda item: (item[0], tuple(reversed(item[1])))
-    )
-    return SolverResult(
-        method="pure_python_pareto_enumeration_v2",
-        selected_ids=signature,
-        objective=round(objective, 8),
-        diagnostics={
-            **{key: round(value, 8) for key, value in metrics.items()},
-            "combinations_inspected": inspected,
-            "feasible_combinations": feasible,
-            "budget_infeasible_combinations": skipped_budget,
-            "pareto_frontier_size": len(frontier),
+    discarded_bound = diagnostics.pop("discarded_bound")
+    proven = discarded_bound < best[0] + BOUND_SLACK
+    return _selection_result(
+        "macro_sum_dynamic_program_v1",
+        best[2],
+        targets,
+        {
+            "search_space_combinations": combinations,
+            **(
+                {"incumbent_objective": round(incumbent, 8)}
+                if math.isfinite(incumbent)
+                else {}
+            ),
+            **diagnostics,
+            "resolution": resolution,
+            "proven_optimal": int(proven),
+            "objective_upper_bound": round(max(best[0], discarded_bound), 8),
         },
     )
 
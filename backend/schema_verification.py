@@ -31,6 +31,14 @@ CURRENT_REQUIRED_TABLES = REQUIRED_RUNTIME_TABLES | {
     "preparation_repair_proposal_events",
     "preparation_repair_proposal_acceptances",
     "household_plan_events",
+    "gamification_events",
+    "gamification_scores",
+    "gamification_achievements",
+    "meal_plan_summaries",
+    "preparation_task_execution_projections",
+    "preparation_task_execution_task_states",
+    "household_coverage_counters",
+    "preparation_schedule_coverage_contributions",
 }
 
 
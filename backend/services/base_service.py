@@ -5,71 +5,92 @@ cache, and silently substituted generated fixtures whenever a live call failed.
 This implementation keeps the existing synchronous service interface for
 compatibility but makes provenance and failure explicit. Callers should move
 network work to an async adapter or thread pool in a later API refactor.
+
+Responses go through a pluggable ``ResponseCache`` (per-instance memory LRU by
+default, or a SQLite file shared across workers) and a non-blocking token
+bucket: a request over the limit fails fast with ``UpstreamRateLimited`` and a
+retry-after estimate instead of sleeping on the calling thread.
 """
 
 from __future__ import annotations
 
-import threading
 import time
-from collections import OrderedDict, deque
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import requests
 
 from backend.config import APIConfig
+from backend.services.response_cache import (
+    ResponseCache,
+    TokenBucket,
+    build_rate_limiter,
+    build_response_cache,
+)
 
 
 class ExternalServiceError(RuntimeError):
     """An optional upstream service could not return a validated response."""
 
 
+class UpstreamRateLimited(ExternalServiceError):
+    """The local rate limiter refused a request; retry after the estimate."""
+
+    def __init__(self, message: str, *, retry_after_seconds: float):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+FetchRequest = Union[str, Tuple[str, Optional[Dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class FetchOutcome:
+    endpoint: str
+    params: Optional[Dict[str, Any]]
+    value: Any = None
+    error: Optional[ExternalServiceError] = None
+
+
 class BaseAPIService:
     """Bounded, thread-safe synchronous HTTP adapter with explicit failures."""
 
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        *,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
         if not base_url or not base_url.strip():
             raise ValueError("base_url is required")
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.session = requests.Session()
-        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
-        self._request_times: deque[float] = deque()
-        self._lock = threading.RLock()
-
-    def _check_rate_limit(self) -> None:
-        while True:
-            with self._lock:
-                now = time.monotonic()
-                while self._request_times and now - self._request_times[0] >= 60:
-                    self._request_times.popleft()
-                if len(self._request_times) < APIConfig.MAX_REQUESTS_PER_MINUTE:
-                    self._request_times.append(now)
-                    return
-                sleep_for = max(0.01, 60 - (now - self._request_times[0]))
-            time.sleep(sleep_for)
+        self._cache = cache if cache is not None else build_response_cache()
+        self._rate_limiter = (
+            rate_limiter if rate_limiter is not None else build_rate_limiter()
+        )
+
+    def _check_rate_limit(self, endpoint: str) -> None:
+        wait = self._rate_limiter.try_acquire()
+        if wait > 0:
+            raise UpstreamRateLimited(
+                f"Upstream rate limit reached for {endpoint}; retry in {wait:.2f}s",
+                retry_after_seconds=wait,
+            )
 
     def _get_from_cache(self, key: str) -> Optional[Any]:
-        if not APIConfig.CACHE_ENABLED:
+        if self._cache is None or not APIConfig.CACHE_ENABLED:
             return None
-        with self._lock:
-            cached = self._cache.get(key)
-            if cached is None:
-                return None
-            value, timestamp = cached
-            if time.monotonic() - timestamp >= APIConfig.CACHE_TTL:
-                del self._cache[key]
-                return None
-            self._cache.move_to_end(key)
-            return value
+        return self._cache.get(key)
 
     def _set_cache(self, key: str, value: Any) -> None:
-        if not APIConfig.CACHE_ENABLED:
+        if self._cache is None or not APIConfig.CACHE_ENABLED:
             return
-        with self._lock:
-            self._cache[key] = (value, time.monotonic())
-            self._cache.move_to_end(key)
-            while len(self._cache) > APIConfig.CACHE_MAX_ENTRIES:
-                self._cache.popitem(last=False)
+        self._cache.set(key, value)
 
     def _make_request(
         self,
@@ -99,7 +120,7 @@ class BaseAPIService:
 
         last_error: Optional[Exception] = None
         for attempt in range(APIConfig.MAX_RETRIES):
-            self._check_rate_limit()
+            self._check_rate_limit(endpoint)
             try:
                 response = self.session.request(
                     method=normalized_method,
@@ -120,3 +141,45 @@ class BaseAPIService:
                     time.sleep(APIConfig.RETRY_BACKOFF_FACTOR * (2**attempt))
 
         raise ExternalServiceError(f"External service request failed for {endpoint}") from last_error
+
+    def fetch_many(
+        self,
+        requests_: Iterable[FetchRequest],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> List[FetchOutcome]:
+        """Fetch GET endpoints on a bounded thread pool, in input order.
+
+        Identical requests are fetched once. Each outcome carries either the
+        value ``_make_request`` returned or the ``ExternalServiceError`` it
+        raised, so one failing lookup does not discard the rest of the batch.
+        """
+
+        normalized = [
+            (item, None) if isinstance(item, str) else (item[0], item[1])
+            for item in requests_
+        ]
+        unique: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        for endpoint, params in normalized:
+            unique.setdefault(self._fetch_key(endpoint, params), (endpoint, params))
+
+        def fetch(request: Tuple[str, Optional[Dict[str, Any]]]) -> Tuple[Any, Any]:
+            endpoint, params = request
+            try:
+                return self._make_request(endpoint, params=params), None
+            except ExternalServiceError as exc:
+                return None, exc
+
+        workers = min(max_workers or APIConfig.FETCH_MANY_MAX_WORKERS, len(unique) or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = dict(zip(unique, pool.map(fetch, unique.values())))
+
+        outcomes = []
+        for endpoint, params in normalized:
+            value, error = fetched[self._fetch_key(endpoint, params)]
+            outcomes.append(FetchOutcome(endpoint, params, value, error))
+        return outcomes
+
+    @staticmethod
+    def _fetch_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        return f"{endpoint.lstrip('/')}:{sorted((params or {}).items())}"
@@ -0,0 +1,159 @@
+"""Preloaded ingredient carbon-footprint table.
+
+``SustainableFoodDBService.calculate_meal_carbon_sum`` issues one upstream
+request per ingredient. The table answers the same lookups from memory: one
+kg CO2e value per ``canonicalize_ingredient_name`` key, loaded from an explicit
+snapshot file. ``score_recipes`` resolves whole plans in one pass and reports
+the ingredients it has no value for instead of counting them as zero.
+
+The bundled ``backend/data/sustainable_db.json`` is generated fixture data, so
+the table is never loaded implicitly; operators opt in with
+``SUSTAINABILITY_CARBON_TABLE_FILE``. Loaded tables are memoized per path and
+file ``(size, mtime)``, so services built per request share one parsed table
+until the file changes.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from backend.domain.ingredients import canonicalize_ingredient_name
+
+
+TABLE_VERSION = "ingredient-carbon-v1"
+
+_loaded_tables: Dict[str, Tuple[Tuple[int, int], "CarbonFootprintTable"]] = {}
+_loaded_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RecipeCarbon:
+    """Carbon total for one recipe; ``carbon_footprint_kg`` is ``None`` when
+    any ingredient is unknown."""
+
+    carbon_footprint_kg: Optional[float]
+    known_carbon_kg: float
+    unknown_ingredients: Tuple[str, ...] = ()
+
+
+def _recipe_carbon(
+    keys: Iterable[str], values: Mapping[str, Optional[float]]
+) -> RecipeCarbon:
+    known = 0.0
+    unknown: List[str] = []
+    for key in keys:
+        value = values.get(key)
+        if value is None:
+            if key not in unknown:
+                unknown.append(key)
+        else:
+            known += value
+    return RecipeCarbon(
+        carbon_footprint_kg=None if unknown else known,
+        known_carbon_kg=known,
+        unknown_ingredients=tuple(unknown),
+    )
+
+
+def score_keyed_recipes(
+    keyed: Sequence[Iterable[str]], values: Mapping[str, Optional[float]]
+) -> List[RecipeCarbon]:
+    """Total canonical ingredient keys per recipe against resolved values."""
+
+    return [_recipe_carbon(keys, values) for keys in keyed]
+
+
+def canonical_recipe_keys(
+    recipes: Sequence[Iterable[str]],
+) -> Tuple[List[List[str]], List[str]]:
+    """Canonicalize ingredient names once per distinct spelling in a batch.
+
+    Returns the per-recipe key lists and the distinct keys in first-seen order.
+    """
+
+    canonical: Dict[str, str] = {}
+    distinct: Dict[str, None] = {}
+    keyed = []
+    for ingredients in recipes:
+        keys = []
+        for name in ingredients:
+            key = canonical.get(name)
+            if key is None:
+                key = canonical[name] = canonicalize_ingredient_name(name)
+            if key:
+                keys.append(key)
+                distinct.setdefault(key, None)
+        keyed.append(keys)
+    return keyed, list(distinct)
+
+
+@dataclass(frozen=True)
+class CarbonFootprintTable:
+    carbon_kg: Mapping[str, float]
+    source: str = "snapshot"
+
+    @classmethod
+    def from_snapshot(
+        cls, raw: Mapping[str, Any], *, source: str = "snapshot"
+    ) -> "CarbonFootprintTable":
+        """Build from ``{"table_version", "ingredients": {name: kg}}``.
+
+        The legacy ``{name: {"carbon_footprint_kg": kg, ...}}`` shape of
+        ``sustainable_db.json`` is also accepted.
+        """
+
+        if "ingredients" in raw:
+            version = raw.get("table_version")
+            if version != TABLE_VERSION:
+                raise ValueError(f"Unsupported carbon table version: {version}")
+            entries = raw["ingredients"]
+        else:
+            entries = {
+                name: (
+                    record.get("carbon_footprint_kg")
+                    if isinstance(record, Mapping)
+                    else None
+                )
+                for name, record in raw.items()
+            }
+        if not isinstance(entries, Mapping):
+            raise ValueError("Carbon table requires an 'ingredients' object")
+
+        carbon_kg: Dict[str, float] = {}
+        for name, value in entries.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"Invalid carbon footprint for {name!r}: {value!r}")
+            key = canonicalize_ingredient_name(str(name))
+            if key in carbon_kg and carbon_kg[key] != float(value):
+                raise ValueError(f"Conflicting carbon footprints for {key!r}")
+            carbon_kg[key] = float(value)
+        return cls(carbon_kg=carbon_kg, source=source)
+
+    def lookup(self, ingredient: str) -> Optional[float]:
+        return self.carbon_kg.get(canonicalize_ingredient_name(ingredient))
+
+    def score_recipes(self, recipes: Sequence[Iterable[str]]) -> List[RecipeCarbon]:
+        keyed, _ = canonical_recipe_keys(recipes)
+        return score_keyed_recipes(keyed, self.carbon_kg)
+
+
+def load_carbon_footprint_table(path: str | Path) -> CarbonFootprintTable:
+    """Return the table for ``path``, re-parsing only when the file changed."""
+
+    table = Path(path)
+    stat = table.stat()
+    version = (stat.st_size, stat.st_mtime_ns)
+    with _loaded_lock:
+        cached = _loaded_tables.get(str(table))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with table.open("r", encoding="utf-8") as handle:
+        raw = json.load(handle)
+    loaded = CarbonFootprintTable.from_snapshot(raw, source=str(table))
+    with _loaded_lock:
+        _loaded_tables[str(table)] = (version, loaded)
+    return loaded
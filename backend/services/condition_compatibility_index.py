@@ -0,0 +1,157 @@
+"""Local DietRxDB condition-compatibility index.
+
+``DietRxDBService.check_condition_compatibility`` fetches every condition and
+the food's interactions per call. The index answers the same question from a
+snapshot: per-condition sets of lowercased harmful and beneficial foods plus a
+food-interaction map keyed by exact food name. Its
+``check_condition_compatibility`` returns exactly what the service returns for
+the same upstream data.
+
+Snapshots are explicit files, exported from the live service with
+``export_condition_compatibility_snapshot``; nothing is fabricated when a
+snapshot is missing. A condition or food absent from the snapshot raises
+``ConditionIndexMiss`` so callers treat it like an unreachable upstream record;
+only foods exported with an empty interaction list count as having none.
+Loaded indexes are memoized per path and file ``(size, mtime)``, so engines
+built per request share one parsed snapshot until the file changes.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+from backend.services.dietrxdb_service import DietRxDBService
+
+
+SNAPSHOT_VERSION = "dietrx-condition-compatibility-v1"
+
+_loaded_indexes: Dict[str, Tuple[Tuple[int, int], "ConditionCompatibilityIndex"]] = {}
+_loaded_lock = threading.Lock()
+
+
+class ConditionIndexMiss(LookupError):
+    """The snapshot has no record for a requested condition or food."""
+
+
+@dataclass(frozen=True)
+class ConditionCompatibilityIndex:
+    harmful: Mapping[str, FrozenSet[str]]
+    beneficial: Mapping[str, FrozenSet[str]]
+    interactions: Mapping[str, Tuple[Dict[str, Any], ...]]
+    source: str = "snapshot"
+
+    @classmethod
+    def from_snapshot(
+        cls, raw: Mapping[str, Any], *, source: str = "snapshot"
+    ) -> "ConditionCompatibilityIndex":
+        version = raw.get("snapshot_version", SNAPSHOT_VERSION)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported condition index snapshot: {version}")
+        diseases = raw.get("diseases")
+        interactions = raw.get("interactions", {})
+        if not isinstance(diseases, Mapping) or not isinstance(interactions, Mapping):
+            raise ValueError("Snapshot requires 'diseases' and 'interactions' objects")
+        return cls(
+            harmful={
+                name: frozenset(food.lower() for food in info.get("harmful_foods", []))
+                for name, info in diseases.items()
+            },
+            beneficial={
+                name: frozenset(
+                    food.lower() for food in info.get("beneficial_foods", [])
+                )
+                for name, info in diseases.items()
+            },
+            interactions={
+                food: tuple(dict(item) for item in items or [])
+                for food, items in interactions.items()
+            },
+            source=source,
+        )
+
+    def check_condition_compatibility(
+        self, food_name: str, conditions: List[str]
+    ) -> Dict[str, Any]:
+        """Mirror ``DietRxDBService.check_condition_compatibility``."""
+
+        warnings = []
+        benefits = []
+        food = food_name.lower()
+        for condition in conditions:
+            if condition not in self.harmful:
+                raise ConditionIndexMiss(
+                    f"Condition {condition!r} is not in the compatibility snapshot"
+                )
+            if food in self.harmful[condition]:
+                warnings.append(f"May worsen {condition}")
+            elif food in self.beneficial[condition]:
+                benefits.append(f"Beneficial for {condition}")
+
+        # The service looks interactions up by the exact food path segment.
+        interactions = self.interactions.get(food_name)
+        if interactions is None:
+            raise ConditionIndexMiss(
+                f"Food {food_name!r} has no interaction record in the compatibility snapshot"
+            )
+        warnings.extend(
+            f"Drug interaction: {item.get('drug', 'Unknown')}" for item in interactions
+        )
+
+        score = 100
+        score -= len(warnings) * 30
+        score += len(benefits) * 10
+        score = max(0, min(100, score))
+        return {
+            "compatible": score >= 50,
+            "score": score,
+            "warnings": warnings,
+            "benefits": benefits,
+            "safe_to_consume": len(warnings) == 0,
+        }
+
+
+def load_condition_compatibility_index(path: str | Path) -> ConditionCompatibilityIndex:
+    """Return the index for ``path``, re-parsing only when the file changed."""
+
+    snapshot = Path(path)
+    stat = snapshot.stat()
+    version = (stat.st_size, stat.st_mtime_ns)
+    with _loaded_lock:
+        cached = _loaded_indexes.get(str(snapshot))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with snapshot.open("r", encoding="utf-8") as handle:
+        raw = json.load(handle)
+    index = ConditionCompatibilityIndex.from_snapshot(raw, source=str(snapshot))
+    with _loaded_lock:
+        _loaded_indexes[str(snapshot)] = (version, index)
+    return index
+
+
+def export_condition_compatibility_snapshot(
+    service: DietRxDBService,
+    *,
+    conditions: Iterable[str],
+    foods: Iterable[str],
+) -> Dict[str, Any]:
+    """Fetch the listed conditions and food interactions into a snapshot dict."""
+
+    diseases = {}
+    for condition in sorted(set(conditions)):
+        info = service.get_disease_info(condition) or {}
+        diseases[condition] = {
+            "beneficial_foods": list(info.get("beneficial_foods", [])),
+            "harmful_foods": list(info.get("harmful_foods", [])),
+        }
+    return {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "diseases": diseases,
+        "interactions": {
+            food: list(service.get_food_interactions(food) or [])
+            for food in sorted(set(foods))
+        },
+    }
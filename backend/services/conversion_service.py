@@ -1,16 +1,31 @@
-"""Evidence-backed ingredient conversion and reviewed storage-policy services."""
+"""Evidence-backed ingredient conversion and reviewed storage-policy services.
+
+Batch conversion resolves every line against a process-local table holding the
+preferred active evidence for each (ingredient, from unit, to unit) key. The
+table is rebuilt when ``register_conversion`` or ``import_fdc_portions`` bumps
+the table version in this process, or when the active-row stamp read at the
+start of every batch shows that another process changed the evidence.
+"""
 
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.database import DBIngredientConversion, DBStoragePolicy
 from backend.domain.conversions import (
+    ConversionBatchItem,
+    ConversionBatchRequest,
+    ConversionBatchResult,
     ConversionRequest,
     ConversionResult,
     IngredientConversionCreate,
@@ -20,6 +35,23 @@ from backend.domain.ingredients import canonicalize_ingredient_name
 
 
 _EPSILON = 1e-12
+_UNREVIEWED_WARNING = (
+    "This conversion has not completed reviewed-external evidence validation."
+)
+
+ConversionKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class ConversionTable:
+    version: int
+    stamp: Tuple[int, Optional[int]]
+    evidence: Dict[ConversionKey, IngredientConversionView]
+
+
+_TABLE_LOCK = threading.Lock()
+_TABLE_VERSION = 0
+_TABLES: "WeakKeyDictionary[Engine, ConversionTable]" = WeakKeyDictionary()
 
 OFFICIAL_STORAGE_POLICIES: tuple[dict[str, Any], ...] = (
     {
@@ -255,6 +287,7 @@ def register_conversion(
             value.active = True
             db.add(value)
             db.commit()
+            bump_conversion_table_version()
             db.refresh(value)
         return value
 
@@ -266,6 +299,7 @@ def register_conversion(
         db.rollback()
         existing = query.with_for_update().one()
         return _resolve_existing_conversion(existing, raw)
+    bump_conversion_table_version()
     db.refresh(value)
     return value
 
@@ -289,10 +323,54 @@ def list_conversions(
     ).all()
 
 
+def _evidence_unavailable(
+    canonical_name: str, from_unit: str, to_unit: str
+) -> Dict[str, Any]:
+    return {
+        "code": "conversion_evidence_unavailable",
+        "message": (
+            "No ingredient-specific evidence-backed conversion exists. "
+            "The system will not guess a density or package size."
+        ),
+        "canonical_name": canonical_name,
+        "from_unit": from_unit,
+        "to_unit": to_unit,
+    }
+
+
+def _conversion_result(
+    payload: ConversionRequest,
+    key: ConversionKey,
+    evidence: IngredientConversionView,
+) -> ConversionResult:
+    canonical_name, from_unit, to_unit = key
+    warnings = []
+    if evidence.evidence_status != "reviewed_external":
+        warnings.append(_UNREVIEWED_WARNING)
+    return ConversionResult(
+        canonical_name=canonical_name,
+        input_quantity_min=payload.quantity_min,
+        input_quantity_max=payload.quantity_max,
+        input_unit=from_unit,
+        output_quantity_min=round(payload.quantity_min * evidence.multiplier_min, 8),
+        output_quantity_max=round(payload.quantity_max * evidence.multiplier_max, 8),
+        output_unit=to_unit,
+        evidence=evidence,
+        warnings=warnings,
+    )
+
+
+def _conversion_key(payload: ConversionRequest) -> ConversionKey:
+    return (
+        canonicalize_ingredient_name(payload.canonical_name),
+        payload.from_unit.strip().lower(),
+        payload.to_unit.strip().lower(),
+    )
+
+
 def convert_quantity(db: Session, payload: ConversionRequest) -> ConversionResult:
-    canonical_name = canonicalize_ingredient_name(payload.canonical_name)
-    from_unit = payload.from_unit.strip().lower()
-    to_unit = payload.to_unit.strip().lower()
+    key = _conversion_key(payload)
+    canonical_name, from_unit, to_unit = key
     candidates = (
         db.query(DBIngredientConversion)
         .filter(
@@ -311,35 +389,110 @@ def convert_quantity(db: Session, payload: ConversionRequest) -> ConversionResul
     if not candidates:
         raise HTTPException(
             status_code=422,
-            detail={
-                "code": "conversion_evidence_unavailable",
-                "message": (
-                    "No ingredient-specific evidence-backed conversion exists. "
-                    "The system will not guess a density or package size."
-                ),
-                "canonical_name": canonical_name,
-                "from_unit": from_unit,
-                "to_unit": to_unit,
-            },
+            detail=_evidence_unavailable(canonical_name, from_unit, to_unit),
         )
-    evidence = candidates[0]
-    output_min = payload.quantity_min * evidence.multiplier_min
-    output_max = payload.quantity_max * evidence.multiplier_max
-    warnings = []
-    if evidence.evidence_status != "reviewed_external":
-        warnings.append(
-            "This conversion has not completed reviewed-external evidence validation."
+    return _conversion_result(
+        payload,
+        key,
+        IngredientConversionView.model_validate(candidates[0]),
+    )
+
+
+def bump_conversion_table_version() -> None:
+    """Invalidate this process's conversion table after an evidence write."""
+
+    global _TABLE_VERSION
+    with _TABLE_LOCK:
+        _TABLE_VERSION += 1
+
+
+def _active_conversion_stamp(db: Session) -> Tuple[int, Optional[int]]:
+    count, latest_id = (
+        db.query(
+            func.count(DBIngredientConversion.id),
+            func.max(DBIngredientConversion.id),
         )
-    return ConversionResult(
-        canonical_name=canonical_name,
-        input_quantity_min=payload.quantity_min,
-        input_quantity_max=payload.quantity_max,
-        input_unit=from_unit,
-        output_quantity_min=round(output_min, 8),
-        output_quantity_max=round(output_max, 8),
-        output_unit=to_unit,
-        evidence=IngredientConversionView.model_validate(evidence),
-        warnings=warnings,
+        .filter(DBIngredientConversion.active.is_(True))
+        .one()
+    )
+    return int(count), latest_id
+
+
+def conversion_table(db: Session) -> ConversionTable:
+    """Return the preferred active evidence per key, rebuilding when stale.
+
+    Candidates are ordered exactly as in ``convert_quantity``: reviewed rows
+    first, newest review first, then lowest id.
+    """
+
+    stamp = _active_conversion_stamp(db)
+    bind = db.get_bind()
+    with _TABLE_LOCK:
+        table = _TABLES.get(bind)
+        version = _TABLE_VERSION
+    if table is not None and table.version == version and table.stamp == stamp:
+        return table
+
+    rows = (
+        db.query(DBIngredientConversion)
+        .filter(DBIngredientConversion.active.is_(True))
+        .order_by(
+            DBIngredientConversion.canonical_name,
+            DBIngredientConversion.from_unit,
+            DBIngredientConversion.to_unit,
+            DBIngredientConversion.reviewed_at.is_(None),
+            DBIngredientConversion.reviewed_at.desc(),
+            DBIngredientConversion.id,
+        )
+        .all()
+    )
+    evidence: Dict[ConversionKey, IngredientConversionView] = {}
+    for row in rows:
+        key = (row.canonical_name, row.from_unit, row.to_unit)
+        if key not in evidence:
+            evidence[key] = IngredientConversionView.model_validate(row)
+    table = ConversionTable(version=version, stamp=stamp, evidence=evidence)
+    with _TABLE_LOCK:
+        if _TABLE_VERSION == version:
+            _TABLES[bind] = table
+    return table
+
+
+def convert_quantities(
+    db: Session, payload: ConversionBatchRequest
+) -> ConversionBatchResult:
+    """Convert every line against the conversion table in one pass.
+
+    Lines without evidence carry the same error detail that ``convert_quantity``
+    raises as a 422, so one unknown ingredient does not fail the batch.
+    """
+
+    table = conversion_table(db)
+    keys: Dict[Tuple[str, str, str], ConversionKey] = {}
+    items: List[ConversionBatchItem] = []
+    for index, line in enumerate(payload.items):
+        raw_key = (line.canonical_name, line.from_unit, line.to_unit)
+        key = keys.get(raw_key)
+        if key is None:
+            key = keys[raw_key] = _conversion_key(line)
+        evidence = table.evidence.get(key)
+        if evidence is None:
+            items.append(
+                ConversionBatchItem(index=index, error=_evidence_unavailable(*key))
+            )
+        else:
+            items.append(
+                ConversionBatchItem(
+                    index=index,
+                    result=_conversion_result(line, key, evidence),
+                )
+            )
+    error_count = sum(item.error is not None for item in items)
+    return ConversionBatchResult(
+        table_version=table.version,
+        converted_count=len(items) - error_count,
+        error_count=error_count,
+        items=items,
     )
 
 
@@ -408,4 +561,5 @@ def import_fdc_portions(
         register_conversion(db, payload)
         if before is None:
             created += 1
+    bump_conversion_table_version()
     return created
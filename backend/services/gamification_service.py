@@ -0,0 +1,486 @@
+"""Transactional gamification scoring over pre-aggregated period buckets.
+
+Each scoring call adds its deltas to one ``gamification_scores`` row per
+metric and period (UTC day, ISO week starting Monday, calendar month, and all
+time) with a single upsert, so concurrent workers never lose an increment and
+no request reads or rewrites other users' data. Leaderboards are a descending
+scan of ``ix_gamification_scores_ranking`` limited to the requested size; a
+rank is one score lookup plus a count over that bucket's index range.
+Leaderboards only show the viewer's own name; everyone else appears under a
+stable pseudonym keyed by ``SECRET_KEY`` so real names never leave the server.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import math
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.database import DBUser, utcnow
+from backend.gamification_models import (
+    SCORE_PERIODS,
+    DBGamificationAchievement,
+    DBGamificationEvent,
+    DBGamificationScore,
+)
+from backend.utils.security import _get_secret_key
+
+
+ALL_TIME_BUCKET = date(1970, 1, 1)
+AVERAGE_MEAL_CARBON_KG = 2.5
+DEFAULT_BADGE = "🌱"
+
+ACHIEVEMENTS: Dict[str, Dict[str, Any]] = {
+    # Sustainability Achievements
+    "eco_warrior": {
+        "name": "Eco Warrior",
+        "description": "Save 100kg CO2 in a month",
+        "threshold": 100,
+        "metric": "carbon_saved",
+        "badge": "🌍",
+        "points": 500,
+    },
+    "tree_planter": {
+        "name": "Tree Planter",
+        "description": "Save equivalent of 10 trees",
+        "threshold": 10,
+        "metric": "trees_equivalent",
+        "badge": "🌳",
+        "points": 300,
+    },
+    "water_saver": {
+        "name": "Water Saver",
+        "description": "Save 1000L of water",
+        "threshold": 1000,
+        "metric": "water_saved",
+        "badge": "💧",
+        "points": 400,
+    },
+    # Variety Achievements
+    "flavor_explorer": {
+        "name": "Flavor Explorer",
+        "description": "Try 50 unique ingredients",
+        "threshold": 50,
+        "metric": "unique_ingredients",
+        "badge": "🗺️",
+        "points": 300,
+    },
+    "cuisine_master": {
+        "name": "Cuisine Master",
+        "description": "Try 10 different cuisines",
+        "threshold": 10,
+        "metric": "unique_cuisines",
+        "badge": "👨‍🍳",
+        "points": 400,
+    },
+    # Health Achievements
+    "macro_master": {
+        "name": "Macro Master",
+        "description": "Hit macro targets 30 days straight",
+        "threshold": 30,
+        "metric": "macro_streak",
+        "badge": "🎯",
+        "points": 600,
+    },
+    "health_champion": {
+        "name": "Health Champion",
+        "description": "Maintain 90%+ health score for a month",
+        "threshold": 30,
+        "metric": "health_streak",
+        "badge": "💪",
+        "points": 500,
+    },
+    # Taste Achievements
+    "taste_adventurer": {
+        "name": "Taste Adventurer",
+        "description": "Rate 100 meals",
+        "threshold": 100,
+        "metric": "meals_rated",
+        "badge": "⭐",
+        "points": 200,
+    },
+    # Social Achievements
+    "team_player": {
+        "name": "Team Player",
+        "description": "Complete 5 team challenges",
+        "threshold": 5,
+        "metric": "team_challenges",
+        "badge": "🤝",
+        "points": 400,
+    },
+}
+
+
+def _as_utc(value: datetime) -> datetime:
+    return (
+        value.replace(tzinfo=timezone.utc)
+        if value.tzinfo is None
+        else value.astimezone(timezone.utc)
+    )
+
+
+def period_bucket(period: str, moment: datetime) -> date:
+    """Return the first UTC date of the ``period`` bucket containing ``moment``."""
+
+    day = _as_utc(moment).date()
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    if period == "all_time":
+        return ALL_TIME_BUCKET
+    raise ValueError(f"period must be one of: {', '.join(SCORE_PERIODS)}")
+
+
+def _validated_deltas(deltas: Mapping[str, float]) -> Dict[str, float]:
+    values: Dict[str, float] = {}
+    for metric, value in deltas.items():
+        if not isinstance(metric, str) or not metric.strip() or len(metric) > 64:
+            raise ValueError("metric names must be non-blank strings of at most 64 characters")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{metric} delta must be a number")
+        if not math.isfinite(value):
+            raise ValueError(f"{metric} delta must be finite")
+        values[metric] = values.get(metric, 0.0) + float(value)
+    return values
+
+
+def _insert(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise RuntimeError(f"Gamification scoring does not support {dialect}")
+    return insert
+
+
+def _increment_scores(
+    db: Session, user_id: str, deltas: Mapping[str, float], moment: datetime
+) -> None:
+    if not deltas:
+        return
+    now = utcnow()
+    rows = [
+        {
+            "user_id": user_id,
+            "metric": metric,
+            "period": period,
+            "bucket_start": period_bucket(period, moment),
+            "score": value,
+            "updated_at": now,
+        }
+        for metric, value in deltas.items()
+        for period in SCORE_PERIODS
+    ]
+    table = DBGamificationScore.__table__
+    statement = _insert(db)(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["metric", "period", "bucket_start", "user_id"],
+        set_={
+            "score": table.c.score + statement.excluded.score,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    db.execute(statement)
+
+
+def user_totals(
+    db: Session,
+    user_id: str,
+    *,
+    period: str = "all_time",
+    now: Optional[datetime] = None,
+) -> Dict[str, float]:
+    bucket = period_bucket(period, now or utcnow())
+    rows = db.execute(
+        select(DBGamificationScore.metric, DBGamificationScore.score).where(
+            DBGamificationScore.user_id == user_id,
+            DBGamificationScore.period == period,
+            DBGamificationScore.bucket_start == bucket,
+        )
+    ).all()
+    return {metric: score for metric, score in rows}
+
+
+def _award_achievements(
+    db: Session, user_id: str, totals: Mapping[str, float], moment: datetime
+) -> List[Dict[str, Any]]:
+    earned = set(
+        db.execute(
+            select(DBGamificationAchievement.achievement_id).where(
+                DBGamificationAchievement.user_id == user_id
+            )
+        ).scalars()
+    )
+    awarded = []
+    table = DBGamificationAchievement.__table__
+    for achievement_id, achievement in ACHIEVEMENTS.items():
+        if achievement_id in earned:
+            continue
+        if totals.get(achievement["metric"], 0.0) < achievement["threshold"]:
+            continue
+        statement = (
+            _insert(db)(table)
+            .values(
+                user_id=user_id,
+                achievement_id=achievement_id,
+                points=achievement["points"],
+                earned_at=utcnow(),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "achievement_id"])
+        )
+        # A concurrent request may have awarded it first; only the inserting
+        # transaction adds the bonus points.
+        if db.execute(statement).rowcount != 1:
+            continue
+        _increment_scores(db, user_id, {"total_points": achievement["points"]}, moment)
+        awarded.append(
+            {
+                "id": achievement_id,
+                "name": achievement["name"],
+                "description": achievement["description"],
+                "badge": achievement["badge"],
+                "points": achievement["points"],
+            }
+        )
+    return awarded
+
+
+def record_stats(
+    db: Session,
+    user_id: str,
+    deltas: Mapping[str, float],
+    *,
+    event_type: str = "stats_updated",
+    occurred_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Add metric deltas for one user, award achievements, and commit."""
+
+    values = _validated_deltas(deltas)
+    moment = _as_utc(occurred_at or utcnow())
+    try:
+        db.add(
+            DBGamificationEvent(
+                user_id=user_id,
+                event_type=event_type,
+                deltas=values,
+                occurred_at=moment,
+            )
+        )
+        db.flush()
+        _increment_scores(db, user_id, values, moment)
+        totals = user_totals(db, user_id)
+        new_achievements = _award_achievements(db, user_id, totals, moment)
+        if new_achievements:
+            totals = user_totals(db, user_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return {
+        "updated_stats": {
+            **totals,
+            "achievements": [item["id"] for item in list_achievements(db, user_id)],
+        },
+        "new_achievements": new_achievements,
+        "total_points": totals.get("total_points", 0),
+    }
+
+
+def _meal_points(meal_data: Mapping[str, Any]) -> int:
+    points = int(meal_data.get("health_score", 0) * 10)
+    carbon = meal_data.get("carbon_footprint", AVERAGE_MEAL_CARBON_KG)
+    if carbon < AVERAGE_MEAL_CARBON_KG:
+        points += int((AVERAGE_MEAL_CARBON_KG - carbon) * 5)
+    points += int(meal_data.get("variety_score", 0) * 5)
+    return points
+
+
+def _impact_comparison(carbon_saved: float) -> str:
+    if carbon_saved < 0.5:
+        return "Small impact - keep going!"
+    if carbon_saved < 1.0:
+        return "Good choice! 🌱"
+    if carbon_saved < 2.0:
+        return "Great impact! 🌟"
+    return "Amazing! You're a sustainability champion! 🏆"
+
+
+def record_meal_impact(
+    db: Session,
+    user_id: str,
+    meal_data: Mapping[str, Any],
+    *,
+    occurred_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Score one logged meal against an average 2.5 kg CO2e meal."""
+
+    carbon_saved = max(0.0, AVERAGE_MEAL_CARBON_KG - meal_data.get("carbon_footprint", 0))
+    trees_equivalent = carbon_saved / 21  # 1 tree absorbs ~21kg CO2/year
+    water_saved = carbon_saved * 50  # Rough estimate: 50L water per kg CO2
+    deltas = {
+        "carbon_saved": carbon_saved,
+        "trees_equivalent": trees_equivalent,
+        "water_saved": water_saved,
+        "meals_logged": 1,
+        "total_points": _meal_points(meal_data),
+    }
+    if meal_data.get("taste_rating"):
+        deltas["meals_rated"] = 1
+    result = record_stats(
+        db, user_id, deltas, event_type="meal_logged", occurred_at=occurred_at
+    )
+    result["visual_impact"] = {
+        "carbon_saved_kg": round(carbon_saved, 2),
+        "trees_equivalent": round(trees_equivalent, 3),
+        "car_miles_saved": round(carbon_saved / 0.404, 1),  # 1 mile = 0.404 kg CO2
+        "water_saved_liters": round(water_saved, 1),
+        "comparison": _impact_comparison(carbon_saved),
+    }
+    return result
+
+
+def _badges(db: Session, user_ids: Iterable[str]) -> Dict[str, str]:
+    """Return the badge of each user's most recent achievement."""
+
+    rows = db.execute(
+        select(
+            DBGamificationAchievement.user_id,
+            DBGamificationAchievement.achievement_id,
+        )
+        .where(DBGamificationAchievement.user_id.in_(list(user_ids)))
+        .order_by(DBGamificationAchievement.earned_at, DBGamificationAchievement.id)
+    ).all()
+    badges: Dict[str, str] = {}
+    for user_id, achievement_id in rows:
+        badges[user_id] = ACHIEVEMENTS.get(achievement_id, {}).get("badge", "⭐")
+    return badges
+
+
+def leaderboard_pseudonym(user_id: str) -> str:
+    """Return the stable public name shown for ``user_id`` to other users."""
+
+    digest = hmac.new(
+        _get_secret_key().encode("utf-8"),
+        f"leaderboard:{user_id}".encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"Player {digest[:8]}"
+
+
+def get_leaderboard(
+    db: Session,
+    metric: str = "carbon_saved",
+    *,
+    period: str = "month",
+    limit: int = 100,
+    now: Optional[datetime] = None,
+    viewer_user_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Return the top ``limit`` users; tied scores share the same rank.
+
+    Only ``viewer_user_id`` is shown under their own name; every other entry
+    uses :func:`leaderboard_pseudonym`.
+    """
+
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    bucket = period_bucket(period, now or utcnow())
+    viewer_name = (
+        db.execute(select(DBUser.name).where(DBUser.id == viewer_user_id)).scalar()
+        if viewer_user_id is not None
+        else None
+    )
+    rows = db.execute(
+        select(DBGamificationScore.user_id, DBGamificationScore.score)
+        .where(
+            DBGamificationScore.metric == metric,
+            DBGamificationScore.period == period,
+            DBGamificationScore.bucket_start == bucket,
+        )
+        .order_by(DBGamificationScore.score.desc(), DBGamificationScore.user_id)
+        .limit(limit)
+    ).all()
+    badges = _badges(db, (user_id for user_id, _score in rows))
+    leaderboard: List[Dict[str, Any]] = []
+    for position, (user_id, score) in enumerate(rows, start=1):
+        tied = leaderboard and leaderboard[-1]["score"] == score
+        leaderboard.append(
+            {
+                "rank": leaderboard[-1]["rank"] if tied else position,
+                "user_id": user_id,
+                "username": (
+                    viewer_name or f"User{user_id[:8]}"
+                    if user_id == viewer_user_id
+                    else leaderboard_pseudonym(user_id)
+                ),
+                "score": score,
+                "badge": badges.get(user_id, DEFAULT_BADGE),
+            }
+        )
+    return leaderboard
+
+
+def get_user_rank(
+    db: Session,
+    user_id: str,
+    metric: str = "carbon_saved",
+    *,
+    period: str = "month",
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    bucket = period_bucket(period, now or utcnow())
+    in_bucket = (
+        DBGamificationScore.metric == metric,
+        DBGamificationScore.period == period,
+        DBGamificationScore.bucket_start == bucket,
+    )
+    score = db.execute(
+        select(DBGamificationScore.score).where(
+            *in_bucket, DBGamificationScore.user_id == user_id
+        )
+    ).scalar_one_or_none()
+    if score is None:
+        return {"rank": None, "score": 0, "percentile": 0}
+    ahead, total = db.execute(
+        select(
+            func.count().filter(DBGamificationScore.score > score),
+            func.count(),
+        ).where(*in_bucket)
+    ).one()
+    rank = ahead + 1
+    return {
+        "rank": rank,
+        "score": score,
+        "percentile": round((1 - rank / total) * 100, 1),
+    }
+
+
+def list_achievements(db: Session, user_id: str) -> List[Dict[str, Any]]:
+    rows = db.execute(
+        select(DBGamificationAchievement)
+        .where(DBGamificationAchievement.user_id == user_id)
+        .order_by(DBGamificationAchievement.earned_at, DBGamificationAchievement.id)
+    ).scalars()
+    achievements = []
+    for row in rows:
+        definition = ACHIEVEMENTS.get(row.achievement_id)
+        if definition is None:
+            continue
+        achievements.append(
+            {
+                **definition,
+                "id": row.achievement_id,
+                "earned_date": _as_utc(row.earned_at).isoformat(),
+            }
+        )
+    return achievements
@@ -36,6 +36,9 @@ from backend.preparation_operations_models import (
     DBPersistedPreparationSchedule,
     DBPreparationScheduleEvent,
 )
+from backend.services.preparation_coverage_counter_service import (
+    refresh_schedule_coverage,
+)
 
 
 def utcnow() -> datetime:
@@ -334,6 +337,7 @@ def _invalidate_dependent_schedules(
                 created_at=now,
             )
         )
+        refresh_schedule_coverage(db, schedule)
     return len(schedules)
 
 
@@ -0,0 +1,138 @@
+"""Write and read the per-plan analytics projection.
+
+Plan writers call ``record_plan_summary`` in the same transaction that stores
+or replaces ``plan_data``. Readers call ``latest_plan_summary``, which finds
+the user's newest plan id through ``ix_meal_plans_user_created_desc`` and loads
+its summary by primary key. A plan stored before the projection existed, or
+under an older ``PROJECTION_VERSION``, is summarised once on first read.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.database import DBMealPlan
+from backend.meal_plan_summary_models import DBMealPlanSummary
+from backend.models import PlanResponse
+
+
+PROJECTION_VERSION = 1
+
+
+def summarize_plan(plan: PlanResponse) -> Dict[str, Any]:
+    day_stats: List[Dict[str, Any]] = []
+    flavor_totals: Dict[str, float] = defaultdict(float)
+    flavor_counts: Counter = Counter()
+    cuisines: Counter = Counter()
+    for day in plan.days:
+        carbon = day.total_stats.get("carbon_footprint_kg")
+        day_stats.append(
+            {
+                "day": day.day,
+                "health_match": float(day.scores.get("health_match", 0.0)),
+                "carbon_footprint_kg": (
+                    float(carbon) if isinstance(carbon, (int, float)) else None
+                ),
+                "carbon_data_status": day.total_stats.get(
+                    "carbon_data_status", "unknown"
+                ),
+                "meal_count": len(day.meals),
+            }
+        )
+        for recipe in day.meals.values():
+            cuisines[recipe.cuisine or "Unknown"] += 1
+            for dimension, value in recipe.flavor_profile.items():
+                try:
+                    flavor_totals[dimension] += float(value)
+                    flavor_counts[dimension] += 1
+                except (TypeError, ValueError):
+                    continue
+
+    shopping_items = [
+        {
+            "category": category,
+            "item": item_name,
+            "count": int(item_data.get("count", 0) or 0),
+            "quantity": item_data.get("quantity"),
+            "quantity_status": item_data.get("quantity_status"),
+        }
+        for category, category_items in (plan.shopping_list or {}).items()
+        for item_name, item_data in category_items.items()
+    ]
+    return {
+        "day_count": len(plan.days),
+        "meal_count": sum(item["meal_count"] for item in day_stats),
+        "day_stats": day_stats,
+        "flavor_totals": {
+            dimension: [flavor_totals[dimension], flavor_counts[dimension]]
+            for dimension in sorted(flavor_counts)
+        },
+        "cuisine_counts": dict(sorted(cuisines.items())),
+        "shopping_items": shopping_items,
+    }
+
+
+def record_plan_summary(
+    db: Session, stored: DBMealPlan, plan: Optional[PlanResponse] = None
+) -> DBMealPlanSummary:
+    """Stage the summary of ``stored`` (flushed first so it has an id)."""
+
+    if stored.id is None:
+        db.flush()
+    values: Dict[str, Any] = {
+        "day_count": 0,
+        "meal_count": 0,
+        "day_stats": [],
+        "flavor_totals": {},
+        "cuisine_counts": {},
+        "overall_stats": {},
+        "shopping_items": [],
+    }
+    try:
+        if plan is None:
+            plan = PlanResponse.model_validate(stored.plan_data)
+    except ValueError:
+        valid = False
+    else:
+        valid = True
+        values.update(summarize_plan(plan))
+        values["overall_stats"] = dict(stored.plan_data.get("overall_stats") or {})
+
+    summary = db.get(DBMealPlanSummary, stored.id)
+    if summary is None:
+        summary = DBMealPlanSummary(plan_id=stored.id)
+        db.add(summary)
+    summary.projection_version = PROJECTION_VERSION
+    summary.schema_version = stored.schema_version
+    summary.plan_valid = valid
+    for field, value in values.items():
+        setattr(summary, field, value)
+    return summary
+
+
+def latest_plan_summary(db: Session, user_id: str) -> Optional[DBMealPlanSummary]:
+    """Return the summary of the user's newest valid plan, or ``None``."""
+
+    plan_id = (
+        db.query(DBMealPlan.id)
+        .filter(DBMealPlan.user_id == user_id)
+        .order_by(DBMealPlan.created_at.desc(), DBMealPlan.id.desc())
+        .limit(1)
+        .scalar()
+    )
+    if plan_id is None:
+        return None
+    summary = db.get(DBMealPlanSummary, plan_id)
+    if summary is None or summary.projection_version != PROJECTION_VERSION:
+        summary = record_plan_summary(db, db.get(DBMealPlan, plan_id))
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent reader backfilled the same plan first.
+            db.rollback()
+            summary = db.get(DBMealPlanSummary, plan_id)
+    return summary if summary is not None and summary.plan_valid else None
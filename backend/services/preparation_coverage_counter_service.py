@@ -0,0 +1,744 @@
+"""Maintain, read, and reconcile household preparation coverage counters.
+
+Every persisted schedule has one contribution row holding the counters it adds
+to its household (see ``schedule_contribution``). Writers call
+``refresh_schedule_coverage`` or ``record_task_event_coverage`` before they
+commit; both replace the schedule's contribution and apply the difference to
+``household_coverage_counters`` in the same transaction. Coverage reads sum
+nothing at request time.
+
+A household is *bootstrapped* once its ``schedule_total`` counter row exists.
+Households that predate the counters are bootstrapped by their first write or
+first coverage read.
+
+Every ORM flush that inserts, updates, or deletes a coverage source row
+(schedules, schedule events, task execution events, repair proposals, and
+acceptances) marks the affected schedules stale in ``Session.info``. The
+explicit refreshes above clear those marks; whatever is still marked when the
+session commits is refreshed in the same transaction, so edits made through
+the ORM outside these services are visible on the next coverage read. Only
+SQL issued without the ORM bypasses the marks; that is drift until
+``reconcile_household_coverage`` recomputes the household from scratch.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import event, func, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.database import utcnow
+from backend.domain.preparation_operations import PreparationScheduleStatus
+from backend.domain.preparation_repair_proposals import (
+    PreparationRepairProposalStatus,
+)
+from backend.domain.preparation_schedule_derivation import (
+    ORIGINAL_SCHEDULER_METHOD,
+    REPAIR_SCHEDULER_METHOD,
+)
+from backend.domain.preparation_task_execution import (
+    PreparationTaskExecutionEventType,
+    PreparationTaskExecutionState,
+)
+from backend.preparation_coverage_counter_models import (
+    DBHouseholdCoverageCounter,
+    DBPreparationScheduleCoverageContribution,
+)
+from backend.preparation_operations_models import (
+    DBPersistedPreparationSchedule,
+    DBPreparationScheduleEvent,
+)
+from backend.preparation_repair_proposal_models import (
+    DBPreparationRepairProposal,
+    DBPreparationRepairProposalAcceptance,
+)
+from backend.preparation_task_execution_models import DBPreparationTaskExecutionEvent
+
+
+BOOTSTRAP_COUNTER = "schedule_total"
+ORPHAN_TASK_EVENT_COUNTER = "orphan_task_event"
+EXECUTION_SCOPE_STATUSES = {
+    PreparationScheduleStatus.APPROVED.value,
+    PreparationScheduleStatus.COMPLETED.value,
+}
+TERMINAL_TASK_STATES = {
+    PreparationTaskExecutionState.COMPLETED.value,
+    PreparationTaskExecutionState.SKIPPED.value,
+}
+_STALE_SCHEDULES_KEY = "coverage_stale_schedules"
+_STALE_HOUSEHOLDS_KEY = "coverage_stale_households"
+
+
+def _insert(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise RuntimeError(f"Coverage counters do not support {dialect}")
+    return insert
+
+
+def _repair_evidence_complete(
+    schedule: DBPersistedPreparationSchedule,
+    proposal: DBPreparationRepairProposal | None,
+    acceptance: DBPreparationRepairProposalAcceptance | None,
+) -> bool:
+    if proposal is None or acceptance is None:
+        return False
+    if proposal.status != PreparationRepairProposalStatus.ACCEPTED.value:
+        return False
+    comparisons = [
+        proposal.id == schedule.source_repair_proposal_id,
+        proposal.version == schedule.source_repair_proposal_version,
+        acceptance.proposal_id == proposal.id,
+        acceptance.proposal_version_after == proposal.version,
+        acceptance.created_schedule_id == schedule.id,
+        acceptance.created_schedule_version == 1,
+        acceptance.derivation_method == REPAIR_SCHEDULER_METHOD,
+        proposal.source_schedule_id == acceptance.source_schedule_id,
+        proposal.source_schedule_version == acceptance.source_schedule_version,
+        proposal.source_schedule_hash == acceptance.source_schedule_hash,
+        proposal.source_schedule_request_hash
+        == acceptance.source_schedule_request_hash,
+        proposal.target_calendar_content_hash
+        == acceptance.target_calendar_content_hash,
+        proposal.repair_request_hash == acceptance.repair_request_hash,
+        proposal.repair_request_hash == schedule.source_repair_request_hash,
+        proposal.repair_result_hash == acceptance.repair_result_hash,
+        proposal.repair_result_hash == schedule.source_repair_result_hash,
+        proposal.revised_request_hash == acceptance.revised_request_hash,
+        proposal.revised_request_hash == schedule.source_revised_request_hash,
+        proposal.repaired_response_hash == acceptance.repaired_response_hash,
+        proposal.repaired_response_hash == schedule.source_repaired_response_hash,
+        sorted(proposal.required_acknowledgement_task_ids or [])
+        == sorted(acceptance.acknowledged_task_ids or []),
+    ]
+    return all(comparisons)
+
+
+def _household_proposal(
+    db: Session,
+    household_id: str,
+    proposal_id: Optional[int],
+) -> DBPreparationRepairProposal | None:
+    if proposal_id is None:
+        return None
+    proposal = db.get(DBPreparationRepairProposal, proposal_id)
+    if proposal is None or proposal.household_id != household_id:
+        return None
+    return proposal
+
+
+def _derivation_contribution(
+    db: Session,
+    schedule: DBPersistedPreparationSchedule,
+    *,
+    has_task_events: bool,
+    counters: Counter,
+    warnings: List[str],
+) -> None:
+    household_id = schedule.household_id
+    acceptance = (
+        db.query(DBPreparationRepairProposalAcceptance)
+        .filter(
+            DBPreparationRepairProposalAcceptance.created_schedule_id == schedule.id,
+            DBPreparationRepairProposalAcceptance.household_id == household_id,
+        )
+        .first()
+    )
+    if acceptance is not None:
+        counters["acceptance_total"] += 1
+        accepted = _household_proposal(db, household_id, acceptance.proposal_id)
+        if (
+            accepted is not None
+            and accepted.status == PreparationRepairProposalStatus.ACCEPTED.value
+        ):
+            counters["proposal_accepted"] += 1
+
+    method = schedule.derivation_method or ORIGINAL_SCHEDULER_METHOD
+    counters[f"derivation_method:{method}"] += 1
+    if method == ORIGINAL_SCHEDULER_METHOD:
+        counters["derivation_original"] += 1
+        repair_columns = [
+            schedule.source_repair_proposal_id,
+            schedule.source_repair_proposal_version,
+            schedule.source_repair_request_hash,
+            schedule.source_repair_result_hash,
+            schedule.source_revised_request_hash,
+            schedule.source_repaired_response_hash,
+        ]
+        if all(value is None for value in repair_columns):
+            counters["derivation_complete"] += 1
+        else:
+            warnings.append(
+                f"schedule {schedule.id} reports original derivation with repair fields"
+            )
+        return
+
+    if method == REPAIR_SCHEDULER_METHOD:
+        counters["derivation_repair"] += 1
+        if schedule.status == PreparationScheduleStatus.DRAFT.value:
+            counters["repair_status:draft"] += 1
+        elif schedule.status == PreparationScheduleStatus.APPROVED.value:
+            counters["repair_status:approved"] += 1
+        if has_task_events:
+            counters["repair_execution_history"] += 1
+        proposal = _household_proposal(
+            db,
+            household_id,
+            schedule.source_repair_proposal_id,
+        )
+        if _repair_evidence_complete(schedule, proposal, acceptance):
+            counters["derivation_complete"] += 1
+            counters["derivation_repair_complete"] += 1
+        else:
+            warnings.append(
+                f"schedule {schedule.id} has incomplete repair derivation evidence"
+            )
+        return
+
+    counters["derivation_unknown"] += 1
+    warnings.append(f"schedule {schedule.id} uses unknown derivation method {method}")
+
+
+def _execution_contribution(
+    db: Session,
+    schedule: DBPersistedPreparationSchedule,
+    *,
+    has_task_events: bool,
+    counters: Counter,
+) -> None:
+    # Imported here: the authoritative validator imports the task execution
+    # service, which records coverage through this module.
+    from backend.services.preparation_task_execution_authoritative_service import (
+        validate_task_execution_snapshot,
+    )
+
+    if schedule.status not in EXECUTION_SCOPE_STATUSES and not has_task_events:
+        return
+    counters["execution_scope"] += 1
+    counters["execution_active"] += int(
+        schedule.status == PreparationScheduleStatus.APPROVED.value
+    )
+    counters["execution_history"] += int(has_task_events)
+    try:
+        _, tasks, _, states = validate_task_execution_snapshot(
+            db,
+            household_id=schedule.household_id,
+            schedule_id=schedule.id,
+        )
+    except HTTPException:
+        counters["execution_invalid"] += 1
+        return
+    terminal = sum(value.value in TERMINAL_TASK_STATES for value in states.values())
+    if (
+        schedule.status == PreparationScheduleStatus.COMPLETED.value
+        and terminal != len(tasks)
+    ):
+        counters["execution_invalid"] += 1
+        return
+    counters["deterministic_task"] += len(tasks)
+    counters["terminal_task"] += terminal
+    counters.update(f"task_state:{value.value}" for value in states.values())
+    counters["fully_terminal_schedule"] += int(terminal == len(tasks))
+
+
+def schedule_contribution(
+    db: Session,
+    schedule: DBPersistedPreparationSchedule,
+) -> Tuple[Dict[str, int], List[str]]:
+    """Compute the counters and derivation warnings one schedule contributes."""
+
+    household_id = schedule.household_id
+    counters: Counter = Counter()
+    warnings: List[str] = []
+    counters[BOOTSTRAP_COUNTER] += 1
+    counters[f"schedule_status:{schedule.status}"] += 1
+
+    has_occurrence = schedule.occurrence_set_payload is not None
+    has_request = schedule.schedule_request_payload is not None and bool(
+        schedule.schedule_request_hash
+    )
+    counters["occurrence_document"] += int(has_occurrence)
+    counters["scheduler_request"] += int(has_request)
+    counters["source_plan_linked"] += int(
+        schedule.source_plan_id is not None
+        and schedule.source_plan_version is not None
+    )
+    if not has_request:
+        counters["replay_status:legacy_request_missing"] += 1
+    elif not has_occurrence:
+        counters["replay_status:legacy_occurrence_set_missing"] += 1
+    else:
+        counters["replay_status:replayable"] += 1
+        counters["replayable_draft"] += int(
+            schedule.status == PreparationScheduleStatus.DRAFT.value
+        )
+    counters["schedule_event_total"] += int(
+        db.query(func.count(DBPreparationScheduleEvent.id))
+        .filter(
+            DBPreparationScheduleEvent.schedule_id == schedule.id,
+            DBPreparationScheduleEvent.household_id == household_id,
+        )
+        .scalar()
+        or 0
+    )
+
+    events = (
+        db.query(
+            DBPreparationTaskExecutionEvent.event_type,
+            DBPreparationTaskExecutionEvent.deviation_minutes,
+            DBPreparationTaskExecutionEvent.reason,
+        )
+        .filter(
+            DBPreparationTaskExecutionEvent.schedule_id == schedule.id,
+            DBPreparationTaskExecutionEvent.household_id == household_id,
+        )
+        .all()
+    )
+    for event_type, deviation, reason in events:
+        _count_task_event(counters, event_type, deviation, reason)
+
+    _derivation_contribution(
+        db,
+        schedule,
+        has_task_events=bool(events),
+        counters=counters,
+        warnings=warnings,
+    )
+    _execution_contribution(
+        db,
+        schedule,
+        has_task_events=bool(events),
+        counters=counters,
+    )
+    return {name: value for name, value in counters.items() if value}, warnings
+
+
+def _count_task_event(
+    counters: Counter,
+    event_type: str,
+    deviation: int,
+    reason: Optional[str],
+) -> None:
+    skipped = event_type == PreparationTaskExecutionEventType.SKIPPED.value
+    counters["task_event_total"] += 1
+    counters["nonzero_deviation_event"] += int(deviation != 0)
+    counters["skipped_task_event"] += int(skipped)
+    counters["skip_reason"] += int(skipped and bool(reason and reason.strip()))
+
+
+def _orphan_task_event_count(db: Session, household_id: str) -> int:
+    return int(
+        db.query(func.count(DBPreparationTaskExecutionEvent.id))
+        .join(
+            DBPersistedPreparationSchedule,
+            DBPersistedPreparationSchedule.id
+            == DBPreparationTaskExecutionEvent.schedule_id,
+        )
+        .filter(
+            DBPreparationTaskExecutionEvent.household_id == household_id,
+            DBPersistedPreparationSchedule.household_id != household_id,
+        )
+        .scalar()
+        or 0
+    )
+
+
+def _increment(db: Session, household_id: str, deltas: Dict[str, int]) -> None:
+    deltas = {name: value for name, value in deltas.items() if value}
+    if not deltas:
+        return
+    now = utcnow()
+    table = DBHouseholdCoverageCounter.__table__
+    statement = _insert(db)(table).values(
+        [
+            {
+                "household_id": household_id,
+                "counter": name,
+                "value": value,
+                "updated_at": now,
+            }
+            for name, value in sorted(deltas.items())
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["household_id", "counter"],
+        set_={
+            "value": table.c.value + statement.excluded.value,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    db.execute(statement)
+
+
+def _store_contribution(
+    db: Session,
+    schedule: DBPersistedPreparationSchedule,
+    counters: Dict[str, int],
+    warnings: List[str],
+) -> None:
+    row = db.get(DBPreparationScheduleCoverageContribution, schedule.id)
+    previous = dict(row.counters or {}) if row is not None else {}
+    if row is None:
+        row = DBPreparationScheduleCoverageContribution(
+            schedule_id=schedule.id,
+            household_id=schedule.household_id,
+        )
+        db.add(row)
+    row.counters = counters
+    row.warnings = warnings
+    row.has_warnings = bool(warnings)
+    _increment(
+        db,
+        schedule.household_id,
+        {
+            name: counters.get(name, 0) - previous.get(name, 0)
+            for name in counters.keys() | previous.keys()
+        },
+    )
+
+
+def _is_bootstrapped(db: Session, household_id: str) -> bool:
+    return (
+        db.query(DBHouseholdCoverageCounter.value)
+        .filter(
+            DBHouseholdCoverageCounter.household_id == household_id,
+            DBHouseholdCoverageCounter.counter == BOOTSTRAP_COUNTER,
+        )
+        .first()
+        is not None
+    )
+
+
+def _recompute(
+    db: Session,
+    household_id: str,
+) -> Tuple[Dict[int, Tuple[Dict[str, int], List[str]]], Dict[str, int]]:
+    schedules = (
+        db.query(DBPersistedPreparationSchedule)
+        .filter(DBPersistedPreparationSchedule.household_id == household_id)
+        .order_by(DBPersistedPreparationSchedule.id)
+        .all()
+    )
+    contributions = {
+        schedule.id: schedule_contribution(db, schedule) for schedule in schedules
+    }
+    totals: Counter = Counter()
+    for counters, _ in contributions.values():
+        totals.update(counters)
+    totals[ORPHAN_TASK_EVENT_COUNTER] += _orphan_task_event_count(db, household_id)
+    expected = {name: value for name, value in totals.items() if value}
+    expected[BOOTSTRAP_COUNTER] = totals[BOOTSTRAP_COUNTER]
+    return contributions, expected
+
+
+def _write_household(
+    db: Session,
+    household_id: str,
+    contributions: Dict[int, Tuple[Dict[str, int], List[str]]],
+    totals: Dict[str, int],
+) -> None:
+    db.query(DBPreparationScheduleCoverageContribution).filter(
+        DBPreparationScheduleCoverageContribution.household_id == household_id
+    ).delete(synchronize_session="fetch")
+    db.query(DBHouseholdCoverageCounter).filter(
+        DBHouseholdCoverageCounter.household_id == household_id
+    ).delete(synchronize_session="fetch")
+    db.add_all(
+        DBPreparationScheduleCoverageContribution(
+            schedule_id=schedule_id,
+            household_id=household_id,
+            counters=counters,
+            warnings=warnings,
+            has_warnings=bool(warnings),
+        )
+        for schedule_id, (counters, warnings) in contributions.items()
+    )
+    db.add_all(
+        DBHouseholdCoverageCounter(
+            household_id=household_id,
+            counter=name,
+            value=value,
+        )
+        for name, value in sorted(totals.items())
+    )
+    db.flush()
+
+
+def _bootstrap(db: Session, household_id: str) -> None:
+    contributions, totals = _recompute(db, household_id)
+    _write_household(db, household_id, contributions, totals)
+    stale = _stale_schedules(db)
+    for schedule_id in [key for key, value in stale.items() if value == household_id]:
+        del stale[schedule_id]
+    _stale_households(db).discard(household_id)
+
+
+def refresh_schedule_coverage(
+    db: Session,
+    schedule: DBPersistedPreparationSchedule,
+) -> None:
+    """Recompute one schedule's contribution inside the caller's transaction."""
+
+    db.flush()
+    _stale_schedules(db).pop(schedule.id, None)
+    if not _is_bootstrapped(db, schedule.household_id):
+        _bootstrap(db, schedule.household_id)
+        return
+    counters, warnings = schedule_contribution(db, schedule)
+    _store_contribution(db, schedule, counters, warnings)
+
+
+def record_task_event_coverage(
+    db: Session,
+    *,
+    schedule: DBPersistedPreparationSchedule,
+    event: DBPreparationTaskExecutionEvent,
+) -> None:
+    """Apply one newly flushed execution event without re-reading the ledger.
+
+    Falls back to a full refresh of the schedule when its stored contribution
+    is missing, out of execution scope, or already marked invalid.
+    """
+
+    _stale_schedules(db).pop(schedule.id, None)
+    row = db.get(DBPreparationScheduleCoverageContribution, schedule.id)
+    previous = dict(row.counters or {}) if row is not None else {}
+    if (
+        row is None
+        or not previous.get("execution_scope")
+        or previous.get("execution_invalid")
+        or not _is_bootstrapped(db, schedule.household_id)
+    ):
+        refresh_schedule_coverage(db, schedule)
+        return
+
+    counters: Counter = Counter(previous)
+    _count_task_event(counters, event.event_type, event.deviation_minutes, event.reason)
+    if not previous.get("execution_history"):
+        counters["execution_history"] = 1
+        if previous.get("derivation_repair"):
+            counters["repair_execution_history"] = 1
+    counters[f"task_state:{event.from_state}"] -= 1
+    counters[f"task_state:{event.to_state}"] += 1
+    counters["terminal_task"] += int(event.to_state in TERMINAL_TASK_STATES)
+    counters["fully_terminal_schedule"] = int(
+        counters["terminal_task"] == counters["deterministic_task"]
+    )
+    _store_contribution(
+        db,
+        schedule,
+        {name: value for name, value in counters.items() if value},
+        list(row.warnings or []),
+    )
+
+
+def _stale_schedules(db: Session) -> Dict[int, str]:
+    return db.info.setdefault(_STALE_SCHEDULES_KEY, {})
+
+
+def _stale_households(db: Session) -> Set[str]:
+    return db.info.setdefault(_STALE_HOUSEHOLDS_KEY, set())
+
+
+def _history_values(value: object, attribute: str) -> Set[object]:
+    history = inspect(value).attrs[attribute].history
+    values = set(history.added) | set(history.deleted) | set(history.unchanged)
+    values.add(getattr(value, attribute, None))
+    values.discard(None)
+    return values
+
+
+def _mark_schedules(session: Session, schedule_ids: Set[object]) -> None:
+    if not schedule_ids:
+        return
+    stale = _stale_schedules(session)
+    rows = session.query(
+        DBPersistedPreparationSchedule.id,
+        DBPersistedPreparationSchedule.household_id,
+    ).filter(DBPersistedPreparationSchedule.id.in_(schedule_ids))
+    for schedule_id, household_id in rows:
+        stale[schedule_id] = household_id
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_stale_coverage(session: Session, _flush_context: object) -> None:
+    changed = [
+        (value, value in session.deleted)
+        for value in (*session.new, *session.dirty, *session.deleted)
+        if value in session.new or value in session.deleted or session.is_modified(value)
+    ]
+    if not changed:
+        return
+    schedule_ids: Set[object] = set()
+    proposal_ids: Set[object] = set()
+    with session.no_autoflush:
+        for value, deleted in changed:
+            if isinstance(value, DBPersistedPreparationSchedule):
+                households = _history_values(value, "household_id")
+                if deleted or len(households) > 1:
+                    # The schedule left a household: recompute what remains.
+                    _stale_households(session).update(households)
+                else:
+                    schedule_ids.add(value.id)
+            elif isinstance(
+                value, (DBPreparationScheduleEvent, DBPreparationTaskExecutionEvent)
+            ):
+                schedule_ids |= _history_values(value, "schedule_id")
+            elif isinstance(value, DBPreparationRepairProposalAcceptance):
+                schedule_ids |= _history_values(value, "created_schedule_id")
+                proposal_ids |= _history_values(value, "proposal_id")
+            elif isinstance(value, DBPreparationRepairProposal):
+                proposal_ids.add(value.id)
+        if proposal_ids:
+            schedule_ids |= {
+                schedule_id
+                for (schedule_id,) in session.query(
+                    DBPersistedPreparationSchedule.id
+                ).filter(
+                    DBPersistedPreparationSchedule.source_repair_proposal_id.in_(
+                        proposal_ids
+                    )
+                )
+            }
+            schedule_ids |= {
+                schedule_id
+                for (schedule_id,) in session.query(
+                    DBPreparationRepairProposalAcceptance.created_schedule_id
+                ).filter(
+                    DBPreparationRepairProposalAcceptance.proposal_id.in_(proposal_ids)
+                )
+            }
+        _mark_schedules(session, schedule_ids)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_stale_coverage(session: Session) -> None:
+    session.flush()
+    households = _stale_households(session)
+    stale = _stale_schedules(session)
+    while households or stale:
+        if households:
+            household_id = households.pop()
+            if _is_bootstrapped(session, household_id):
+                _bootstrap(session, household_id)
+            continue
+        schedule_id, _household_id = stale.popitem()
+        schedule = session.get(DBPersistedPreparationSchedule, schedule_id)
+        if schedule is not None:
+            refresh_schedule_coverage(session, schedule)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_coverage(session: Session) -> None:
+    session.info.pop(_STALE_SCHEDULES_KEY, None)
+    session.info.pop(_STALE_HOUSEHOLDS_KEY, None)
+
+
+def _household_counters(db: Session, household_id: str) -> Dict[str, int]:
+    return {
+        counter: int(value)
+        for counter, value in db.query(
+            DBHouseholdCoverageCounter.counter,
+            DBHouseholdCoverageCounter.value,
+        ).filter(DBHouseholdCoverageCounter.household_id == household_id)
+    }
+
+
+def load_household_counters(db: Session, household_id: str) -> Dict[str, int]:
+    """Return the household's counters, bootstrapping them on first read."""
+
+    counters = _household_counters(db, household_id)
+    if BOOTSTRAP_COUNTER in counters:
+        return counters
+    _bootstrap(db, household_id)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent writer or reader bootstrapped the household first.
+        db.rollback()
+    return _household_counters(db, household_id)
+
+
+def household_derivation_warnings(db: Session, household_id: str) -> List[str]:
+    rows = db.query(DBPreparationScheduleCoverageContribution.warnings).filter(
+        DBPreparationScheduleCoverageContribution.household_id == household_id,
+        DBPreparationScheduleCoverageContribution.has_warnings.is_(True),
+    )
+    return sorted({warning for (warnings,) in rows for warning in warnings or []})
+
+
+def reconcile_household_coverage(
+    db: Session,
+    *,
+    household_id: str,
+    apply: bool = False,
+) -> Dict[str, object]:
+    """Recompute a household's coverage from scratch and report drift.
+
+    With ``apply`` the recomputed contributions and counters replace the
+    stored ones under the household lock and the transaction is committed.
+    """
+
+    from backend.services.preparation_operations_service import _lock_household
+
+    if apply:
+        _lock_household(db, household_id)
+    contributions, expected = _recompute(db, household_id)
+    stored = _household_counters(db, household_id)
+    drift = [
+        {
+            "counter": name,
+            "stored": stored.get(name, 0),
+            "expected": expected.get(name, 0),
+        }
+        for name in sorted(stored.keys() | expected.keys())
+        if stored.get(name, 0) != expected.get(name, 0)
+    ]
+    stored_rows = {
+        row.schedule_id: row
+        for row in db.query(DBPreparationScheduleCoverageContribution).filter(
+            DBPreparationScheduleCoverageContribution.household_id == household_id
+        )
+    }
+    schedule_drift = sorted(
+        schedule_id
+        for schedule_id in contributions.keys() | stored_rows.keys()
+        if schedule_id not in contributions
+        or schedule_id not in stored_rows
+        or (stored_rows[schedule_id].counters or {}) != contributions[schedule_id][0]
+        or list(stored_rows[schedule_id].warnings or [])
+        != contributions[schedule_id][1]
+    )
+    report: Dict[str, object] = {
+        "household_id": household_id,
+        "bootstrapped": BOOTSTRAP_COUNTER in stored,
+        "schedule_count": len(contributions),
+        "drift": drift,
+        "schedule_drift": schedule_drift,
+        "applied": False,
+    }
+    if apply and (drift or schedule_drift or not report["bootstrapped"]):
+        _write_household(db, household_id, contributions, expected)
+        db.commit()
+        report["applied"] = True
+    elif apply:
+        db.commit()
+    return report
+
+
+__all__ = [
+    "household_derivation_warnings",
+    "load_household_counters",
+    "reconcile_household_coverage",
+    "record_task_event_coverage",
+    "refresh_schedule_coverage",
+    "schedule_contribution",
+]
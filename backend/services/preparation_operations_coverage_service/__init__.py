@@ -1,147 +1,125 @@
 """Authoritative preparation coverage entry point.
 
-This package shadows the historical sibling module, reuses its operational
-provenance calculation, and recomputes task-execution denominators from the
-strict product-facing snapshot validator.
+This package shadows the historical sibling module. Provenance and execution
+denominators come from the household coverage counters, whose per-schedule
+contributions are computed with the strict product-facing snapshot validator
+when schedules, acceptances, and task events are written. Calendar totals and
+latest timestamps are single aggregate queries.
 """
 
 from __future__ import annotations
 
-import importlib.util
-from collections import Counter
-from pathlib import Path
-
-from fastapi import HTTPException
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from backend.domain.preparation_operations import PreparationScheduleStatus
+from backend.domain.preparation_operations import (
+    CalendarEvidenceStatus,
+    PreparationScheduleStatus,
+)
 from backend.domain.preparation_operations_coverage import (
     PreparationOperationsCoverageView,
 )
-from backend.domain.preparation_task_execution import (
-    PreparationTaskExecutionEventType,
-    PreparationTaskExecutionState,
+from backend.domain.preparation_task_execution import PreparationTaskExecutionState
+from backend.preparation_operations_models import (
+    DBPersistedPreparationSchedule,
+    DBResourceCalendarVersion,
 )
-from backend.preparation_operations_models import DBPersistedPreparationSchedule
 from backend.preparation_task_execution_models import DBPreparationTaskExecutionEvent
-from backend.services.preparation_task_execution_authoritative_service import (
-    validate_task_execution_snapshot,
+from backend.services.preparation_coverage_counter_service import (
+    ORPHAN_TASK_EVENT_COUNTER,
+    load_household_counters,
 )
+from backend.services.preparation_operations_service import utcnow
 
 
-_LEGACY_PATH = Path(__file__).resolve().parent.parent / "preparation_operations_coverage_service.py"
-_LEGACY_SPEC = importlib.util.spec_from_file_location(
-    "backend.services._legacy_preparation_operations_coverage_service",
-    _LEGACY_PATH,
+REPLAY_STATUSES = (
+    "replayable",
+    "legacy_request_missing",
+    "legacy_occurrence_set_missing",
 )
-if _LEGACY_SPEC is None or _LEGACY_SPEC.loader is None:  # pragma: no cover
-    raise RuntimeError("Legacy preparation coverage service is unavailable")
-_LEGACY_MODULE = importlib.util.module_from_spec(_LEGACY_SPEC)
-_LEGACY_SPEC.loader.exec_module(_LEGACY_MODULE)
-
-
-SCOPE_STATUSES = {
-    PreparationScheduleStatus.APPROVED.value,
-    PreparationScheduleStatus.COMPLETED.value,
-}
-TERMINAL_STATES = {
-    PreparationTaskExecutionState.COMPLETED,
-    PreparationTaskExecutionState.SKIPPED,
-}
 
 
 def _ratio(value: int, total: int) -> float:
     return round(value / total, 6) if total else 0.0
 
 
+def _isoformat(value) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
 def get_preparation_operations_coverage(
     db: Session,
     *,
     household_id: str,
 ) -> PreparationOperationsCoverageView:
-    base = _LEGACY_MODULE.get_preparation_operations_coverage(
-        db,
-        household_id=household_id,
+    counters = load_household_counters(db, household_id)
+    calendar_total, reviewed_calendar_total, active_reviewed_calendar_count, latest_calendar = (
+        db.query(
+            func.count(DBResourceCalendarVersion.id),
+            func.count(DBResourceCalendarVersion.id).filter(
+                DBResourceCalendarVersion.evidence_status
+                == CalendarEvidenceStatus.REVIEWED.value
+            ),
+            func.count(DBResourceCalendarVersion.id).filter(
+                DBResourceCalendarVersion.active.is_(True),
+                DBResourceCalendarVersion.evidence_status
+                == CalendarEvidenceStatus.REVIEWED.value,
+            ),
+            func.max(DBResourceCalendarVersion.created_at),
+        )
+        .filter(DBResourceCalendarVersion.household_id == household_id)
+        .one()
     )
-    schedules = (
-        db.query(DBPersistedPreparationSchedule)
+    latest_schedule = (
+        db.query(func.max(DBPersistedPreparationSchedule.created_at))
         .filter(DBPersistedPreparationSchedule.household_id == household_id)
-        .order_by(DBPersistedPreparationSchedule.id)
-        .all()
+        .scalar()
     )
-    events = (
-        db.query(DBPreparationTaskExecutionEvent)
+    latest_task_event = (
+        db.query(func.max(DBPreparationTaskExecutionEvent.created_at))
         .filter(DBPreparationTaskExecutionEvent.household_id == household_id)
-        .order_by(
-            DBPreparationTaskExecutionEvent.created_at,
-            DBPreparationTaskExecutionEvent.id,
-        )
-        .all()
-    )
-    event_schedule_ids = {value.schedule_id for value in events}
-    scope = [
-        value
-        for value in schedules
-        if value.status in SCOPE_STATUSES or value.id in event_schedule_ids
-    ]
-
-    state_counts = Counter(
-        {
-            PreparationTaskExecutionState.PLANNED.value: 0,
-            PreparationTaskExecutionState.IN_PROGRESS.value: 0,
-            PreparationTaskExecutionState.COMPLETED.value: 0,
-            PreparationTaskExecutionState.SKIPPED.value: 0,
-        }
-    )
-    invalid_count = 0
-    deterministic_task_count = 0
-    terminal_task_count = 0
-    fully_terminal_schedule_count = 0
-    history_schedule_count = sum(value.id in event_schedule_ids for value in scope)
-
-    for schedule in scope:
-        try:
-            _, tasks, _, states = validate_task_execution_snapshot(
-                db,
-                household_id=household_id,
-                schedule_id=schedule.id,
-            )
-        except HTTPException:
-            invalid_count += 1
-            continue
-        terminal = sum(value in TERMINAL_STATES for value in states.values())
-        if (
-            schedule.status == PreparationScheduleStatus.COMPLETED.value
-            and terminal != len(tasks)
-        ):
-            invalid_count += 1
-            continue
-        deterministic_task_count += len(tasks)
-        terminal_task_count += terminal
-        state_counts.update(value.value for value in states.values())
-        fully_terminal_schedule_count += int(terminal == len(tasks))
-
-    nonzero_deviation_count = sum(value.deviation_minutes != 0 for value in events)
-    skipped_count = sum(
-        value.event_type == PreparationTaskExecutionEventType.SKIPPED.value
-        for value in events
-    )
-    skip_reason_count = sum(
-        value.event_type == PreparationTaskExecutionEventType.SKIPPED.value
-        and bool(value.reason and value.reason.strip())
-        for value in events
+        .scalar()
     )
 
-    warnings = [
-        value
-        for value in base.warnings
-        if value
-        not in {
-            "Approved or completed execution schedules have no task-event history",
-            "One or more execution schedules or task histories are structurally invalid",
-        }
-    ]
-    if scope and history_schedule_count < len(scope):
+    schedule_total = counters.get("schedule_total", 0)
+    replay_status_counts = {
+        status: counters.get(f"replay_status:{status}", 0)
+        for status in REPLAY_STATUSES
+    }
+    replayable_schedule_count = replay_status_counts["replayable"]
+    source_plan_linked_count = counters.get("source_plan_linked", 0)
+    scope_count = counters.get("execution_scope", 0)
+    history_count = counters.get("execution_history", 0)
+    invalid_count = counters.get("execution_invalid", 0)
+    deterministic_task_count = counters.get("deterministic_task", 0)
+    terminal_task_count = counters.get("terminal_task", 0)
+    skipped_count = counters.get("skipped_task_event", 0)
+    skip_reason_count = counters.get("skip_reason", 0)
+
+    warnings: list[str] = []
+    if active_reviewed_calendar_count == 0:
+        warnings.append("No active reviewed resource calendar is available")
+    elif active_reviewed_calendar_count > 1:
+        warnings.append(
+            "More than one active reviewed resource calendar was observed"
+        )
+    if schedule_total == 0:
+        warnings.append("No persisted preparation schedules are available")
+    if replayable_schedule_count < schedule_total:
+        warnings.append(
+            "One or more legacy schedules lack complete replay provenance"
+        )
+    if source_plan_linked_count < schedule_total and schedule_total:
+        warnings.append(
+            "One or more schedules are not linked to a source plan version"
+        )
+    if counters.get(ORPHAN_TASK_EVENT_COUNTER, 0):
+        warnings.append(
+            "Task events were observed without a matching household schedule"
+        )
+    if skipped_count != skip_reason_count:
+        warnings.append("One or more skipped task events lack a nonblank reason")
+    if scope_count and history_count < scope_count:
         warnings.append(
             "One or more execution-scope schedules have no task-event history"
         )
@@ -149,47 +127,62 @@ def get_preparation_operations_coverage(
         warnings.append(
             "One or more execution schedules or task histories are structurally invalid"
         )
-    if skipped_count != skip_reason_count and (
-        "One or more skipped task events lack a nonblank reason" not in warnings
-    ):
-        warnings.append("One or more skipped task events lack a nonblank reason")
 
-    payload = base.model_dump(mode="json")
-    payload.update(
-        {
-            "execution_scope_schedule_count": len(scope),
-            "execution_active_schedule_count": sum(
-                value.status == PreparationScheduleStatus.APPROVED.value
-                for value in scope
-            ),
-            "execution_history_schedule_count": history_schedule_count,
-            "execution_invalid_schedule_count": invalid_count,
-            "deterministic_task_count": deterministic_task_count,
-            "task_state_counts": {
-                state.value: int(state_counts.get(state.value, 0))
-                for state in PreparationTaskExecutionState
-            },
-            "terminal_task_count": terminal_task_count,
-            "fully_terminal_schedule_count": fully_terminal_schedule_count,
-            "task_event_total": len(events),
-            "nonzero_deviation_event_count": nonzero_deviation_count,
-            "skipped_task_event_count": skipped_count,
-            "skip_reason_count": skip_reason_count,
-            "task_event_schedule_coverage": _ratio(
-                history_schedule_count,
-                len(scope),
-            ),
-            "terminal_task_coverage": _ratio(
-                terminal_task_count,
-                deterministic_task_count,
-            ),
-            "latest_task_event_at": (
-                events[-1].created_at.isoformat() if events else None
-            ),
-            "warnings": warnings,
-        }
+    return PreparationOperationsCoverageView(
+        household_id=household_id,
+        generated_at=utcnow().isoformat(),
+        calendar_total=int(calendar_total or 0),
+        reviewed_calendar_total=int(reviewed_calendar_total or 0),
+        active_reviewed_calendar_count=int(active_reviewed_calendar_count or 0),
+        schedule_total=schedule_total,
+        schedule_status_counts={
+            status.value: counters.get(f"schedule_status:{status.value}", 0)
+            for status in PreparationScheduleStatus
+        },
+        replay_status_counts=replay_status_counts,
+        occurrence_document_count=counters.get("occurrence_document", 0),
+        scheduler_request_count=counters.get("scheduler_request", 0),
+        replayable_schedule_count=replayable_schedule_count,
+        replayable_draft_count=counters.get("replayable_draft", 0),
+        source_plan_linked_count=source_plan_linked_count,
+        event_total=counters.get("schedule_event_total", 0),
+        occurrence_document_coverage=_ratio(
+            counters.get("occurrence_document", 0),
+            schedule_total,
+        ),
+        scheduler_request_coverage=_ratio(
+            counters.get("scheduler_request", 0),
+            schedule_total,
+        ),
+        replayable_schedule_coverage=_ratio(
+            replayable_schedule_count,
+            schedule_total,
+        ),
+        execution_scope_schedule_count=scope_count,
+        execution_active_schedule_count=counters.get("execution_active", 0),
+        execution_history_schedule_count=history_count,
+        execution_invalid_schedule_count=invalid_count,
+        deterministic_task_count=deterministic_task_count,
+        task_state_counts={
+            state.value: counters.get(f"task_state:{state.value}", 0)
+            for state in PreparationTaskExecutionState
+        },
+        terminal_task_count=terminal_task_count,
+        fully_terminal_schedule_count=counters.get("fully_terminal_schedule", 0),
+        task_event_total=counters.get("task_event_total", 0),
+        nonzero_deviation_event_count=counters.get("nonzero_deviation_event", 0),
+        skipped_task_event_count=skipped_count,
+        skip_reason_count=skip_reason_count,
+        task_event_schedule_coverage=_ratio(history_count, scope_count),
+        terminal_task_coverage=_ratio(
+            terminal_task_count,
+            deterministic_task_count,
+        ),
+        latest_calendar_created_at=_isoformat(latest_calendar),
+        latest_schedule_created_at=_isoformat(latest_schedule),
+        latest_task_event_at=_isoformat(latest_task_event),
+        warnings=warnings,
     )
-    return PreparationOperationsCoverageView.model_validate(payload)
 
 
 __all__ = ["get_preparation_operations_coverage"]
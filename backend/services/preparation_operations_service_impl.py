@@ -45,6 +45,9 @@ from backend.preparation_operations_models import (
     DBPreparationScheduleEvent,
     DBResourceCalendarVersion,
 )
+from backend.services.preparation_coverage_counter_service import (
+    refresh_schedule_coverage,
+)
 
 
 ACTIVE_SCHEDULE_STATUSES = {
@@ -537,6 +540,7 @@ def _invalidate_schedules_for_calendar(
             request_fingerprint=fingerprint,
             created_at=now,
         )
+        refresh_schedule_coverage(db, schedule)
     return len(schedules)
 
 
@@ -924,6 +928,7 @@ def create_persisted_schedule(
         request_fingerprint=fingerprint,
         created_at=now,
     )
+    refresh_schedule_coverage(db, schedule)
     try:
         db.commit()
     except IntegrityError as exc:
@@ -1266,6 +1271,7 @@ def transition_schedule(
         request_fingerprint=fingerprint,
         created_at=now,
     )
+    refresh_schedule_coverage(db, schedule)
     try:
         db.commit()
     except IntegrityError as exc:
@@ -56,6 +56,9 @@ from backend.preparation_task_execution_models import (
 from backend.services.household_plan_lifecycle_service import (
     assert_approved_source_plan,
 )
+from backend.services.preparation_coverage_counter_service import (
+    refresh_schedule_coverage,
+)
 from backend.services.preparation_operations_service import (
     _append_event,
     _assert_occurrence_household,
@@ -707,6 +710,7 @@ def accept_repair_proposal(
         idempotency_key=payload.idempotency_key,
         request_fingerprint=fingerprint,
     )
+    refresh_schedule_coverage(db, schedule)
 
     try:
         db.commit()
@@ -1,10 +1,22 @@
-"""Execution-aware authoritative reads and rejection for repair proposals."""
+"""Execution-aware authoritative reads and rejection for repair proposals.
+
+Views are built from a ``_ProposalReadContext`` that loads every referenced
+schedule, plan, calendar, acceptance and execution-history flag for a batch of
+proposals in a fixed number of ``IN (...)`` queries, so listing N proposals
+costs the same number of round-trips as reading one.
+"""
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Sequence
 
 from fastapi import HTTPException
+from sqlalchemy import and_, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -48,14 +60,73 @@ ACTIVE_SOURCE_STATUSES = {
 }
 
 
-def _acceptance_record(
+@dataclass(frozen=True)
+class _ProposalReadContext:
+    schedules: Dict[int, DBPersistedPreparationSchedule]
+    plans: Dict[int, DBMealPlan]
+    calendars: Dict[int, DBResourceCalendarVersion]
+    acceptances: Dict[int, DBPreparationRepairProposalAcceptance]
+    executed_schedule_ids: FrozenSet[int]
+
+
+def _by_id(db: Session, model, ids: set) -> Dict[int, object]:
+    if not ids:
+        return {}
+    return {row.id: row for row in db.query(model).filter(model.id.in_(ids))}
+
+
+def _load_read_context(
     db: Session,
-    proposal_id: int,
-) -> DBPreparationRepairProposalAcceptance | None:
-    return (
-        db.query(DBPreparationRepairProposalAcceptance)
-        .filter(DBPreparationRepairProposalAcceptance.proposal_id == proposal_id)
-        .first()
+    proposals: Sequence[DBPreparationRepairProposal],
+) -> _ProposalReadContext:
+    proposal_ids = {proposal.id for proposal in proposals}
+    acceptances = (
+        {
+            row.proposal_id: row
+            for row in db.query(DBPreparationRepairProposalAcceptance).filter(
+                DBPreparationRepairProposalAcceptance.proposal_id.in_(proposal_ids)
+            )
+        }
+        if proposal_ids
+        else {}
+    )
+    source_ids = {proposal.source_schedule_id for proposal in proposals}
+    schedules = _by_id(
+        db,
+        DBPersistedPreparationSchedule,
+        source_ids | {row.created_schedule_id for row in acceptances.values()},
+    )
+    plans = _by_id(
+        db,
+        DBMealPlan,
+        {
+            schedules[schedule_id].source_plan_id
+            for schedule_id in source_ids
+            if schedule_id in schedules
+            and schedules[schedule_id].source_plan_id is not None
+        },
+    )
+    calendars = _by_id(
+        db,
+        DBResourceCalendarVersion,
+        {proposal.target_calendar_version_id for proposal in proposals},
+    )
+    executed = (
+        frozenset(
+            schedule_id
+            for (schedule_id,) in db.query(DBPreparationTaskExecutionEvent.schedule_id)
+            .filter(DBPreparationTaskExecutionEvent.schedule_id.in_(source_ids))
+            .distinct()
+        )
+        if source_ids
+        else frozenset()
+    )
+    return _ProposalReadContext(
+        schedules=schedules,
+        plans=plans,
+        calendars=calendars,
+        acceptances=acceptances,
+        executed_schedule_ids=executed,
     )
 
 
@@ -63,7 +134,16 @@ def _acceptance_view(
     db: Session,
     value: DBPreparationRepairProposalAcceptance,
 ) -> PreparationRepairProposalAcceptanceView:
-    schedule = db.get(DBPersistedPreparationSchedule, value.created_schedule_id)
+    return _acceptance_view_from(
+        value,
+        db.get(DBPersistedPreparationSchedule, value.created_schedule_id),
+    )
+
+
+def _acceptance_view_from(
+    value: DBPreparationRepairProposalAcceptance,
+    schedule: DBPersistedPreparationSchedule | None,
+) -> PreparationRepairProposalAcceptanceView:
     if schedule is None or schedule.household_id != value.household_id:
         raise HTTPException(
             status_code=409,
@@ -113,12 +193,19 @@ def _acceptance_view(
 def _stale_reasons(
     db: Session,
     proposal: DBPreparationRepairProposal,
+) -> List[str]:
+    return _stale_reasons_from(proposal, _load_read_context(db, [proposal]))
+
+
+def _stale_reasons_from(
+    proposal: DBPreparationRepairProposal,
+    context: _ProposalReadContext,
 ) -> List[str]:
     reasons: List[str] = []
     if proposal.status != PreparationRepairProposalStatus.PROPOSED.value:
         reasons.append(f"proposal_status_{proposal.status}")
 
-    source = db.get(DBPersistedPreparationSchedule, proposal.source_schedule_id)
+    source = context.schedules.get(proposal.source_schedule_id)
     if source is None or source.household_id != proposal.household_id:
         reasons.append("source_schedule_missing")
     else:
@@ -130,16 +217,10 @@ def _stale_reasons(
             reasons.append("source_schedule_request_hash_changed")
         if source.status not in ACTIVE_SOURCE_STATUSES:
             reasons.append(f"source_schedule_status_{source.status}")
-        execution_exists = (
-            db.query(DBPreparationTaskExecutionEvent.id)
-            .filter(DBPreparationTaskExecutionEvent.schedule_id == source.id)
-            .first()
-            is not None
-        )
-        if execution_exists:
+        if source.id in context.executed_schedule_ids:
             reasons.append("source_schedule_has_execution_history")
         if source.source_plan_id is not None:
-            plan = db.get(DBMealPlan, source.source_plan_id)
+            plan = context.plans.get(source.source_plan_id)
             if (
                 plan is None
                 or plan.household_id != proposal.household_id
@@ -148,10 +229,7 @@ def _stale_reasons(
             ):
                 reasons.append("source_plan_not_currently_approved")
 
-    calendar = db.get(
-        DBResourceCalendarVersion,
-        proposal.target_calendar_version_id,
-    )
+    calendar = context.calendars.get(proposal.target_calendar_version_id)
     if calendar is None or calendar.household_id != proposal.household_id:
         reasons.append("target_calendar_missing")
     else:
@@ -168,8 +246,15 @@ def _proposal_view(
     db: Session,
     proposal: DBPreparationRepairProposal,
 ) -> PreparationRepairProposalView:
-    stale = _stale_reasons(db, proposal)
-    acceptance = _acceptance_record(db, proposal.id)
+    return _proposal_view_from(proposal, _load_read_context(db, [proposal]))
+
+
+def _proposal_view_from(
+    proposal: DBPreparationRepairProposal,
+    context: _ProposalReadContext,
+) -> PreparationRepairProposalView:
+    stale = _stale_reasons_from(proposal, context)
+    acceptance = context.acceptances.get(proposal.id)
     is_accepted = proposal.status == PreparationRepairProposalStatus.ACCEPTED.value
     if is_accepted and acceptance is None:
         raise HTTPException(
@@ -187,7 +272,14 @@ def _proposal_view(
                 "message": "Non-accepted proposal has contradictory acceptance evidence",
             },
         )
-    acceptance_view = _acceptance_view(db, acceptance) if acceptance else None
+    acceptance_view = (
+        _acceptance_view_from(
+            acceptance,
+            context.schedules.get(acceptance.created_schedule_id),
+        )
+        if acceptance
+        else None
+    )
     return PreparationRepairProposalView(
         id=proposal.id,
         household_id=proposal.household_id,
@@ -232,12 +324,47 @@ def _proposal_view(
     )
 
 
+def encode_repair_proposal_cursor(view: PreparationRepairProposalView) -> str:
+    """Return the keyset cursor that resumes a listing after ``view``."""
+
+    raw = json.dumps([view.updated_at, view.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+# ``preparation_repair_proposals.id`` is a signed 32-bit INTEGER column.
+_CURSOR_ID_RANGE = range(-(2**31), 2**31)
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        updated_at, proposal_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if type(proposal_id) is not int or proposal_id not in _CURSOR_ID_RANGE:
+            raise ValueError("cursor proposal id is not a valid identifier")
+        return datetime.fromisoformat(updated_at), proposal_id
+    except (binascii.Error, OverflowError, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "code": "repair_proposal_cursor_invalid",
+                "message": "Repair proposal listing cursor is malformed",
+            },
+        ) from exc
+
+
 def list_repair_proposals(
     db: Session,
     *,
     household_id: str,
     statuses: Iterable[PreparationRepairProposalStatus] | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> List[PreparationRepairProposalView]:
+    """List proposals newest first, optionally one keyset page at a time.
+
+    ``cursor`` comes from ``encode_repair_proposal_cursor`` applied to the last
+    view of the previous page.
+    """
+
     query = db.query(DBPreparationRepairProposal).filter(
         DBPreparationRepairProposal.household_id == household_id
     )
@@ -247,11 +374,26 @@ def list_repair_proposals(
                 [value.value for value in statuses]
             )
         )
-    rows = query.order_by(
+    if cursor is not None:
+        updated_at, proposal_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                DBPreparationRepairProposal.updated_at < updated_at,
+                and_(
+                    DBPreparationRepairProposal.updated_at == updated_at,
+                    DBPreparationRepairProposal.id < proposal_id,
+                ),
+            )
+        )
+    query = query.order_by(
         DBPreparationRepairProposal.updated_at.desc(),
         DBPreparationRepairProposal.id.desc(),
-    ).all()
-    return [_proposal_view(db, value) for value in rows]
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    rows = query.all()
+    context = _load_read_context(db, rows)
+    return [_proposal_view_from(value, context) for value in rows]
 
 
 def get_repair_proposal(
@@ -443,6 +585,7 @@ __all__ = [
     "_acceptance_view",
     "_proposal_view",
     "_stale_reasons",
+    "encode_repair_proposal_cursor",
     "get_repair_proposal",
     "get_repair_proposal_acceptance",
     "list_repair_proposal_events",
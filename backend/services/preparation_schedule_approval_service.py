@@ -54,6 +54,9 @@ from backend.preparation_task_execution_models import (
 from backend.services.household_plan_lifecycle_service import (
     assert_approved_source_plan,
 )
+from backend.services.preparation_coverage_counter_service import (
+    refresh_schedule_coverage,
+)
 from backend.services.preparation_operations_service import (
     _append_event,
     _assert_occurrence_household,
@@ -543,6 +546,7 @@ def approve_schedule_authoritative(
         request_fingerprint=fingerprint,
         created_at=now,
     )
+    refresh_schedule_coverage(db, schedule)
     try:
         db.commit()
     except IntegrityError as exc:
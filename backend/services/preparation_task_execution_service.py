@@ -1,10 +1,20 @@
-"""Append-only, user-confirmed execution events for persisted preparation tasks."""
+"""Append-only, user-confirmed execution events for persisted preparation tasks.
+
+Each task's replayed state is kept in ``preparation_task_execution_task_states``
+and advanced in the same transaction as every event insert, so recording an
+event and answering "which tasks are terminal" do not re-scan the ledger. The
+projection is trusted only while its ``last_event_id`` is the ledger's newest
+event and its ``schedule_hash`` matches the schedule; otherwise reads replay in
+memory and the next write rebuilds it.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
-from typing import Dict, List
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 from pydantic import ValidationError
@@ -23,7 +33,14 @@ from backend.domain.preparation_task_execution import (
     PreparationTaskExecutionTaskView,
 )
 from backend.preparation_operations_models import DBPersistedPreparationSchedule
-from backend.preparation_task_execution_models import DBPreparationTaskExecutionEvent
+from backend.preparation_task_execution_models import (
+    DBPreparationTaskExecutionEvent,
+    DBPreparationTaskExecutionProjection,
+    DBPreparationTaskExecutionTaskState,
+)
+from backend.services.preparation_coverage_counter_service import (
+    record_task_event_coverage,
+)
 from backend.services.preparation_operations_service import (
     _lock_household,
     _schedule_view,
@@ -31,6 +48,24 @@ from backend.services.preparation_operations_service import (
 )
 
 
+_TASK_CACHE_SIZE = 256
+_TASK_CACHE: "OrderedDict[str, Dict[str, ScheduledPreparationTask]]" = OrderedDict()
+_TASK_CACHE_LOCK = threading.Lock()
+
+_TERMINAL_STATES = {
+    PreparationTaskExecutionState.COMPLETED.value,
+    PreparationTaskExecutionState.SKIPPED.value,
+}
+_PROJECTED_FIELDS = (
+    "state",
+    "started_actual_minute",
+    "completed_actual_minute",
+    "skipped_actual_minute",
+    "latest_event_id",
+    "terminal_reason",
+)
+
+
 def _canonical_hash(value: object) -> str:
     return hashlib.sha256(
         json.dumps(
@@ -92,7 +127,7 @@ def _event_view(
     )
 
 
-def _scheduled_tasks(
+def _parse_scheduled_tasks(
     schedule: DBPersistedPreparationSchedule,
 ) -> Dict[str, ScheduledPreparationTask]:
     try:
@@ -113,7 +148,13 @@ def _scheduled_tasks(
                 "message": "Execution requires a complete persisted schedule",
             },
         )
-    tasks = {value.task_id: value for value in response.scheduled}
+    tasks = {
+        value.task_id: value
+        for value in sorted(
+            response.scheduled,
+            key=lambda task: (task.start_minute, task.finish_minute, task.task_id),
+        )
+    }
     if not tasks:
         raise HTTPException(
             status_code=409,
@@ -133,6 +174,31 @@ def _scheduled_tasks(
     return tasks
 
 
+def _scheduled_tasks(
+    schedule: DBPersistedPreparationSchedule,
+) -> Dict[str, ScheduledPreparationTask]:
+    """Return the schedule's tasks in display order, parsed once per hash.
+
+    ``schedule_hash`` commits to the persisted response, so two rows with the
+    same hash share one parsed task map. Only successful parses are cached;
+    an invalid payload raises on every call.
+    """
+
+    key = schedule.schedule_hash
+    with _TASK_CACHE_LOCK:
+        cached = _TASK_CACHE.get(key)
+        if cached is not None:
+            _TASK_CACHE.move_to_end(key)
+            return cached
+    tasks = _parse_scheduled_tasks(schedule)
+    with _TASK_CACHE_LOCK:
+        _TASK_CACHE[key] = tasks
+        _TASK_CACHE.move_to_end(key)
+        while len(_TASK_CACHE) > _TASK_CACHE_SIZE:
+            _TASK_CACHE.popitem(last=False)
+    return tasks
+
+
 def _events(
     db: Session,
     *,
@@ -149,15 +215,55 @@ def _events(
     )
 
 
-def _states(
+def _latest_event_id(db: Session, *, schedule_id: int) -> Optional[int]:
+    return (
+        db.query(DBPreparationTaskExecutionEvent.id)
+        .filter(DBPreparationTaskExecutionEvent.schedule_id == schedule_id)
+        .order_by(
+            DBPreparationTaskExecutionEvent.created_at.desc(),
+            DBPreparationTaskExecutionEvent.id.desc(),
+        )
+        .limit(1)
+        .scalar()
+    )
+
+
+def _apply_event(
+    progress: DBPreparationTaskExecutionTaskState,
+    event: DBPreparationTaskExecutionEvent,
+) -> None:
+    progress.state = event.to_state
+    progress.latest_event_id = event.id
+    if event.event_type == PreparationTaskExecutionEventType.STARTED.value:
+        if progress.started_actual_minute is None:
+            progress.started_actual_minute = event.actual_minute
+    elif event.event_type == PreparationTaskExecutionEventType.COMPLETED.value:
+        if progress.completed_actual_minute is None:
+            progress.completed_actual_minute = event.actual_minute
+        progress.terminal_reason = event.reason
+    elif event.event_type == PreparationTaskExecutionEventType.SKIPPED.value:
+        if progress.skipped_actual_minute is None:
+            progress.skipped_actual_minute = event.actual_minute
+        progress.terminal_reason = event.reason
+
+
+def _replay(
+    *,
+    schedule_id: int,
     tasks: Dict[str, ScheduledPreparationTask],
     events: List[DBPreparationTaskExecutionEvent],
-) -> Dict[str, PreparationTaskExecutionState]:
-    state = {
-        task_id: PreparationTaskExecutionState.PLANNED for task_id in tasks
+) -> Dict[str, DBPreparationTaskExecutionTaskState]:
+    progress = {
+        task_id: DBPreparationTaskExecutionTaskState(
+            schedule_id=schedule_id,
+            task_id=task_id,
+            state=PreparationTaskExecutionState.PLANNED.value,
+        )
+        for task_id in tasks
     }
     for event in events:
-        if event.task_id not in tasks:
+        current = progress.get(event.task_id)
+        if current is None:
             raise HTTPException(
                 status_code=409,
                 detail={
@@ -169,8 +275,7 @@ def _states(
                     "task_id": event.task_id,
                 },
             )
-        observed = PreparationTaskExecutionState(event.from_state)
-        if state[event.task_id] != observed:
+        if current.state != PreparationTaskExecutionState(event.from_state).value:
             raise HTTPException(
                 status_code=409,
                 detail={
@@ -179,68 +284,117 @@ def _states(
                     "task_id": event.task_id,
                 },
             )
-        state[event.task_id] = PreparationTaskExecutionState(event.to_state)
-    return state
+        _apply_event(current, event)
+    return progress
 
 
-def _task_events(
-    events: List[DBPreparationTaskExecutionEvent],
-    task_id: str,
-) -> List[DBPreparationTaskExecutionEvent]:
-    return [value for value in events if value.task_id == task_id]
+def _projected_progress(
+    db: Session,
+    *,
+    schedule: DBPersistedPreparationSchedule,
+    tasks: Dict[str, ScheduledPreparationTask],
+    last_event_id: Optional[int],
+) -> Optional[Dict[str, DBPreparationTaskExecutionTaskState]]:
+    """Return the stored projection if it reflects ``last_event_id``."""
+
+    header = db.get(DBPreparationTaskExecutionProjection, schedule.id)
+    if (
+        header is None
+        or header.schedule_hash != schedule.schedule_hash
+        or header.last_event_id != last_event_id
+    ):
+        return None
+    rows = {
+        row.task_id: row
+        for row in db.query(DBPreparationTaskExecutionTaskState).filter(
+            DBPreparationTaskExecutionTaskState.schedule_id == schedule.id
+        )
+    }
+    if rows.keys() != tasks.keys():
+        return None
+    return rows
+
+
+def _task_progress(
+    db: Session,
+    *,
+    schedule: DBPersistedPreparationSchedule,
+    tasks: Dict[str, ScheduledPreparationTask],
+) -> Dict[str, DBPreparationTaskExecutionTaskState]:
+    """Read each task's state, replaying in memory when the projection is stale."""
+
+    progress = _projected_progress(
+        db,
+        schedule=schedule,
+        tasks=tasks,
+        last_event_id=_latest_event_id(db, schedule_id=schedule.id),
+    )
+    if progress is None:
+        progress = _replay(
+            schedule_id=schedule.id,
+            tasks=tasks,
+            events=_events(db, schedule_id=schedule.id),
+        )
+    return progress
+
+
+def _refresh_projection(
+    db: Session,
+    *,
+    schedule: DBPersistedPreparationSchedule,
+    tasks: Dict[str, ScheduledPreparationTask],
+) -> Tuple[
+    DBPreparationTaskExecutionProjection,
+    Dict[str, DBPreparationTaskExecutionTaskState],
+]:
+    """Load the stored projection for a write, rebuilding it when stale.
+
+    Callers hold the household lock and the schedule row lock, so the rebuild
+    cannot race another writer on the same ledger.
+    """
+
+    progress = _projected_progress(
+        db,
+        schedule=schedule,
+        tasks=tasks,
+        last_event_id=_latest_event_id(db, schedule_id=schedule.id),
+    )
+    if progress is not None:
+        return db.get(DBPreparationTaskExecutionProjection, schedule.id), progress
+
+    events = _events(db, schedule_id=schedule.id)
+    progress = _replay(schedule_id=schedule.id, tasks=tasks, events=events)
+    db.query(DBPreparationTaskExecutionTaskState).filter(
+        DBPreparationTaskExecutionTaskState.schedule_id == schedule.id
+    ).delete(synchronize_session="fetch")
+    header = db.get(DBPreparationTaskExecutionProjection, schedule.id)
+    if header is None:
+        header = DBPreparationTaskExecutionProjection(schedule_id=schedule.id)
+        db.add(header)
+    header.schedule_hash = schedule.schedule_hash
+    header.event_count = len(events)
+    header.last_event_id = events[-1].id if events else None
+    db.flush()
+    db.add_all(progress.values())
+    # Flush now so a request rejected after this point leaves a consistent
+    # projection in the transaction rather than pending duplicate rows.
+    db.flush()
+    return header, progress
 
 
 def _task_view(
     *,
     task: ScheduledPreparationTask,
-    state: PreparationTaskExecutionState,
-    events: List[DBPreparationTaskExecutionEvent],
+    progress: DBPreparationTaskExecutionTaskState,
 ) -> PreparationTaskExecutionTaskView:
-    task_events = _task_events(events, task.task_id)
-    started = next(
-        (
-            value.actual_minute
-            for value in task_events
-            if value.event_type == PreparationTaskExecutionEventType.STARTED.value
-        ),
-        None,
-    )
-    completed = next(
-        (
-            value.actual_minute
-            for value in task_events
-            if value.event_type == PreparationTaskExecutionEventType.COMPLETED.value
-        ),
-        None,
-    )
-    skipped = next(
-        (
-            value.actual_minute
-            for value in task_events
-            if value.event_type == PreparationTaskExecutionEventType.SKIPPED.value
-        ),
-        None,
-    )
-    terminal = next(
-        (
-            value
-            for value in reversed(task_events)
-            if value.event_type
-            in {
-                PreparationTaskExecutionEventType.COMPLETED.value,
-                PreparationTaskExecutionEventType.SKIPPED.value,
-            }
-        ),
-        None,
-    )
     return PreparationTaskExecutionTaskView(
         task=task,
-        state=state,
-        latest_event_id=task_events[-1].id if task_events else None,
-        started_actual_minute=started,
-        completed_actual_minute=completed,
-        skipped_actual_minute=skipped,
-        terminal_reason=terminal.reason if terminal else None,
+        state=PreparationTaskExecutionState(progress.state),
+        latest_event_id=progress.latest_event_id,
+        started_actual_minute=progress.started_actual_minute,
+        completed_actual_minute=progress.completed_actual_minute,
+        skipped_actual_minute=progress.skipped_actual_minute,
+        terminal_reason=progress.terminal_reason,
     )
 
 
@@ -248,28 +402,14 @@ def _overview_from_rows(
     *,
     schedule: DBPersistedPreparationSchedule,
     tasks: Dict[str, ScheduledPreparationTask],
+    progress: Dict[str, DBPreparationTaskExecutionTaskState],
     events: List[DBPreparationTaskExecutionEvent],
 ) -> PreparationTaskExecutionOverview:
-    states = _states(tasks, events)
     task_views = [
-        _task_view(
-            task=tasks[task_id],
-            state=states[task_id],
-            events=events,
-        )
-        for task_id in sorted(
-            tasks,
-            key=lambda value: (
-                tasks[value].start_minute,
-                tasks[value].finish_minute,
-                value,
-            ),
-        )
+        _task_view(task=task, progress=progress[task_id])
+        for task_id, task in tasks.items()
     ]
-    counts = {
-        value: sum(1 for state in states.values() if state == value)
-        for value in PreparationTaskExecutionState
-    }
+    counts = Counter(value.state for value in task_views)
     terminal = (
         counts[PreparationTaskExecutionState.COMPLETED]
         + counts[PreparationTaskExecutionState.SKIPPED]
@@ -305,7 +445,20 @@ def get_task_execution_overview(
         raise HTTPException(status_code=404, detail="Resource not found")
     tasks = _scheduled_tasks(schedule)
     events = _events(db, schedule_id=schedule.id)
-    return _overview_from_rows(schedule=schedule, tasks=tasks, events=events)
+    progress = _projected_progress(
+        db,
+        schedule=schedule,
+        tasks=tasks,
+        last_event_id=events[-1].id if events else None,
+    )
+    if progress is None:
+        progress = _replay(schedule_id=schedule.id, tasks=tasks, events=events)
+    return _overview_from_rows(
+        schedule=schedule,
+        tasks=tasks,
+        progress=progress,
+        events=events,
+    )
 
 
 def assert_schedule_tasks_terminal(
@@ -314,16 +467,11 @@ def assert_schedule_tasks_terminal(
     schedule: DBPersistedPreparationSchedule,
 ) -> None:
     tasks = _scheduled_tasks(schedule)
-    events = _events(db, schedule_id=schedule.id)
-    states = _states(tasks, events)
+    progress = _task_progress(db, schedule=schedule, tasks=tasks)
     remaining = sorted(
         task_id
-        for task_id, state in states.items()
-        if state
-        not in {
-            PreparationTaskExecutionState.COMPLETED,
-            PreparationTaskExecutionState.SKIPPED,
-        }
+        for task_id, value in progress.items()
+        if value.state not in _TERMINAL_STATES
     )
     if remaining:
         raise HTTPException(
@@ -391,18 +539,13 @@ def record_task_execution_event(
         if schedule is None or schedule.household_id != household_id:
             raise HTTPException(status_code=404, detail="Resource not found")
         tasks = _scheduled_tasks(schedule)
-        events = _events(db, schedule_id=schedule.id)
-        states = _states(tasks, events)
         task = tasks.get(normalized_task_id)
         if task is None:
             raise HTTPException(status_code=404, detail="Resource not found")
+        progress = _task_progress(db, schedule=schedule, tasks=tasks)
         return PreparationTaskExecutionMutationView(
             schedule=_schedule_view(schedule),
-            task=_task_view(
-                task=task,
-                state=states[normalized_task_id],
-                events=events,
-            ),
+            task=_task_view(task=task, progress=progress[normalized_task_id]),
             event=_event_view(existing),
         )
 
@@ -450,9 +593,9 @@ def record_task_execution_event(
             },
         )
 
-    events = _events(db, schedule_id=schedule.id)
-    states = _states(tasks, events)
-    current = states[normalized_task_id]
+    projection, progress = _refresh_projection(db, schedule=schedule, tasks=tasks)
+    task_progress = progress[normalized_task_id]
+    current = PreparationTaskExecutionState(task_progress.state)
     allowed = {
         PreparationTaskExecutionEventType.STARTED: {
             PreparationTaskExecutionState.PLANNED,
@@ -481,11 +624,8 @@ def record_task_execution_event(
         blocked = sorted(
             dependency
             for dependency in task.dependencies
-            if states[dependency]
-            not in {
-                PreparationTaskExecutionState.COMPLETED,
-                PreparationTaskExecutionState.SKIPPED,
-            }
+            if dependency not in progress
+            or progress[dependency].state not in _TERMINAL_STATES
         )
         if blocked:
             raise HTTPException(
@@ -501,16 +641,8 @@ def record_task_execution_event(
                 },
             )
     if event_type == PreparationTaskExecutionEventType.COMPLETED:
-        started_event = next(
-            (
-                value
-                for value in _task_events(events, normalized_task_id)
-                if value.event_type
-                == PreparationTaskExecutionEventType.STARTED.value
-            ),
-            None,
-        )
-        if started_event is None:
+        started_minute = task_progress.started_actual_minute
+        if started_minute is None:
             raise HTTPException(
                 status_code=409,
                 detail={
@@ -519,7 +651,7 @@ def record_task_execution_event(
                     "task_id": normalized_task_id,
                 },
             )
-        if payload.actual_minute < started_event.actual_minute:
+        if payload.actual_minute < started_minute:
             raise HTTPException(
                 status_code=422,
                 detail={
@@ -529,7 +661,7 @@ def record_task_execution_event(
                         "confirmed start minute"
                     ),
                     "task_id": normalized_task_id,
-                    "started_actual_minute": started_event.actual_minute,
+                    "started_actual_minute": started_minute,
                 },
             )
 
@@ -595,6 +727,11 @@ def record_task_execution_event(
     db.add(schedule)
     db.add(event)
     try:
+        db.flush()
+        _apply_event(task_progress, event)
+        projection.event_count += 1
+        projection.last_event_id = event.id
+        record_task_event_coverage(db, schedule=schedule, event=event)
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -607,13 +744,96 @@ def record_task_execution_event(
         ) from exc
     db.refresh(schedule)
     db.refresh(event)
-    all_events = _events(db, schedule_id=schedule.id)
     return PreparationTaskExecutionMutationView(
         schedule=_schedule_view(schedule),
-        task=_task_view(
-            task=task,
-            state=target,
-            events=all_events,
-        ),
+        task=_task_view(task=task, progress=task_progress),
         event=_event_view(event),
     )
+
+
+def verify_task_execution_projection(
+    db: Session,
+    *,
+    household_id: str,
+    schedule_id: int,
+) -> Dict[str, object]:
+    """Compare the stored projection of one schedule with a full ledger replay.
+
+    Read-only. A projection that is merely behind the ledger (for example a
+    schedule whose events predate the projection tables) is reported as
+    ``stale`` rather than as mismatches; the next recorded event rebuilds it.
+    """
+
+    schedule = (
+        db.query(DBPersistedPreparationSchedule)
+        .filter(
+            DBPersistedPreparationSchedule.id == schedule_id,
+            DBPersistedPreparationSchedule.household_id == household_id,
+        )
+        .first()
+    )
+    if schedule is None:
+        raise HTTPException(status_code=404, detail="Resource not found")
+    tasks = _scheduled_tasks(schedule)
+    events = _events(db, schedule_id=schedule.id)
+    expected = _replay(schedule_id=schedule.id, tasks=tasks, events=events)
+    header = db.get(DBPreparationTaskExecutionProjection, schedule.id)
+    report: Dict[str, object] = {
+        "schedule_id": schedule.id,
+        "event_count": len(events),
+        "projected": header is not None,
+        "stale": False,
+        "mismatches": [],
+    }
+    if header is None:
+        report["stale"] = bool(events)
+        return report
+    last_event_id = events[-1].id if events else None
+    if (
+        header.schedule_hash != schedule.schedule_hash
+        or header.last_event_id != last_event_id
+    ):
+        report["stale"] = True
+        return report
+
+    mismatches: List[Dict[str, object]] = []
+    if header.event_count != len(events):
+        mismatches.append(
+            {
+                "task_id": None,
+                "field": "event_count",
+                "expected": len(events),
+                "observed": header.event_count,
+            }
+        )
+    stored = {
+        row.task_id: row
+        for row in db.query(DBPreparationTaskExecutionTaskState).filter(
+            DBPreparationTaskExecutionTaskState.schedule_id == schedule.id
+        )
+    }
+    for task_id in sorted(expected.keys() | stored.keys()):
+        want = expected.get(task_id)
+        have = stored.get(task_id)
+        if want is None or have is None:
+            mismatches.append(
+                {
+                    "task_id": task_id,
+                    "field": "row",
+                    "expected": want is not None,
+                    "observed": have is not None,
+                }
+            )
+            continue
+        for field in _PROJECTED_FIELDS:
+            if getattr(want, field) != getattr(have, field):
+                mismatches.append(
+                    {
+                        "task_id": task_id,
+                        "field": field,
+                        "expected": getattr(want, field),
+                        "observed": getattr(have, field),
+                    }
+                )
+    report["mismatches"] = mismatches
+    return report
@@ -0,0 +1,223 @@
+"""Response caches and rate limiting for upstream data services.
+
+``MemoryResponseCache`` is the bounded per-instance LRU the services always
+had. ``SQLiteResponseCache`` stores the same JSON payloads in one SQLite file,
+so every service instance and worker process pointed at the file shares hits
+and survives restarts. Both apply the TTL on read and evict the least recently
+stored entries once ``max_entries`` is exceeded.
+
+``TokenBucket`` never sleeps: ``try_acquire`` either takes a token or returns
+how long the caller would have to wait for one.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Protocol
+
+from backend.config import APIConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache(Protocol):
+    def get(self, key: str) -> Optional[Any]: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+
+class MemoryResponseCache:
+    """Thread-safe LRU with TTL, local to one process."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            value, stored_at = cached
+            if self._clock() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteResponseCache:
+    """JSON response cache in a SQLite file shared across processes.
+
+    Cache failures such as a locked database degrade to misses; they never fail
+    the upstream request.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS upstream_response_cache ("
+        "cache_key TEXT PRIMARY KEY, "
+        "payload TEXT NOT NULL, "
+        "stored_at REAL NOT NULL)"
+    )
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(self._SCHEMA)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_upstream_response_cache_stored_at "
+                "ON upstream_response_cache (stored_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            row = self._connection().execute(
+                "SELECT payload FROM upstream_response_cache "
+                "WHERE cache_key = ? AND stored_at > ?",
+                (key, self._clock() - self.ttl_seconds),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Upstream response cache read failed: %s", exc)
+            return None
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        now = self._clock()
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO upstream_response_cache "
+                    "(cache_key, payload, stored_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, separators=(",", ":")), now),
+                )
+                connection.execute(
+                    "DELETE FROM upstream_response_cache WHERE stored_at <= ?",
+                    (now - self.ttl_seconds,),
+                )
+                connection.execute(
+                    "DELETE FROM upstream_response_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM upstream_response_cache "
+                    "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            logger.warning("Upstream response cache write failed: %s", exc)
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM upstream_response_cache"
+        ).fetchone()[0]
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate_per_second``."""
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate_per_second <= 0 or capacity < 1:
+            raise ValueError("rate_per_second and capacity must be positive")
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _wait_locked(self) -> float:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate_per_second
+
+    def try_acquire(self) -> float:
+        """Take a token and return 0.0, or return the seconds until one is free."""
+
+        with self._lock:
+            wait = self._wait_locked()
+            if wait == 0.0:
+                self._tokens -= 1.0
+            return wait
+
+    def wait_estimate(self) -> float:
+        with self._lock:
+            return self._wait_locked()
+
+
+def build_response_cache() -> Optional[ResponseCache]:
+    """Return the cache selected by ``APIConfig``, or ``None`` when disabled."""
+
+    if not APIConfig.CACHE_ENABLED:
+        return None
+    if APIConfig.CACHE_BACKEND == "sqlite":
+        if not APIConfig.CACHE_SQLITE_PATH:
+            raise ValueError("CACHE_SQLITE_PATH is required when CACHE_BACKEND=sqlite")
+        return SQLiteResponseCache(
+            APIConfig.CACHE_SQLITE_PATH,
+            ttl_seconds=APIConfig.CACHE_TTL,
+            max_entries=APIConfig.CACHE_MAX_ENTRIES,
+        )
+    if APIConfig.CACHE_BACKEND != "memory":
+        raise ValueError(f"Unsupported CACHE_BACKEND: {APIConfig.CACHE_BACKEND}")
+    return MemoryResponseCache(
+        ttl_seconds=APIConfig.CACHE_TTL,
+        max_entries=APIConfig.CACHE_MAX_ENTRIES,
+    )
+
+
+def build_rate_limiter() -> TokenBucket:
+    return TokenBucket(
+        rate_per_second=APIConfig.MAX_REQUESTS_PER_MINUTE / 60.0,
+        capacity=APIConfig.RATE_LIMIT_BURST,
+    )
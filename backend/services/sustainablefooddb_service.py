@@ -3,19 +3,31 @@ SustainableFoodDB API Service - Environmental impact tracking
 """
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Sequence
 from backend.services.base_service import BaseAPIService
+from backend.services.carbon_footprint_table import (
+    CarbonFootprintTable,
+    RecipeCarbon,
+    canonical_recipe_keys,
+    load_carbon_footprint_table,
+    score_keyed_recipes,
+)
 from backend.config import APIConfig
 
 class SustainableFoodDBService(BaseAPIService):
     """Service for tracking carbon footprint - prioritizing Local JSON data"""
     
-    def __init__(self):
+    def __init__(self, carbon_table: Optional[CarbonFootprintTable] = None):
         super().__init__(
             base_url=APIConfig.SUSTAINABLEFOODDB_BASE_URL,
             api_key=APIConfig.SUSTAINABLEFOODDB_API_KEY
         )
         self.local_db = {} # Unused
+        if carbon_table is None and APIConfig.SUSTAINABILITY_CARBON_TABLE_FILE:
+            carbon_table = load_carbon_footprint_table(
+                APIConfig.SUSTAINABILITY_CARBON_TABLE_FILE
+            )
+        self.carbon_table = carbon_table
 
     
     def search_sustainable_foods(self, query: str) -> List[Dict]:
@@ -43,6 +55,30 @@ class SustainableFoodDBService(BaseAPIService):
         
         return total
     
+    def score_recipes(self, recipes: Sequence[Iterable[str]]) -> List[RecipeCarbon]:
+        """Carbon totals for many recipes, each given as ingredient names.
+
+        Uses the preloaded table when configured; otherwise each distinct
+        canonical ingredient is fetched once through ``fetch_many``. Ingredients
+        without a value are reported per recipe rather than counted as zero.
+        """
+        if self.carbon_table is not None:
+            return self.carbon_table.score_recipes(recipes)
+
+        keyed, distinct = canonical_recipe_keys(recipes)
+        outcomes = self.fetch_many(
+            ("ingredient-cf", {"ingredient": key}) for key in distinct
+        )
+        values: Dict[str, Optional[float]] = {}
+        for key, outcome in zip(distinct, outcomes):
+            value = (
+                outcome.value.get("carbon_footprint")
+                if isinstance(outcome.value, dict)
+                else None
+            )
+            values[key] = float(value) if isinstance(value, (int, float)) else None
+        return score_keyed_recipes(keyed, values)
+
     def get_carbon_by_name(self, food_name: str) -> float:
         """Get carbon footprint by food name"""
         return self.get_ingredient_carbon_footprint(food_name)
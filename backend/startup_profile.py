@@ -0,0 +1,180 @@
+"""Opt-in startup profiling for the API process.
+
+Set ``STARTUP_PROFILE_REPORT`` to a JSON path to record how long each module
+took to import and how long each lifespan phase ran. ``backend/__init__`` calls
+``install_from_env`` before the ORM mappings load, so the report covers every
+import made on the way to ``backend.main``; the lifespan hook calls
+``finish`` once the app is ready to serve. Without the variable nothing is
+installed and ``phase`` is a no-op.
+
+``STARTUP_WARM_IMPORTS`` (comma-separated module names) lists deferred
+dependencies to import during startup instead of on first use, for workers
+that prefer a slower boot over a slower first request.
+
+Only the standard library is imported here.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+PROFILE_ENV = "STARTUP_PROFILE_REPORT"
+WARM_IMPORTS_ENV = "STARTUP_WARM_IMPORTS"
+REPORT_SCHEMA_VERSION = 1
+
+
+@dataclass
+class StartupProfile:
+    report_path: Path
+    started_at: float = field(default_factory=time.perf_counter)
+    modules: List[Dict[str, Any]] = field(default_factory=list)
+    phases: Dict[str, float] = field(default_factory=dict)
+    _stack: List[List[Any]] = field(default_factory=list)
+
+    def _enter_module(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_module(self) -> None:
+        name, started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self.modules.append(
+            {
+                "module": name,
+                "cumulative_seconds": cumulative,
+                "self_seconds": max(0.0, cumulative - children),
+            }
+        )
+
+    def report(self, *, top: int = 50) -> Dict[str, Any]:
+        modules = sorted(self.modules, key=lambda item: item["cumulative_seconds"], reverse=True)
+        return {
+            "schema_version": REPORT_SCHEMA_VERSION,
+            "ready_seconds": round(time.perf_counter() - self.started_at, 6),
+            "module_count": len(self.modules),
+            "modules": [
+                {
+                    "module": item["module"],
+                    "cumulative_seconds": round(item["cumulative_seconds"], 6),
+                    "self_seconds": round(item["self_seconds"], 6),
+                }
+                for item in modules[:top]
+            ],
+            "phases": {name: round(value, 6) for name, value in self.phases.items()},
+            "heavy_modules_loaded": sorted(
+                name for name in ("numpy", "torch", "torchvision") if name in sys.modules
+            ),
+        }
+
+
+class _TimingLoader:
+    """Delegating loader that times ``exec_module`` for one module."""
+
+    def __init__(self, loader: Any, profile: StartupProfile):
+        self._loader = loader
+        self._profile = profile
+
+    def create_module(self, spec: ModuleSpec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._profile._enter_module(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile._exit_module()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(MetaPathFinder):
+    def __init__(self, profile: StartupProfile):
+        self._profile = profile
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimingLoader(spec.loader, self._profile)
+        return spec
+
+
+_ACTIVE: Optional[StartupProfile] = None
+_FINDER: Optional[_TimingFinder] = None
+
+
+def install_from_env() -> Optional[StartupProfile]:
+    """Start profiling when ``STARTUP_PROFILE_REPORT`` is set."""
+
+    global _ACTIVE, _FINDER
+    path = os.getenv(PROFILE_ENV, "").strip()
+    if not path or _ACTIVE is not None:
+        return _ACTIVE
+    _ACTIVE = StartupProfile(report_path=Path(path))
+    _FINDER = _TimingFinder(_ACTIVE)
+    sys.meta_path.insert(0, _FINDER)
+    return _ACTIVE
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the duration of a named startup phase when profiling."""
+
+    if _ACTIVE is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _ACTIVE.phases[name] = _ACTIVE.phases.get(name, 0.0) + time.perf_counter() - started
+
+
+def warm_imports(modules: Sequence[str]) -> Dict[str, float]:
+    """Import deferred dependencies now; return seconds per module."""
+
+    timings = {}
+    for name in modules:
+        started = time.perf_counter()
+        importlib.import_module(name)
+        timings[name] = round(time.perf_counter() - started, 6)
+    return timings
+
+
+def configured_warm_imports() -> List[str]:
+    return [name.strip() for name in os.getenv(WARM_IMPORTS_ENV, "").split(",") if name.strip()]
+
+
+def finish() -> Optional[Dict[str, Any]]:
+    """Stop profiling and write the report; return it, or None when inactive."""
+
+    global _ACTIVE, _FINDER
+    if _ACTIVE is None:
+        return None
+    if _FINDER in sys.meta_path:
+        sys.meta_path.remove(_FINDER)
+    report = _ACTIVE.report()
+    path = _ACTIVE.report_path
+    _ACTIVE, _FINDER = None, None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return report
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from backend.research.advanced_baselines import BM25Retriever, MatrixFactorizationRecommender, LinUCBPolicy, BetaBernoulliThompsonPolicy, BradleyTerryPreference, MahalanobisOOD, SplitConformalRegressor, KaplanMeierExpiry, InstructionDAGParser
 
 
@@ -6,10 +9,29 @@ def test_retrieval_and_recommendation_baselines_are_deterministic():
     data=[("u1","r1",5),("u1","r2",1),("u2","r1",4),("u2","r2",2)]
     one=MatrixFactorizationRecommender(seed=7,epochs=10).fit(data); two=MatrixFactorizationRecommender(seed=7,epochs=10).fit(data)
     assert one.recommend("u1")==two.recommend("u1")
+    als=MatrixFactorizationRecommender(seed=7,epochs=10,solver="als").fit(data); assert als.recommend("u1")==MatrixFactorizationRecommender(seed=7,epochs=10,solver="als").fit(data).recommend("u1")
+    assert MatrixFactorizationRecommender().solver=="sgd" and MatrixFactorizationRecommender(regularization=0).reg==0
+    with pytest.raises(ValueError): MatrixFactorizationRecommender(solver="als",regularization=0)
+
+
+def test_als_recommendations_match_brute_force_ranking():
+    rng=np.random.default_rng(3); users=[f"u{n}" for n in range(30)]; items=[f"r{n:02d}" for n in range(25)]
+    data=[(users[u],items[i],float(rng.integers(1,6))) for u,i in zip(rng.integers(0,30,400),rng.integers(0,25,400))]
+    model=MatrixFactorizationRecommender(factors=4,epochs=8,regularization=0.1,solver="als").fit(data)
+    errors=[model.predict(u,i)-r for u,i,r in data]; baseline=[model.global_mean-r for _,_,r in data]
+    assert np.mean(np.square(errors))<np.mean(np.square(baseline))
+    batch=model.recommend_batch(users+["cold"],k=5,exclude={"u0":items[:20]})
+    for user in users+["cold"]:
+        banned=set(items[:20]) if user=="u0" else set(); expected=sorted(((i,model.predict(user,i)) for i in model.items if i not in banned),key=lambda x:(-x[1],x[0]))[:5]
+        assert [i for i,_ in batch[user]]==[i for i,_ in expected] and np.allclose([v for _,v in batch[user]],[v for _,v in expected])
+    assert batch["cold"]==[(i,model.global_mean) for i in items[:5]]
 
 
 def test_bandit_and_preference_contracts():
     policy=LinUCBPolicy(["a","b"],2,alpha=0); policy.update("a",[1,0],1); assert policy.select([1,0])[0]=="a"
+    assert np.array_equal(policy.A["a"],[[2,0],[0,1]]) and np.array_equal(policy.b["a"],[1,0])
+    with pytest.raises(ValueError,match="read-only"): policy.A["a"][0,0]=5
+    with pytest.raises(ValueError,match="read-only"): policy.b["b"]+=1
     th=BetaBernoulliThompsonPolicy(["a"],seed=1); assert th.select()[0]=="a"; th.update("a",1)
     btl=BradleyTerryPreference(epochs=30).fit([("a","b",1)]*5); assert btl.probability("a","b")>.5
 
@@ -19,3 +41,27 @@ def test_ood_conformal_survival_and_instruction_baselines():
     conformal=SplitConformalRegressor().fit([1,2,3],[1.1,1.9,3.2],alpha=.2); low,high=conformal.interval([2])[0]; assert low<2<high
     km=KaplanMeierExpiry().fit([1,2,3],[True,False,True]); assert 0<=km.survival_probability(3)<=1
     steps=InstructionDAGParser().parse(["Chop onion and heat oil","Add onion and stir"]); assert steps[1].dependencies==(0,) and "stir" in steps[1].actions
+
+
+def test_batched_bradley_terry_matches_sequential_fit():
+    rng=np.random.default_rng(5); items=[f"r{n}" for n in range(6)]; strength=np.linspace(-1,1,6)
+    data=[]
+    for a,b in zip(rng.integers(0,6,150),rng.integers(0,6,150)):
+        if a!=b: data.append((items[a],items[b],float(rng.random()<1/(1+np.exp(strength[b]-strength[a])))))
+    sequential=BradleyTerryPreference(solver="sgd",learning_rate=0.005,epochs=1500).fit(data)
+    for solver in ("mm","newton"):
+        batched=BradleyTerryPreference(solver=solver).fit(data)
+        assert batched.iterations<batched.epochs
+        assert max(abs(batched.score[i]-sequential.score[i]) for i in items)<0.02
+    assert [i for i,_ in BradleyTerryPreference(solver="mm").fit(data).ranking()]==[i for i,_ in sequential.ranking()]
+    assert BradleyTerryPreference().solver=="sgd"
+    for solver in ("sgd","mm","newton"):
+        with pytest.raises(ValueError,match=r"\[0,1\]"): BradleyTerryPreference(solver=solver).fit([("a","b",1.5)])
+
+
+def test_newton_rejects_a_step_that_halving_cannot_improve(monkeypatch):
+    logaddexp=np.logaddexp
+    monkeypatch.setattr(np,"logaddexp",lambda zero,delta: logaddexp(zero,delta)+1e6*np.abs(delta))
+    model=BradleyTerryPreference(solver="newton").fit([("a","b",1),("a","b",1),("b","c",1)])
+    assert model.iterations==0
+    assert model.score=={"a":0.0,"b":0.0,"c":0.0}
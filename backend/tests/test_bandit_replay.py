@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base, DBFeedback, DBUser
+from backend.research.advanced_baselines import LinUCBPolicy
+from backend.research.bandit_replay import LoggedBanditEvent, replay_linucb
+from scripts import replay_linucb_feedback as replay_cli
+
+
+def _uniform_log(count: int, *, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    weights = {"1": np.array([1.0, 0.0, 0.0]), "2": np.array([0.0, 1.0, 0.0])}
+    events = []
+    for event_id in range(1, count + 1):
+        context = rng.normal(size=3)
+        action = ("1", "2")[int(rng.integers(0, 2))]
+        reward = float(context @ weights[action] > 0)
+        events.append(
+            LoggedBanditEvent(event_id, tuple(context.tolist()), action, reward)
+        )
+    return events
+
+
+def test_sherman_morrison_scores_match_explicit_inverse():
+    rng = np.random.default_rng(4)
+    policy = LinUCBPolicy(["a", "b", "c"], 4, alpha=0.5)
+    for _ in range(200):
+        context = rng.normal(size=4)
+        action, _scores = policy.select(context)
+        policy.update(action, context, float(rng.random()))
+    context = rng.normal(size=4)
+    _chosen, scores = policy.select(context, allowed=["c", "a"])
+    assert sorted(scores) == ["a", "c"]
+    for action, score in scores.items():
+        inverse = np.linalg.inv(policy.A[action])
+        expected = (inverse @ policy.b[action]) @ context + 0.5 * np.sqrt(
+            context @ inverse @ context
+        )
+        assert score == pytest.approx(expected, rel=1e-9)
+    chosen, matrix = policy.select_batch([context, -context], allowed=["c", "a"])
+    assert chosen[0] == policy.select(context, allowed=["a", "c"])[0]
+    assert matrix.shape == (2, 2)
+
+
+def test_replay_is_deterministic_and_learns_from_matched_events():
+    events = _uniform_log(4000)
+    first = replay_linucb(events, ["1", "2"], feature_dim=3, alpha=0.2)
+    second = replay_linucb(iter(events), ["2", "1"], feature_dim=3, alpha=0.2)
+    assert first == second
+    assert first.logged_events == 4000
+    assert 0.3 < first.match_rate < 0.7
+    assert first.mean_matched_reward > first.logged_mean_reward + 0.1
+
+    shorter = replay_linucb(
+        events + [LoggedBanditEvent(9999, (1.0,), "1", 1.0)],
+        ["1", "2"],
+        feature_dim=3,
+    )
+    assert shorter.skipped_dimension_mismatch == 1
+    with pytest.raises(ValueError, match="unknown action"):
+        replay_linucb(events, ["1"], feature_dim=3)
+
+
+def test_feedback_stream_pages_meal_selections_by_id():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[DBUser.__table__, DBFeedback.__table__])
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with Session() as db:
+        db.add(DBUser(id="user-1"))
+        payloads = [
+            {"state": [0.5, -1.0], "selected_recipe_id": 3, "reward": 1.0},
+            {"state": [1.0, 0.0], "selected_recipe_id": 7, "reward": 0.0},
+            {"state": "broken", "selected_recipe_id": 3, "reward": 1.0},
+            {"state": [0.0, 1.0], "selected_recipe_id": 3, "reward": 0.5},
+            {"state": [0.0, 1.0, 2.0], "selected_recipe_id": 9, "reward": 0.5},
+        ]
+        for payload in payloads:
+            db.add(
+                DBFeedback(
+                    user_id="user-1", feedback_type="meal_selection", payload=payload
+                )
+            )
+        db.add(DBFeedback(user_id="user-1", feedback_type="taste", payload={}))
+        db.commit()
+
+        events = list(replay_cli.iter_meal_selection_events(db, batch_size=2))
+        assert [event.event_id for event in events] == [1, 2, 4, 5]
+        assert events[0] == LoggedBanditEvent(1, (0.5, -1.0), "3", 1.0)
+        assert replay_cli.scan_action_space(db, batch_size=2) == (["3", "7", "9"], 2)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from backend.config import APIConfig
+from backend.services.base_service import BaseAPIService, UpstreamRateLimited
+from backend.services.response_cache import (
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    TokenBucket,
+)
+from backend.tests.upstream_stub import UpstreamStub
+
+
+ROUTES = {f"food/{index}": {"id": index, "name": f"food {index}"} for index in range(8)}
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _single_attempt(monkeypatch):
+    monkeypatch.setattr(APIConfig, "MAX_RETRIES", 1)
+    monkeypatch.setattr(APIConfig, "CACHE_ENABLED", True)
+    monkeypatch.setattr(APIConfig, "MOCK_MODE", False)
+
+
+def _service(url, *, cache=None, capacity=100) -> BaseAPIService:
+    return BaseAPIService(
+        url,
+        cache=(
+            cache
+            if cache is not None
+            else MemoryResponseCache(ttl_seconds=60, max_entries=32)
+        ),
+        rate_limiter=TokenBucket(rate_per_second=1.0, capacity=capacity),
+    )
+
+
+def test_sqlite_cache_is_shared_between_service_instances(tmp_path):
+    path = tmp_path / "upstream-cache.sqlite3"
+    with UpstreamStub(ROUTES) as stub:
+        first = _service(
+            stub.url, cache=SQLiteResponseCache(path, ttl_seconds=60, max_entries=32)
+        )
+        second = _service(
+            stub.url, cache=SQLiteResponseCache(path, ttl_seconds=60, max_entries=32)
+        )
+
+        assert first._make_request("food/1") == ROUTES["food/1"]
+        assert second._make_request("food/1") == ROUTES["food/1"]
+
+    assert stub.hits["food/1"] == 1
+
+
+def test_sqlite_cache_applies_ttl_and_size_bound(tmp_path):
+    clock = _Clock()
+    cache = SQLiteResponseCache(
+        tmp_path / "cache.sqlite3", ttl_seconds=10, max_entries=2, clock=clock
+    )
+    for key in ("a", "b", "c"):
+        clock.now += 1
+        cache.set(key, {"key": key})
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == {"key": "c"}
+
+    clock.now += 10
+    assert cache.get("c") is None
+
+
+def test_token_bucket_reports_wait_instead_of_sleeping():
+    clock = _Clock()
+    bucket = TokenBucket(rate_per_second=2.0, capacity=2, clock=clock)
+
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.wait_estimate() == 0.0
+    assert bucket.try_acquire() == 0.0
+
+
+def test_rate_limited_request_fails_fast_with_retry_estimate():
+    with UpstreamStub(ROUTES) as stub:
+        service = _service(stub.url, capacity=1)
+        service._make_request("food/1")
+
+        started = time.perf_counter()
+        with pytest.raises(UpstreamRateLimited) as raised:
+            service._make_request("food/2")
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert 0 < raised.value.retry_after_seconds <= 1.0
+    assert stub.hits["food/2"] == 0
+
+
+def test_fetch_many_is_ordered_deduplicated_and_parallel():
+    requested = [f"food/{index}" for index in range(8)] + ["food/3", "missing"]
+    with UpstreamStub(ROUTES, delay_seconds=0.2) as stub:
+        service = _service(stub.url)
+
+        started = time.perf_counter()
+        outcomes = service.fetch_many(requested, max_workers=8)
+        elapsed = time.perf_counter() - started
+
+    assert [outcome.endpoint for outcome in outcomes] == requested
+    assert [outcome.value for outcome in outcomes[:9]] == [
+        ROUTES[endpoint] for endpoint in requested[:9]
+    ]
+    assert outcomes[-1].value is None and outcomes[-1].error is not None
+    assert stub.hits["food/3"] == 1
+    assert elapsed < 0.2 * len(requested) / 2
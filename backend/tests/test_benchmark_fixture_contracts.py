@@ -10,6 +10,7 @@ from backend.domain.benchmark_fixtures import (
     InventoryBenchmarkFixture,
     PlannerBenchmarkFixture,
 )
+from backend.research.planner_benchmarks import generate_problem
 
 
 def planner_fixture() -> dict:
@@ -107,6 +108,18 @@ def test_planner_fixture_rejects_duplicate_ids_nonfinite_and_extra_fields():
         PlannerBenchmarkFixture.model_validate(extra)
 
 
+def test_planner_fixture_accepts_generated_problem_metadata():
+    generated = generate_problem(seed=3, slots=2, options_per_slot=2)
+    problem = PlannerBenchmarkFixture.model_validate(generated).to_problem()
+
+    assert problem["schema_version"] == 1
+    assert problem["generator"]["contains_user_data"] is False
+
+    unsupported = dict(generated, schema_version=2)
+    with pytest.raises(ValidationError):
+        PlannerBenchmarkFixture.model_validate(unsupported)
+
+
 def test_inventory_fixture_rejects_duplicate_lots_bad_policy_and_outside_demand():
     duplicate = inventory_fixture()
     duplicate["initial_lots"].append(dict(duplicate["initial_lots"][0]))
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.config import APIConfig
+from backend.domain.ingredients import parse_ingredient_lines
+from backend.engines.health_engine import HealthEngine
+from backend.engines.plan_generator import PlanGenerator
+from backend.engines.taste_engine import TasteEngine
+from backend.engines.variety_engine import VarietyEngine
+from backend.engines.weekly_optimizer import PlanSelection, WeeklyPlanOptimizer
+from backend.models import Gender, Goal, Recipe, UserProfile
+from backend.services.carbon_footprint_table import (
+    TABLE_VERSION,
+    CarbonFootprintTable,
+    RecipeCarbon,
+)
+from backend.services.response_cache import MemoryResponseCache, TokenBucket
+from backend.services.sustainablefooddb_service import SustainableFoodDBService
+from backend.tests.upstream_stub import UpstreamStub
+
+
+CARBON = {"rice": 2.0, "tofu": 1.5, "garlic": 0.25, "chicken breast": 6.5}
+
+
+def _table() -> CarbonFootprintTable:
+    return CarbonFootprintTable.from_snapshot(
+        {"table_version": TABLE_VERSION, "ingredients": CARBON}
+    )
+
+
+def test_table_accepts_legacy_shape_and_canonicalizes_lookups():
+    legacy = CarbonFootprintTable.from_snapshot(
+        {
+            name: {"carbon_footprint_kg": kg, "water_usage_l": 1.0}
+            for name, kg in CARBON.items()
+        }
+    )
+
+    assert legacy.carbon_kg == _table().carbon_kg
+    assert legacy.lookup("Garlic, minced") == 0.25
+    assert legacy.lookup("saffron") is None
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        {"table_version": "other", "ingredients": CARBON},
+        {"table_version": TABLE_VERSION, "ingredients": {"rice": -1}},
+        {"table_version": TABLE_VERSION, "ingredients": {"Rice": 1.0, "rice": 2.0}},
+    ],
+)
+def test_table_rejects_invalid_snapshots(raw):
+    with pytest.raises(ValueError):
+        CarbonFootprintTable.from_snapshot(raw)
+
+
+def test_services_share_the_parsed_table_until_it_changes(tmp_path, monkeypatch):
+    path = tmp_path / "carbon.json"
+    path.write_text(
+        json.dumps({"table_version": TABLE_VERSION, "ingredients": CARBON}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(APIConfig, "SUSTAINABILITY_CARBON_TABLE_FILE", str(path))
+    opened = []
+    real_open = Path.open
+
+    def counting_open(self, *args, **kwargs):
+        opened.append(self)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+
+    first = SustainableFoodDBService()
+    second = SustainableFoodDBService()
+    assert opened == [path]
+    assert second.carbon_table is first.carbon_table
+
+    path.write_text(
+        json.dumps(
+            {"table_version": TABLE_VERSION, "ingredients": {**CARBON, "rice": 3.0}}
+        ),
+        encoding="utf-8",
+    )
+    os.utime(path, ns=(1, 1))
+    opened.clear()
+    refreshed = SustainableFoodDBService()
+    assert opened == [path]
+    assert refreshed.carbon_table.carbon_kg != first.carbon_table.carbon_kg
+
+
+def test_score_recipes_reports_unknown_ingredients_instead_of_zero():
+    scored = _table().score_recipes([["Rice", "tofu", "garlic"], ["rice", "saffron"], []])
+
+    assert scored == [
+        RecipeCarbon(carbon_footprint_kg=3.75, known_carbon_kg=3.75),
+        RecipeCarbon(
+            carbon_footprint_kg=None,
+            known_carbon_kg=2.0,
+            unknown_ingredients=("saffron",),
+        ),
+        RecipeCarbon(carbon_footprint_kg=0.0, known_carbon_kg=0.0),
+    ]
+
+
+def test_upstream_batch_fetches_each_ingredient_once_and_matches_table(monkeypatch):
+    monkeypatch.setattr(APIConfig, "MAX_RETRIES", 1)
+    monkeypatch.setattr(APIConfig, "MOCK_MODE", False)
+
+    def footprint(query):
+        value = CARBON.get(query.get("ingredient"))
+        return None if value is None else {"carbon_footprint": value}
+
+    recipes = [["rice", "tofu"], ["Rice", "garlic"], ["rice", "saffron"]]
+    with UpstreamStub({"ingredient-cf": footprint}) as stub:
+        service = SustainableFoodDBService()
+        service.base_url = stub.url
+        service._cache = MemoryResponseCache(ttl_seconds=60, max_entries=32)
+        service._rate_limiter = TokenBucket(rate_per_second=1.0, capacity=100)
+
+        scored = service.score_recipes(recipes)
+
+    assert scored == _table().score_recipes(recipes)
+    assert stub.hits["ingredient-cf"] == 4
+
+
+def _recipe(recipe_id: str, ingredients: list[str], calories: int) -> Recipe:
+    return Recipe(
+        id=recipe_id,
+        name=recipe_id.title(),
+        description="",
+        ingredients=ingredients,
+        ingredient_lines=parse_ingredient_lines(ingredients),
+        calories=calories,
+        macros={"protein": 30, "carbs": 70, "fat": 15},
+    )
+
+
+class _CountingCarbonService:
+    def __init__(self, table: CarbonFootprintTable):
+        self.table = table
+        self.batches: list[int] = []
+
+    def score_recipes(self, recipes):
+        recipes = list(recipes)
+        self.batches.append(len(recipes))
+        return self.table.score_recipes(recipes)
+
+
+def test_plan_scores_carbon_once_per_plan(monkeypatch):
+    monkeypatch.setenv("ENABLE_SUSTAINABILITY_ESTIMATES", "true")
+    planner = PlanGenerator.__new__(PlanGenerator)
+    planner.health_engine = HealthEngine()
+    planner.taste_engine = TasteEngine()
+    planner.sustainability_service = _CountingCarbonService(_table())
+    planner.optimizer = WeeklyPlanOptimizer(beam_width=8, max_options_per_slot=6)
+    planner.recipes = [
+        _recipe("tofu rice", ["200 g rice", "150 g tofu", "1 clove garlic"], 700),
+        _recipe("chicken rice", ["200 g rice", "150 g chicken breast"], 750),
+        _recipe("saffron rice", ["200 g rice", "1 pinch saffron"], 650),
+    ]
+    user = UserProfile(
+        age=30,
+        weight_kg=75,
+        height_cm=180,
+        gender=Gender.MALE,
+        activity_level=1.55,
+        goal=Goal.MAINTENANCE,
+    )
+
+    plan = planner.create_plan(user, days=3)
+
+    assert planner.sustainability_service.batches == [
+        len({recipe.id for day in plan.days for recipe in day.meals.values()})
+    ]
+
+    tofu, chicken, saffron = planner.recipes
+    carbon = planner._estimate_recipe_carbon(
+        [
+            PlanSelection(day=1, slot="Lunch", recipe=tofu, portion=1.0),
+            PlanSelection(day=1, slot="Dinner", recipe=chicken, portion=1.0),
+            PlanSelection(day=2, slot="Dinner", recipe=saffron, portion=1.0),
+        ]
+    )
+
+    def day_stats(*recipes):
+        return planner._build_daily_plan(
+            day=1,
+            selections=[
+                PlanSelection(day=1, slot=slot, recipe=recipe, portion=1.0)
+                for slot, recipe in zip(("Lunch", "Dinner"), recipes)
+            ],
+            target=planner.health_engine.calculate_targets(user),
+            genome=planner.taste_engine.generate_flavor_genome(user),
+            variety_engine=VarietyEngine(no_repeat_window=7),
+            carbon_by_recipe=carbon,
+        ).total_stats
+
+    known = day_stats(tofu, chicken)
+    assert known["carbon_data_status"] == "unverified_estimate"
+    assert known["carbon_footprint_kg"] == 3.75 + 8.5
+    assert known["carbon_unknown_ingredients"] == []
+
+    unknown = day_stats(tofu, saffron)
+    assert unknown["carbon_data_status"] == "unavailable"
+    assert unknown["carbon_footprint_kg"] is None
+    assert unknown["carbon_unknown_ingredients"] == ["saffron"]
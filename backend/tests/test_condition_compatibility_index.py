@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.config import APIConfig
+from backend.engines.health_engine import HealthEngine
+from backend.models import NutrientTarget
+from backend.services.base_service import ExternalServiceError
+from backend.services.condition_compatibility_index import (
+    ConditionCompatibilityIndex,
+    ConditionIndexMiss,
+    export_condition_compatibility_snapshot,
+    load_condition_compatibility_index,
+)
+from backend.services.dietrxdb_service import DietRxDBService
+
+
+DISEASES = {
+    "Hypertension": {
+        "beneficial_foods": ["Kale", "garlic"],
+        "harmful_foods": ["Salt", "soy sauce"],
+    },
+    "Diabetes Type 2": {
+        "beneficial_foods": ["garlic", "tofu"],
+        "harmful_foods": ["honey"],
+    },
+}
+INTERACTIONS = {
+    "kale": [{"drug": "Warfarin", "severity": "Moderate"}],
+    "grapefruit": [{"drug": "Statins"}, {}],
+}
+RECIPES = {
+    "stir-fry": ["tofu", "soy sauce", "garlic"],
+    "salad": ["kale", "garlic", "Salt"],
+    "toast": ["honey", "bread"],
+    "unknown": [],
+}
+FOODS = ["tofu", "soy sauce", "garlic", "kale", "Salt", "honey", "bread", "grapefruit"]
+
+
+class _OfflineDietRx(DietRxDBService):
+    def __init__(self):
+        super().__init__()
+        self.requests: list[str] = []
+
+    def _make_request(self, endpoint, method="GET", params=None, data=None):
+        self.requests.append(endpoint)
+        kind, _, name = endpoint.partition("/")
+        if kind == "disease":
+            if name not in DISEASES:
+                raise ExternalServiceError(f"External service request failed for {endpoint}")
+            return DISEASES[name]
+        if kind == "food-interactions":
+            return INTERACTIONS.get(name, [])
+        raise AssertionError(f"unexpected endpoint {endpoint}")
+
+
+class _OfflineRecipes:
+    def get_nutrition_info(self, recipe_id):
+        return {"calories": 500, "protein": 30, "carbs": 60, "fat": 15}
+
+    def get_micronutrition_info(self, recipe_id):
+        return {"Iron": 4, "Calcium": 250}
+
+    def get_recipe_info(self, recipe_id):
+        return {"ingredients": RECIPES[recipe_id]}
+
+
+def _index() -> ConditionCompatibilityIndex:
+    return ConditionCompatibilityIndex.from_snapshot(
+        {
+            "diseases": DISEASES,
+            "interactions": {food: INTERACTIONS.get(food, []) for food in FOODS},
+        }
+    )
+
+
+def _engine(index=None) -> HealthEngine:
+    engine = HealthEngine(compatibility_index=index)
+    engine.recipe_service = _OfflineRecipes()
+    engine.diet_rx_service = _OfflineDietRx()
+    return engine
+
+
+TARGET = NutrientTarget(
+    calories=2000,
+    protein_g=120,
+    carbs_g=220,
+    fat_g=70,
+    micro_nutrients={"Iron": 8.0, "Calcium": 1000.0},
+)
+CONDITIONS = ["Hypertension", "Diabetes Type 2"]
+
+
+@pytest.mark.parametrize("food", FOODS)
+def test_index_matches_live_service_compatibility(food):
+    assert _index().check_condition_compatibility(
+        food, CONDITIONS
+    ) == _OfflineDietRx().check_condition_compatibility(food, CONDITIONS)
+
+
+def test_unknown_condition_is_a_miss_not_a_pass():
+    with pytest.raises(ConditionIndexMiss):
+        _index().check_condition_compatibility("kale", ["Gout"])
+
+
+@pytest.mark.parametrize("food", ["saffron", "KALE"])
+def test_unexported_food_is_a_miss_not_an_interaction_free_pass(food):
+    with pytest.raises(ConditionIndexMiss, match="interaction record"):
+        _index().check_condition_compatibility(food, CONDITIONS)
+
+
+def test_exported_snapshot_round_trips_through_the_loader(tmp_path):
+    snapshot = export_condition_compatibility_snapshot(
+        _OfflineDietRx(), conditions=CONDITIONS, foods=FOODS
+    )
+    path = tmp_path / "dietrx-index.json"
+    path.write_text(json.dumps(snapshot), encoding="utf-8")
+
+    loaded = load_condition_compatibility_index(path)
+
+    assert loaded.source == str(path)
+    for food in FOODS:
+        assert loaded.check_condition_compatibility(
+            food, CONDITIONS
+        ) == _index().check_condition_compatibility(food, CONDITIONS)
+
+
+def test_engines_share_the_parsed_snapshot_until_it_changes(tmp_path, monkeypatch):
+    snapshot = export_condition_compatibility_snapshot(
+        _OfflineDietRx(), conditions=CONDITIONS, foods=FOODS
+    )
+    path = tmp_path / "dietrx-index.json"
+    path.write_text(json.dumps(snapshot), encoding="utf-8")
+    monkeypatch.setattr(APIConfig, "DIETRX_COMPATIBILITY_INDEX_FILE", str(path))
+    opened = []
+    real_open = Path.open
+
+    def counting_open(self, *args, **kwargs):
+        opened.append(self)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+
+    first = HealthEngine()
+    second = HealthEngine()
+    assert opened == [path]
+    assert second.compatibility_index is first.compatibility_index
+
+    snapshot["interactions"]["tofu"] = [{"drug": "MAOI"}]
+    path.write_text(json.dumps(snapshot), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    opened.clear()
+    refreshed = HealthEngine()
+    assert opened == [path]
+    assert refreshed.compatibility_index.check_condition_compatibility(
+        "tofu", CONDITIONS
+    )["warnings"] == ["Drug interaction: MAOI"]
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_batch_scoring_matches_per_recipe_scoring(use_index):
+    recipes = list(RECIPES)
+    engine = _engine(_index() if use_index else None)
+    single = [
+        engine.score_recipe_comprehensive(recipe, TARGET, CONDITIONS)
+        for recipe in recipes
+    ]
+    single_requests = len(engine.diet_rx_service.requests)
+
+    batch_engine = _engine(_index() if use_index else None)
+    batch = batch_engine.score_recipes_batch(recipes, TARGET, CONDITIONS)
+
+    assert batch == single
+    assert [result["safety_status"] for result in batch] == [
+        "unsafe",
+        "unsafe",
+        "unsafe",
+        "unknown",
+    ]
+    if use_index:
+        assert batch_engine.diet_rx_service.requests == []
+    else:
+        assert len(batch_engine.diet_rx_service.requests) < single_requests
+
+
+def test_batch_scoring_reports_index_misses_as_verification_errors():
+    result = _engine(_index()).score_recipes_batch(["salad"], TARGET, ["Gout"])[0]
+
+    assert result["safety_status"] == "unknown"
+    assert result["condition_score"] == 0.5
+    assert len(result["verification_errors"]) == 3
+
+
+def test_batch_scoring_reports_unexported_ingredients_as_verification_errors():
+    snapshot = {
+        "diseases": DISEASES,
+        "interactions": {"kale": INTERACTIONS["kale"], "garlic": []},
+    }
+    engine = _engine(ConditionCompatibilityIndex.from_snapshot(snapshot))
+
+    result = engine.score_recipes_batch(["stir-fry"], TARGET, CONDITIONS)[0]
+
+    assert result["safety_status"] == "unknown"
+    assert result["verification_errors"] == [
+        "Could not verify tofu: Food 'tofu' has no interaction record "
+        "in the compatibility snapshot",
+        "Could not verify soy sauce: Food 'soy sauce' has no interaction record "
+        "in the compatibility snapshot",
+    ]
+    assert engine.diet_rx_service.requests == []
@@ -13,9 +13,14 @@ from backend.database import (
     DBRecipe,
     DBUser,
 )
-from backend.domain.conversions import ConversionRequest, IngredientConversionCreate
+from backend.domain.conversions import (
+    ConversionBatchRequest,
+    ConversionRequest,
+    IngredientConversionCreate,
+)
 from backend.domain.inventory import HouseholdCreate, LeftoverCreate
 from backend.services.conversion_service import (
+    convert_quantities,
     convert_quantity,
     import_fdc_portions,
     list_storage_policies,
@@ -180,6 +185,92 @@ def test_fdc_conversion_is_food_specific_and_preserves_missing_evidence():
         )
 
 
+def _oats_conversion(**update) -> IngredientConversionCreate:
+    return IngredientConversionCreate(
+        canonical_name="rolled oats",
+        from_unit="cup",
+        to_unit="g",
+        multiplier_min=80,
+        multiplier_max=80,
+        source_name="Reviewed Portion Study",
+        source_url="https://example.test/portion-study",
+        source_version="v1",
+        evidence_status="reviewed_external",
+        reviewed_at=datetime(2026, 7, 1, tzinfo=timezone.utc),
+        notes="Exact study fixture",
+    ).model_copy(update=update)
+
+
+def test_batch_conversion_matches_single_lookups_and_reports_missing_lines():
+    db = _db()
+    import_fdc_portions(
+        db,
+        canonical_name="rolled oats",
+        fdc_id=123,
+        portions=[{"amount": 1, "gramWeight": 90, "measureUnit": {"name": "cup"}}],
+        source_version="2026-04",
+    )
+    register_conversion(db, _oats_conversion())
+    register_conversion(
+        db,
+        _oats_conversion(
+            multiplier_min=85,
+            multiplier_max=85,
+            source_version="v0",
+            reviewed_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+    )
+    lines = [
+        ConversionRequest(
+            canonical_name=" Rolled Oats ",
+            quantity_min=1,
+            quantity_max=2,
+            from_unit="CUP",
+            to_unit="g",
+        ),
+        ConversionRequest(
+            canonical_name="rice",
+            quantity_min=1,
+            quantity_max=1,
+            from_unit="cup",
+            to_unit="g",
+        ),
+    ]
+
+    batch = convert_quantities(db, ConversionBatchRequest(items=lines))
+
+    assert batch.converted_count == 1
+    assert batch.error_count == 1
+    assert batch.items[0].result == convert_quantity(db, lines[0])
+    assert batch.items[0].result.evidence.source_version == "v1"
+    assert batch.items[0].result.output_quantity_max == 160
+    with pytest.raises(HTTPException) as missing:
+        convert_quantity(db, lines[1])
+    assert batch.items[1].index == 1
+    assert batch.items[1].result is None
+    assert batch.items[1].error == missing.value.detail
+
+
+def test_batch_conversion_table_is_rebuilt_after_new_evidence():
+    db = _db()
+    line = ConversionRequest(
+        canonical_name="rolled oats",
+        quantity_min=1,
+        quantity_max=1,
+        from_unit="cup",
+        to_unit="g",
+    )
+    before = convert_quantities(db, ConversionBatchRequest(items=[line]))
+    assert before.error_count == 1
+
+    register_conversion(db, _oats_conversion())
+    after = convert_quantities(db, ConversionBatchRequest(items=[line]))
+
+    assert after.table_version > before.table_version
+    assert after.error_count == 0
+    assert after.items[0].result.output_quantity_min == 80
+
+
 def test_only_reviewed_storage_policies_are_seeded_with_sources():
     db = _db()
     assert seed_official_storage_policies(db) >= 1
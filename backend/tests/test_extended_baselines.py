@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import random
 
 import pytest
 
 from backend.research.forecasting_baselines import (
+    SMOOTHING_GRID,
     HoltLinearForecaster,
     SeasonalNaiveForecaster,
     SimpleExponentialSmoothingForecaster,
@@ -39,6 +41,96 @@ def test_exponential_smoothing_is_deterministic_and_validates_alpha():
         SimpleExponentialSmoothingForecaster(alpha=0)
 
 
+def _scalar_smoothing(values, alpha):
+    level = float(values[0])
+    squared_error = 0.0
+    for value in values[1:]:
+        squared_error += (float(value) - level) ** 2
+        level = alpha * float(value) + (1 - alpha) * level
+    return level, squared_error
+
+
+def _scalar_holt(values, alpha, beta, damping):
+    level = float(values[0])
+    trend = float(values[1]) - float(values[0])
+    squared_error = 0.0
+    for value in values[1:]:
+        previous_level = level
+        squared_error += (value - (level + damping * trend)) ** 2
+        level = alpha * value + (1 - alpha) * (level + damping * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * damping * trend
+    return level, trend, squared_error
+
+
+def test_vectorized_smoothing_grid_matches_scalar_selection():
+    series = [3.0, 0.0, 4.5, 2.25, 7.0, 1.0, 0.0, 5.5, 6.0, 2.0]
+    model = SimpleExponentialSmoothingForecaster().fit(series)
+    level, _error, alpha = min(
+        (
+            (*_scalar_smoothing(series, candidate), candidate)
+            for candidate in SMOOTHING_GRID
+        ),
+        key=lambda item: (item[1], item[2]),
+    )
+    assert model.fitted_alpha_ == alpha
+    assert model.predict(2) == [level, level]
+
+    level, trend, _error, alpha, beta = min(
+        (
+            (*_scalar_holt(series, first, second, 0.9), first, second)
+            for first in SMOOTHING_GRID
+            for second in SMOOTHING_GRID
+        ),
+        key=lambda item: (item[2], item[3], item[4]),
+    )
+    holt = HoltLinearForecaster(alpha=None, beta=None, damping=0.9).fit(series)
+    assert (holt.fitted_alpha_, holt.fitted_beta_) == (alpha, beta)
+    assert (holt.level_, holt.trend_) == (level, trend)
+
+    fixed = HoltLinearForecaster(alpha=0.5, beta=0.5, damping=0.9).fit(series)
+    assert (fixed.level_, fixed.trend_) == _scalar_holt(series, 0.5, 0.5, 0.9)[:2]
+
+
+class _PerOriginFit:
+    """Hide ``fit_prefixes`` so the backtest refits a fresh model per origin."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def fit(self, values):
+        self.model.fit(values)
+        return self
+
+    def predict(self, horizon):
+        return self.model.predict(horizon)
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        SimpleExponentialSmoothingForecaster,
+        lambda: SimpleExponentialSmoothingForecaster(alpha=0.4),
+        HoltLinearForecaster,
+        lambda: HoltLinearForecaster(beta=None, damping=0.9),
+        lambda: HoltLinearForecaster(alpha=None, beta=None),
+    ],
+)
+def test_prefix_fits_match_refitting_every_origin(factory):
+    generator = random.Random(5)
+    series = [round(generator.uniform(0, 10), 3) for _ in range(60)]
+
+    lengths = [1, 2, 3, 17, 40, 60]
+    for length, model in zip(lengths, factory().fit_prefixes(series, lengths)):
+        expected = factory().fit(series[:length])
+        assert vars(model) == vars(expected)
+
+    backtest = rolling_origin_backtest(factory, series, minimum_train_size=7, horizon=3)
+    refitted = rolling_origin_backtest(
+        lambda: _PerOriginFit(factory()), series, minimum_train_size=7, horizon=3
+    )
+    assert backtest == refitted
+
+
 def test_holt_and_tsb_preserve_nonnegative_demand_contracts():
     holt = HoltLinearForecaster(
         alpha=0.5,
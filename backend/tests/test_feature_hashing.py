@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from backend.ml.feature_hashing import FeatureHasher, stable_feature_index
+
+
+def test_indices_do_not_depend_on_the_process_hash_seed():
+    script = (
+        "from backend.ml.feature_hashing import stable_feature_index;"
+        "print([stable_feature_index(n, 512) for n in ('vanillin', 'limonene')])"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    expected = [stable_feature_index("vanillin", 512), stable_feature_index("limonene", 512)]
+    assert outputs == {f"{expected}\n"}
+
+
+def test_transform_builds_canonical_csr_and_sums_collisions():
+    hasher = FeatureHasher(8)
+    batch = hasher.transform([{"a": 1.0, "b": 2.0, "c": 3.0}, {}, {"x": 0.5}])
+    assert batch.shape == (3, 8)
+    assert batch.indptr.tolist()[0] == 0 and batch.indptr[-1] == len(batch.indices)
+    dense = np.zeros((3, 8), dtype=np.float32)
+    for row, features in enumerate([{"a": 1.0, "b": 2.0, "c": 3.0}, {}, {"x": 0.5}]):
+        for name, value in features.items():
+            dense[row, hasher.index(name)] += value
+    assert np.array_equal(batch.to_dense(), dense)
+    for row in range(batch.rows):
+        columns = batch.indices[batch.indptr[row] : batch.indptr[row + 1]]
+        assert np.all(np.diff(columns) > 0)
+    with pytest.raises(ValueError, match="finite"):
+        hasher.transform([{"a": float("nan")}])
+
+
+def test_predict_batch_matches_predict_single():
+    torch = pytest.importorskip("torch")
+    from backend.ml.taste_predictor import DeepTastePredictor
+
+    torch.manual_seed(0)
+    model = DeepTastePredictor(input_dim=64, hidden_dim=32, device=torch.device("cpu"))
+    user = {"vanillin": 0.9, "limonene": 0.2}
+    recipes = [{"vanillin": 0.1 * index, f"compound-{index}": 1.0} for index in range(5)]
+    scores, confidences = model.predict_batch([user], recipes, batch_size=2)
+    for recipe, score, confidence in zip(recipes, scores, confidences):
+        expected = model.predict_single(user, recipe)
+        assert (float(score), float(confidence)) == pytest.approx(expected, abs=1e-5)
+    paired, _ = model.predict_batch([user] * 5, recipes)
+    assert torch.allclose(paired, scores, atol=1e-6)
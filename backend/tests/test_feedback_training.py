@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from backend.ml.feedback_training import (  # noqa: E402
+    CHECKPOINT_NAME,
+    FeedbackTrainingConfig,
+    TasteFeedbackBatches,
+    train_taste_predictor,
+)
+from backend.database import DBFeedback  # noqa: E402
+from backend.research.registry import LocalArtifactRegistry  # noqa: E402
+from scripts.train_feedback_models import synthetic_session_factory  # noqa: E402
+
+
+CONFIG = FeedbackTrainingConfig(
+    epochs=2, batch_size=8, chunk_size=16, input_dim=32, hidden_dim=16
+)
+
+
+def test_batches_are_page_aligned_and_reproducible():
+    factory = synthetic_session_factory(40, vector_length=8)
+    dataset = TasteFeedbackBatches(
+        factory, batch_size=8, chunk_size=16, input_dim=32, seed=3, epoch=0
+    )
+    batches = list(dataset)
+    assert [int(batch[2].shape[0]) for batch in batches] == [8, 8, 8, 8, 8]
+    assert [batch[3] for batch in batches if batch[4]] == [16, 32, 40]
+    assert batches[0][0].shape == (8, 1, 32)
+    assert torch.equal(batches[0][0][:, 0, 8:], torch.zeros(8, 24))
+    again = list(dataset)
+    assert all(torch.equal(a[2], b[2]) for a, b in zip(batches, again))
+
+    resumed = list(
+        TasteFeedbackBatches(
+            factory,
+            batch_size=8,
+            chunk_size=16,
+            input_dim=32,
+            seed=3,
+            epoch=0,
+            after_id=16,
+        )
+    )
+    assert all(torch.equal(a[2], b[2]) for a, b in zip(batches[2:], resumed))
+
+
+def test_skipped_rows_are_counted_once_across_epochs(tmp_path):
+    factory = synthetic_session_factory(20, vector_length=8)
+    with factory() as db:
+        rows = db.query(DBFeedback).order_by(DBFeedback.id).limit(3).all()
+        rows[0].payload = {**rows[0].payload, "rating": 1.5}
+        rows[1].payload = {**rows[1].payload, "user_genome": None}
+        rows[2].payload = {"rating": 0.5}
+        db.commit()
+
+    result = train_taste_predictor(factory, tmp_path / "run", CONFIG)
+
+    assert result.completed
+    assert result.epochs_completed == 2
+    assert result.skipped_rows == 3
+    assert result.samples_trained == 34
+
+
+def test_interrupted_run_resumes_and_registers(tmp_path):
+    factory = synthetic_session_factory(40, vector_length=8)
+    partial = train_taste_predictor(factory, tmp_path / "run", CONFIG, max_pages=2)
+    assert not partial.completed
+    assert partial.samples_trained == 32
+    assert (tmp_path / "run" / CHECKPOINT_NAME).exists()
+
+    registry = LocalArtifactRegistry(tmp_path / "registry")
+    finished = train_taste_predictor(
+        factory, tmp_path / "run", CONFIG, registry=registry, version="test"
+    )
+    assert finished.completed
+    assert finished.resumed_from_feedback_id == 32
+    assert finished.samples_trained == 80
+    assert finished.registry_key == "model:replay_personalization:test"
+    assert not (tmp_path / "run" / CHECKPOINT_NAME).exists()
+    entry = registry.get("model", "replay_personalization", "test")
+    assert registry.verify_integrity(entry)
+    assert entry.card["evaluation_metrics"]["samples_trained"] == 80
+
+    train_taste_predictor(factory, tmp_path / "other", CONFIG, max_pages=1)
+    with pytest.raises(ValueError, match="different training configuration"):
+        train_taste_predictor(
+            factory,
+            tmp_path / "other",
+            FeedbackTrainingConfig(epochs=3, batch_size=8, chunk_size=16),
+        )
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base, DBUser
+from backend.gamification.gamification_engine import GamificationEngine
+from backend.gamification_models import (
+    DBGamificationAchievement,
+    DBGamificationEvent,
+    DBGamificationScore,
+)
+from backend.services import gamification_service
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MONDAY = datetime(2026, 8, 3, 9, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret-key-that-is-longer-than-thirty-two-characters")
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            DBUser.__table__,
+            DBGamificationEvent.__table__,
+            DBGamificationScore.__table__,
+            DBGamificationAchievement.__table__,
+        ],
+    )
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with factory() as db:
+        db.add_all(
+            DBUser(id=f"user-{index}", name=f"User {index}") for index in range(5)
+        )
+        db.commit()
+    return factory
+
+
+def test_period_buckets_start_on_utc_day_monday_and_first_of_month():
+    moment = datetime(2026, 8, 6, 23, 30, tzinfo=timezone.utc)
+
+    assert gamification_service.period_bucket("day", moment) == date(2026, 8, 6)
+    assert gamification_service.period_bucket("week", moment) == date(2026, 8, 3)
+    assert gamification_service.period_bucket("month", moment) == date(2026, 8, 1)
+    assert gamification_service.period_bucket("all_time", moment) == date(1970, 1, 1)
+    with pytest.raises(ValueError, match="period must be one of"):
+        gamification_service.period_bucket("year", moment)
+
+
+def test_scores_accumulate_in_every_period_bucket(session_factory):
+    with session_factory() as db:
+        gamification_service.record_stats(
+            db, "user-0", {"carbon_saved": 1.5}, occurred_at=MONDAY
+        )
+        gamification_service.record_stats(
+            db,
+            "user-0",
+            {"carbon_saved": 2.0},
+            occurred_at=datetime(2026, 8, 10, tzinfo=timezone.utc),
+        )
+
+        assert gamification_service.user_totals(db, "user-0") == {"carbon_saved": 3.5}
+        assert gamification_service.user_totals(
+            db, "user-0", period="month", now=MONDAY
+        ) == {"carbon_saved": 3.5}
+        assert gamification_service.user_totals(
+            db, "user-0", period="week", now=MONDAY
+        ) == {"carbon_saved": 1.5}
+        assert db.query(DBGamificationScore).count() == 6
+        assert db.query(DBGamificationEvent).count() == 2
+
+
+def test_leaderboard_and_rank_share_competition_ranking(session_factory):
+    with session_factory() as db:
+        for user_id, score in [
+            ("user-0", 5.0),
+            ("user-1", 9.0),
+            ("user-2", 5.0),
+            ("user-3", 1.0),
+        ]:
+            gamification_service.record_stats(
+                db, user_id, {"carbon_saved": score}, occurred_at=MONDAY
+            )
+
+        leaderboard = gamification_service.get_leaderboard(
+            db, "carbon_saved", period="week", limit=3, now=MONDAY
+        )
+        rank = gamification_service.get_user_rank(
+            db, "user-2", "carbon_saved", period="week", now=MONDAY
+        )
+        absent = gamification_service.get_user_rank(
+            db, "user-4", "carbon_saved", period="week", now=MONDAY
+        )
+
+    assert [(entry["user_id"], entry["rank"]) for entry in leaderboard] == [
+        ("user-1", 1),
+        ("user-0", 2),
+        ("user-2", 2),
+    ]
+    assert leaderboard[0]["username"] == gamification_service.leaderboard_pseudonym(
+        "user-1"
+    )
+    assert rank == {"rank": 2, "score": 5.0, "percentile": 50.0}
+    assert absent == {"rank": None, "score": 0, "percentile": 0}
+
+
+def test_leaderboard_names_only_the_viewer_and_pseudonymises_everyone_else(
+    session_factory, monkeypatch
+):
+    with session_factory() as db:
+        for index in range(4):
+            gamification_service.record_stats(
+                db, f"user-{index}", {"carbon_saved": float(index)}, occurred_at=MONDAY
+            )
+        viewed = gamification_service.get_leaderboard(
+            db, period="week", now=MONDAY, viewer_user_id="user-2"
+        )
+        again = gamification_service.get_leaderboard(db, period="week", now=MONDAY)
+        monkeypatch.setenv("SECRET_KEY", "another-secret-key-that-is-longer-than-32-chars")
+        rekeyed = gamification_service.get_leaderboard(db, period="week", now=MONDAY)
+
+    names = {entry["user_id"]: entry["username"] for entry in viewed}
+    assert names["user-2"] == "User 2"
+    assert not {"User 0", "User 1", "User 3"} & set(names.values())
+    assert len(set(names.values())) == 4
+    assert all(
+        entry["username"] == names[entry["user_id"]]
+        for entry in again
+        if entry["user_id"] != "user-2"
+    )
+    assert not {entry["username"] for entry in rekeyed} & set(names.values())
+
+
+def test_achievement_is_awarded_once_with_bonus_points(session_factory):
+    engine = GamificationEngine(session_factory)
+
+    first = engine.update_user_stats("user-0", {"team_challenges": 5})
+    second = engine.update_user_stats("user-0", {"team_challenges": 1})
+
+    assert [item["id"] for item in first["new_achievements"]] == ["team_player"]
+    assert first["total_points"] == 400
+    assert second["new_achievements"] == []
+    assert second["updated_stats"]["achievements"] == ["team_player"]
+    assert [item["id"] for item in engine.get_user_achievements("user-0")] == [
+        "team_player"
+    ]
+    assert engine.get_leaderboard("total_points", period="all_time")[0]["badge"] == "🤝"
+
+
+def test_meal_impact_is_scored_and_summarised_for_the_month(session_factory):
+    engine = GamificationEngine(session_factory)
+
+    result = engine.log_meal_impact(
+        "user-0",
+        {"carbon_footprint": 0.5, "health_score": 0.8, "variety_score": 0.4},
+    )
+    summary = engine.get_monthly_impact_summary("user-0")
+
+    assert result["visual_impact"]["carbon_saved_kg"] == 2.0
+    assert result["total_points"] == 8 + 10 + 2
+    assert summary["carbon_saved_kg"] == 2.0
+    assert summary["meals_logged"] == 1
+
+
+def test_invalid_deltas_are_rejected_without_writes(session_factory):
+    with session_factory() as db:
+        with pytest.raises(ValueError, match="must be finite"):
+            gamification_service.record_stats(db, "user-0", {"carbon_saved": float("nan")})
+        assert db.query(DBGamificationEvent).count() == 0
+
+
+def test_rank_reads_do_not_scale_with_leaderboard_size(session_factory):
+    with session_factory() as db:
+        for index in range(5):
+            gamification_service.record_stats(
+                db, f"user-{index}", {"total_points": index}, occurred_at=MONDAY
+            )
+        statements = []
+        bind = db.get_bind()
+
+        def capture(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            rank = gamification_service.get_user_rank(
+                db, "user-1", "total_points", period="day", now=MONDAY
+            )
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+    assert rank["rank"] == 4
+    assert len(statements) == 2
+
+
+def test_gamification_migration_creates_indexed_tables(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'gamification.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "backend" / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+
+    command.upgrade(config, "20260802_0019")
+    inspector = inspect(create_engine(url))
+    assert {
+        index["name"] for index in inspector.get_indexes("gamification_scores")
+    } == {"ix_gamification_scores_ranking", "ix_gamification_scores_user_bucket"}
+
+    command.downgrade(config, "20260802_0018")
+    assert "gamification_scores" not in inspect(create_engine(url)).get_table_names()
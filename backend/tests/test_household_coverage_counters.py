@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, inspect
+
+from backend.domain.preparation_operations import PreparationScheduleStatus
+from backend.domain.preparation_task_execution import (
+    PreparationTaskExecutionEventType,
+)
+from backend.preparation_coverage_counter_models import (
+    DBHouseholdCoverageCounter,
+    DBPreparationScheduleCoverageContribution,
+)
+from backend.preparation_operations_models import DBPersistedPreparationSchedule
+from backend.services.preparation_coverage_counter_service import (
+    reconcile_household_coverage,
+)
+from backend.services.preparation_operations_coverage_service import (
+    get_preparation_operations_coverage,
+)
+from backend.services.preparation_task_execution_service import (
+    record_task_execution_event,
+)
+from backend.tests.test_preparation_operations_execution_coverage import (
+    HOUSEHOLD_ID,
+    OWNER_ID,
+    _approved_schedule,
+    _event,
+    db,
+)
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _start_first_task(db, approved, key: str):
+    task = approved.schedule.scheduled[0]
+    return record_task_execution_event(
+        db,
+        household_id=HOUSEHOLD_ID,
+        schedule_id=approved.id,
+        task_id=task.task_id,
+        actor_user_id=OWNER_ID,
+        event_type=PreparationTaskExecutionEventType.STARTED,
+        payload=_event(approved.version, task.start_minute, key),
+    )
+
+
+def _count_statements(db, fn) -> int:
+    statements: list[str] = []
+    engine = db.get_bind()
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def test_service_writes_keep_counters_equal_to_a_full_recompute(db):
+    first = _approved_schedule(db, "first")
+    _start_first_task(db, first, "counter-first-start")
+    # Registering the second calendar invalidates the first schedule.
+    _approved_schedule(db, "second")
+
+    report = reconcile_household_coverage(db, household_id=HOUSEHOLD_ID)
+
+    assert report["bootstrapped"] is True
+    assert report["schedule_count"] == 2
+    assert report["drift"] == []
+    assert report["schedule_drift"] == []
+    coverage = get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID)
+    assert coverage.schedule_status_counts["invalidated"] == 1
+    assert coverage.execution_scope_schedule_count == 2
+    assert coverage.execution_history_schedule_count == 1
+    assert coverage.task_event_total == 1
+
+
+def test_coverage_read_query_count_does_not_grow_with_schedules(db):
+    _approved_schedule(db, "only")
+    get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID)
+    small = _count_statements(
+        db,
+        lambda: get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID),
+    )
+
+    for index in range(3):
+        approved = _approved_schedule(db, f"extra-{index}")
+        _start_first_task(db, approved, f"counter-extra-start-{index}")
+    large = _count_statements(
+        db,
+        lambda: get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID),
+    )
+
+    assert large == small
+
+
+def test_first_read_bootstraps_a_household_without_counters(db):
+    approved = _approved_schedule(db)
+    db.query(DBPreparationScheduleCoverageContribution).delete()
+    db.query(DBHouseholdCoverageCounter).delete()
+    db.commit()
+
+    coverage = get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID)
+
+    assert coverage.schedule_total == 1
+    assert coverage.deterministic_task_count == len(approved.schedule.scheduled)
+    assert db.get(DBPreparationScheduleCoverageContribution, approved.id) is not None
+
+
+def test_reconciliation_reports_then_repairs_counter_drift(db):
+    _approved_schedule(db)
+    row = db.get(DBHouseholdCoverageCounter, (HOUSEHOLD_ID, "execution_scope"))
+    row.value = 7
+    db.commit()
+
+    report = reconcile_household_coverage(db, household_id=HOUSEHOLD_ID)
+    assert report["drift"] == [
+        {"counter": "execution_scope", "stored": 7, "expected": 1}
+    ]
+    assert report["applied"] is False
+    assert (
+        get_preparation_operations_coverage(
+            db, household_id=HOUSEHOLD_ID
+        ).execution_scope_schedule_count
+        == 7
+    )
+
+    repaired = reconcile_household_coverage(
+        db,
+        household_id=HOUSEHOLD_ID,
+        apply=True,
+    )
+    assert repaired["applied"] is True
+    assert reconcile_household_coverage(db, household_id=HOUSEHOLD_ID)["drift"] == []
+    assert (
+        get_preparation_operations_coverage(
+            db, household_id=HOUSEHOLD_ID
+        ).execution_scope_schedule_count
+        == 1
+    )
+
+
+def test_orm_edits_outside_the_services_refresh_coverage_on_commit(db):
+    approved = _approved_schedule(db)
+    row = db.get(DBPersistedPreparationSchedule, approved.id)
+    row.status = PreparationScheduleStatus.COMPLETED.value
+    row.version += 1
+    db.commit()
+
+    report = reconcile_household_coverage(db, household_id=HOUSEHOLD_ID)
+    assert report["drift"] == []
+    assert report["schedule_drift"] == []
+    coverage = get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID)
+    assert coverage.execution_invalid_schedule_count == 1
+
+    row = db.get(DBPersistedPreparationSchedule, approved.id)
+    row.status = PreparationScheduleStatus.APPROVED.value
+    db.flush()
+    db.rollback()
+    assert "coverage_stale_schedules" not in db.info
+    assert reconcile_household_coverage(db, household_id=HOUSEHOLD_ID)["drift"] == []
+
+
+def test_sql_edits_bypassing_the_orm_stay_stale_until_reconciled(db):
+    approved = _approved_schedule(db)
+    table = DBPersistedPreparationSchedule.__table__
+    db.execute(
+        table.update()
+        .where(table.c.id == approved.id)
+        .values(
+            status=PreparationScheduleStatus.COMPLETED.value,
+            version=approved.version + 1,
+        )
+    )
+    db.commit()
+
+    stale = get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID)
+    assert stale.execution_invalid_schedule_count == 0
+    report = reconcile_household_coverage(
+        db,
+        household_id=HOUSEHOLD_ID,
+        apply=True,
+    )
+    assert report["schedule_drift"] == [approved.id]
+    assert report["applied"] is True
+    coverage = get_preparation_operations_coverage(db, household_id=HOUSEHOLD_ID)
+    assert coverage.execution_invalid_schedule_count == 1
+
+
+def test_coverage_counter_migration_adds_and_drops_tables(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'coverage-counters.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "backend" / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+
+    command.upgrade(config, "20260802_0022")
+    tables = set(inspect(create_engine(url)).get_table_names())
+    assert {
+        "household_coverage_counters",
+        "preparation_schedule_coverage_contributions",
+    } <= tables
+
+    command.downgrade(config, "20260802_0021")
+    tables = set(inspect(create_engine(url)).get_table_names())
+    assert "household_coverage_counters" not in tables
+    assert "preparation_schedule_coverage_contributions" not in tables
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.research.inventory_policy_sweep import (
+    PolicySweepAxis,
+    sweep_reorder_policies,
+)
+from backend.research.inventory_simulation import (
+    DemandEvent,
+    SimulationLot,
+    simulate_perishable_inventory,
+)
+from scripts.sweep_inventory_policies import (
+    build_report,
+    regression_failures,
+    write_csv,
+)
+
+
+FIXTURE = Path(__file__).resolve().parents[2] / "benchmarks" / "inventory_policy_sweep_small.json"
+
+
+def trace():
+    lots = [
+        SimulationLot("milk-open", "milk", 2, expires_day=3),
+        SimulationLot("bread-open", "bread", 1, expires_day=2),
+    ]
+    demands = [
+        DemandEvent(day=day, sku=sku, quantity=quantity)
+        for day in range(8)
+        for sku, quantity in (("milk", 1.0), ("bread", 0.5 + day % 2))
+    ]
+    axes = [
+        PolicySweepAxis("milk", (0, 1, 2), (2, 4), 1, 3),
+        PolicySweepAxis("bread", (0, 1), (1, 3), 2, 2),
+    ]
+    return lots, demands, axes
+
+
+def test_sweep_cells_match_single_policy_replays():
+    lots, demands, axes = trace()
+    result = sweep_reorder_policies(lots, demands, axes, horizon_days=8)
+
+    assert result.cell_count == 10
+    assert [value.sku for value in result.best_by_sku] == ["bread", "milk"]
+    for cell in result.cells:
+        axis = next(value for value in axes if value.sku == cell.sku)
+        policy = next(
+            value
+            for value in axis.policies()
+            if (value.reorder_point, value.order_up_to)
+            == (cell.reorder_point, cell.order_up_to)
+        )
+        direct = simulate_perishable_inventory(
+            [value for value in lots if value.sku == cell.sku],
+            [value for value in demands if value.sku == cell.sku],
+            [policy],
+            horizon_days=8,
+        )
+        assert cell.input_fingerprint == direct.input_fingerprint
+        assert cell.fill_rate == direct.fill_rate
+        assert cell.expired_units == direct.expired_units
+
+
+def test_sweep_ranking_and_frontier_are_explicit():
+    lots, demands, axes = trace()
+    result = sweep_reorder_policies(lots, demands, axes, horizon_days=8)
+    for sku in ("bread", "milk"):
+        cells = [value for value in result.cells if value.sku == sku]
+        assert [value.rank for value in cells] == list(range(1, len(cells) + 1))
+        assert [(-value.fill_rate, value.expired_units) for value in cells] == sorted(
+            (-value.fill_rate, value.expired_units) for value in cells
+        )
+        for cell in cells:
+            dominated = any(
+                other.fill_rate >= cell.fill_rate
+                and other.expired_units <= cell.expired_units
+                and (other.fill_rate, other.expired_units)
+                != (cell.fill_rate, cell.expired_units)
+                for other in cells
+            )
+            assert cell.pareto_efficient is not dominated
+
+
+def test_parallel_sweep_is_identical_to_serial():
+    lots, demands, axes = trace()
+    serial = sweep_reorder_policies(lots, demands, axes, horizon_days=8)
+    parallel = sweep_reorder_policies(
+        list(reversed(lots)),
+        list(reversed(demands)),
+        list(reversed(axes)),
+        horizon_days=8,
+        workers=2,
+    )
+    assert serial == parallel
+    assert len(serial.sweep_fingerprint) == 64
+
+
+def test_sweep_rejects_invalid_grids():
+    lots, demands, axes = trace()
+    with pytest.raises(ValueError, match="unique"):
+        PolicySweepAxis("milk", (1, 1), (2,), 1, 3)
+    with pytest.raises(ValueError, match="no cell"):
+        sweep_reorder_policies(
+            lots,
+            demands,
+            [PolicySweepAxis("milk", (5,), (1,), 1, 3)],
+            horizon_days=8,
+        )
+    with pytest.raises(ValueError, match="maximum"):
+        sweep_reorder_policies(
+            lots,
+            demands,
+            axes,
+            horizon_days=8,
+            maximum_cells=3,
+        )
+    with pytest.raises(ValueError, match="outside"):
+        sweep_reorder_policies(lots, demands, axes, horizon_days=4)
+
+
+def test_sweep_cli_report_and_csv_are_machine_readable(tmp_path):
+    report = build_report(FIXTURE)
+    assert report == build_report(FIXTURE)
+    assert report["method"] == "fefo_reorder_policy_grid_sweep_v1"
+    assert report["cell_count"] == len(report["cells"])
+    json.dumps(report, allow_nan=False)
+
+    path = tmp_path / "cells.csv"
+    write_csv(report, path)
+    with path.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == report["cell_count"]
+    assert rows[0]["input_fingerprint"] == report["cells"][0]["input_fingerprint"]
+
+    assert regression_failures(
+        report,
+        minimum_fill_rate=0.0,
+        maximum_waste_units=None,
+    ) == []
+    failures = regression_failures(
+        {
+            "cells": [
+                {"sku": "milk", "fill_rate": 0.5, "expired_units": 0.0},
+                {"sku": "milk", "fill_rate": 1.0, "expired_units": 3.0},
+            ]
+        },
+        minimum_fill_rate=0.9,
+        maximum_waste_units=1.0,
+    )
+    assert failures == [
+        "no swept policy for milk meets the fill-rate and waste gates"
+    ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from backend.research.inventory_simulation import (
@@ -119,6 +121,46 @@ def test_deterministic_replay_and_fingerprint_are_order_invariant():
     assert len(first.input_fingerprint) == 64
 
 
+def test_compact_event_mode_keeps_metrics_and_fingerprint():
+    lots = [
+        SimulationLot("old", "milk", 2, expires_day=2),
+        SimulationLot("new", "milk", 3, expires_day=6),
+    ]
+    demands = [
+        DemandEvent(day=day, sku="milk", quantity=1.5) for day in range(6)
+    ]
+    policies = [
+        ReorderPolicy("milk", 1, 4, lead_time_days=2, shelf_life_days=3)
+    ]
+    full = simulate_perishable_inventory(
+        lots,
+        demands,
+        policies,
+        horizon_days=6,
+    )
+    compact = simulate_perishable_inventory(
+        lots,
+        demands,
+        policies,
+        horizon_days=6,
+        compact_events=True,
+    )
+
+    assert compact.events == ()
+    assert compact.event_counters == full.event_counters
+    assert replace(compact, events=full.events) == full
+    counted = {
+        (value.sku, value.event_type): value.count
+        for value in full.event_counters
+    }
+    for (sku, event_type), count in counted.items():
+        assert count == sum(
+            1
+            for value in full.events
+            if (value.sku, value.event_type) == (sku, event_type)
+        )
+
+
 def test_service_level_and_per_sku_metrics_are_explicit():
     result = simulate_perishable_inventory(
         [SimulationLot("apple-lot", "apple", 1, expires_day=4)],
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi import HTTPException
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api import analytics_routes, online_learning_routes, sustainability_routes
+from backend.database import Base, DBMealPlan, DBUser
+from backend.meal_plan_summary_models import DBMealPlanSummary
+from backend.models import PlanResponse
+from backend.services import meal_plan_summary_service
+from backend.services.meal_plan_summary_service import (
+    latest_plan_summary,
+    record_plan_summary,
+)
+
+
+ROOT = Path(__file__).resolve().parents[2]
+USER_ID = "summary@example.test"
+NOW = datetime(2026, 8, 3, 12, tzinfo=timezone.utc)
+
+
+def _recipe(recipe_id: str, cuisine: str, sweet: float) -> dict:
+    return {
+        "id": recipe_id,
+        "name": recipe_id,
+        "description": "Fixture recipe",
+        "ingredients": [],
+        "ingredient_lines": [],
+        "servings": 2,
+        "calories": 400,
+        "macros": {},
+        "flavor_profile": {"sweet": sweet},
+        "tags": [],
+        "cuisine": cuisine,
+        "instructions": ["Cook"],
+        "estimated_cost": 0,
+        "nutrition_basis": "per_serving",
+    }
+
+
+def _plan_data(days: int = 2) -> dict:
+    return {
+        "user_id": USER_ID,
+        "days": [
+            {
+                "day": day,
+                "meals": {
+                    "lunch": _recipe(f"lunch-{day}", "Thai", 0.2),
+                    "dinner": _recipe(f"dinner-{day}", "Italian", 0.6),
+                },
+                "portions": {},
+                "total_stats": {
+                    "carbon_footprint_kg": 1.5 * day,
+                    "carbon_data_status": "unverified_estimate",
+                },
+                "scores": {"health_match": 0.5 + 0.1 * day},
+            }
+            for day in range(1, days + 1)
+        ],
+        "shopping_list": {
+            "Produce": {"basil": {"count": 2, "quantity": "2 bunches"}},
+        },
+        "overall_stats": {"average_health_match": 0.9, "average_variety": 0.8},
+        "warnings": [],
+    }
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[DBUser.__table__, DBMealPlan.__table__, DBMealPlanSummary.__table__],
+    )
+    session = sessionmaker(bind=engine, autoflush=False)()
+    user = DBUser(id=USER_ID, name="Summary")
+    session.add(user)
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _store(db, plan_data: dict, created_at: datetime, *, summarize: bool = True):
+    stored = DBMealPlan(
+        user_id=USER_ID,
+        schema_version="2",
+        plan_data=plan_data,
+        created_at=created_at,
+    )
+    db.add(stored)
+    if summarize:
+        record_plan_summary(db, stored)
+    db.commit()
+    return stored
+
+
+def test_summary_precomputes_read_side_aggregates(db):
+    _store(db, _plan_data(), NOW)
+
+    summary = latest_plan_summary(db, USER_ID)
+
+    assert summary.day_count == 2
+    assert summary.meal_count == 4
+    assert summary.cuisine_counts == {"Italian": 2, "Thai": 2}
+    assert summary.flavor_totals == {"sweet": [pytest.approx(1.6), 4]}
+    assert summary.shopping_items == [
+        {
+            "category": "Produce",
+            "item": "basil",
+            "count": 2,
+            "quantity": "2 bunches",
+            "quantity_status": None,
+        }
+    ]
+    assert [day["carbon_footprint_kg"] for day in summary.day_stats] == [1.5, 3.0]
+
+
+def test_read_endpoints_do_not_hydrate_plan_documents(db, monkeypatch):
+    _store(db, _plan_data(), NOW)
+    user = db.get(DBUser, USER_ID)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("plan_data was validated on a read path")
+
+    monkeypatch.setattr(meal_plan_summary_service.PlanResponse, "model_validate", fail)
+
+    health = analytics_routes.get_health_insights(
+        USER_ID, period="7d", db=db, current_user=user
+    )
+    taste = analytics_routes.get_taste_insights(USER_ID, db=db, current_user=user)
+    variety = analytics_routes.get_variety_insights(USER_ID, db=db, current_user=user)
+    insight = analytics_routes.get_plan_insight(USER_ID, db=db, current_user=user)
+    carbon = sustainability_routes.get_carbon_footprint(USER_ID, db=db, current_user=user)
+    shopping = online_learning_routes.generate_shopping_list(
+        USER_ID, days_ahead=7, db=db, current_user=user
+    )
+
+    assert [item["score"] for item in health] == [60.0, 70.0]
+    assert taste == [
+        {
+            "subject": "Sweet",
+            "A": 40.0,
+            "fullMark": 100,
+            "metric": "average_planned_recipe_profile",
+        }
+    ]
+    assert [(item["name"], item["value"]) for item in variety] == [
+        ("Italian", 50.0),
+        ("Thai", 50.0),
+    ]
+    assert insight["priority"] == "low"
+    assert carbon["total_footprint"] == 4.5
+    assert carbon["average_meal_footprint"] == 1.125
+    assert shopping["summary"]["days_covered"] == 2
+
+
+def test_newest_unsummarised_plan_is_backfilled_instead_of_older_summary(db):
+    _store(db, _plan_data(days=1), NOW)
+    newest = _store(db, _plan_data(days=3), NOW + timedelta(hours=1), summarize=False)
+
+    summary = latest_plan_summary(db, USER_ID)
+
+    assert summary.plan_id == newest.id
+    assert summary.day_count == 3
+    assert db.get(DBMealPlanSummary, newest.id) is not None
+
+
+def test_invalid_newest_plan_is_reported_missing(db):
+    _store(db, _plan_data(), NOW)
+    _store(db, {"user_id": USER_ID, "days": "broken"}, NOW + timedelta(hours=1))
+    user = db.get(DBUser, USER_ID)
+
+    assert latest_plan_summary(db, USER_ID) is None
+    with pytest.raises(HTTPException) as raised:
+        analytics_routes.get_variety_insights(USER_ID, db=db, current_user=user)
+    assert raised.value.status_code == 404
+
+
+def test_rewriting_a_plan_refreshes_its_summary(db):
+    stored = _store(db, _plan_data(days=2), NOW)
+    replacement = PlanResponse.model_validate(_plan_data(days=1))
+    stored.plan_data = replacement.model_dump(mode="json")
+
+    record_plan_summary(db, stored, replacement)
+    db.commit()
+
+    assert latest_plan_summary(db, USER_ID).day_count == 1
+
+
+def test_summary_migration_adds_table_and_user_created_index(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'plan-summaries.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "backend" / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+
+    command.upgrade(config, "20260802_0020")
+    inspector = inspect(create_engine(url))
+    assert "meal_plan_summaries" in inspector.get_table_names()
+    assert "ix_meal_plans_user_created_desc" in {
+        index["name"] for index in inspector.get_indexes("meal_plans")
+    }
+
+    command.downgrade(config, "20260802_0019")
+    inspector = inspect(create_engine(url))
+    assert "meal_plan_summaries" not in inspector.get_table_names()
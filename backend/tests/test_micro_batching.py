@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.ml.batching import InferenceQueueFull, MicroBatcher
+
+
+def test_concurrent_requests_share_batches_and_keep_their_results():
+    sizes = []
+
+    def batch_fn(items):
+        sizes.append(len(items))
+        return [item * 10 for item in items]
+
+    async def scenario(batcher):
+        return await asyncio.gather(*(batcher.infer(value) for value in range(20)))
+
+    with MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50) as batcher:
+        results = asyncio.run(scenario(batcher))
+        metrics = batcher.metrics()
+    assert results == [value * 10 for value in range(20)]
+    assert max(sizes) == 8 and sum(sizes) == 20 and len(sizes) <= 4
+    assert metrics.completed == metrics.submitted == 20
+    assert metrics.batches == len(sizes)
+    assert sum(size * count for size, count in metrics.batch_size_histogram.items()) == 20
+    assert metrics.queue_depth == 0 and metrics.max_queue_depth >= 8
+
+
+def test_failures_reach_every_caller_and_full_queue_rejects():
+    def failing(items):
+        raise RuntimeError("model exploded")
+
+    with MicroBatcher(failing, max_batch_size=4, max_wait_ms=1) as batcher:
+        futures = [batcher.submit(value) for value in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="model exploded"):
+                future.result(timeout=5)
+        assert batcher.metrics().failed == 3
+
+    release = threading.Event()
+    batcher = MicroBatcher(
+        lambda items: release.wait(5) and items, max_batch_size=1, max_queue_size=1
+    )
+    with batcher:
+        first = batcher.submit("a")
+        while batcher.metrics().queue_depth:
+            time.sleep(0.001)
+        batcher.submit("b")
+        with pytest.raises(InferenceQueueFull):
+            batcher.submit("c")
+        release.set()
+        assert first.result(timeout=5) == "a"
+        assert batcher.metrics().rejected == 1
+    with pytest.raises(RuntimeError, match="closed"):
+        batcher.submit("d")
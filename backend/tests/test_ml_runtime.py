@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from backend.ml import runtime
+
+
+def test_api_and_ml_package_imports_do_not_import_torch():
+    script = (
+        "import sys, backend.main, backend.ml, backend.ml.runtime, "
+        "backend.ml.feature_hashing; print('torch' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cache_loads_each_key_once_under_concurrency():
+    cache = runtime.ModelCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.get_or_load("model", "a" * 64, "eager", "cpu", loader)
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len({id(entry.model) for entry in results}) == 1
+    assert (cache.hits, cache.misses) == (7, 1)
+
+    other = cache.get_or_load("model", "b" * 64, "eager", "cpu", loader)
+    assert other.model is not results[0].model
+    assert len(cache.entries()) == 2
+
+
+def test_artifact_key_tracks_file_content(tmp_path):
+    weights = tmp_path / "weights.pth"
+    assert runtime.artifact_key(weights) == runtime.UNTRAINED
+    weights.write_bytes(b"first")
+    first = runtime.artifact_key(weights)
+    weights.write_bytes(b"second!")
+    assert runtime.artifact_key(weights) not in {first, runtime.UNTRAINED}
+
+
+def test_warmup_configuration_is_validated_before_starting(monkeypatch):
+    monkeypatch.setenv("ML_WARMUP_MODELS", " taste_predictor, ")
+    monkeypatch.setenv("ML_INFERENCE_VARIANT", "quantized")
+    assert runtime.configured_warmup() == (["taste_predictor"], "quantized")
+    assert runtime.start_background_warmup([]) is None
+    with pytest.raises(ValueError, match="unknown warm-up models"):
+        runtime.start_background_warmup(["taste"])
+    with pytest.raises(ValueError, match="variant"):
+        runtime.start_background_warmup(["taste_predictor"], variant="int4")
+    with pytest.raises(ValueError, match="CPU only"):
+        runtime.load_taste_predictor(variant="quantized", device="cuda")
+
+
+@pytest.mark.parametrize(
+    ("name", "loader"),
+    [
+        ("taste_predictor", runtime.load_taste_predictor),
+        ("recipe_vision", runtime.load_vision_analyzer),
+    ],
+)
+def test_request_path_reads_the_key_warm_up_filled(monkeypatch, name, loader):
+    monkeypatch.setenv("ML_INFERENCE_VARIANT", "quantized")
+    cache = runtime.ModelCache()
+    warmed_model = object()
+    monkeypatch.setattr(
+        runtime.MODEL_CACHE,
+        "get_or_load",
+        lambda *key, **_kwargs: cache.get_or_load(*key[:4], lambda: warmed_model),
+    )
+
+    # The warmers load with the variant start_background_warmup receives.
+    _names, variant = runtime.configured_warmup()
+    warmed = loader(variant=variant)
+    served = runtime.load_configured(name)
+
+    assert served is warmed
+    assert served.variant == "quantized"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("variant", runtime.VARIANTS)
+def test_taste_predictor_getter_keeps_predict_batch_under_every_variant(
+    monkeypatch, tmp_path, variant
+):
+    torch = pytest.importorskip("torch")
+    from backend.ml.taste_predictor import (
+        DeepTastePredictor,
+        get_pretrained_taste_predictor,
+    )
+
+    monkeypatch.setenv("ML_INFERENCE_VARIANT", variant)
+    monkeypatch.setattr(runtime, "WEIGHTS_DIR", tmp_path)
+    runtime.MODEL_CACHE.clear()
+    try:
+        served = runtime.load_configured("taste_predictor")
+        model = get_pretrained_taste_predictor()
+        scores, confidences = model.predict_batch(
+            [{"sweet": 1.0}], [{"sweet": 0.5}, {"bitter": 2.0}]
+        )
+        example = torch.zeros(1, 1, model.input_dim)
+        with torch.inference_mode():
+            eager_score, _ = model(example, example)
+            served_score, _ = served.model(example, example)
+    finally:
+        runtime.MODEL_CACHE.clear()
+
+    assert isinstance(model, DeepTastePredictor)
+    assert scores.shape == confidences.shape == (2,)
+    assert served_score.shape == eager_score.shape == (1, 1)
+    if variant != "quantized":
+        assert torch.allclose(served_score, eager_score, atol=1e-5)
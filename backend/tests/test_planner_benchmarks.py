@@ -4,6 +4,8 @@ from backend.research.planner_benchmarks import generate_problem, run_benchmark
 from backend.research.solver_baselines import (
     OptionalSolverUnavailable,
     SolverResult,
+    beam_search_optimize,
+    dynamic_programming_optimize,
     pareto_enumeration,
 )
 
@@ -158,3 +160,43 @@ def test_required_optional_solver_unavailability_fails_the_gate():
     assert report["results"]["optional"]["status"] == "dependency_unavailable"
     assert report["gate"]["passed"] is False
     assert "optional:required_dependency_unavailable" in report["gate"]["failures"]
+
+
+def test_exact_dynamic_program_certifies_beam_gap_at_twenty_slots():
+    report = run_benchmark(
+        generate_problem(seed=17, slots=20, options_per_slot=5),
+        repeats=2,
+        solvers={
+            "beam": beam_search_optimize,
+            "exact_dp": dynamic_programming_optimize,
+        },
+    )
+
+    assert report["schema_version"] == 3
+    assert report["gate"]["passed"] is True
+    exact = report["results"]["exact_dp"]
+    assert exact["deterministic"] is True
+    assert exact["representative"]["diagnostics"]["proven_optimal"] == 1
+    comparisons = report["comparisons"]
+    assert comparisons["certified_upper_bound"] == comparisons["best_common_objective"]
+    assert comparisons["solvers"]["exact_dp"]["gap_to_upper_bound"] == 0
+    assert comparisons["solvers"]["beam"]["gap_to_upper_bound"] >= 0
+
+
+def test_unproven_optimum_is_a_gate_failure():
+    def truncated_solver(_options, _targets):
+        return SolverResult(
+            method="truncated_test_solver",
+            selected_ids=("b1", "d1"),
+            objective=0.5,
+            diagnostics={"proven_optimal": 0, "objective_upper_bound": 0.9},
+        )
+
+    report = run_benchmark(
+        PROBLEM,
+        repeats=1,
+        solvers={"truncated": truncated_solver},
+    )
+
+    assert "truncated:optimality_not_proven" in report["gate"]["failures"]
+    assert report["comparisons"]["certified_upper_bound"] == 0.9
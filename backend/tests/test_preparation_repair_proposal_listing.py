@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import base64
+
+import pytest
+from sqlalchemy import event
+
+from backend.services.preparation_repair_proposal_acceptance_service import (
+    accept_repair_proposal,
+)
+from backend.services.preparation_repair_proposal_creation_service import (
+    create_repair_proposal,
+)
+from backend.services.preparation_repair_proposal_read_service import (
+    encode_repair_proposal_cursor,
+    get_repair_proposal,
+    list_repair_proposals,
+)
+from backend.tests.test_preparation_operations_service import (
+    HOUSEHOLD_ID,
+    OWNER_ID,
+    db,
+)
+from backend.tests.test_preparation_repair_proposal_acceptance import (
+    acceptance_payload,
+    create_proposal,
+)
+from backend.tests.test_preparation_repair_proposal_api import _client
+from backend.tests.test_preparation_repair_proposals import proposal_payload
+
+
+def _add_proposals(db, calendar, source, count: int, offset: int = 0) -> None:
+    for index in range(offset, offset + count):
+        create_repair_proposal(
+            db,
+            household_id=HOUSEHOLD_ID,
+            actor_user_id=OWNER_ID,
+            payload=proposal_payload(
+                schedule=source,
+                calendar=calendar,
+                key=f"repair-listing-{index:04d}",
+            ),
+        )
+
+
+def _listing_statements(db) -> tuple[int, list]:
+    statements: list[str] = []
+    engine = db.get_bind()
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        views = list_repair_proposals(db, household_id=HOUSEHOLD_ID)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements), views
+
+
+def test_listing_round_trips_do_not_grow_with_proposal_count(db):
+    calendar, source, proposal = create_proposal(db)
+    accept_repair_proposal(
+        db,
+        household_id=HOUSEHOLD_ID,
+        proposal_id=proposal.id,
+        actor_user_id=OWNER_ID,
+        payload=acceptance_payload(proposal, key="repair-listing-accept"),
+    )
+    _add_proposals(db, calendar, source, 1)
+    db.expire_all()
+    small, small_views = _listing_statements(db)
+
+    _add_proposals(db, calendar, source, 6, offset=1)
+    db.expire_all()
+    large, large_views = _listing_statements(db)
+
+    assert len(small_views) == 2
+    assert len(large_views) == 8
+    assert large == small
+    assert sum(view.accepted for view in large_views) == 1
+
+
+def test_batched_views_match_single_proposal_reads(db):
+    calendar, source, proposal = create_proposal(db)
+    accept_repair_proposal(
+        db,
+        household_id=HOUSEHOLD_ID,
+        proposal_id=proposal.id,
+        actor_user_id=OWNER_ID,
+        payload=acceptance_payload(proposal, key="repair-listing-accept"),
+    )
+    _add_proposals(db, calendar, source, 2)
+
+    listed = list_repair_proposals(db, household_id=HOUSEHOLD_ID)
+
+    assert listed == [
+        get_repair_proposal(db, household_id=HOUSEHOLD_ID, proposal_id=view.id)
+        for view in listed
+    ]
+    assert any(view.stale_reasons for view in listed)
+
+
+def test_keyset_pages_cover_the_full_listing_in_order(db):
+    calendar, source, _ = create_proposal(db)
+    _add_proposals(db, calendar, source, 4)
+    full = [view.id for view in list_repair_proposals(db, household_id=HOUSEHOLD_ID)]
+
+    paged: list[int] = []
+    cursor = None
+    while True:
+        page = list_repair_proposals(
+            db,
+            household_id=HOUSEHOLD_ID,
+            limit=2,
+            cursor=cursor,
+        )
+        paged.extend(view.id for view in page)
+        if len(page) < 2:
+            break
+        cursor = encode_repair_proposal_cursor(page[-1])
+
+    assert paged == full
+
+
+def test_listing_route_returns_next_cursor_and_rejects_malformed_cursor(db):
+    calendar, source, _ = create_proposal(db)
+    _add_proposals(db, calendar, source, 2)
+    client = _client(db, authenticated=True)
+    path = (
+        f"/api/v1/households/{HOUSEHOLD_ID}/preparation-operations/"
+        "repair-proposals"
+    )
+
+    first = client.get(path, params={"limit": 2})
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    second = client.get(
+        path,
+        params={"limit": 2, "cursor": first.headers["x-next-cursor"]},
+    )
+    assert second.status_code == 200
+    assert len(second.json()) == 1
+    assert "x-next-cursor" not in second.headers
+
+    malformed = client.get(path, params={"cursor": "not-a-cursor"})
+    assert malformed.status_code == 422
+    assert malformed.json()["detail"]["code"] == "repair_proposal_cursor_invalid"
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '["2026-01-01T00:00:00",1e400]',
+        '["2026-01-01T00:00:00",2147483648]',
+        '["2026-01-01T00:00:00",99999999999999999999999999]',
+        '["2026-01-01T00:00:00",1.5]',
+        '["2026-01-01T00:00:00","7"]',
+        '["2026-01-01T00:00:00",true]',
+        '[20260101,7]',
+        '{"updated_at":"2026-01-01T00:00:00","id":7}',
+    ],
+)
+def test_listing_route_rejects_crafted_cursor_values(db, raw):
+    client = _client(db, authenticated=True)
+    path = (
+        f"/api/v1/households/{HOUSEHOLD_ID}/preparation-operations/"
+        "repair-proposals"
+    )
+    cursor = base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    response = client.get(path, params={"cursor": cursor})
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["code"] == "repair_proposal_cursor_invalid"
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, inspect
+
+from backend.domain.preparation_task_execution import (
+    PreparationTaskExecutionEventType,
+    PreparationTaskExecutionState,
+)
+from backend.preparation_operations_models import DBPersistedPreparationSchedule
+from backend.preparation_task_execution_models import (
+    DBPreparationTaskExecutionEvent,
+    DBPreparationTaskExecutionProjection,
+    DBPreparationTaskExecutionTaskState,
+)
+from backend.services import preparation_task_execution_service
+from backend.services.preparation_task_execution_service import (
+    get_task_execution_overview,
+    record_task_execution_event,
+    verify_task_execution_projection,
+)
+from backend.tests.test_preparation_operations_service import HOUSEHOLD_ID, OWNER_ID
+from backend.tests.test_preparation_task_execution_service import (  # noqa: F401
+    create_approved_schedule,
+    db,
+    event_payload,
+)
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _record(db, schedule_id, task, event_type, version, minute, key, reason=None):
+    return record_task_execution_event(
+        db,
+        household_id=HOUSEHOLD_ID,
+        schedule_id=schedule_id,
+        task_id=task.task_id,
+        actor_user_id=OWNER_ID,
+        event_type=event_type,
+        payload=event_payload(version, minute, key, reason=reason),
+    )
+
+
+def _verify(db, schedule_id):
+    return verify_task_execution_projection(
+        db,
+        household_id=HOUSEHOLD_ID,
+        schedule_id=schedule_id,
+    )
+
+
+def test_recorded_events_keep_projection_in_step_with_replay(db):
+    approved = create_approved_schedule(db)
+    first = approved.schedule.scheduled[0]
+    started = _record(
+        db,
+        approved.id,
+        first,
+        PreparationTaskExecutionEventType.STARTED,
+        approved.version,
+        first.start_minute,
+        "projection-start",
+    )
+    completed = _record(
+        db,
+        approved.id,
+        first,
+        PreparationTaskExecutionEventType.COMPLETED,
+        started.schedule.version,
+        first.finish_minute + 2,
+        "projection-complete",
+        reason="Oven ran slow",
+    )
+
+    row = db.get(DBPreparationTaskExecutionTaskState, (approved.id, first.task_id))
+    assert row.state == PreparationTaskExecutionState.COMPLETED.value
+    assert row.started_actual_minute == first.start_minute
+    assert row.completed_actual_minute == first.finish_minute + 2
+    assert row.latest_event_id == completed.event.id
+    assert row.terminal_reason == "Oven ran slow"
+    header = db.get(DBPreparationTaskExecutionProjection, approved.id)
+    assert (header.event_count, header.last_event_id) == (2, completed.event.id)
+    assert completed.task.completed_actual_minute == first.finish_minute + 2
+
+    report = _verify(db, approved.id)
+    assert report["stale"] is False
+    assert report["mismatches"] == []
+
+
+def test_recording_does_not_rescan_the_ledger(db):
+    approved = create_approved_schedule(db)
+    tasks = approved.schedule.scheduled
+    version = approved.version
+    for index, task in enumerate(tasks):
+        version = _record(
+            db,
+            approved.id,
+            task,
+            PreparationTaskExecutionEventType.SKIPPED,
+            version,
+            task.start_minute,
+            f"projection-skip-{index}",
+            reason="Not needed today",
+        ).schedule.version
+    statements = []
+    bind = db.get_bind()
+
+    def capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        overview = get_task_execution_overview(
+            db,
+            household_id=HOUSEHOLD_ID,
+            schedule_id=approved.id,
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert overview.skipped_count == len(tasks)
+    ledger_scans = [
+        value
+        for value in statements
+        if "FROM preparation_task_execution_events" in value
+    ]
+    assert len(ledger_scans) == 1
+
+
+def test_stale_projection_is_replayed_on_read_and_rebuilt_on_write(db):
+    approved = create_approved_schedule(db)
+    first, second = approved.schedule.scheduled[:2]
+    started = _record(
+        db,
+        approved.id,
+        first,
+        PreparationTaskExecutionEventType.STARTED,
+        approved.version,
+        first.start_minute,
+        "stale-start",
+    )
+    db.query(DBPreparationTaskExecutionTaskState).delete()
+    db.query(DBPreparationTaskExecutionProjection).delete()
+    db.commit()
+
+    assert _verify(db, approved.id)["stale"] is True
+    overview = get_task_execution_overview(
+        db,
+        household_id=HOUSEHOLD_ID,
+        schedule_id=approved.id,
+    )
+    assert overview.in_progress_count == 1
+    assert db.query(DBPreparationTaskExecutionProjection).count() == 0
+
+    _record(
+        db,
+        approved.id,
+        second,
+        PreparationTaskExecutionEventType.SKIPPED,
+        started.schedule.version,
+        second.start_minute,
+        "stale-skip",
+        reason="Leftovers cover it",
+    )
+    report = _verify(db, approved.id)
+    assert report == {
+        "schedule_id": approved.id,
+        "event_count": 2,
+        "projected": True,
+        "stale": False,
+        "mismatches": [],
+    }
+
+
+def test_verification_reports_field_level_drift(db):
+    approved = create_approved_schedule(db)
+    first = approved.schedule.scheduled[0]
+    _record(
+        db,
+        approved.id,
+        first,
+        PreparationTaskExecutionEventType.STARTED,
+        approved.version,
+        first.start_minute,
+        "drift-start",
+    )
+    row = db.get(DBPreparationTaskExecutionTaskState, (approved.id, first.task_id))
+    row.state = PreparationTaskExecutionState.PLANNED.value
+    db.commit()
+
+    assert _verify(db, approved.id)["mismatches"] == [
+        {
+            "task_id": first.task_id,
+            "field": "state",
+            "expected": "in_progress",
+            "observed": "planned",
+        }
+    ]
+
+
+def test_parsed_tasks_are_cached_by_schedule_hash(db, monkeypatch):
+    approved = create_approved_schedule(db)
+    schedule = db.get(DBPersistedPreparationSchedule, approved.id)
+    preparation_task_execution_service._TASK_CACHE.clear()
+    calls = []
+    parse = preparation_task_execution_service._parse_scheduled_tasks
+
+    def counting(value):
+        calls.append(value.schedule_hash)
+        return parse(value)
+
+    monkeypatch.setattr(
+        preparation_task_execution_service, "_parse_scheduled_tasks", counting
+    )
+    first = preparation_task_execution_service._scheduled_tasks(schedule)
+    second = preparation_task_execution_service._scheduled_tasks(schedule)
+
+    assert first is second
+    assert calls == [schedule.schedule_hash]
+    assert list(first) == [
+        task.task_id
+        for task in sorted(
+            approved.schedule.scheduled,
+            key=lambda task: (task.start_minute, task.finish_minute, task.task_id),
+        )
+    ]
+    assert db.query(DBPreparationTaskExecutionEvent).count() == 0
+
+
+def test_projection_migration_creates_and_drops_tables(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'task-projection.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "backend" / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+
+    command.upgrade(config, "20260802_0021")
+    inspector = inspect(create_engine(url))
+    assert {
+        "preparation_task_execution_projections",
+        "preparation_task_execution_task_states",
+    } <= set(inspector.get_table_names())
+    assert "ix_preparation_task_states_schedule_state" in {
+        index["name"]
+        for index in inspector.get_indexes("preparation_task_execution_task_states")
+    }
+
+    command.downgrade(config, "20260802_0020")
+    assert "preparation_task_execution_task_states" not in inspect(
+        create_engine(url)
+    ).get_table_names()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import math
+import random
+from collections import Counter
+from dataclasses import asdict
+
 import pytest
 
 from backend.research.baselines import RankedItem
 from backend.research.ranking_evaluation import (
     RankingInteraction,
     RankingItem,
+    TemporalRankingSplit,
     evaluate_rankings,
     intra_list_diversity,
     ranking_fixture_fingerprint,
@@ -139,3 +147,88 @@ def test_diversity_and_fixture_fingerprint_are_deterministic():
     )
     assert first == second
     assert len(first) == 64
+
+
+def test_vectorized_metrics_match_scalar_definitions_bit_for_bit():
+    rng = random.Random(7)
+    catalog = [
+        RankingItem(
+            f"item-{index}",
+            tuple(rng.choice([0.0, rng.uniform(-2, 2)]) for _ in range(5)),
+        )
+        for index in range(40)
+    ]
+    history = [
+        RankingInteraction(f"user-{user}", rng.choice(catalog).item_id, step)
+        for user in range(60)
+        for step in range(rng.randint(2, 6))
+    ]
+    split = temporal_leave_last_out(history)
+    seen = {(value.user_id, value.item_id) for value in split.train}
+    split = TemporalRankingSplit(
+        train=split.train,
+        test_by_user={
+            user_id: item_id
+            for user_id, item_id in split.test_by_user.items()
+            if (user_id, item_id) not in seen
+        },
+    )
+    exclusions = {
+        user_id: [
+            value.item_id
+            for value in rng.sample(catalog, 3)
+            if value.item_id != relevant_item
+        ]
+        for user_id, relevant_item in split.test_by_user.items()
+    }
+    recommendations = {
+        user_id: [
+            RankedItem(value.item_id, rng.random())
+            for value in rng.sample(catalog, rng.randint(0, 8))
+        ]
+        for user_id in split.test_by_user
+    }
+    common = {
+        "model_id": "parity",
+        "recommendations": recommendations,
+        "split": split,
+        "items": catalog,
+        "user_groups": {},
+        "hard_exclusions": exclusions,
+        "k": 6,
+    }
+    result = evaluate_rankings(**common)
+
+    feature_map = {value.item_id: value.features for value in catalog}
+    popularity = Counter(value.item_id for value in split.train)
+    denominator = len(split.train) + len(catalog)
+    for metrics in result.per_user:
+        identifiers = [
+            value.item_id for value in recommendations[metrics.user_id][:6]
+        ]
+        assert metrics.diversity == intra_list_diversity(identifiers, feature_map)
+        expected_novelty = (
+            sum(
+                -math.log2((popularity.get(value, 0) + 1) / denominator)
+                for value in identifiers
+            )
+            / len(identifiers)
+            if identifiers
+            else 0.0
+        )
+        assert metrics.novelty == expected_novelty
+    payload = {
+        user_id: [
+            {"item_id": value.item_id, "score": float(value.score)}
+            for value in values[:6]
+        ]
+        for user_id, values in recommendations.items()
+    }
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+    assert result.recommendation_fingerprint == hashlib.sha256(canonical).hexdigest()
+    assert asdict(evaluate_rankings(**common, chunk_size=7)) == asdict(result)
+    assert asdict(evaluate_rankings(**common, chunk_size=9, workers=2)) == asdict(
+        result
+    )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base, DBRecipe
+from scripts import backfill_recipe_ingredients as backfill
+
+
+LINES = ["200 g rice", "1 cup milk", "2 cloves garlic, minced", "salt to taste"]
+
+
+def _session_factory(count: int = 7):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[DBRecipe.__table__])
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with Session() as db:
+        db.add_all(
+            DBRecipe(
+                id=f"recipe-{index:03d}",
+                name=f"Recipe {index}",
+                ingredients=LINES[: 2 + index % 3],
+                calories=0 if index == 3 else 450,
+                macros={"protein": 20, "carbs": 60, "fat": 12},
+            )
+            for index in range(count)
+        )
+        db.commit()
+    return Session
+
+
+def _report_ids(path) -> list[str]:
+    return [
+        json.loads(line)["recipe_id"]
+        for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+
+
+def _stored(Session) -> dict[str, list]:
+    with Session() as db:
+        return {row.id: row.ingredient_data for row in db.query(DBRecipe)}
+
+
+def test_dry_run_streams_chunks_and_leaves_rows_untouched(tmp_path):
+    Session = _session_factory()
+    report = tmp_path / "quality.jsonl"
+
+    summary = backfill.run(
+        apply=False, report_path=report, chunk_size=3, session_factory=Session
+    )
+
+    assert summary["status"] == "complete"
+    assert summary["chunks"] == 3
+    assert summary["recipe_count"] == 7
+    assert summary["rows_requiring_ingredient_backfill"] == 7
+    assert summary["invalid_recipe_count"] == 1
+    assert _report_ids(report) == [f"recipe-{index:03d}" for index in range(7)]
+    assert all(data == [] for data in _stored(Session).values())
+
+
+def test_apply_resumes_after_failed_chunk_without_duplicate_findings(
+    tmp_path, monkeypatch
+):
+    Session = _session_factory()
+    report = tmp_path / "quality.jsonl"
+    process = backfill._process_values
+    calls = []
+
+    def fail_second_chunk(batch):
+        calls.append(len(batch))
+        if len(calls) == 2:
+            raise RuntimeError("worker crashed")
+        return process(batch)
+
+    monkeypatch.setattr(backfill, "_process_values", fail_second_chunk)
+    with pytest.raises(RuntimeError):
+        backfill.run(apply=True, report_path=report, chunk_size=3, session_factory=Session)
+
+    checkpoint = json.loads(
+        backfill.default_checkpoint_path(report).read_text(encoding="utf-8")
+    )
+    assert checkpoint["status"] == "running"
+    assert checkpoint["last_recipe_id"] == "recipe-002"
+    stored = _stored(Session)
+    assert all(stored[f"recipe-{index:03d}"] for index in range(3))
+    assert not any(stored[f"recipe-{index:03d}"] for index in range(3, 7))
+
+    # Simulate a crash after findings were written but before the checkpoint.
+    with report.open("a", encoding="utf-8") as handle:
+        handle.write('{"recipe_id": "recipe-003"}\n')
+    monkeypatch.setattr(backfill, "_process_values", process)
+    summary = backfill.run(
+        apply=True, report_path=report, chunk_size=3, resume=True, session_factory=Session
+    )
+
+    assert summary["status"] == "complete"
+    assert summary["recipe_count"] == 7
+    assert summary["rows_requiring_ingredient_backfill"] == 7
+    assert _report_ids(report) == [f"recipe-{index:03d}" for index in range(7)]
+    assert all(_stored(Session).values())
+
+    rerun = backfill.run(
+        apply=True, report_path=report, chunk_size=3, session_factory=Session
+    )
+    assert rerun["rows_requiring_ingredient_backfill"] == 0
+
+
+def test_worker_processes_match_in_process_results(tmp_path):
+    Session = _session_factory(count=11)
+    single = tmp_path / "single.jsonl"
+    fanned = tmp_path / "fanned.jsonl"
+
+    first = backfill.run(
+        apply=False, report_path=single, chunk_size=4, session_factory=Session
+    )
+    second = backfill.run(
+        apply=False,
+        report_path=fanned,
+        chunk_size=4,
+        workers=2,
+        session_factory=Session,
+    )
+
+    assert single.read_text(encoding="utf-8") == fanned.read_text(encoding="utf-8")
+    for key in ("recipe_count", "rows_requiring_ingredient_backfill", "invalid_recipe_count"):
+        assert first[key] == second[key]
+
+
+def test_resume_rejects_checkpoint_from_another_mode(tmp_path):
+    Session = _session_factory()
+    report = tmp_path / "quality.jsonl"
+    backfill.run(apply=False, report_path=report, session_factory=Session)
+
+    with pytest.raises(ValueError):
+        backfill.run(apply=True, report_path=report, resume=True, session_factory=Session)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import re
+from dataclasses import replace
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.request_metrics_middleware import install_request_metrics
+from backend.request_metrics import RequestMetrics
+from backend.request_metrics_openmetrics import render_request_metrics_openmetrics
+
+
+_SAMPLE = re.compile(
+    r'^([a-zA-Z_:][a-zA-Z0-9_:]*)'
+    r'(\{[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\\n]|\\.)*"'
+    r'(?:,[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\\n]|\\.)*")*\})?'
+    r' (-?[0-9.e+-]+|\+Inf)$'
+)
+_SUFFIXES = {"histogram": ("_bucket", "_count", "_sum"), "counter": ("",), "gauge": ("",)}
+
+
+def _assert_valid_exposition(rendered: str) -> dict[str, list[tuple[str, str, float]]]:
+    assert rendered.endswith("# EOF\n")
+    lines = rendered.splitlines()
+    assert lines.count("# EOF") == 1 and lines[-1] == "# EOF"
+
+    families: dict[str, str] = {}
+    samples: dict[str, list[tuple[str, str, float]]] = {}
+    current = None
+    for index, line in enumerate(lines[:-1]):
+        if line.startswith("# HELP "):
+            name = line.split(" ")[2]
+            assert name not in families, f"family {name} declared twice"
+            assert lines[index + 1].startswith(f"# TYPE {name} ")
+            current = name
+            continue
+        if line.startswith("# TYPE "):
+            _, _, name, metric_type = line.split(" ")
+            assert name == current
+            families[name] = metric_type
+            samples[name] = []
+            continue
+        match = _SAMPLE.match(line)
+        assert match, f"invalid sample line: {line!r}"
+        sample_name, labels, value = match.groups()
+        assert current is not None
+        suffixes = _SUFFIXES[families[current]]
+        assert any(sample_name == current + suffix for suffix in suffixes), line
+        samples[current].append((sample_name, labels or "", float(value)))
+
+    for name, metric_type in families.items():
+        if metric_type != "histogram":
+            continue
+        series: dict[str, list[tuple[str, float]]] = {}
+        counts: dict[str, float] = {}
+        for sample_name, labels, value in samples[name]:
+            base = re.sub(r',?le="[^"]*"', "", labels).replace("{}", "")
+            if sample_name.endswith("_bucket"):
+                le = re.search(r'le="([^"]*)"', labels).group(1)
+                series.setdefault(base, []).append((le, value))
+            elif sample_name.endswith("_count"):
+                counts[base] = value
+        for base, buckets in series.items():
+            assert buckets[-1][0] == "+Inf"
+            bounds = [float(le) for le, _ in buckets[:-1]]
+            assert bounds == sorted(bounds)
+            values = [value for _, value in buckets]
+            assert values == sorted(values), f"{name}{base} buckets not cumulative"
+            assert values[-1] == counts[base]
+    return samples
+
+
+def _app(metrics: RequestMetrics) -> tuple[FastAPI, sessionmaker]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b')"))
+    Session = sessionmaker(bind=engine)
+    app = FastAPI()
+
+    def get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, db: Session = Depends(get_db)):
+        for _ in range(3):
+            db.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id}).all()
+        return {"id": item_id}
+
+    @app.post("/items/{item_id}/touch")
+    def touch_item(item_id: int, db: Session = Depends(get_db)):
+        db.execute(text("UPDATE items SET name = name WHERE id >= :id"), {"id": item_id})
+        db.commit()
+        return {"id": item_id}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    install_request_metrics(app, engine, metrics)
+    return app, Session
+
+
+def test_requests_are_labelled_by_route_template_with_per_request_statements():
+    metrics = RequestMetrics()
+    app, Session = _app(metrics)
+    with TestClient(app) as client:
+        for item_id in (1, 2, 1):
+            assert client.get(f"/items/{item_id}").status_code == 200
+        assert client.post("/items/1/touch").status_code == 200
+        assert client.get("/ping").status_code == 200
+        assert client.get("/missing/42").status_code == 404
+    with Session() as db:
+        db.execute(text("SELECT 1")).all()
+
+    snapshot = metrics.snapshot()
+    routes = {(route.method, route.route): route for route in snapshot.routes}
+    assert set(routes) == {
+        ("GET", "/items/{item_id}"),
+        ("POST", "/items/{item_id}/touch"),
+        ("GET", "/ping"),
+        ("GET", "unmatched"),
+    }
+    items = routes[("GET", "/items/{item_id}")]
+    assert items.latency_seconds.count == 3
+    assert items.db_statements.count == 3
+    assert items.db_statements.sum == 9
+    assert routes[("GET", "/ping")].db_statements.sum == 0
+    assert routes[("POST", "/items/{item_id}/touch")].db_rows_total == 2
+    assert snapshot.statements_outside_requests_total == 1
+    assert snapshot.statement_seconds.count == 11
+    assert snapshot.pool_checkouts_total == snapshot.pool_checkins_total
+    assert snapshot.pool_checked_out == 0
+    assert snapshot.pool_checkout_seconds.count == snapshot.pool_checkouts_total
+
+
+def test_openmetrics_exposition_is_valid_and_deterministic():
+    metrics = RequestMetrics()
+    app, _ = _app(metrics)
+    with TestClient(app) as client:
+        client.get("/items/1")
+        client.get("/ping")
+
+    snapshot = metrics.snapshot()
+    rendered = render_request_metrics_openmetrics(snapshot)
+    samples = _assert_valid_exposition(rendered)
+
+    assert render_request_metrics_openmetrics(snapshot) == rendered
+    assert (
+        'nutriflavor_http_request_db_statements_bucket'
+        '{method="GET",route="/items/{item_id}",le="5.0"} 1'
+    ) in rendered
+    assert ("nutriflavor_db_pool_checked_out", "", 0.0) in samples[
+        "nutriflavor_db_pool_checked_out"
+    ]
+    assert "/items/1" not in rendered
+    assert "SELECT" not in rendered
+
+
+def test_openmetrics_empty_snapshot_is_valid():
+    rendered = render_request_metrics_openmetrics(RequestMetrics().snapshot())
+
+    _assert_valid_exposition(rendered)
+    assert "# TYPE nutriflavor_http_request_duration_seconds histogram" in rendered
+    assert "route=" not in rendered
+
+
+def test_openmetrics_rejects_unbounded_labels_and_drifted_histograms():
+    metrics = RequestMetrics()
+    app, _ = _app(metrics)
+    with TestClient(app) as client:
+        client.get("/items/1")
+    snapshot = metrics.snapshot()
+    route = snapshot.routes[0]
+
+    with pytest.raises(ValueError, match="route template"):
+        render_request_metrics_openmetrics(
+            replace(snapshot, routes=(replace(route, route="items/1"),))
+        )
+    with pytest.raises(ValueError, match="method label"):
+        render_request_metrics_openmetrics(
+            replace(snapshot, routes=(replace(route, method="BREW"),))
+        )
+    drifted = replace(route.latency_seconds, count=route.latency_seconds.count + 1)
+    with pytest.raises(ValueError, match="count drifted"):
+        render_request_metrics_openmetrics(
+            replace(snapshot, routes=(replace(route, latency_seconds=drifted),))
+        )
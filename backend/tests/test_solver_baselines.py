@@ -1,10 +1,16 @@
+import random
+from itertools import product
+
 import pytest
 
 from backend.research.solver_baselines import (
     OptionalSolverUnavailable,
     PlannerOption,
     PlannerTargets,
+    beam_search_optimize,
     cp_sat_optimize,
+    dynamic_programming_optimize,
+    evaluate_selection,
     milp_optimize,
     pareto_enumeration,
 )
@@ -24,24 +30,177 @@ def test_pareto_solver_is_deterministic_and_feasible():
     first = pareto_enumeration(options(), target)
     second = pareto_enumeration(options(), target)
     assert first.selected_ids == second.selected_ids
-    assert first.method == "pure_python_pareto_enumeration_v2"
+    assert first.method == "pure_python_pareto_branch_and_bound_v3"
     assert len(first.selected_ids) == 2
-    assert first.diagnostics["combinations_inspected"] == 4
-    assert first.diagnostics["feasible_combinations"] == 4
-    assert first.diagnostics["budget_infeasible_combinations"] == 0
+    assert first.diagnostics == second.diagnostics
+    assert first.diagnostics["search_space_combinations"] == 4
+    assert 1 <= first.diagnostics["complete_selections_evaluated"]
+    assert first.diagnostics["verified_frontier_points"] >= 1
 
 
 def test_pareto_enforces_same_hard_cost_limit_as_exact_solvers():
     target = PlannerTargets(1000, 60, 115, 32, 11)
     result = pareto_enumeration(options(), target)
     assert result.diagnostics["cost"] <= 11
-    assert result.diagnostics["budget_infeasible_combinations"] == 3
+    # Cost lower bounds prune over-budget branches before they are completed.
+    assert result.diagnostics["complete_selections_evaluated"] < 4
     assert result.selected_ids == ("a1", "b1")
 
     with pytest.raises(ValueError, match="No complete slot selection is feasible"):
         pareto_enumeration(options(), PlannerTargets(1000, 60, 115, 32, 10))
 
 
+def exhaustive_frontier_choice(values, target):
+    slots = sorted({value.slot for value in values})
+    grouped = [
+        sorted(
+            (value for value in values if value.slot == slot),
+            key=lambda item: item.option_id,
+        )
+        for slot in slots
+    ]
+    points = []
+    for selection in product(*grouped):
+        objective, metrics = evaluate_selection(selection, target)
+        if target.cost_limit is not None and metrics["cost"] > target.cost_limit + 1e-9:
+            continue
+        vector = (
+            metrics["nutrition_match"],
+            metrics["taste"],
+            metrics["variety"],
+            metrics["pantry"] - metrics["cost"] * 0.001,
+        )
+        points.append((vector, objective, tuple(value.option_id for value in selection)))
+    frontier = [
+        point
+        for point in points
+        if not any(
+            all(a >= b for a, b in zip(other[0], point[0]))
+            and any(a > b for a, b in zip(other[0], point[0]))
+            for other in points
+        )
+    ]
+    _vector, objective, signature = max(
+        frontier, key=lambda item: (item[1], tuple(reversed(item[2])))
+    )
+    return signature, round(objective, 8)
+
+
+def random_options(rng, slots, per_slot):
+    return [
+        PlannerOption(
+            f"slot-{slot}",
+            f"slot-{slot}-{index}",
+            round(rng.uniform(250, 750)),
+            round(rng.uniform(8, 55), 2),
+            round(rng.uniform(20, 110), 2),
+            round(rng.uniform(5, 35), 2),
+            round(rng.uniform(1.5, 12)),
+            rng.choice([0.5, 0.8, round(rng.random(), 2)]),
+            round(rng.random(), 1),
+            round(rng.random(), 1),
+        )
+        for slot in range(slots)
+        for index in range(per_slot)
+    ]
+
+
+def test_branch_and_bound_matches_exhaustive_frontier_reference():
+    rng = random.Random(29)
+    for _case in range(40):
+        slots = rng.randint(1, 4)
+        values = random_options(rng, slots, rng.randint(1, 4))
+        target = PlannerTargets(
+            slots * 500,
+            slots * 30,
+            slots * 65,
+            slots * 20,
+            rng.choice([None, slots * 6.0, slots * 9.0]),
+        )
+        try:
+            expected = exhaustive_frontier_choice(values, target)
+        except ValueError:
+            with pytest.raises(ValueError, match="No complete slot selection"):
+                pareto_enumeration(values, target)
+            continue
+        result = pareto_enumeration(values, target)
+        assert (result.selected_ids, result.objective) == expected
+
+
+def test_branch_and_bound_exceeds_former_combination_ceiling():
+    values = random_options(random.Random(7), 9, 4)
+    target = PlannerTargets(4500, 270, 585, 180, 63)
+    result = pareto_enumeration(values, target)
+    assert result.diagnostics["search_space_combinations"] == 4**9 > 250_000
+    assert result.diagnostics["nodes_expanded"] < 4**9
+    with pytest.raises(ValueError, match="exceeded 5 nodes"):
+        pareto_enumeration(values, target, maximum_nodes=5)
+
+
+def exhaustive_optimum(values, target):
+    slots = sorted({value.slot for value in values})
+    grouped = [[value for value in values if value.slot == slot] for slot in slots]
+    objectives = []
+    for selection in product(*grouped):
+        objective, metrics = evaluate_selection(selection, target)
+        if target.cost_limit is None or metrics["cost"] <= target.cost_limit + 1e-9:
+            objectives.append(objective)
+    return round(max(objectives), 8) if objectives else None
+
+
+def test_dynamic_program_matches_exhaustive_optimum():
+    rng = random.Random(30)
+    for _case in range(60):
+        slots = rng.randint(1, 5)
+        values = random_options(rng, slots, rng.randint(1, 4))
+        target = PlannerTargets(
+            slots * 500,
+            rng.choice([0, slots * 30]),
+            slots * 65,
+            slots * 20,
+            rng.choice([None, slots * 6.0, slots * 9.0]),
+        )
+        expected = exhaustive_optimum(values, target)
+        if expected is None:
+            with pytest.raises(ValueError, match="No complete slot selection"):
+                dynamic_programming_optimize(values, target)
+            continue
+        result = dynamic_programming_optimize(
+            values,
+            target,
+            resolution=rng.choice([0.001, 0.05]),
+            beam_width=1,
+        )
+        assert result.objective == expected
+        assert result.diagnostics["proven_optimal"] == 1
+        assert result.diagnostics["objective_upper_bound"] == expected
+
+
+def test_dynamic_program_reports_bound_when_layers_are_cut():
+    values = random_options(random.Random(11), 8, 5)
+    target = PlannerTargets(4000, 240, 520, 160, 56)
+    exact = dynamic_programming_optimize(values, target)
+    cut = dynamic_programming_optimize(values, target, maximum_labels=1, beam_width=1)
+
+    assert cut.objective <= exact.objective
+    assert cut.diagnostics["maximum_layer_labels"] == 1
+    assert cut.diagnostics["objective_upper_bound"] >= exact.objective
+    if cut.diagnostics["proven_optimal"]:
+        assert cut.objective == exact.objective
+
+
+def test_beam_search_is_deterministic_and_budget_feasible():
+    values = random_options(random.Random(5), 12, 4)
+    target = PlannerTargets(6000, 360, 780, 240, 60)
+    first = beam_search_optimize(values, target, beam_width=8)
+    second = beam_search_optimize(values, target, beam_width=8)
+
+    assert first == second
+    assert first.method == "deterministic_slot_beam_search_v1"
+    assert first.diagnostics["cost"] <= 60
+    assert first.objective <= dynamic_programming_optimize(values, target).objective
+
+
 def test_duplicate_option_identifiers_are_rejected_for_every_solver_surface():
     duplicate = options() + [
         PlannerOption("snack", "a1", 100, 2, 20, 1, 1, 0.5, 0.5, 0.5)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+from backend import startup_profile
+
+
+def _run(script: str, **env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **env},
+    )
+
+
+def test_api_import_defers_numpy():
+    result = _run("import sys, backend.main; print('numpy' in sys.modules)")
+    assert result.stdout.strip() == "False"
+
+
+def test_profile_report_records_imports_and_lifespan_phases(tmp_path):
+    report_path = tmp_path / "startup.json"
+    script = (
+        "import asyncio, backend.main as main\n"
+        "async def boot():\n"
+        "    async with main.app.router.lifespan_context(main.app):\n"
+        "        pass\n"
+        "asyncio.run(boot())\n"
+    )
+    _run(
+        script,
+        STARTUP_PROFILE_REPORT=str(report_path),
+        STARTUP_WARM_IMPORTS="numpy",
+        DATABASE_URL=f"sqlite:///{tmp_path / 'startup.sqlite3'}",
+        ML_WARMUP_MODELS="",
+    )
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["schema_version"] == startup_profile.REPORT_SCHEMA_VERSION
+    modules = {item["module"]: item for item in report["modules"]}
+    assert "backend.main" in modules
+    assert modules["backend.main"]["cumulative_seconds"] >= modules["backend.main"]["self_seconds"]
+    assert {"schema", "seed_storage_policies", "warm_imports"} <= set(report["phases"])
+    assert report["heavy_modules_loaded"] == ["numpy"]
+    assert report["ready_seconds"] > 0
+
+
+def test_phase_is_a_no_op_without_an_active_profile():
+    with startup_profile.phase("schema"):
+        pass
+    assert startup_profile.finish() is None
@@ -0,0 +1,76 @@
+"""Test-only HTTP stand-in for the upstream data services.
+
+The stub serves fixed JSON payloads from a threaded local server so service
+clients exercise the real ``requests`` path, connection pooling, and caching
+without network access. A route maps to a JSON payload or to a callable that
+receives the parsed query string and returns a payload (``None`` for 404). The
+stub counts hits per path and can add a fixed response delay to model upstream
+latency in benchmarks.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Mapping
+from urllib.parse import parse_qs, urlsplit
+
+
+class UpstreamStub:
+    def __init__(self, routes: Mapping[str, Any], *, delay_seconds: float = 0.0):
+        self.routes = {path.strip("/"): payload for path, payload in routes.items()}
+        self.delay_seconds = delay_seconds
+        self.hits: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                parts = urlsplit(self.path)
+                path = parts.path.strip("/")
+                with stub._lock:
+                    stub.hits[path] += 1
+                if stub.delay_seconds:
+                    time.sleep(stub.delay_seconds)
+                payload = stub.routes.get(path)
+                if callable(payload):
+                    query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+                    payload = payload(query)
+                if payload is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        return Handler
+
+    def __enter__(self) -> "UpstreamStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
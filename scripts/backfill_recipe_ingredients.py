@@ -3,82 +3,257 @@
 Dry-run is the default. Pass ``--apply`` only after reviewing the generated
 report. The command never auto-corrects calories or macros because basis and
 source provenance must be resolved first.
+
+Recipes are streamed in ``--chunk-size`` keyset pages ordered by id. Each chunk
+appends its recipe findings to the JSONL report, commits (``--apply``) or rolls
+back, then atomically rewrites the checkpoint with the last processed id and
+the report byte offset. ``--resume`` continues after the checkpointed id and
+truncates any report lines written after it, so an interrupted run neither
+loses committed chunks nor duplicates findings. Ingredient lines are parsed
+through a bounded memo because identical strings recur across recipes;
+``--workers`` fans parsing and validation out to worker processes.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from backend.database import DBRecipe, SessionLocal
-from backend.domain.ingredients import parse_ingredient_lines
+from backend.domain.ingredients import parse_ingredient_line
 from backend.domain.nutrition_validation import validate_recipe_nutrition
-from backend.models import Recipe
+from backend.models import IngredientLine, Recipe
 
 
-def _row_to_recipe(row: DBRecipe) -> Recipe:
-    ingredients = [str(value) for value in list(row.ingredients or [])]
-    parsed = parse_ingredient_lines(ingredients)
+CHECKPOINT_VERSION = "recipe-ingredient-backfill-v1"
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_PARSE_CACHE_SIZE = 65_536
+
+_parse_line: Callable[[str], IngredientLine] = lru_cache(
+    maxsize=DEFAULT_PARSE_CACHE_SIZE
+)(parse_ingredient_line)
+
+
+def configure_parse_cache(maxsize: int) -> None:
+    """Replace the per-process ingredient-line memo with an empty one."""
+
+    global _parse_line
+    _parse_line = lru_cache(maxsize=max(1, maxsize))(parse_ingredient_line)
+
+
+def _row_values(row: DBRecipe) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "description": row.description,
+        "image_url": row.image_url,
+        "ingredients": list(row.ingredients or []),
+        "servings": getattr(row, "servings", 1.0),
+        "calories": row.calories,
+        "macros": row.macros,
+        "flavor_profile": row.flavor_profile,
+        "tags": row.tags,
+        "cuisine": row.cuisine,
+        "instructions": row.instructions,
+        "estimated_cost": row.estimated_cost,
+        "source_name": getattr(row, "source_name", None),
+        "source_url": getattr(row, "source_url", None),
+        "source_version": getattr(row, "source_version", None),
+        "nutrition_basis": getattr(row, "nutrition_basis", None),
+    }
+
+
+def _recipe_from_values(values: Dict[str, Any]) -> Recipe:
+    ingredients = [str(value) for value in values["ingredients"]]
     return Recipe(
-        id=row.id,
-        name=row.name or "Unnamed recipe",
-        description=row.description or "",
-        image_url=row.image_url,
+        id=values["id"],
+        name=values["name"] or "Unnamed recipe",
+        description=values["description"] or "",
+        image_url=values["image_url"],
         ingredients=ingredients,
-        ingredient_lines=parsed,
-        servings=max(0.01, float(getattr(row, "servings", 1.0) or 1.0)),
-        calories=max(0, int(row.calories or 0)),
-        macros=dict(row.macros or {}),
-        flavor_profile=dict(row.flavor_profile or {}),
-        tags=list(row.tags or []),
-        cuisine=row.cuisine,
-        instructions=list(row.instructions or []),
-        estimated_cost=max(0.0, float(row.estimated_cost or 0.0)),
-        source_name=getattr(row, "source_name", None),
-        source_url=getattr(row, "source_url", None),
-        source_version=getattr(row, "source_version", None),
-        nutrition_basis=getattr(row, "nutrition_basis", None) or "per_serving",
+        ingredient_lines=[_parse_line(value) for value in ingredients],
+        servings=max(0.01, float(values["servings"] or 1.0)),
+        calories=max(0, int(values["calories"] or 0)),
+        macros=dict(values["macros"] or {}),
+        flavor_profile=dict(values["flavor_profile"] or {}),
+        tags=list(values["tags"] or []),
+        cuisine=values["cuisine"],
+        instructions=list(values["instructions"] or []),
+        estimated_cost=max(0.0, float(values["estimated_cost"] or 0.0)),
+        source_name=values["source_name"],
+        source_url=values["source_url"],
+        source_version=values["source_version"],
+        nutrition_basis=values["nutrition_basis"] or "per_serving",
     )
 
 
-def run(*, apply: bool, report_path: Path) -> Dict[str, Any]:
-    db = SessionLocal()
-    reports: List[Dict[str, Any]] = []
-    updated = 0
+def _row_to_recipe(row: DBRecipe) -> Recipe:
+    return _recipe_from_values(_row_values(row))
+
+
+def _process_values(
+    batch: Sequence[Dict[str, Any]],
+) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Validate recipes and render canonical ingredient data; runs in workers."""
+
+    results = []
+    for values in batch:
+        recipe = _recipe_from_values(values)
+        normalized = [line.model_dump(mode="json") for line in recipe.ingredient_lines]
+        results.append((validate_recipe_nutrition(recipe), normalized))
+    return results
+
+
+def _fresh_checkpoint(*, apply: bool, report_path: Path) -> Dict[str, Any]:
+    return {
+        "checkpoint_version": CHECKPOINT_VERSION,
+        "mode": "apply" if apply else "dry_run",
+        "report_path": str(report_path),
+        "status": "running",
+        "last_recipe_id": None,
+        "report_bytes": 0,
+        "chunks": 0,
+        "recipe_count": 0,
+        "rows_requiring_ingredient_backfill": 0,
+        "invalid_recipe_count": 0,
+        "warning_recipe_count": 0,
+    }
+
+
+def _load_checkpoint(path: Path, *, apply: bool, report_path: Path) -> Dict[str, Any]:
+    checkpoint = json.loads(path.read_text(encoding="utf-8"))
+    expected = _fresh_checkpoint(apply=apply, report_path=report_path)
+    for key in ("checkpoint_version", "mode", "report_path"):
+        if checkpoint.get(key) != expected[key]:
+            raise ValueError(
+                f"Checkpoint {path} has {key}={checkpoint.get(key)!r}; "
+                f"this run needs {expected[key]!r}"
+            )
+    return checkpoint
+
+
+def _write_checkpoint(path: Path, checkpoint: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    try:
+        temporary.write_text(
+            json.dumps(checkpoint, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        temporary.replace(path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+
+
+def default_checkpoint_path(report_path: Path) -> Path:
+    return report_path.with_name(f"{report_path.name}.checkpoint.json")
+
+
+def run(
+    *,
+    apply: bool,
+    report_path: Path,
+    checkpoint_path: Optional[Path] = None,
+    resume: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    parse_cache_size: int = DEFAULT_PARSE_CACHE_SIZE,
+    session_factory: Callable[[], Session] | None = None,
+) -> Dict[str, Any]:
+    if chunk_size < 1 or workers < 1:
+        raise ValueError("chunk_size and workers must be at least 1")
+    checkpoint_path = checkpoint_path or default_checkpoint_path(report_path)
+    if resume and checkpoint_path.exists():
+        checkpoint = _load_checkpoint(checkpoint_path, apply=apply, report_path=report_path)
+    else:
+        checkpoint = _fresh_checkpoint(apply=apply, report_path=report_path)
+    configure_parse_cache(parse_cache_size)
+
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with report_path.open("ab") as handle:
+        handle.truncate(checkpoint["report_bytes"])
+    if checkpoint["status"] == "complete":
+        return checkpoint
+
+    pool = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=configure_parse_cache,
+            initargs=(parse_cache_size,),
+        )
+        if workers > 1
+        else None
+    )
+    db = (session_factory or SessionLocal)()
     try:
-        rows = db.query(DBRecipe).order_by(DBRecipe.id).all()
-        for row in rows:
-            recipe = _row_to_recipe(row)
-            reports.append(validate_recipe_nutrition(recipe))
-            normalized = [line.model_dump(mode="json") for line in recipe.ingredient_lines]
-            if normalized != list(getattr(row, "ingredient_data", None) or []):
-                updated += 1
+        with report_path.open("ab") as handle:
+            while True:
+                statement = select(DBRecipe).order_by(DBRecipe.id).limit(chunk_size)
+                if checkpoint["last_recipe_id"] is not None:
+                    statement = statement.where(DBRecipe.id > checkpoint["last_recipe_id"])
+                rows = db.scalars(statement).all()
+                if not rows:
+                    break
+
+                values = [_row_values(row) for row in rows]
+                if pool is None:
+                    results = _process_values(values)
+                else:
+                    step = -(-len(values) // workers)
+                    parts = [
+                        values[start : start + step]
+                        for start in range(0, len(values), step)
+                    ]
+                    results = [
+                        item
+                        for part in pool.map(_process_values, parts)
+                        for item in part
+                    ]
+
+                lines = []
+                for row, (report, normalized) in zip(rows, results):
+                    lines.append(json.dumps(report, sort_keys=True))
+                    checkpoint["invalid_recipe_count"] += not report["valid"]
+                    checkpoint["warning_recipe_count"] += bool(report["warnings"])
+                    if normalized != list(getattr(row, "ingredient_data", None) or []):
+                        checkpoint["rows_requiring_ingredient_backfill"] += 1
+                        if apply:
+                            row.ingredient_data = normalized
+                handle.write(("\n".join(lines) + "\n").encode("utf-8"))
+                handle.flush()
+                os.fsync(handle.fileno())
+
+                last_recipe_id = values[-1]["id"]
                 if apply:
-                    row.ingredient_data = normalized
-                    db.add(row)
-        if apply:
-            db.commit()
-        else:
-            db.rollback()
+                    db.commit()
+                else:
+                    db.rollback()
+                db.expunge_all()
+
+                checkpoint["last_recipe_id"] = last_recipe_id
+                checkpoint["report_bytes"] = handle.tell()
+                checkpoint["chunks"] += 1
+                checkpoint["recipe_count"] += len(values)
+                _write_checkpoint(checkpoint_path, checkpoint)
     except Exception:
         db.rollback()
         raise
     finally:
         db.close()
+        if pool is not None:
+            pool.shutdown()
 
-    summary = {
-        "mode": "apply" if apply else "dry_run",
-        "recipe_count": len(reports),
-        "rows_requiring_ingredient_backfill": updated,
-        "invalid_recipe_count": sum(1 for item in reports if not item["valid"]),
-        "warning_recipe_count": sum(1 for item in reports if item["warnings"]),
-        "recipes": reports,
-    }
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-    return summary
+    checkpoint["status"] = "complete"
+    _write_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint
 
 
 def main() -> None:
@@ -87,17 +262,37 @@ def main() -> None:
     parser.add_argument(
         "--report",
         type=Path,
-        default=Path("reports/recipe_data_quality.json"),
-        help="output JSON report path",
+        default=Path("reports/recipe_data_quality.jsonl"),
+        help="output JSONL report path, one recipe finding per line",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="checkpoint path (default: <report>.checkpoint.json)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue after the last checkpointed recipe instead of starting over",
     )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--parse-cache-size", type=int, default=DEFAULT_PARSE_CACHE_SIZE)
     args = parser.parse_args()
-    summary = run(apply=args.apply, report_path=args.report)
-    print(
-        json.dumps(
-            {key: value for key, value in summary.items() if key != "recipes"},
-            indent=2,
+    try:
+        summary = run(
+            apply=args.apply,
+            report_path=args.report,
+            checkpoint_path=args.checkpoint,
+            resume=args.resume,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            parse_cache_size=args.parse_cache_size,
         )
-    )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(json.dumps(summary, indent=2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark API import-to-ready time for a no-ML configuration.
+
+Each run spawns a fresh interpreter against a throwaway SQLite database with
+model warm-up disabled and ``STARTUP_PROFILE_REPORT`` set, imports
+``backend.main``, and enters the application lifespan. Wall-clock ready time
+is measured from interpreter start to the end of the lifespan startup; the
+profile report supplies the slowest imports and per-phase durations. The run
+fails when the median ready time exceeds ``--max-ready-seconds`` or when torch
+or numpy were imported on the way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FORBIDDEN_MODULES = ("numpy", "torch", "torchvision")
+
+_BOOT = """
+import asyncio, backend.main as main
+async def boot():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+asyncio.run(boot())
+"""
+
+
+def _boot_once(workdir: Path, index: int) -> dict:
+    report_path = workdir / f"startup-{index}.json"
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{workdir / f'startup-{index}.sqlite3'}",
+        "ML_WARMUP_MODELS": "",
+        "STARTUP_WARM_IMPORTS": "",
+        "STARTUP_PROFILE_REPORT": str(report_path),
+    }
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", _BOOT], cwd=REPO_ROOT, env=env, check=True
+    )
+    wall_seconds = time.perf_counter() - started
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    return {"wall_seconds": wall_seconds, "report": report}
+
+
+def benchmark_api_startup(*, runs: int, max_ready_seconds: float, top: int) -> dict:
+    if runs < 1 or top < 1 or max_ready_seconds <= 0:
+        raise ValueError("runs, top, and max ready seconds must be positive")
+    with tempfile.TemporaryDirectory() as workdir:
+        boots = [_boot_once(Path(workdir), index) for index in range(runs)]
+
+    wall = [boot["wall_seconds"] for boot in boots]
+    ready = [boot["report"]["ready_seconds"] for boot in boots]
+    last = boots[-1]["report"]
+    heavy = sorted(
+        {name for boot in boots for name in boot["report"]["heavy_modules_loaded"]}
+        & set(FORBIDDEN_MODULES)
+    )
+    median_wall = statistics.median(wall)
+    return {
+        "schema_version": 1,
+        "runs": runs,
+        "max_ready_seconds": max_ready_seconds,
+        "median_wall_ready_seconds": round(median_wall, 3),
+        "max_wall_ready_seconds": round(max(wall), 3),
+        "median_profiled_ready_seconds": round(statistics.median(ready), 3),
+        "module_count": last["module_count"],
+        "phases": last["phases"],
+        "slowest_imports": last["modules"][:top],
+        "heavy_modules_loaded": heavy,
+        "passed": median_wall <= max_ready_seconds and not heavy,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark API import-to-ready time with ML warm-up disabled"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ready-seconds", type=float, default=5.0)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/api_startup_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_api_startup(
+            runs=args.runs, max_ready_seconds=args.max_ready_seconds, top=args.top
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["passed"]}))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
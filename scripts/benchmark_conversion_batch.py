@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Compare batch quantity conversion with one ``convert_quantity`` call per line.
+
+Conversions are seeded into a throwaway in-memory SQLite database; every
+ingredient gets one reviewed and one unreviewed candidate so both paths apply
+the same evidence precedence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base, DBIngredientConversion
+from backend.domain.conversions import ConversionBatchRequest, ConversionRequest
+from backend.services.conversion_service import (
+    bump_conversion_table_version,
+    convert_quantities,
+    convert_quantity,
+)
+
+
+UNITS = ("cup", "tbsp", "tsp", "piece")
+
+
+def _seed(db: Session, ingredients: int) -> None:
+    reviewed_at = datetime(2026, 7, 1, tzinfo=timezone.utc)
+    rows = []
+    for index in range(ingredients):
+        for unit in UNITS:
+            for version, reviewed in (("unreviewed", False), ("reviewed", True)):
+                rows.append(
+                    DBIngredientConversion(
+                        canonical_name=f"ingredient {index}",
+                        from_unit=unit,
+                        to_unit="g",
+                        multiplier_min=10.0 + index % 7,
+                        multiplier_max=12.0 + index % 7,
+                        source_name="Benchmark",
+                        source_url="https://example.test/benchmark",
+                        source_version=version,
+                        evidence_status=(
+                            "reviewed_external" if reviewed else "external_unverified"
+                        ),
+                        reviewed_at=reviewed_at if reviewed else None,
+                        notes=None,
+                        active=True,
+                    )
+                )
+    db.add_all(rows)
+    db.commit()
+    bump_conversion_table_version()
+
+
+def _lines(*, count: int, ingredients: int, seed: int) -> list[ConversionRequest]:
+    generator = random.Random(seed)
+    return [
+        ConversionRequest(
+            # Roughly one line in fifty names an ingredient without evidence.
+            canonical_name=f"ingredient {generator.randrange(int(ingredients * 1.02))}",
+            quantity_min=1.0,
+            quantity_max=2.0,
+            from_unit=generator.choice(UNITS),
+            to_unit="g",
+        )
+        for _ in range(count)
+    ]
+
+
+def benchmark_conversion_batch(*, lines: int, ingredients: int, seed: int) -> dict:
+    if lines < 1 or ingredients < 1:
+        raise ValueError("lines and ingredients must be at least 1")
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[DBIngredientConversion.__table__])
+    db = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        _seed(db, ingredients)
+        requests = _lines(count=lines, ingredients=ingredients, seed=seed)
+
+        started = time.perf_counter()
+        single = []
+        for line in requests:
+            try:
+                single.append(convert_quantity(db, line))
+            except HTTPException as exc:
+                single.append(exc.detail)
+        per_item_seconds = time.perf_counter() - started
+
+        payload = ConversionBatchRequest(items=requests)
+        started = time.perf_counter()
+        cold = convert_quantities(db, payload)
+        cold_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        warm = convert_quantities(db, payload)
+        warm_seconds = time.perf_counter() - started
+
+        matches = all(
+            (item.result if item.result is not None else item.error) == expected
+            for item, expected in zip(warm.items, single)
+        )
+        return {
+            "schema_version": 1,
+            "lines": lines,
+            "ingredients": ingredients,
+            "seed": seed,
+            "error_lines": warm.error_count,
+            "per_item_seconds": round(per_item_seconds, 6),
+            "batch_cold_seconds": round(cold_seconds, 6),
+            "batch_warm_seconds": round(warm_seconds, 6),
+            "warm_speedup": round(per_item_seconds / warm_seconds, 2),
+            "results_match": matches and cold.items == warm.items,
+        }
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark batch conversion against per-line conversion calls"
+    )
+    parser.add_argument("--lines", type=int, default=10_000)
+    parser.add_argument("--ingredients", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/conversion_batch_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_conversion_batch(
+            lines=args.lines,
+            ingredients=args.ingredients,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["results_match"]}))
+    return 0 if report["results_match"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
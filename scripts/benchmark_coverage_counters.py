@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Compare counter-backed coverage reads with a full household recompute.
+
+One approved schedule is created through the services and its row is cloned
+to the requested household size. Timings run against a throwaway SQLite file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.database import Base, DBHousehold, DBUser
+from backend.domain.preparation_operations import PreparationScheduleEventType
+from backend.preparation_operations_models import DBPersistedPreparationSchedule
+from backend.services.preparation_coverage_counter_service import (
+    reconcile_household_coverage,
+)
+from backend.services.preparation_operations_coverage_service import (
+    get_preparation_operations_coverage,
+)
+from backend.services.preparation_operations_service import (
+    create_persisted_schedule,
+    register_resource_calendar,
+    transition_schedule,
+)
+from backend.tests.preparation_operations_service_cases import (
+    HOUSEHOLD_ID,
+    OWNER_ID,
+    calendar_payload,
+    persisted_payload,
+    transition_payload,
+)
+
+
+CLONE_BATCH_SIZE = 1000
+
+
+def _seed(db: Session, schedules: int) -> None:
+    db.add_all(
+        [
+            DBUser(id=OWNER_ID, name="Benchmark owner"),
+            DBHousehold(
+                id=HOUSEHOLD_ID,
+                owner_user_id=OWNER_ID,
+                name="Benchmark home",
+                timezone="UTC",
+                version=1,
+            ),
+        ]
+    )
+    db.commit()
+    calendar = register_resource_calendar(
+        db,
+        household_id=HOUSEHOLD_ID,
+        actor_user_id=OWNER_ID,
+        payload=calendar_payload("benchmark-v1", "benchmark-calendar"),
+    )
+    draft = create_persisted_schedule(
+        db,
+        household_id=HOUSEHOLD_ID,
+        actor_user_id=OWNER_ID,
+        payload=persisted_payload(calendar, "benchmark-schedule"),
+    )
+    approved = transition_schedule(
+        db,
+        household_id=HOUSEHOLD_ID,
+        schedule_id=draft.id,
+        actor_user_id=OWNER_ID,
+        event_type=PreparationScheduleEventType.APPROVED,
+        payload=transition_payload(draft.version, "benchmark-approve", "Benchmark"),
+    )
+    table = DBPersistedPreparationSchedule.__table__
+    template = {
+        column.name: getattr(
+            db.get(DBPersistedPreparationSchedule, approved.id),
+            column.key,
+        )
+        for column in DBPersistedPreparationSchedule.__mapper__.columns
+        if column.name != "id"
+    }
+    clones = [
+        {**template, "creation_idempotency_key": f"benchmark-clone-{index}"}
+        for index in range(1, schedules)
+    ]
+    for start in range(0, len(clones), CLONE_BATCH_SIZE):
+        db.execute(insert(table), clones[start : start + CLONE_BATCH_SIZE])
+    db.commit()
+
+
+def _timed(fn: Callable[[], object], repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples), 6)
+
+
+def _statement_count(db: Session, fn: Callable[[], object]) -> int:
+    statements = []
+    engine = db.get_bind()
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def benchmark_coverage_counters(*, schedules: int, repeats: int) -> dict:
+    if schedules < 1:
+        raise ValueError("schedules must be at least 1")
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'coverage.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+        try:
+            _seed(db, schedules)
+            started = time.perf_counter()
+            bootstrap = reconcile_household_coverage(
+                db,
+                household_id=HOUSEHOLD_ID,
+                apply=True,
+            )
+            bootstrap_seconds = round(time.perf_counter() - started, 6)
+
+            def read():
+                return get_preparation_operations_coverage(
+                    db,
+                    household_id=HOUSEHOLD_ID,
+                )
+
+            def recompute():
+                return reconcile_household_coverage(db, household_id=HOUSEHOLD_ID)
+
+            coverage = read()
+            read_seconds = _timed(read, repeats)
+            recompute_seconds = _timed(recompute, repeats)
+            report = {
+                "schema_version": 1,
+                "schedules": schedules,
+                "repeats": repeats,
+                "bootstrap_seconds": bootstrap_seconds,
+                "counter_read_seconds": read_seconds,
+                "counter_read_statements": _statement_count(db, read),
+                "full_recompute_seconds": recompute_seconds,
+                "speedup": (
+                    round(recompute_seconds / read_seconds, 2) if read_seconds else None
+                ),
+                "schedule_total": coverage.schedule_total,
+                "drift_after_bootstrap": recompute()["drift"],
+                "bootstrap_applied": bootstrap["applied"],
+            }
+        finally:
+            db.close()
+            engine.dispose()
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark counter-backed preparation coverage reads against a full "
+            "recompute of the same household"
+        )
+    )
+    parser.add_argument("--schedules", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/coverage_counter_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_coverage_counters(
+            schedules=args.schedules,
+            repeats=args.repeats,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "schedules": args.schedules}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
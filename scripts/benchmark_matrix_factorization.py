@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Compare ALS and per-interaction SGD matrix-factorization training cost."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.research.advanced_baselines import MatrixFactorizationRecommender
+
+
+Interaction = Tuple[str, str, float]
+
+
+def generate_interactions(
+    *,
+    seed: int,
+    user_count: int,
+    item_count: int,
+    interaction_count: int,
+    rank: int = 4,
+) -> List[Interaction]:
+    """Draw ratings from a seeded low-rank model plus noise, clipped to 1-5."""
+
+    if min(user_count, item_count, interaction_count, rank) < 1:
+        raise ValueError("counts and rank must be at least 1")
+    rng = np.random.default_rng(seed)
+    user_factors = rng.normal(0, 0.6, (user_count, rank))
+    item_factors = rng.normal(0, 0.6, (item_count, rank))
+    users = rng.integers(0, user_count, interaction_count)
+    items = rng.integers(0, item_count, interaction_count)
+    ratings = np.clip(
+        3.0
+        + np.einsum("ij,ij->i", user_factors[users], item_factors[items])
+        + rng.normal(0, 0.25, interaction_count),
+        1.0,
+        5.0,
+    ).round(3)
+    return [
+        (f"user-{user}", f"item-{item}", rating)
+        for user, item, rating in zip(users.tolist(), items.tolist(), ratings.tolist())
+    ]
+
+
+def _holdout_rmse(
+    model: MatrixFactorizationRecommender, holdout: Sequence[Interaction]
+) -> float:
+    errors = [model.predict(user, item) - rating for user, item, rating in holdout]
+    return math.sqrt(sum(error * error for error in errors) / max(1, len(errors)))
+
+
+def _measure_fit(
+    interactions: Sequence[Interaction], holdout: Sequence[Interaction], **options
+) -> Tuple[MatrixFactorizationRecommender, Dict[str, float]]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    model = MatrixFactorizationRecommender(**options).fit(interactions)
+    seconds = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return model, {
+        "fit_seconds": round(seconds, 4),
+        "fit_seconds_per_epoch": round(seconds / options["epochs"], 4),
+        "peak_traced_mib": round(peak / 2**20, 2),
+        "holdout_rmse": round(_holdout_rmse(model, holdout), 6),
+    }
+
+
+def benchmark_matrix_factorization(
+    interactions: Sequence[Interaction],
+    *,
+    factors: int = 16,
+    epochs: int = 10,
+    baseline_epochs: Optional[int] = 1,
+    holdout_fraction: float = 0.02,
+    recommend_users: int = 1_000,
+    k: int = 10,
+    seed: int = 0,
+) -> dict:
+    """Fit both solvers on the same split and report time, memory, and RMSE.
+
+    The SGD reference is a Python loop over every interaction, so it is run
+    for ``baseline_epochs`` (default one) and compared per epoch; pass
+    ``None`` to skip it.
+    """
+
+    if not 0 < holdout_fraction < 1:
+        raise ValueError("holdout_fraction must be in (0, 1)")
+    cut = len(interactions) - max(1, int(len(interactions) * holdout_fraction))
+    if cut < 1:
+        raise ValueError("at least two interactions are required")
+    train, holdout = list(interactions[:cut]), list(interactions[cut:])
+    model, als = _measure_fit(
+        train, holdout, factors=factors, epochs=epochs, seed=seed, solver="als"
+    )
+    users = model.users[:recommend_users]
+    started = time.perf_counter()
+    model.recommend_batch(users, k=k)
+    seconds = time.perf_counter() - started
+    als["recommend_users_per_second"] = round(len(users) / max(seconds, 1e-9), 1)
+    report = {
+        "schema_version": 1,
+        "interaction_count": len(interactions),
+        "train_count": len(train),
+        "holdout_count": len(holdout),
+        "user_count": len(model.users),
+        "item_count": len(model.items),
+        "factors": factors,
+        "solvers": {"als": dict(als, epochs=epochs)},
+    }
+    if baseline_epochs is not None:
+        _baseline, sgd = _measure_fit(
+            train,
+            holdout,
+            factors=factors,
+            epochs=baseline_epochs,
+            seed=seed,
+            solver="sgd",
+        )
+        report["solvers"]["sgd"] = dict(sgd, epochs=baseline_epochs)
+        report["als_epoch_speedup"] = round(
+            sgd["fit_seconds_per_epoch"] / max(als["fit_seconds_per_epoch"], 1e-9), 2
+        )
+    return report
+
+
+def regression_failures(
+    report: dict,
+    *,
+    maximum_als_fit_seconds: Optional[float] = None,
+    maximum_als_holdout_rmse: Optional[float] = None,
+) -> List[str]:
+    failures = []
+    als = report["solvers"]["als"]
+    if maximum_als_fit_seconds is not None and als["fit_seconds"] > maximum_als_fit_seconds:
+        failures.append(
+            f"als fit took {als['fit_seconds']}s; maximum is {maximum_als_fit_seconds}s"
+        )
+    if (
+        maximum_als_holdout_rmse is not None
+        and als["holdout_rmse"] > maximum_als_holdout_rmse
+    ):
+        failures.append(
+            f"als holdout RMSE {als['holdout_rmse']} exceeds {maximum_als_holdout_rmse}"
+        )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare ALS and per-interaction SGD matrix factorization"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--user-count", type=int, default=50_000)
+    parser.add_argument("--item-count", type=int, default=5_000)
+    parser.add_argument("--interaction-count", type=int, default=1_000_000)
+    parser.add_argument("--factors", type=int, default=16)
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--baseline-epochs", type=int, default=1)
+    parser.add_argument("--skip-baseline", action="store_true")
+    parser.add_argument("--maximum-als-fit-seconds", type=float)
+    parser.add_argument("--maximum-als-holdout-rmse", type=float)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    try:
+        interactions = generate_interactions(
+            seed=args.seed,
+            user_count=args.user_count,
+            item_count=args.item_count,
+            interaction_count=args.interaction_count,
+        )
+        report = benchmark_matrix_factorization(
+            interactions,
+            factors=args.factors,
+            epochs=args.epochs,
+            baseline_epochs=None if args.skip_baseline else args.baseline_epochs,
+            seed=args.seed,
+        )
+        failures = regression_failures(
+            report,
+            maximum_als_fit_seconds=args.maximum_als_fit_seconds,
+            maximum_als_holdout_rmse=args.maximum_als_holdout_rmse,
+        )
+        report["regression_failures"] = failures
+        report["passed"] = not failures
+    except (OSError, TypeError, ValueError) as exc:
+        print(f"Matrix-factorization benchmark failed: {type(exc).__name__}: {exc}")
+        return 2
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": not failures}))
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Measure API import time and cold/warm first-inference latency of ML models.
+
+Every sample runs in a fresh interpreter so import and model-build costs are
+paid exactly as a new worker pays them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from backend.ml.runtime import VARIANTS, torch_available
+
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
+
+API_IMPORT = """
+import json, sys, time
+started = time.perf_counter()
+import backend.main
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "torch_imported": "torch" in sys.modules,
+}))
+"""
+
+FIRST_INFERENCE = """
+import json, time
+started = time.perf_counter()
+import torch
+from backend.ml.runtime import load_taste_predictor
+imported = time.perf_counter()
+loaded = load_taste_predictor(variant={variant!r}, device=torch.device("cpu"))
+example = torch.zeros(1, 1, 512)
+with torch.inference_mode():
+    loaded.model(example, example)
+first = time.perf_counter()
+with torch.inference_mode():
+    loaded = load_taste_predictor(variant={variant!r}, device=torch.device("cpu"))
+    loaded.model(example, example)
+second = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - started,
+    "first_request_seconds": first - imported,
+    "warm_request_seconds": second - first,
+}))
+"""
+
+
+def _run(code: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _median(samples: Sequence[dict], field: str) -> float:
+    return round(statistics.median(sample[field] for sample in samples), 4)
+
+
+def benchmark_ml_startup(
+    *, repeats: int = 3, variants: Sequence[str] = ("eager",)
+) -> dict:
+    """Return median timings over ``repeats`` fresh interpreters."""
+
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    unknown = sorted(set(variants) - set(VARIANTS))
+    if unknown:
+        raise ValueError(f"unknown variants: {', '.join(unknown)}")
+    api = [_run(API_IMPORT) for _ in range(repeats)]
+    report = {
+        "schema_version": 1,
+        "repeats": repeats,
+        "api_import_seconds": _median(api, "seconds"),
+        "api_imports_torch": any(sample["torch_imported"] for sample in api),
+        "torch_available": torch_available(),
+        "taste_predictor": {},
+    }
+    if report["torch_available"]:
+        for variant in variants:
+            samples = [
+                _run(FIRST_INFERENCE.format(variant=variant)) for _ in range(repeats)
+            ]
+            report["taste_predictor"][variant] = {
+                field: _median(samples, field)
+                for field in (
+                    "import_seconds",
+                    "first_request_seconds",
+                    "warm_request_seconds",
+                )
+            }
+    return report
+
+
+def regression_failures(
+    report: dict,
+    *,
+    maximum_api_import_seconds: Optional[float] = None,
+    maximum_first_request_seconds: Optional[float] = None,
+) -> List[str]:
+    failures = []
+    if report["api_imports_torch"]:
+        failures.append("importing backend.main imported torch")
+    if (
+        maximum_api_import_seconds is not None
+        and report["api_import_seconds"] > maximum_api_import_seconds
+    ):
+        failures.append(
+            f"API import took {report['api_import_seconds']}s; maximum is "
+            f"{maximum_api_import_seconds}s"
+        )
+    if maximum_first_request_seconds is not None:
+        for variant, timings in report["taste_predictor"].items():
+            if timings["first_request_seconds"] > maximum_first_request_seconds:
+                failures.append(
+                    f"{variant} first request took {timings['first_request_seconds']}s; "
+                    f"maximum is {maximum_first_request_seconds}s"
+                )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure API startup and first ML inference latency"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--variant", action="append", choices=VARIANTS, dest="variants"
+    )
+    parser.add_argument("--maximum-api-import-seconds", type=float)
+    parser.add_argument("--maximum-first-request-seconds", type=float)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_ml_startup(
+            repeats=args.repeats, variants=args.variants or ["eager"]
+        )
+        failures = regression_failures(
+            report,
+            maximum_api_import_seconds=args.maximum_api_import_seconds,
+            maximum_first_request_seconds=args.maximum_first_request_seconds,
+        )
+        report["regression_failures"] = failures
+        report["passed"] = not failures
+    except (OSError, ValueError, subprocess.CalledProcessError) as exc:
+        print(f"ML startup benchmark failed: {type(exc).__name__}: {exc}")
+        return 2
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": not failures}))
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,7 +9,11 @@ from pathlib import Path
 from typing import Any, Dict
 
 from backend.domain.benchmark_fixtures import PlannerBenchmarkFixture
-from backend.research.planner_benchmarks import generate_problem, run_benchmark
+from backend.research.planner_benchmarks import (
+    DEFAULT_SOLVERS,
+    generate_problem,
+    run_benchmark,
+)
 
 
 def _load_or_generate(
@@ -42,8 +46,9 @@ def _load_or_generate(
 def main() -> int:
     parser = argparse.ArgumentParser(
         description=(
-            "Benchmark Pareto, optional CP-SAT, and optional MILP planners with "
-            "repeatability and selection-validity gates."
+            "Benchmark Pareto, beam, exact dynamic-programming, optional CP-SAT, "
+            "and optional MILP planners with repeatability and selection-validity "
+            "gates."
         )
     )
     parser.add_argument("problem", nargs="?", type=Path)
@@ -58,11 +63,18 @@ def main() -> int:
     )
     parser.add_argument("--repeats", type=int, default=3)
     parser.add_argument("--max-objective-gap", type=float)
+    parser.add_argument(
+        "--solver",
+        action="append",
+        default=[],
+        choices=sorted(DEFAULT_SOLVERS),
+        help="Run only this solver; repeat to select several (default: all)",
+    )
     parser.add_argument(
         "--require-solver",
         action="append",
         default=[],
-        choices=["pareto", "cp_sat", "milp"],
+        choices=sorted(DEFAULT_SOLVERS),
         help="Fail when this solver or its optional dependency is unavailable",
     )
     parser.add_argument(
@@ -77,6 +89,11 @@ def main() -> int:
         report = run_benchmark(
             problem,
             repeats=args.repeats,
+            solvers=(
+                {name: DEFAULT_SOLVERS[name] for name in args.solver}
+                if args.solver
+                else None
+            ),
             max_objective_gap=args.max_objective_gap,
             require_available=args.require_solver,
         )
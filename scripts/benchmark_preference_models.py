@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Compare batched and sequential Bradley-Terry preference fitting."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.research.advanced_baselines import BradleyTerryPreference
+
+
+Comparison = Tuple[str, str, float]
+
+
+def generate_comparisons(
+    *,
+    seed: int,
+    item_count: int,
+    comparison_count: int,
+) -> Tuple[List[Comparison], Dict[str, float]]:
+    """Draw binary outcomes from seeded latent Bradley-Terry strengths."""
+
+    if item_count < 2 or comparison_count < 1:
+        raise ValueError("at least two items and one comparison are required")
+    rng = np.random.default_rng(seed)
+    strengths = rng.normal(0, 1, item_count)
+    first = rng.integers(0, item_count, comparison_count)
+    second = (first + rng.integers(1, item_count, comparison_count)) % item_count
+    wins = rng.random(comparison_count) < 1 / (
+        1 + np.exp(-(strengths[first] - strengths[second]))
+    )
+    names = [f"recipe-{index}" for index in range(item_count)]
+    comparisons = [
+        (names[a], names[b], 1.0 if won else 0.0)
+        for a, b, won in zip(first.tolist(), second.tolist(), wins.tolist())
+    ]
+    return comparisons, dict(zip(names, strengths.tolist()))
+
+
+def _measure_fit(
+    comparisons: Sequence[Comparison], truth: Dict[str, float], **options
+) -> Tuple[BradleyTerryPreference, Dict[str, float]]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    model = BradleyTerryPreference(**options).fit(comparisons)
+    seconds = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    fitted = [model.score[item] for item in model.items]
+    expected = [truth[item] for item in model.items]
+    return model, {
+        "fit_seconds": round(seconds, 4),
+        "iterations": model.iterations,
+        "peak_traced_mib": round(peak / 2**20, 2),
+        "strength_correlation": round(float(np.corrcoef(fitted, expected)[0, 1]), 6),
+    }
+
+
+def _max_score_difference(
+    left: BradleyTerryPreference, right: BradleyTerryPreference
+) -> float:
+    return max(abs(left.score[item] - right.score[item]) for item in left.items)
+
+
+def benchmark_preference_models(
+    comparisons: Sequence[Comparison],
+    truth: Dict[str, float],
+    *,
+    epochs: int = 1_000,
+    tolerance: float = 1e-6,
+    baseline_epochs: Optional[int] = 1,
+    parity_comparisons: Sequence[Comparison] = (),
+) -> dict:
+    """Fit every solver on the same comparisons.
+
+    The sequential SGD reference visits each comparison in Python, so on the
+    full set it runs ``baseline_epochs`` and is compared per epoch. Agreement
+    with its default 200-epoch fit is measured on ``parity_comparisons``,
+    which should be small and densely connected; the difference includes the
+    oscillation of constant-step SGD around the optimum.
+    """
+
+    solvers = {}
+    models = {}
+    for solver in ("mm", "newton"):
+        models[solver], solvers[solver] = _measure_fit(
+            comparisons, truth, solver=solver, epochs=epochs, tolerance=tolerance
+        )
+    report = {
+        "schema_version": 1,
+        "comparison_count": len(comparisons),
+        "item_count": len(models["mm"].items),
+        "solvers": solvers,
+        "mm_newton_max_score_difference": round(
+            _max_score_difference(models["mm"], models["newton"]), 9
+        ),
+    }
+    if baseline_epochs is not None:
+        _baseline, sgd = _measure_fit(
+            comparisons, truth, solver="sgd", epochs=baseline_epochs
+        )
+        sgd["fit_seconds_per_epoch"] = round(sgd["fit_seconds"] / baseline_epochs, 4)
+        solvers["sgd"] = sgd
+    if parity_comparisons:
+        sample = list(parity_comparisons)
+        reference = BradleyTerryPreference(solver="sgd").fit(sample)
+        batched = BradleyTerryPreference(
+            solver="mm", epochs=epochs, tolerance=tolerance
+        ).fit(sample)
+        report["parity"] = {
+            "comparison_count": len(sample),
+            "sgd_epochs": reference.epochs,
+            "max_score_difference": round(
+                _max_score_difference(reference, batched), 6
+            ),
+        }
+    return report
+
+
+def regression_failures(
+    report: dict,
+    *,
+    maximum_mm_fit_seconds: Optional[float] = None,
+    maximum_parity_difference: Optional[float] = None,
+) -> List[str]:
+    failures = []
+    mm = report["solvers"]["mm"]
+    if maximum_mm_fit_seconds is not None and mm["fit_seconds"] > maximum_mm_fit_seconds:
+        failures.append(
+            f"mm fit took {mm['fit_seconds']}s; maximum is {maximum_mm_fit_seconds}s"
+        )
+    parity = report.get("parity")
+    if maximum_parity_difference is not None:
+        if parity is None:
+            failures.append("parity was not measured")
+        elif parity["max_score_difference"] > maximum_parity_difference:
+            failures.append(
+                f"sgd/mm score difference {parity['max_score_difference']} exceeds "
+                f"{maximum_parity_difference}"
+            )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare batched and sequential Bradley-Terry fitting"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--item-count", type=int, default=5_000)
+    parser.add_argument("--comparison-count", type=int, default=1_000_000)
+    parser.add_argument("--epochs", type=int, default=1_000)
+    parser.add_argument("--tolerance", type=float, default=1e-6)
+    parser.add_argument("--baseline-epochs", type=int, default=1)
+    parser.add_argument("--skip-baseline", action="store_true")
+    parser.add_argument("--parity-items", type=int, default=20)
+    parser.add_argument("--parity-comparisons", type=int, default=1_000)
+    parser.add_argument("--maximum-mm-fit-seconds", type=float)
+    parser.add_argument("--maximum-parity-difference", type=float)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    try:
+        comparisons, truth = generate_comparisons(
+            seed=args.seed,
+            item_count=args.item_count,
+            comparison_count=args.comparison_count,
+        )
+        report = benchmark_preference_models(
+            comparisons,
+            truth,
+            epochs=args.epochs,
+            tolerance=args.tolerance,
+            baseline_epochs=None if args.skip_baseline else args.baseline_epochs,
+            parity_comparisons=generate_comparisons(
+                seed=args.seed,
+                item_count=args.parity_items,
+                comparison_count=args.parity_comparisons,
+            )[0],
+        )
+        failures = regression_failures(
+            report,
+            maximum_mm_fit_seconds=args.maximum_mm_fit_seconds,
+            maximum_parity_difference=args.maximum_parity_difference,
+        )
+        report["regression_failures"] = failures
+        report["passed"] = not failures
+    except (OSError, TypeError, ValueError) as exc:
+        print(f"Preference benchmark failed: {type(exc).__name__}: {exc}")
+        return 2
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": not failures}))
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -112,7 +112,7 @@ def _eligible_candidates(
     return sorted(set(all_items) - seen.get(user_id, set()) - blocked)
 
 
-def benchmark_rankers(fixture: dict, *, k: int = 5) -> dict:
+def benchmark_rankers(fixture: dict, *, k: int = 5, workers: int = 1) -> dict:
     if k < 1:
         raise ValueError("k must be at least 1")
     items: List[RankingItem] = list(fixture["items"])
@@ -181,6 +181,7 @@ def benchmark_rankers(fixture: dict, *, k: int = 5) -> dict:
             user_groups=user_groups,
             hard_exclusions=hard_exclusions,
             k=k,
+            workers=workers,
         )
         for model_id, values in sorted(recommendations.items())
     }
@@ -312,6 +313,7 @@ def main() -> int:
     parser.add_argument("--items-per-group", type=int, default=8)
     parser.add_argument("--interactions-per-user", type=int, default=6)
     parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
     parser.add_argument("--require-model", action="append", default=[])
     parser.add_argument("--minimum-best-recall", type=float)
     parser.add_argument("--minimum-best-coverage", type=float)
@@ -337,7 +339,7 @@ def main() -> int:
                 interactions_per_user=args.interactions_per_user,
             )
         )
-        report = benchmark_rankers(fixture, k=args.k)
+        report = benchmark_rankers(fixture, k=args.k, workers=args.workers)
         failures = regression_failures(
             report,
             required_models=args.require_model,
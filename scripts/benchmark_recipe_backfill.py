@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Benchmark the chunked recipe backfill against the load-everything pass.
+
+A synthetic catalog is written to a throwaway SQLite file; ingredient lines are
+drawn from a fixed pool so identical strings recur across recipes as they do in
+real catalogs. Each mode runs as a dry run in its own spawned process so peak
+resident memory is measured per mode. The legacy mode replays the previous
+script body: ``.all()``, unmemoized parsing, and one in-memory report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base, DBRecipe
+
+
+UNITS = ("g", "cup", "tbsp", "tsp", "clove", "piece")
+PREPARATIONS = ("", ", chopped", ", minced", " (optional)", ", to taste")
+
+
+def _build_catalog(path: Path, *, recipes: int, distinct_lines: int, seed: int) -> None:
+    generator = random.Random(seed)
+    pool = [
+        f"{generator.randint(1, 400)} {generator.choice(UNITS)} ingredient "
+        f"{generator.randrange(distinct_lines // 3 or 1)}{generator.choice(PREPARATIONS)}"
+        for _ in range(distinct_lines)
+    ]
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[DBRecipe.__table__])
+    with engine.begin() as connection:
+        for start in range(0, recipes, 10_000):
+            connection.execute(
+                insert(DBRecipe),
+                [
+                    {
+                        "id": f"recipe-{index:08d}",
+                        "name": f"Recipe {index}",
+                        "description": "",
+                        "ingredients": generator.sample(pool, generator.randint(6, 12)),
+                        "ingredient_data": [],
+                        "servings": 2.0,
+                        "calories": generator.randint(200, 900),
+                        "macros": {
+                            "protein": generator.randint(5, 50),
+                            "carbs": generator.randint(10, 100),
+                            "fat": generator.randint(2, 40),
+                        },
+                        "flavor_profile": {},
+                        "tags": [],
+                        "instructions": [],
+                        "estimated_cost": 0.0,
+                        "nutrition_basis": "per_serving",
+                    }
+                    for index in range(start, min(start + 10_000, recipes))
+                ],
+            )
+    engine.dispose()
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _run_legacy(database: str, report: str) -> dict:
+    from backend.domain.ingredients import parse_ingredient_lines
+    from backend.domain.nutrition_validation import validate_recipe_nutrition
+    from backend.models import Recipe
+
+    Session = sessionmaker(bind=create_engine(f"sqlite:///{database}"))
+    started = time.perf_counter()
+    db = Session()
+    reports = []
+    updated = 0
+    try:
+        for row in db.query(DBRecipe).order_by(DBRecipe.id).all():
+            ingredients = [str(value) for value in list(row.ingredients or [])]
+            recipe = Recipe(
+                id=row.id,
+                name=row.name,
+                description=row.description or "",
+                ingredients=ingredients,
+                ingredient_lines=parse_ingredient_lines(ingredients),
+                servings=max(0.01, float(row.servings or 1.0)),
+                calories=max(0, int(row.calories or 0)),
+                macros=dict(row.macros or {}),
+                nutrition_basis=row.nutrition_basis or "per_serving",
+            )
+            reports.append(validate_recipe_nutrition(recipe))
+            normalized = [line.model_dump(mode="json") for line in recipe.ingredient_lines]
+            if normalized != list(row.ingredient_data or []):
+                updated += 1
+        db.rollback()
+    finally:
+        db.close()
+    Path(report).write_text(json.dumps({"recipes": reports}), encoding="utf-8")
+    return {
+        "seconds": time.perf_counter() - started,
+        "peak_rss_mb": _peak_rss_mb(),
+        "recipe_count": len(reports),
+        "rows_requiring_ingredient_backfill": updated,
+    }
+
+
+def _run_chunked(database: str, report: str, chunk_size: int, workers: int) -> dict:
+    from scripts import backfill_recipe_ingredients as backfill
+
+    Session = sessionmaker(bind=create_engine(f"sqlite:///{database}"))
+    started = time.perf_counter()
+    summary = backfill.run(
+        apply=False,
+        report_path=Path(report),
+        chunk_size=chunk_size,
+        workers=workers,
+        session_factory=Session,
+    )
+    return {
+        "seconds": time.perf_counter() - started,
+        "peak_rss_mb": _peak_rss_mb(),
+        "recipe_count": summary["recipe_count"],
+        "rows_requiring_ingredient_backfill": summary["rows_requiring_ingredient_backfill"],
+    }
+
+
+def _isolated(function, *args) -> dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(function, *args).result()
+
+
+def benchmark_recipe_backfill(
+    *, recipes: int, distinct_lines: int, chunk_size: int, workers: int, seed: int
+) -> dict:
+    if min(recipes, distinct_lines, chunk_size, workers) < 1:
+        raise ValueError("recipes, distinct lines, chunk size, and workers must be positive")
+    with tempfile.TemporaryDirectory() as workdir:
+        database = Path(workdir) / "catalog.sqlite3"
+        started = time.perf_counter()
+        _build_catalog(database, recipes=recipes, distinct_lines=distinct_lines, seed=seed)
+        build_seconds = time.perf_counter() - started
+
+        legacy = _isolated(_run_legacy, str(database), str(Path(workdir) / "legacy.json"))
+        chunked = _isolated(
+            _run_chunked, str(database), str(Path(workdir) / "chunked.jsonl"), chunk_size, 1
+        )
+        fanned = (
+            _isolated(
+                _run_chunked,
+                str(database),
+                str(Path(workdir) / "fanned.jsonl"),
+                chunk_size,
+                workers,
+            )
+            if workers > 1
+            else None
+        )
+
+    counts = ("recipe_count", "rows_requiring_ingredient_backfill")
+    matches = all(
+        legacy[key] == run[key]
+        for run in (chunked, fanned)
+        if run is not None
+        for key in counts
+    )
+    return {
+        "schema_version": 1,
+        "recipes": recipes,
+        "distinct_lines": distinct_lines,
+        "chunk_size": chunk_size,
+        "workers": workers,
+        "seed": seed,
+        "catalog_build_seconds": round(build_seconds, 3),
+        "legacy_seconds": round(legacy["seconds"], 3),
+        "legacy_peak_rss_mb": round(legacy["peak_rss_mb"], 1),
+        "chunked_seconds": round(chunked["seconds"], 3),
+        "chunked_peak_rss_mb": round(chunked["peak_rss_mb"], 1),
+        "fanned_seconds": round(fanned["seconds"], 3) if fanned else None,
+        "fanned_peak_rss_mb": round(fanned["peak_rss_mb"], 1) if fanned else None,
+        "results_match": matches,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark chunked recipe ingredient backfill on a synthetic catalog"
+    )
+    parser.add_argument("--recipes", type=int, default=500_000)
+    parser.add_argument("--distinct-lines", type=int, default=5_000)
+    parser.add_argument("--chunk-size", type=int, default=2_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/recipe_backfill_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_recipe_backfill(
+            recipes=args.recipes,
+            distinct_lines=args.distinct_lines,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["results_match"]}))
+    return 0 if report["results_match"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Benchmark request-metrics overhead on a tight loop of ASGI requests.
+
+Two identical FastAPI apps are built, each on its own in-memory SQLite engine;
+only one has the request-metrics middleware and engine hooks installed. Requests
+are driven straight through the ASGI interface (no sockets or HTTP client) so
+the measured difference is the instrumentation itself. Rounds alternate between
+the apps and the median per-request time is compared for a no-database async
+route and a sync route that runs ``--statements`` queries, the shape of the
+N+1-prone proposal and plan routes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.request_metrics_middleware import install_request_metrics
+from backend.request_metrics import RequestMetrics
+
+
+def _build_app(statements: int, metrics: RequestMetrics | None) -> FastAPI:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(
+            text("INSERT INTO items (id, name) VALUES (:id, :name)"),
+            [{"id": index, "name": f"item {index}"} for index in range(100)],
+        )
+    SessionFactory = sessionmaker(bind=engine)
+    app = FastAPI()
+
+    def get_db():
+        db = SessionFactory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, db: Session = Depends(get_db)):
+        names = [
+            db.execute(
+                text("SELECT name FROM items WHERE id = :id"),
+                {"id": (item_id + offset) % 100},
+            ).scalar_one()
+            for offset in range(statements)
+        ]
+        return {"id": item_id, "names": names}
+
+    if metrics is not None:
+        install_request_metrics(app, engine, metrics)
+    return app
+
+
+async def _drive(app: FastAPI, path: str, requests: int) -> float:
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        return messages[0]
+
+    async def send(_message):
+        return None
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 1),
+        "server": ("benchmark", 80),
+    }
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def _measure(*, requests: int, rounds: int, statements: int) -> dict:
+    metrics = RequestMetrics()
+    apps = {
+        "baseline": _build_app(statements, None),
+        "instrumented": _build_app(statements, metrics),
+    }
+    paths = {"ping": "/ping", "db": "/items/7"}
+    samples = {(app_name, route): [] for app_name in apps for route in paths}
+    for app_name, app in apps.items():
+        for path in paths.values():
+            await _drive(app, path, max(1, requests // 10))
+    metrics.reset_for_tests()
+
+    for _ in range(rounds):
+        for route, path in paths.items():
+            for app_name, app in apps.items():
+                samples[(app_name, route)].append(await _drive(app, path, requests))
+
+    snapshot = metrics.snapshot()
+    routes = {route.route: route for route in snapshot.routes}
+    expected = requests * rounds
+    counts_match = (
+        routes["/ping"].latency_seconds.count == expected
+        and routes["/items/{item_id}"].latency_seconds.count == expected
+        and routes["/items/{item_id}"].db_statements.sum == expected * statements
+    )
+    medians = {key: statistics.median(values) for key, values in samples.items()}
+    return {"medians": medians, "counts_match": counts_match}
+
+
+def benchmark_request_metrics(
+    *, requests: int, rounds: int, statements: int, max_overhead_ratio: float
+) -> dict:
+    if min(requests, rounds, statements) < 1 or max_overhead_ratio <= 0:
+        raise ValueError("requests, rounds, statements, and max overhead must be positive")
+    measured = asyncio.run(
+        _measure(requests=requests, rounds=rounds, statements=statements)
+    )
+    medians = measured["medians"]
+    report = {
+        "schema_version": 1,
+        "requests_per_round": requests,
+        "rounds": rounds,
+        "statements_per_db_request": statements,
+        "max_overhead_ratio": max_overhead_ratio,
+        "counts_match": measured["counts_match"],
+    }
+    ratios = []
+    for route in ("ping", "db"):
+        baseline = medians[("baseline", route)]
+        instrumented = medians[("instrumented", route)]
+        ratio = (instrumented - baseline) / baseline
+        ratios.append(ratio)
+        report[f"{route}_baseline_us"] = round(baseline * 1e6, 1)
+        report[f"{route}_instrumented_us"] = round(instrumented * 1e6, 1)
+        report[f"{route}_overhead_us"] = round((instrumented - baseline) * 1e6, 1)
+        report[f"{route}_overhead_ratio"] = round(ratio, 4)
+    report["passed"] = measured["counts_match"] and max(ratios) <= max_overhead_ratio
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark request-metrics middleware and SQL hook overhead"
+    )
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--statements", type=int, default=10)
+    parser.add_argument("--max-overhead-ratio", type=float, default=0.25)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/request_metrics_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_request_metrics(
+            requests=args.requests,
+            rounds=args.rounds,
+            statements=args.statements,
+            max_overhead_ratio=args.max_overhead_ratio,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["passed"]}))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Benchmark smoothing-forecaster fits against the pre-vectorization loops.
+
+Single default fits are compared with the scalar per-candidate loops they
+replaced and must not be slower than ``--max-slowdown-ratio``. Rolling-origin
+backtests are compared with refitting a fresh model at every origin, which is
+what the backtest did before forecasters could fit all prefixes in one scan.
+Timings are best-of-``--repeat`` wall clock and are only meaningful on a quiet
+machine, which is why this lives outside the unit suite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import timeit
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+from backend.research.forecasting_baselines import (
+    SMOOTHING_GRID,
+    HoltLinearForecaster,
+    SimpleExponentialSmoothingForecaster,
+    rolling_origin_backtest,
+)
+
+
+def _validated(values: Sequence[float], *, nonnegative: bool = False) -> List[float]:
+    result = [float(value) for value in values]
+    if not result:
+        raise ValueError("values cannot be empty")
+    if not all(math.isfinite(value) for value in result):
+        raise ValueError("values must be finite")
+    if nonnegative and any(value < 0 for value in result):
+        raise ValueError("values must be non-negative")
+    return result
+
+
+class BaselineSmoothing:
+    """The pre-vectorization SimpleExponentialSmoothingForecaster.fit."""
+
+    @staticmethod
+    def _fit_alpha(values: Sequence[float], alpha: float) -> tuple[float, float]:
+        level = float(values[0])
+        squared_error = 0.0
+        for value in values[1:]:
+            squared_error += (float(value) - level) ** 2
+            level = alpha * float(value) + (1 - alpha) * level
+        return level, squared_error
+
+    def fit(self, values: Sequence[float]) -> "BaselineSmoothing":
+        series = _validated(values)
+        scored = [(*self._fit_alpha(series, alpha), alpha) for alpha in SMOOTHING_GRID]
+        self.level_, _error, self.fitted_alpha_ = min(
+            scored, key=lambda item: (item[1], item[2])
+        )
+        return self
+
+
+class BaselineHolt:
+    """The pre-vectorization HoltLinearForecaster.fit with default parameters."""
+
+    alpha = 0.3
+    beta = 0.1
+    damping = 1.0
+    nonnegative = True
+
+    def fit(self, values: Sequence[float]) -> "BaselineHolt":
+        series = _validated(values, nonnegative=self.nonnegative)
+        level = series[0]
+        trend = series[1] - series[0] if len(series) > 1 else 0.0
+        for value in series[1:]:
+            previous_level = level
+            level = self.alpha * value + (1 - self.alpha) * (
+                level + self.damping * trend
+            )
+            trend = self.beta * (level - previous_level) + (
+                1 - self.beta
+            ) * self.damping * trend
+        self.level_ = level
+        self.trend_ = trend
+        return self
+
+
+class _PerOriginFit:
+    def __init__(self, model: object):
+        self.model = model
+
+    def fit(self, values: Sequence[float]) -> "_PerOriginFit":
+        self.model.fit(values)
+        return self
+
+    def predict(self, horizon: int) -> List[float]:
+        return self.model.predict(horizon)
+
+
+def _best_seconds(function: Callable[[], object], *, number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def benchmark_smoothing_fits(
+    *,
+    seed: int,
+    length: int,
+    minimum_train_size: int,
+    repeat: int,
+    max_slowdown_ratio: float,
+) -> dict:
+    if length < 4 or not 2 <= minimum_train_size < length or repeat < 1:
+        raise ValueError("length, minimum_train_size, and repeat are inconsistent")
+    if max_slowdown_ratio <= 0:
+        raise ValueError("max_slowdown_ratio must be positive")
+    generator = random.Random(seed)
+    series = [round(generator.uniform(0, 10), 6) for _ in range(length)]
+
+    single_fits = {
+        "simple_exponential_smoothing": (
+            lambda: SimpleExponentialSmoothingForecaster().fit(series),
+            lambda: BaselineSmoothing().fit(series),
+        ),
+        "holt_linear": (
+            lambda: HoltLinearForecaster().fit(series),
+            lambda: BaselineHolt().fit(series),
+        ),
+    }
+    report = {
+        "schema_version": 1,
+        "seed": seed,
+        "series_length": length,
+        "minimum_train_size": minimum_train_size,
+        "max_slowdown_ratio": max_slowdown_ratio,
+        "single_fits": {},
+        "backtests": {},
+    }
+    passed = True
+    for name, (current, baseline) in single_fits.items():
+        current_seconds = _best_seconds(current, number=20, repeat=repeat)
+        baseline_seconds = _best_seconds(baseline, number=20, repeat=repeat)
+        ratio = current_seconds / baseline_seconds
+        passed = passed and ratio <= max_slowdown_ratio
+        report["single_fits"][name] = {
+            "baseline_us": round(baseline_seconds * 1e6, 1),
+            "current_us": round(current_seconds * 1e6, 1),
+            "ratio": round(ratio, 3),
+        }
+
+    backtests = {
+        "simple_exponential_smoothing": SimpleExponentialSmoothingForecaster,
+        "holt_linear": HoltLinearForecaster,
+        "holt_linear_grid": lambda: HoltLinearForecaster(alpha=None, beta=None),
+    }
+    for name, factory in backtests.items():
+        def prefix_run(factory=factory):
+            return rolling_origin_backtest(
+                factory, series, minimum_train_size=minimum_train_size
+            )
+
+        def per_origin_run(factory=factory):
+            return rolling_origin_backtest(
+                lambda: _PerOriginFit(factory()),
+                series,
+                minimum_train_size=minimum_train_size,
+            )
+
+        identical = prefix_run() == per_origin_run()
+        prefix_seconds = _best_seconds(prefix_run, number=1, repeat=repeat)
+        per_origin_seconds = _best_seconds(per_origin_run, number=1, repeat=repeat)
+        passed = passed and identical and prefix_seconds <= per_origin_seconds
+        report["backtests"][name] = {
+            "identical": identical,
+            "per_origin_ms": round(per_origin_seconds * 1e3, 2),
+            "prefix_scan_ms": round(prefix_seconds * 1e3, 2),
+            "speedup": round(per_origin_seconds / prefix_seconds, 1),
+        }
+    report["passed"] = passed
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark smoothing forecaster fits and rolling-origin backtests"
+    )
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--length", type=int, default=365)
+    parser.add_argument("--minimum-train-size", type=int, default=28)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--max-slowdown-ratio", type=float, default=1.5)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/smoothing_fit_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_smoothing_fits(
+            seed=args.seed,
+            length=args.length,
+            minimum_train_size=args.minimum_train_size,
+            repeat=args.repeat,
+            max_slowdown_ratio=args.max_slowdown_ratio,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["passed"]}))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Compare plan-generation latency with sustainability estimates on and off.
+
+Plans are generated from synthetic recipes. The enabled runs score carbon
+through the preloaded ``CarbonFootprintTable`` and through the batched upstream
+path against the local ``UpstreamStub``. The legacy figure replays the old
+per-day ``get_sustainability_score`` calls (one request per ingredient line)
+against the same stub on the generated plan.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from pathlib import Path
+
+from backend.config import APIConfig
+from backend.domain.ingredients import parse_ingredient_lines
+from backend.engines.health_engine import HealthEngine
+from backend.engines.plan_generator import PlanGenerator
+from backend.engines.taste_engine import TasteEngine
+from backend.engines.weekly_optimizer import WeeklyPlanOptimizer
+from backend.models import Gender, Goal, Recipe, UserProfile
+from backend.services.carbon_footprint_table import TABLE_VERSION, CarbonFootprintTable
+from backend.services.response_cache import MemoryResponseCache, TokenBucket
+from backend.services.sustainablefooddb_service import SustainableFoodDBService
+from backend.tests.upstream_stub import UpstreamStub
+
+
+USER = UserProfile(
+    age=30,
+    weight_kg=75,
+    height_cm=180,
+    gender=Gender.MALE,
+    activity_level=1.55,
+    goal=Goal.MAINTENANCE,
+)
+
+
+def _recipes(*, count: int, ingredients: int, seed: int) -> tuple[list[Recipe], dict]:
+    generator = random.Random(seed)
+    carbon = {
+        f"ingredient {index}": round(generator.uniform(0.1, 20.0), 2)
+        for index in range(ingredients)
+    }
+    names = list(carbon)
+    recipes = []
+    for index in range(count):
+        lines = [
+            f"{generator.randint(50, 250)} g {name}"
+            for name in generator.sample(names, 8)
+        ]
+        recipes.append(
+            Recipe(
+                id=f"recipe-{index}",
+                name=f"Recipe {index}",
+                description="",
+                ingredients=lines,
+                ingredient_lines=parse_ingredient_lines(lines),
+                calories=generator.randint(400, 900),
+                macros={
+                    "protein": generator.uniform(15, 50),
+                    "carbs": generator.uniform(30, 100),
+                    "fat": generator.uniform(8, 35),
+                },
+            )
+        )
+    return recipes, carbon
+
+
+def _planner(recipes: list[Recipe], service) -> PlanGenerator:
+    planner = PlanGenerator.__new__(PlanGenerator)
+    planner.health_engine = HealthEngine()
+    planner.taste_engine = TasteEngine()
+    planner.sustainability_service = service
+    planner.recipes = recipes
+    planner.optimizer = WeeklyPlanOptimizer(beam_width=16, max_options_per_slot=12)
+    return planner
+
+
+def _upstream_service(url: str) -> SustainableFoodDBService:
+    service = SustainableFoodDBService(carbon_table=None)
+    service.base_url = url
+    service._cache = MemoryResponseCache(ttl_seconds=3600, max_entries=10_000)
+    service._rate_limiter = TokenBucket(rate_per_second=10_000.0, capacity=10_000)
+    return service
+
+
+def _timed_plans(planner: PlanGenerator, *, days: int, runs: int, enabled: bool):
+    os.environ["ENABLE_SUSTAINABILITY_ESTIMATES"] = "true" if enabled else "false"
+    timings = []
+    plan = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        plan = planner.create_plan(USER, days=days)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), plan
+
+
+def benchmark_sustainability_scoring(
+    *, recipes: int, ingredients: int, days: int, runs: int, delay_ms: float, seed: int
+) -> dict:
+    if min(recipes, ingredients, days, runs) < 1 or ingredients < 8:
+        raise ValueError("recipes, days, and runs must be positive; ingredients at least 8")
+    APIConfig.CACHE_ENABLED = True
+    APIConfig.MAX_RETRIES = 1
+    catalog, carbon = _recipes(count=recipes, ingredients=ingredients, seed=seed)
+    table = CarbonFootprintTable.from_snapshot(
+        {"table_version": TABLE_VERSION, "ingredients": carbon}
+    )
+    previous = os.environ.get("ENABLE_SUSTAINABILITY_ESTIMATES")
+
+    def footprint(query):
+        value = carbon.get(query.get("ingredient"))
+        return None if value is None else {"carbon_footprint": value}
+
+    try:
+        disabled_seconds, _ = _timed_plans(
+            _planner(catalog, SustainableFoodDBService(carbon_table=table)),
+            days=days,
+            runs=runs,
+            enabled=False,
+        )
+        table_seconds, table_plan = _timed_plans(
+            _planner(catalog, SustainableFoodDBService(carbon_table=table)),
+            days=days,
+            runs=runs,
+            enabled=True,
+        )
+        with UpstreamStub(
+            {"ingredient-cf": footprint}, delay_seconds=delay_ms / 1000.0
+        ) as stub:
+            # A fresh service per run keeps every batch cold.
+            upstream_timings = []
+            for _ in range(runs):
+                planner = _planner(catalog, _upstream_service(stub.url))
+                seconds, upstream_plan = _timed_plans(
+                    planner, days=days, runs=1, enabled=True
+                )
+                upstream_timings.append(seconds)
+            upstream_seconds = statistics.median(upstream_timings)
+
+            legacy = _upstream_service(stub.url)
+            legacy._cache = None
+            started = time.perf_counter()
+            legacy_values = [
+                legacy.get_sustainability_score(
+                    [
+                        line.name
+                        for recipe in day.meals.values()
+                        for line in recipe.ingredient_lines
+                    ]
+                )["carbon_footprint_kg"]
+                for day in table_plan.days
+            ]
+            legacy_seconds = time.perf_counter() - started
+    finally:
+        if previous is None:
+            os.environ.pop("ENABLE_SUSTAINABILITY_ESTIMATES", None)
+        else:
+            os.environ["ENABLE_SUSTAINABILITY_ESTIMATES"] = previous
+
+    table_values = [day.total_stats["carbon_footprint_kg"] for day in table_plan.days]
+    upstream_values = [day.total_stats["carbon_footprint_kg"] for day in upstream_plan.days]
+    return {
+        "schema_version": 1,
+        "recipes": recipes,
+        "ingredients": ingredients,
+        "days": days,
+        "runs": runs,
+        "delay_ms": delay_ms,
+        "seed": seed,
+        "plan_disabled_seconds": round(disabled_seconds, 6),
+        "plan_table_seconds": round(table_seconds, 6),
+        "plan_upstream_batch_seconds": round(upstream_seconds, 6),
+        "legacy_per_ingredient_scoring_seconds": round(legacy_seconds, 6),
+        "table_overhead_ratio": round(table_seconds / disabled_seconds, 3),
+        "results_match": table_values == upstream_values == legacy_values,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark plan generation with sustainability estimates"
+    )
+    parser.add_argument("--recipes", type=int, default=60)
+    parser.add_argument("--ingredients", type=int, default=120)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/sustainability_scoring_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_sustainability_scoring(
+            recipes=args.recipes,
+            ingredients=args.ingredients,
+            days=args.days,
+            runs=args.runs,
+            delay_ms=args.delay_ms,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["results_match"]}))
+    return 0 if report["results_match"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Compare sequential upstream lookups with ``fetch_many`` and the shared cache.
+
+All traffic goes to the local ``UpstreamStub`` with a fixed per-response delay
+standing in for upstream latency. The sequential baseline is one service with
+the per-instance memory LRU. The warm pass uses a fresh service instance on the
+same SQLite cache file, which is what a restarted or second worker sees.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from backend.config import APIConfig
+from backend.services.base_service import BaseAPIService
+from backend.services.response_cache import (
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    TokenBucket,
+)
+from backend.tests.upstream_stub import UpstreamStub
+
+
+def _service(url: str, cache_path: Path | None, lookups: int) -> BaseAPIService:
+    return BaseAPIService(
+        url,
+        cache=(
+            SQLiteResponseCache(cache_path, ttl_seconds=3600, max_entries=lookups)
+            if cache_path is not None
+            else MemoryResponseCache(ttl_seconds=3600, max_entries=lookups)
+        ),
+        rate_limiter=TokenBucket(rate_per_second=1_000.0, capacity=lookups * 2),
+    )
+
+
+def benchmark_upstream_fetch(
+    *, lookups: int, foods: int, delay_ms: float, workers: int, seed: int
+) -> dict:
+    if lookups < 1 or foods < 1 or workers < 1:
+        raise ValueError("lookups, foods, and workers must be at least 1")
+    APIConfig.CACHE_ENABLED = True
+    APIConfig.MAX_RETRIES = 1
+    generator = random.Random(seed)
+    routes = {f"food/{index}": {"id": index} for index in range(foods)}
+    endpoints = [f"food/{generator.randrange(foods)}" for _ in range(lookups)]
+
+    with tempfile.TemporaryDirectory() as workdir, UpstreamStub(
+        routes, delay_seconds=delay_ms / 1000.0
+    ) as stub:
+        cache_path = Path(workdir) / "upstream-cache.sqlite3"
+
+        started = time.perf_counter()
+        baseline = _service(stub.url, None, lookups)
+        sequential = [baseline._make_request(endpoint) for endpoint in endpoints]
+        sequential_seconds = time.perf_counter() - started
+        sequential_hits = sum(stub.hits.values())
+        stub.hits.clear()
+
+        started = time.perf_counter()
+        cold = _service(stub.url, cache_path, lookups).fetch_many(
+            endpoints, max_workers=workers
+        )
+        cold_seconds = time.perf_counter() - started
+        cold_hits = sum(stub.hits.values())
+        stub.hits.clear()
+
+        started = time.perf_counter()
+        warm = _service(stub.url, cache_path, lookups).fetch_many(
+            endpoints, max_workers=workers
+        )
+        warm_seconds = time.perf_counter() - started
+        warm_hits = sum(stub.hits.values())
+
+    matches = [item.value for item in cold] == sequential == [
+        item.value for item in warm
+    ]
+    return {
+        "schema_version": 1,
+        "lookups": lookups,
+        "foods": foods,
+        "delay_ms": delay_ms,
+        "workers": workers,
+        "seed": seed,
+        "sequential_seconds": round(sequential_seconds, 6),
+        "sequential_upstream_hits": sequential_hits,
+        "fetch_many_cold_seconds": round(cold_seconds, 6),
+        "fetch_many_cold_upstream_hits": cold_hits,
+        "fetch_many_warm_seconds": round(warm_seconds, 6),
+        "fetch_many_warm_upstream_hits": warm_hits,
+        "cold_speedup": round(sequential_seconds / cold_seconds, 2),
+        "results_match": matches,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark fetch_many and the shared response cache"
+    )
+    parser.add_argument("--lookups", type=int, default=400)
+    parser.add_argument("--foods", type=int, default=150)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/upstream_fetch_benchmark.json"),
+    )
+    args = parser.parse_args()
+
+    try:
+        report = benchmark_upstream_fetch(
+            lookups=args.lookups,
+            foods=args.foods,
+            delay_ms=args.delay_ms,
+            workers=args.workers,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": report["results_match"]}))
+    return 0 if report["results_match"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Export a DietRxDB condition-compatibility snapshot for offline scoring.
+
+Point ``DIETRX_COMPATIBILITY_INDEX_FILE`` at the written file to let
+``HealthEngine`` check conditions without per-ingredient upstream calls.
+Export every ingredient the catalog uses: ingredients missing from the snapshot
+are reported as verification errors, never as free of drug interactions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from backend.services.base_service import ExternalServiceError
+from backend.services.condition_compatibility_index import (
+    export_condition_compatibility_snapshot,
+)
+from backend.services.dietrxdb_service import DietRxDBService
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fetch the listed conditions and food interactions from DietRxDB "
+            "into a local compatibility snapshot."
+        )
+    )
+    parser.add_argument("--condition", action="append", required=True)
+    parser.add_argument(
+        "--foods-file",
+        type=Path,
+        required=True,
+        help="Text file with one ingredient name per line",
+    )
+    parser.add_argument("--output", type=Path, required=True)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    foods = [
+        line.strip()
+        for line in args.foods_file.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    try:
+        snapshot = export_condition_compatibility_snapshot(
+            DietRxDBService(),
+            conditions=args.condition,
+            foods=foods,
+        )
+    except ExternalServiceError as exc:
+        print(
+            json.dumps({"status": "upstream_error", "detail": str(exc)}, sort_keys=True),
+            file=sys.stderr,
+        )
+        return 2
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(snapshot, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(
+        json.dumps(
+            {
+                "status": "exported",
+                "output": str(args.output),
+                "conditions": len(snapshot["diseases"]),
+                "foods": len(snapshot["interactions"]),
+            },
+            sort_keys=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
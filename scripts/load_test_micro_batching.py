@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Load-test the in-process inference micro-batcher across batch windows.
+
+Concurrent asyncio clients each send requests back to back through one
+``MicroBatcher``. For every batch window the report gives throughput, latency
+percentiles, and the observed batch sizes; ``max_batch_size=1`` is included
+as the unbatched baseline. The default ``matmul`` workload is a numpy stand-in
+with a fixed per-forward cost; ``--workload vision`` runs the ResNet50
+analyzer with random weights and needs torch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.ml.batching import MicroBatcher
+
+
+def matmul_workload(width: int = 1_024, *, seed: int = 0) -> Tuple[Callable, Callable]:
+    """Return ``(batch_fn, make_item)`` for a dense two-layer numpy model."""
+
+    rng = np.random.default_rng(seed)
+    first = rng.standard_normal((width, width)).astype(np.float32)
+    second = rng.standard_normal((width, 16)).astype(np.float32)
+
+    def batch_fn(items: List[np.ndarray]) -> List[np.ndarray]:
+        hidden = np.maximum(np.stack(items) @ first, 0.0)
+        return list(hidden @ second)
+
+    def make_item(index: int) -> np.ndarray:
+        return np.full(width, (index % 7) / 7.0, dtype=np.float32)
+
+    return batch_fn, make_item
+
+
+def vision_workload(num_threads: Optional[int]) -> Tuple[Callable, Callable]:
+    import torch
+
+    from backend.ml.recipe_vision import RecipeVisionAnalyzer
+
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    model = RecipeVisionAnalyzer(pretrained=False, device=torch.device("cpu"))
+    image = torch.rand(3, 224, 224)
+    return model.analyze_tensors, lambda _index: image
+
+
+async def _drive(
+    batcher: MicroBatcher, make_item: Callable, *, requests: int, concurrency: int
+) -> List[float]:
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def client() -> None:
+        for index in counter:
+            started = time.perf_counter()
+            await batcher.infer(make_item(index))
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies
+
+
+def run_window(
+    batch_fn: Callable,
+    make_item: Callable,
+    *,
+    max_batch_size: int,
+    max_wait_ms: float,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    with MicroBatcher(
+        batch_fn,
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+        max_queue_size=max(concurrency, 1),
+    ) as batcher:
+        started = time.perf_counter()
+        latencies = asyncio.run(
+            _drive(batcher, make_item, requests=requests, concurrency=concurrency)
+        )
+        seconds = time.perf_counter() - started
+        metrics = asdict(batcher.metrics())
+    milliseconds = np.array(latencies) * 1000.0
+    metrics["batch_size_histogram"] = {
+        str(size): count for size, count in metrics["batch_size_histogram"].items()
+    }
+    return {
+        "max_batch_size": max_batch_size,
+        "max_wait_ms": max_wait_ms,
+        "requests_per_second": round(requests / max(seconds, 1e-9), 1),
+        "latency_p50_ms": round(float(np.percentile(milliseconds, 50)), 3),
+        "latency_p95_ms": round(float(np.percentile(milliseconds, 95)), 3),
+        "metrics": metrics,
+    }
+
+
+def load_test(
+    batch_fn: Callable,
+    make_item: Callable,
+    *,
+    windows_ms: Sequence[float],
+    max_batch_size: int,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    if requests < 1 or concurrency < 1:
+        raise ValueError("requests and concurrency must be at least 1")
+    batch_fn([make_item(0), make_item(1)])  # warm caches and BLAS threads
+    runs = [
+        run_window(
+            batch_fn,
+            make_item,
+            max_batch_size=1,
+            max_wait_ms=0.0,
+            requests=requests,
+            concurrency=concurrency,
+        )
+    ]
+    for window in windows_ms:
+        runs.append(
+            run_window(
+                batch_fn,
+                make_item,
+                max_batch_size=max_batch_size,
+                max_wait_ms=window,
+                requests=requests,
+                concurrency=concurrency,
+            )
+        )
+    baseline = runs[0]["requests_per_second"]
+    for run in runs:
+        run["speedup_vs_unbatched"] = round(run["requests_per_second"] / baseline, 2)
+    return {
+        "schema_version": 1,
+        "requests": requests,
+        "concurrency": concurrency,
+        "runs": runs,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure micro-batched inference throughput vs batch window"
+    )
+    parser.add_argument("--workload", choices=("matmul", "vision"), default="matmul")
+    parser.add_argument("--width", type=int, default=1_024)
+    parser.add_argument("--num-threads", type=int)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument(
+        "--window-ms", type=float, action="append", dest="windows"
+    )
+    parser.add_argument("--minimum-speedup", type=float)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    try:
+        if args.workload == "vision":
+            batch_fn, make_item = vision_workload(args.num_threads)
+        else:
+            batch_fn, make_item = matmul_workload(args.width)
+        report = load_test(
+            batch_fn,
+            make_item,
+            windows_ms=args.windows or [0.0, 1.0, 2.0, 5.0, 10.0],
+            max_batch_size=args.max_batch_size,
+            requests=args.requests,
+            concurrency=args.concurrency,
+        )
+        report["workload"] = args.workload
+        best = max(run["speedup_vs_unbatched"] for run in report["runs"])
+        failures = []
+        if args.minimum_speedup is not None and best < args.minimum_speedup:
+            failures.append(
+                f"best speedup {best} is below the minimum {args.minimum_speedup}"
+            )
+        report["regression_failures"] = failures
+        report["passed"] = not failures
+    except (ImportError, OSError, ValueError) as exc:
+        print(f"Micro-batching load test failed: {type(exc).__name__}: {exc}")
+        return 2
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(json.dumps({"output": str(args.output), "passed": not failures}))
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare a household's coverage counters with a full recompute."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Sequence
+
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+from backend.api.database_error_handlers import classify_operational_error
+from backend.database import SessionLocal
+from backend.services.preparation_coverage_counter_service import (
+    reconcile_household_coverage,
+)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recompute a household's preparation coverage counters from its "
+            "schedules and task events and report drift. Writes only with --apply."
+        )
+    )
+    parser.add_argument("--household-id", required=True)
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Replace drifted counters and contributions with the recompute",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        report = reconcile_household_coverage(
+            db,
+            household_id=args.household_id,
+            apply=args.apply,
+        )
+        drifted = bool(report["drift"] or report["schedule_drift"])
+        if report["applied"]:
+            report["status"] = "repaired"
+        else:
+            report["status"] = "drift" if drifted else "consistent"
+        print(json.dumps(report, sort_keys=True))
+        return 1 if report["status"] == "drift" else 0
+    except HTTPException as exc:
+        payload = {
+            "status": "reconciliation_rejected",
+            "http_status": exc.status_code,
+            "detail": exc.detail,
+        }
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 2
+    except OperationalError as exc:
+        payload = {
+            "status": "database_error",
+            "detail": classify_operational_error(exc),
+        }
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 3
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
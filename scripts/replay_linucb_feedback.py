@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Replay LinUCB over stored meal-selection feedback without touching it."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from backend.api.database_error_handlers import classify_operational_error
+from backend.database import DBFeedback, SessionLocal
+from backend.research.bandit_replay import LoggedBanditEvent, replay_linucb
+
+
+FEEDBACK_TYPE = "meal_selection"
+
+
+def iter_meal_selection_events(
+    db: Session,
+    *,
+    batch_size: int = 5_000,
+) -> Iterator[LoggedBanditEvent]:
+    """Stream logged selections in id order with keyset pagination.
+
+    Each page is one indexed query bounded by the previous page's last id, so
+    memory stays at one page regardless of log size. Rows whose payload does
+    not carry a numeric state, action, and reward are skipped.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    last_id = 0
+    while True:
+        rows = (
+            db.query(DBFeedback.id, DBFeedback.payload)
+            .filter(DBFeedback.feedback_type == FEEDBACK_TYPE, DBFeedback.id > last_id)
+            .order_by(DBFeedback.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return
+        for event_id, payload in rows:
+            try:
+                yield LoggedBanditEvent(
+                    event_id=event_id,
+                    context=tuple(float(value) for value in payload["state"]),
+                    action=str(int(payload["selected_recipe_id"])),
+                    reward=float(payload["reward"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        last_id = rows[-1][0]
+
+
+def scan_action_space(
+    db: Session, *, batch_size: int = 5_000
+) -> Tuple[List[str], Optional[int]]:
+    """Return the logged actions and the most common context length."""
+
+    actions = set()
+    dimensions: Counter[int] = Counter()
+    for event in iter_meal_selection_events(db, batch_size=batch_size):
+        actions.add(event.action)
+        dimensions[len(event.context)] += 1
+    if not dimensions:
+        return [], None
+    dimension = min(dimensions, key=lambda value: (-dimensions[value], value))
+    return sorted(actions), dimension
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay LinUCB over stored meal-selection feedback. "
+            "The command only reads feedback_events."
+        )
+    )
+    parser.add_argument("--alpha", type=float, default=1.0)
+    parser.add_argument("--feature-dim", type=int)
+    parser.add_argument("--action", action="append", default=[])
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--output", type=Path, required=True)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    db = SessionLocal()
+    try:
+        actions, dimension = list(args.action), args.feature_dim
+        if not actions or dimension is None:
+            scanned_actions, scanned_dimension = scan_action_space(
+                db, batch_size=args.batch_size
+            )
+            actions = actions or scanned_actions
+            dimension = dimension if dimension is not None else scanned_dimension
+        if not actions or dimension is None:
+            print(json.dumps({"status": "no_events"}, sort_keys=True))
+            return 1
+        started = time.perf_counter()
+        result = replay_linucb(
+            iter_meal_selection_events(db, batch_size=args.batch_size),
+            actions,
+            feature_dim=dimension,
+            alpha=args.alpha,
+        )
+        seconds = time.perf_counter() - started
+        report = asdict(result)
+        report["replay_seconds"] = round(seconds, 4)
+        report["events_per_second"] = round(
+            result.logged_events / max(seconds, 1e-9), 1
+        )
+    except ValueError as exc:
+        payload = {"status": "invalid", "detail": str(exc)}
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 2
+    except OperationalError as exc:
+        payload = {
+            "status": "database_error",
+            "detail": classify_operational_error(exc),
+        }
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 3
+    finally:
+        db.close()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    print(
+        json.dumps(
+            {"output": str(args.output), "matched_events": result.matched_events}
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
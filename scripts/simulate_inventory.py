@@ -17,13 +17,14 @@ def load_document(path: Path) -> InventoryBenchmarkFixture:
     return InventoryBenchmarkFixture.model_validate(raw)
 
 
-def build_report(path: Path) -> dict:
+def build_report(path: Path, *, compact_events: bool = False) -> dict:
     document = load_document(path)
     result = simulate_perishable_inventory(
         [value.to_domain() for value in document.initial_lots],
         [value.to_domain() for value in document.demand_events],
         [value.to_domain() for value in document.policies],
         horizon_days=document.horizon_days,
+        compact_events=compact_events,
     )
     return {
         "method": result.method,
@@ -43,6 +44,7 @@ def build_report(path: Path) -> dict:
         "order_count": result.order_count,
         "per_sku": [asdict(value) for value in result.per_sku],
         "events": [asdict(value) for value in result.events],
+        "event_counters": [asdict(value) for value in result.event_counters],
         "limitations": [
             "This is an offline deterministic replay and never mutates household inventory.",
             "Demand, lead times, reorder policy, and shelf life are explicit scenario inputs rather than learned guarantees.",
@@ -90,10 +92,15 @@ def main() -> int:
     parser.add_argument("--minimum-fill-rate", type=float)
     parser.add_argument("--maximum-waste-units", type=float)
     parser.add_argument("--maximum-stockout-units", type=float)
+    parser.add_argument(
+        "--compact-events",
+        action="store_true",
+        help="report aggregate event counters without the per-movement ledger",
+    )
     args = parser.parse_args()
 
     try:
-        report = build_report(args.input)
+        report = build_report(args.input, compact_events=args.compact_events)
         failures = regression_failures(
             report,
             minimum_fill_rate=args.minimum_fill_rate,
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Sweep reorder-policy grids over one typed perishable-inventory fixture."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+from dataclasses import asdict, fields
+from pathlib import Path
+
+from backend.domain.benchmark_fixtures import InventoryPolicySweepFixture
+from backend.research.inventory_policy_sweep import (
+    PolicySweepCell,
+    sweep_reorder_policies,
+)
+
+
+def load_document(path: Path) -> InventoryPolicySweepFixture:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return InventoryPolicySweepFixture.model_validate(raw)
+
+
+def build_report(path: Path, *, workers: int = 1) -> dict:
+    document = load_document(path)
+    result = sweep_reorder_policies(
+        [value.to_domain() for value in document.initial_lots],
+        [value.to_domain() for value in document.demand_events],
+        [value.to_domain() for value in document.policy_grid],
+        horizon_days=document.horizon_days,
+        workers=workers,
+    )
+    return {
+        "method": result.method,
+        "deterministic": result.deterministic,
+        "horizon_days": result.horizon_days,
+        "sweep_fingerprint": result.sweep_fingerprint,
+        "cell_count": result.cell_count,
+        "cells": [asdict(value) for value in result.cells],
+        "best_by_sku": [asdict(value) for value in result.best_by_sku],
+        "warnings": list(result.warnings),
+    }
+
+
+def regression_failures(
+    report: dict,
+    *,
+    minimum_fill_rate: float | None,
+    maximum_waste_units: float | None,
+) -> list[str]:
+    failures = []
+    if minimum_fill_rate is not None and not 0 <= minimum_fill_rate <= 1:
+        raise ValueError("minimum_fill_rate must be in [0, 1]")
+    if maximum_waste_units is not None and maximum_waste_units < 0:
+        raise ValueError("maximum_waste_units cannot be negative")
+    cells_by_sku: dict[str, list[dict]] = {}
+    for cell in report["cells"]:
+        cells_by_sku.setdefault(cell["sku"], []).append(cell)
+    for sku, cells in sorted(cells_by_sku.items()):
+        admissible = [
+            cell
+            for cell in cells
+            if (minimum_fill_rate is None or cell["fill_rate"] >= minimum_fill_rate)
+            and (
+                maximum_waste_units is None
+                or cell["expired_units"] <= maximum_waste_units
+            )
+        ]
+        if not admissible:
+            failures.append(
+                f"no swept policy for {sku} meets the fill-rate and waste gates"
+            )
+    return failures
+
+
+def write_csv(report: dict, path: Path) -> None:
+    columns = [value.name for value in fields(PolicySweepCell)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=columns)
+        writer.writeheader()
+        for cell in report["cells"]:
+            writer.writerow(cell)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Sweep deterministic reorder-policy grids"
+    )
+    parser.add_argument("input", type=Path)
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--csv", type=Path, help="also write the ranked cell table")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--minimum-fill-rate", type=float)
+    parser.add_argument("--maximum-waste-units", type=float)
+    args = parser.parse_args()
+
+    try:
+        report = build_report(args.input, workers=args.workers)
+        failures = regression_failures(
+            report,
+            minimum_fill_rate=args.minimum_fill_rate,
+            maximum_waste_units=args.maximum_waste_units,
+        )
+        report["regression_failures"] = failures
+        report["passed"] = not failures
+    except (OSError, json.JSONDecodeError, TypeError, ValueError) as exc:
+        print(f"Inventory policy sweep failed: {type(exc).__name__}: {exc}")
+        return 2
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(report, indent=2, sort_keys=True, allow_nan=False) + "\n",
+        encoding="utf-8",
+    )
+    if args.csv:
+        write_csv(report, args.csv)
+    print(json.dumps({"output": str(args.output), "passed": not failures}))
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Train the taste predictor offline from stored feedback and register it.
+
+With ``--synthetic-rows`` the job runs against a throwaway in-memory database
+seeded with that many taste events, which is how CPU samples/sec is measured
+without touching a real database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.database_error_handlers import classify_operational_error
+from backend.database import Base, DBFeedback, DBUser, SessionLocal
+from backend.ml.feedback_training import (
+    DEFAULT_MODEL_ID,
+    FEEDBACK_TYPE,
+    FeedbackTrainingConfig,
+    train_taste_predictor,
+)
+from backend.research.registry import LocalArtifactRegistry
+
+
+def synthetic_session_factory(
+    rows: int, *, seed: int = 0, vector_length: int = 64, batch_size: int = 5_000
+) -> sessionmaker:
+    """Return a session factory over an in-memory database of taste events.
+
+    Ratings follow the cosine similarity of the two vectors, so the model has a
+    learnable signal; payloads match what ``/api/v1/learning/taste`` stores.
+    """
+
+    if rows < 1 or vector_length < 1:
+        raise ValueError("synthetic rows and vector length must be at least 1")
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[DBUser.__table__, DBFeedback.__table__])
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    rng = np.random.default_rng(seed)
+    with factory() as db:
+        db.add(DBUser(id="synthetic-user"))
+        for start in range(0, rows, batch_size):
+            count = min(batch_size, rows - start)
+            users = rng.random((count, vector_length))
+            recipes = rng.random((count, vector_length))
+            ratings = np.einsum("ij,ij->i", users, recipes) / (
+                np.linalg.norm(users, axis=1) * np.linalg.norm(recipes, axis=1)
+            )
+            db.bulk_insert_mappings(
+                DBFeedback,
+                [
+                    {
+                        "user_id": "synthetic-user",
+                        "feedback_type": FEEDBACK_TYPE,
+                        "payload": {
+                            "user_id": "synthetic-user",
+                            "recipe_id": f"recipe-{start + offset}",
+                            "rating": round(float(rating), 6),
+                            "user_genome": user.round(6).tolist(),
+                            "recipe_profile": recipe.round(6).tolist(),
+                        },
+                    }
+                    for offset, (user, recipe, rating) in enumerate(
+                        zip(users, recipes, ratings)
+                    )
+                ],
+            )
+        db.commit()
+    return factory
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Train the taste predictor from stored taste feedback. "
+            "The command only reads feedback_events."
+        )
+    )
+    defaults = FeedbackTrainingConfig()
+    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument("--registry-root", type=Path)
+    parser.add_argument("--model-id", default=DEFAULT_MODEL_ID)
+    parser.add_argument("--version")
+    parser.add_argument("--epochs", type=int, default=defaults.epochs)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--chunk-size", type=int, default=defaults.chunk_size)
+    parser.add_argument("--learning-rate", type=float, default=defaults.learning_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--input-dim", type=int, default=defaults.input_dim)
+    parser.add_argument("--hidden-dim", type=int, default=defaults.hidden_dim)
+    parser.add_argument("--num-workers", type=int, default=defaults.num_workers)
+    parser.add_argument(
+        "--checkpoint-every-pages", type=int, default=defaults.checkpoint_every_pages
+    )
+    parser.add_argument("--max-pages", type=int)
+    parser.add_argument("--synthetic-rows", type=int)
+    parser.add_argument("--minimum-samples-per-second", type=float)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        config = FeedbackTrainingConfig(
+            epochs=args.epochs,
+            batch_size=args.batch_size,
+            chunk_size=args.chunk_size,
+            learning_rate=args.learning_rate,
+            seed=args.seed,
+            input_dim=args.input_dim,
+            hidden_dim=args.hidden_dim,
+            num_workers=args.num_workers,
+            checkpoint_every_pages=args.checkpoint_every_pages,
+        )
+        session_factory = (
+            synthetic_session_factory(args.synthetic_rows, seed=args.seed)
+            if args.synthetic_rows is not None
+            else SessionLocal
+        )
+        result = train_taste_predictor(
+            session_factory,
+            args.output_dir,
+            config,
+            registry=(
+                LocalArtifactRegistry(args.registry_root)
+                if args.registry_root is not None
+                else None
+            ),
+            model_id=args.model_id,
+            version=args.version,
+            max_pages=args.max_pages,
+        )
+    except (OSError, ValueError) as exc:
+        payload = {"status": "invalid", "detail": f"{type(exc).__name__}: {exc}"}
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 2
+    except OperationalError as exc:
+        payload = {
+            "status": "database_error",
+            "detail": classify_operational_error(exc),
+        }
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 3
+
+    report = asdict(result)
+    failures = []
+    if (
+        args.minimum_samples_per_second is not None
+        and result.samples_per_second < args.minimum_samples_per_second
+    ):
+        failures.append(
+            f"trained {result.samples_per_second} samples/s; minimum is "
+            f"{args.minimum_samples_per_second}"
+        )
+    report["regression_failures"] = failures
+    report["passed"] = not failures
+    print(json.dumps(report, indent=2, sort_keys=True, allow_nan=False))
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
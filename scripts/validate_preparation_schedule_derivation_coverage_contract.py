@@ -21,6 +21,7 @@ PATH = (
 FILES = {
     "domain": "backend/domain/preparation_schedule_derivation_coverage.py",
     "service": "backend/services/preparation_schedule_derivation_coverage_service.py",
+    "counters": "backend/services/preparation_coverage_counter_service.py",
     "route": "backend/api/preparation_schedule_derivation_routes.py",
     "tests": "backend/tests/test_preparation_schedule_derivation_coverage.py",
 }
@@ -94,13 +95,17 @@ def validate_contract() -> dict:
         },
         "service": {
             "def get_schedule_derivation_coverage",
-            "def _repair_evidence_complete",
+            "load_household_counters(",
             "original_schedule_count=original_count",
             "repair_schedule_count=repair_count",
             "unknown_method_count=unknown_count",
             "complete_derivation_count=complete_count",
             "incomplete_derivation_count=incomplete",
             "repair_acceptance_link_coverage_ratio",
+        },
+        "counters": {
+            "def _repair_evidence_complete",
+            "def reconcile_household_coverage",
             "has incomplete repair derivation evidence",
             "uses unknown derivation method",
         },
@@ -41,7 +41,8 @@ def validate_execution_boundary() -> dict:
         "read": {
             "DBPreparationTaskExecutionEvent",
             "source_schedule_has_execution_history",
-            "DBPreparationTaskExecutionEvent.schedule_id == source.id",
+            "DBPreparationTaskExecutionEvent.schedule_id.in_(source_ids)",
+            "source.id in context.executed_schedule_ids",
             "def _stale_reasons",
             "def _proposal_view",
         },
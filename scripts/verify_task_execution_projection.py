@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Check one schedule's task execution projection against a full ledger replay."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Sequence
+
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+from backend.api.database_error_handlers import classify_operational_error
+from backend.database import SessionLocal
+from backend.services.preparation_task_execution_service import (
+    verify_task_execution_projection,
+)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay a schedule's execution ledger and compare it with the stored "
+            "per-task projection. The command never writes."
+        )
+    )
+    parser.add_argument("--household-id", required=True)
+    parser.add_argument("--schedule-id", required=True, type=int)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    if args.schedule_id < 1:
+        _parser().error("--schedule-id must be at least 1")
+
+    db = SessionLocal()
+    try:
+        report = verify_task_execution_projection(
+            db,
+            household_id=args.household_id,
+            schedule_id=args.schedule_id,
+        )
+        report["status"] = "mismatch" if report["mismatches"] else "verified"
+        print(json.dumps(report, sort_keys=True))
+        return 1 if report["mismatches"] else 0
+    except HTTPException as exc:
+        payload = {
+            "status": "verification_rejected",
+            "http_status": exc.status_code,
+            "detail": exc.detail,
+        }
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 2
+    except OperationalError as exc:
+        payload = {
+            "status": "database_error",
+            "detail": classify_operational_error(exc),
+        }
+        print(json.dumps(payload, sort_keys=True), file=sys.stderr)
+        return 3
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())